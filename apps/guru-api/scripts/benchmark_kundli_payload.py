@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+GET /kundli payload benchmark: response size and serialization time.
+
+The full response (D1 + 15 vargas) is computed once locally (compute_kundli,
+no API call) and encoded per payload variant:
+- full: every chart and field (the default response)
+- D1+D9: vargas=D1,D9 (what the chart screen renders)
+- compact: compact=true (Planets/Houses/Aspects as columns + rows)
+- compact D1+D9: both
+
+and per encoder:
+- fastapi: jsonable_encoder + JSONResponse (FastAPI's default for a dict)
+- stdlib: JSONResponse without jsonable_encoder
+- orjson: FastJSONResponse with orjson (skipped if orjson is not installed)
+
+Sizes are raw and gzip-compressed bytes; times are the mean per encoding.
+
+Usage:
+    python scripts/benchmark_kundli_payload.py [--repeat 50] [--dob 1995-05-16 --time 18:38 --lat 12.9716 --lon 77.5946]
+"""
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+APP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(APP_DIR))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api import responses
+from src.api.kundli_routes import compute_kundli, select_kundli_response
+
+
+def encoders() -> Dict[str, Callable[[Any], bytes]]:
+    encoders = {
+        "fastapi": lambda content: JSONResponse(jsonable_encoder(content)).body,
+        "stdlib": lambda content: JSONResponse(content).body,
+    }
+    if responses.orjson is not None:
+        encoders["orjson"] = lambda content: responses.FastJSONResponse(content).body
+    return encoders
+
+
+def mean_micros(fn: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--dob", default="1995-05-16")
+    parser.add_argument("--time", default="18:38")
+    parser.add_argument("--lat", type=float, default=12.9716)
+    parser.add_argument("--lon", type=float, default=77.5946)
+    parser.add_argument("--timezone", default="Asia/Kolkata")
+    args = parser.parse_args()
+
+    response = compute_kundli(args.dob, args.time, args.lat, args.lon, args.timezone)
+
+    variants = {
+        "full": select_kundli_response(response),
+        "D1+D9": select_kundli_response(response, vargas={"D1", "D9"}),
+        "compact": select_kundli_response(response, compact=True),
+        "compact D1+D9": select_kundli_response(response, vargas={"D1", "D9"}, compact=True),
+    }
+    encode = encoders()
+    baseline_micros = mean_micros(lambda: encode["fastapi"](response), args.repeat)
+
+    header = f"{'payload':<15} {'encoder':<8} {'bytes':>8} {'gzip':>7} {'us':>10} {'vs fastapi full':>16}"
+    print(header)
+    print("-" * len(header))
+    for variant, content in variants.items():
+        for name, fn in encode.items():
+            body = fn(content)
+            micros = mean_micros(lambda: fn(content), args.repeat)
+            print(
+                f"{variant:<15} {name:<8} {len(body):>8} {len(gzip.compress(body)):>7} "
+                f"{micros:>10.1f} {baseline_micros / micros:>15.1f}x"
+            )
+    if responses.orjson is None:
+        print("\norjson is not installed: FastJSONResponse uses the stdlib encoder")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Post-processor micro-benchmark over the master_test_case charts.
+
+For every scripts/master_test_case_*.py payload the chart context is built
+locally (no API call) and representative LLM output is post-processed:
+- structured: _finalize_structured (daily sections → guidance + structured)
+- narrative: validate_and_format_guidance on the flat guidance text
+- sanitizer / retrograde: the individual hot passes
+
+LLM text: --responses DIR reads saved /predict responses (<case>.json with
+"structured" and "guidance", e.g. written by the master scripts); otherwise
+sections are synthesized from the chart with the vocabulary the post-processor
+rewrites.
+
+--compare REV runs the same inputs through post_processor.py (and
+_strip_disallowed_retrograde) from git revision REV, checks the outputs are
+identical and prints the speedup.
+
+Usage:
+    python scripts/benchmark_post_processor.py [--repeat 200] [--compare HEAD~1] [--responses DIR]
+"""
+import argparse
+import ast
+import json
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+APP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(APP_DIR))
+
+from src.ai import post_processor
+from src.api import prediction_routes
+
+CALCULATION_DATE = "2026-02-04T07:10:00"
+
+# Names prediction_routes imports from post_processor (swapped for --compare)
+PATCHED_NAMES = ("apply_anti_leak_sanitizer", "sanitize_structured_dict", "apply_dharma_graha_tone_to_section")
+
+
+def load_cases() -> List[Tuple[str, Dict[str, Any]]]:
+    """(case name, payload) from the master_test_case scripts, read without executing them."""
+    cases = []
+    for path in sorted((APP_DIR / "scripts").glob("master_test_case_*.py")):
+        for node in ast.parse(path.read_text(encoding="utf-8")).body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in ("PAYLOAD", "payload")
+            ):
+                cases.append((path.stem, ast.literal_eval(node.value)))
+                break
+    return cases
+
+
+def synthesize_sections(prepared: Dict[str, Any]) -> Dict[str, str]:
+    """LLM-style daily sections for a chart, using the phrases the post-processor rewrites."""
+    context = prepared["context"]
+    md = (context.get("time") or {}).get("mahadasha_lord") or "Saturn"
+    ad = (context.get("time") or {}).get("antardasha_lord") or "Venus"
+    name = prepared["seeker_name"]
+    transit_lines = []
+    for planet, data in (context.get("transit") or {}).items():
+        if isinstance(data, dict) and data.get("house"):
+            retro = " This retrograde motion asks for revisitation." if data.get("retrograde") else ""
+            transit_lines.append(
+                f"{planet} currently transits your {data['house']}th house, a dusthana for some matters; "
+                f"its bindu count shows structural support.{retro}"
+            )
+    return {
+        "greeting": f"{name}, on this Tritiya of the Shukla Paksha, the wheel of Time turns thus:",
+        "panchanga": "On this sacred day the Nakshatra invites introspection. Interpretation unavailable.",
+        "dasha": (
+            f"Under the influence of {md} Mahadasha and {ad} Antardasha, the lordship function of the period "
+            f"yields mixed results. As lord of the 10th, {md} shadbala is high; restrict expansion language."
+        ),
+        "chandra_bala": "The Moon is steady in a kendra. Do not initiate major ventures today.",
+        "tara_bala": "Tara is mild; the primary dosha of the day is haste.",
+        "major_transits": "\n".join(transit_lines) or "Jupiter currently transits a trikona.",
+        "dharmic_guidance": "Stay positive. Patience is a virtue. Believe in yourself. Do your duty. You've got this.",
+        "throne": "You were born under your birth star.",
+        "moon_movement": "",
+        "nirnaya": "Travel is fine. Work steadily. Be patient. Avoid anger.",
+        "shanti_parihara": "Offer water to the Sun at sunrise; combust planets amplify energy when honoured.",
+    }
+
+
+def load_revision(rev: str) -> types.SimpleNamespace:
+    """post_processor.py and _strip_disallowed_retrograde as of a git revision."""
+
+    def show(path: str) -> str:
+        return subprocess.run(
+            ["git", "show", f"{rev}:apps/guru-api/{path}"],
+            cwd=APP_DIR, check=True, capture_output=True, text=True,
+        ).stdout
+
+    module = types.ModuleType(f"post_processor_{rev}")
+    exec(compile(show("src/ai/post_processor.py"), module.__name__, "exec"), module.__dict__)
+    routes_source = show("src/api/prediction_routes.py")
+    retro = next(
+        node for node in ast.parse(routes_source).body
+        if isinstance(node, ast.FunctionDef) and node.name == "_strip_disallowed_retrograde"
+    )
+    namespace: Dict[str, Any] = {"List": List}
+    exec(compile(ast.Module([retro], type_ignores=[]), module.__name__, "exec"), namespace)
+    module._strip_disallowed_retrograde = namespace["_strip_disallowed_retrograde"]
+    return module
+
+
+def use_implementation(impl) -> None:
+    """Point prediction_routes at a post-processor implementation."""
+    for name in PATCHED_NAMES:
+        setattr(prediction_routes, name, getattr(impl, name))
+    prediction_routes._strip_disallowed_retrograde = impl._strip_disallowed_retrograde
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> Tuple[Any, float]:
+    """(result, mean microseconds per call)."""
+    result = fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return result, (time.perf_counter() - started) / repeat * 1e6
+
+
+def workloads(prepared: Dict[str, Any], sections: Dict[str, str], guidance: str) -> Dict[str, Callable[[Any], Any]]:
+    context = prepared["context"]
+    allowed = prepared["allowed_retrograde_set_out"] or {"Mercury"}
+    return {
+        "structured": lambda impl: prediction_routes._finalize_structured(prepared, dict(sections)),
+        "narrative": lambda impl: impl.validate_and_format_guidance(guidance, context),
+        "sanitizer": lambda impl: impl.apply_anti_leak_sanitizer(guidance),
+        "retrograde": lambda impl: impl._strip_disallowed_retrograde(guidance, allowed),
+    }
+
+
+def run(impl, prepared, sections, guidance, repeat) -> Dict[str, Tuple[Any, float]]:
+    use_implementation(impl)
+    try:
+        return {
+            name: timed(lambda: work(impl), repeat)
+            for name, work in workloads(prepared, sections, guidance).items()
+        }
+    finally:
+        use_implementation(current)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200, help="timed calls per workload")
+    parser.add_argument("--compare", metavar="REV", help="git revision to compare against")
+    parser.add_argument("--responses", metavar="DIR", help="saved /predict responses (<case>.json)")
+    args = parser.parse_args()
+
+    baseline = load_revision(args.compare) if args.compare else None
+    totals: Dict[str, List[float]] = {}
+    mismatches = 0
+    print(f"{'case':<40} {'workload':<11} {'current µs':>11}" + (f" {args.compare + ' µs':>14} {'speedup':>8}" if baseline else ""))
+    for case, payload in load_cases():
+        prepared = prediction_routes._prepare_prediction(
+            payload["birth_details"], "daily", payload.get("calculation_date", CALCULATION_DATE)
+        )
+        saved = Path(args.responses) / f"{case}.json" if args.responses else None
+        if saved and saved.exists():
+            response = json.loads(saved.read_text(encoding="utf-8"))
+            sections = response.get("structured") or synthesize_sections(prepared)
+            guidance = response.get("guidance") or prediction_routes._build_guidance_with_structure(sections)
+        else:
+            sections = synthesize_sections(prepared)
+            guidance = prediction_routes._build_guidance_with_structure(sections)
+
+        results = run(current, prepared, sections, guidance, args.repeat)
+        old_results = run(baseline, prepared, sections, guidance, args.repeat) if baseline else {}
+        for name, (output, micros) in results.items():
+            line = f"{case:<40} {name:<11} {micros:>11.1f}"
+            totals.setdefault(name, [0.0, 0.0])[0] += micros
+            if baseline:
+                old_output, old_micros = old_results[name]
+                same = json.dumps(output, sort_keys=True, default=str) == json.dumps(old_output, sort_keys=True, default=str)
+                mismatches += not same
+                totals[name][1] += old_micros
+                line += f" {old_micros:>14.1f} {old_micros / micros:>7.2f}x" + ("" if same else "  OUTPUT DIFFERS")
+            print(line)
+
+    print()
+    for name, (new_total, old_total) in totals.items():
+        summary = f"{'total':<40} {name:<11} {new_total:>11.1f}"
+        if baseline:
+            summary += f" {old_total:>14.1f} {old_total / new_total:>7.2f}x"
+        print(summary)
+    if mismatches:
+        print(f"\n{mismatches} outputs differ from {args.compare}")
+        return 1
+    return 0
+
+
+current = types.SimpleNamespace(
+    **{name: getattr(post_processor, name) for name in dir(post_processor) if not name.startswith("__")},
+    _strip_disallowed_retrograde=prediction_routes._strip_disallowed_retrograde,
+)
+
+if __name__ == "__main__":
+    sys.exit(main())
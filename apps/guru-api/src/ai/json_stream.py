@@ -0,0 +1,116 @@
+"""
+Incremental parser for a JSON object streamed in text chunks.
+
+The structured daily prompt asks the LLM for one JSON object of sections
+({"greeting": "...", "panchanga": "...", ...}). JsonObjectStream yields each
+top-level member as soon as its value is complete, so a section can be
+post-processed and sent to the client while the rest is still generating.
+"""
+
+import json
+from json.decoder import scanstring
+from typing import Any, List, Tuple
+
+_WHITESPACE = " \t\r\n"
+
+
+class JsonObjectStream:
+    """
+    Feed text chunks; get back (key, value) for each completed top-level member.
+
+    A leading markdown code fence (```json) is skipped. Anything else that is
+    not a JSON object sets failed; the caller should then rely on the full text.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._decoder = json.JSONDecoder()
+        self.failed = False
+
+    @property
+    def done(self) -> bool:
+        """The closing brace of the object was seen."""
+        return self._state == "end"
+
+    def _skip_whitespace(self, pos: int) -> int:
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of the streamed response.
+
+        Args:
+            text: Next chunk
+
+        Returns:
+            Members completed by this chunk, in order
+        """
+        self._buffer += text
+        buffer = self._buffer
+        members: List[Tuple[str, Any]] = []
+        pos = self._pos
+        while not self.failed and self._state != "end":
+            pos = self._skip_whitespace(pos)
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            state = self._state
+            if state == "start":
+                if char == "{":
+                    self._state = "first_key"
+                    pos += 1
+                elif char == "`":
+                    newline = buffer.find("\n", pos)
+                    if newline < 0:
+                        break
+                    pos = newline + 1
+                else:
+                    self.failed = True
+            elif state in ("first_key", "key"):
+                if char == "}" and state == "first_key":
+                    self._state = "end"
+                    pos += 1
+                elif char == '"':
+                    try:
+                        self._key, pos = scanstring(buffer, pos + 1)
+                    except json.JSONDecodeError:
+                        break  # key still arriving
+                    self._state = "colon"
+                else:
+                    self.failed = True
+            elif state == "colon":
+                if char == ":":
+                    self._state = "value"
+                    pos += 1
+                else:
+                    self.failed = True
+            elif state == "value":
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # value still arriving
+                # A number or literal may continue in the next chunk: wait for a delimiter
+                if not isinstance(value, (str, dict, list)) and self._skip_whitespace(end) >= len(buffer):
+                    break
+                members.append((self._key, value))
+                self._state = "separator"
+                pos = end
+            elif state == "separator":
+                if char == ",":
+                    self._state = "key"
+                    pos += 1
+                elif char == "}":
+                    self._state = "end"
+                    pos += 1
+                else:
+                    self.failed = True
+        # Drop the consumed prefix
+        self._buffer = buffer[pos:]
+        self._pos = 0
+        return members
@@ -0,0 +1,401 @@
+"""
+LLM Response Cache - content-addressed by the canonical Guru context.
+
+predict() sends the same multi-thousand-token prompt to the LLM whenever a
+user refreshes the same day/month/year. The response depends only on:
+
+- the timescale and the Guru context (with calculation_date reduced to the
+  period it falls in: YYYY-MM-DD, YYYY-MM or YYYY)
+- the prompt template version and the model
+
+so the cache key is a SHA-256 of those, serialized canonically (sorted keys,
+compact separators). Entries expire at the end of their period in the
+seeker's timezone.
+
+Backends are pluggable:
+- MemoryCacheBackend: per-process LRU
+- SQLiteCacheBackend: on-disk store shared by workers and restarts
+- LLMResponseCache(backends=[memory, sqlite]) reads through both tiers and
+  promotes disk hits to memory
+
+🔒 Only responses the caller accepts are stored (set() is explicit), so a
+failed or malformed generation is never replayed.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pytz
+
+from src.config import settings
+
+# Bump when the predict() prompts change so old responses are not replayed
+PREDICT_PROMPT_VERSION = "1"
+
+# Context fields that vary within a period without changing the prompt's meaning
+VOLATILE_CONTEXT_KEYS = ("calculation_date",)
+
+
+def period_label(timescale: str, calculation_date: datetime) -> str:
+    """Period a calculation date belongs to (YYYY-MM-DD daily, YYYY-MM monthly, YYYY yearly)."""
+    if timescale == "monthly":
+        return calculation_date.strftime("%Y-%m")
+    if timescale == "yearly":
+        return calculation_date.strftime("%Y")
+    return calculation_date.strftime("%Y-%m-%d")
+
+
+def period_end(timescale: str, calculation_date: datetime, timezone: str = "Asia/Kolkata") -> float:
+    """
+    End of the day/month/year containing a local calculation date.
+
+    Args:
+        timescale: daily, monthly or yearly
+        calculation_date: Naive local datetime
+        timezone: Seeker's timezone
+
+    Returns:
+        Unix timestamp of the next period boundary (local midnight)
+    """
+    start = calculation_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    if timescale == "monthly":
+        boundary = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+    elif timescale == "yearly":
+        boundary = start.replace(year=start.year + 1, month=1, day=1)
+    else:
+        boundary = start + timedelta(days=1)
+    return pytz.timezone(timezone).localize(boundary).timestamp()
+
+
+def canonical_context(context: Dict[str, Any], timescale: str, calculation_date: datetime) -> Dict[str, Any]:
+    """Context with volatile fields replaced by the calculation period."""
+    canonical = {k: v for k, v in context.items() if k not in VOLATILE_CONTEXT_KEYS}
+    canonical["_period"] = period_label(timescale, calculation_date)
+    return canonical
+
+
+def make_cache_key(
+    timescale: str,
+    context: Dict[str, Any],
+    model: str,
+    prompt_version: str = PREDICT_PROMPT_VERSION,
+    variant: str = "",
+) -> str:
+    """
+    Stable content hash of everything that determines an LLM response.
+
+    Args:
+        timescale: daily, monthly or yearly
+        context: Canonical context (see canonical_context)
+        model: Model name (mode-qualified, e.g. "openai:gpt-4o")
+        prompt_version: Prompt template version
+        variant: Prompt variant (e.g. "structured", "narrative")
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        {
+            "timescale": timescale,
+            "context": context,
+            "model": model,
+            "prompt_version": prompt_version,
+            "variant": variant,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage interface: string values with an absolute expiry (Unix time)."""
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        """(value, expires_at) of a live entry, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        """Store value until expires_at."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry (no-op if missing)."""
+
+    @abstractmethod
+    def purge_expired(self, now: float) -> int:
+        """Remove expired entries; returns how many."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Thread-safe in-process LRU.
+
+    Args:
+        max_entries: Maximum entries (least recently used evicted)
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def purge_expired(self, now: float) -> int:
+        with self._lock:
+            expired = [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk store (one SQLite file, WAL mode) shared across workers and restarts.
+
+    Args:
+        path: Database file (created if missing)
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_expires_at ON llm_cache (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread (sqlite3 connections are not shareable by default)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def purge_expired(self, now: float) -> int:
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+class LLMResponseCache:
+    """
+    Read-through cache over one or more backends (fastest first).
+
+    Args:
+        backends: Tiers to read in order; set() writes to all
+        enabled: False turns get() into a miss and set() into a no-op
+    """
+
+    def __init__(self, backends: Sequence[CacheBackend], enabled: bool = True):
+        if not backends:
+            raise ValueError("At least one cache backend is required")
+        self.backends: List[CacheBackend] = list(backends)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._tier_hits = {backend.name: 0 for backend in self.backends}
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response, or None (a hit in a slower tier is copied into the faster ones)."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        for index, backend in enumerate(self.backends):
+            try:
+                entry = backend.get(key, now)
+            except Exception as e:
+                print(f"Warning: LLM cache {backend.name} read failed: {e}")
+                continue
+            if entry is not None:
+                value, expires_at = entry
+                with self._lock:
+                    self._hits += 1
+                    self._tier_hits[backend.name] += 1
+                for faster in self.backends[:index]:
+                    faster.set(key, value, expires_at)
+                return value
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        """
+        Store a response in every tier until expires_at (Unix time).
+
+        Already-expired entries are ignored.
+        """
+        if not self.enabled or expires_at <= time.time():
+            return
+        for backend in self.backends:
+            try:
+                backend.set(key, value, expires_at)
+            except Exception as e:
+                print(f"Warning: LLM cache {backend.name} write failed: {e}")
+        with self._lock:
+            self._stores += 1
+
+    def purge_expired(self) -> int:
+        """Delete expired entries from every tier; returns the number removed."""
+        now = time.time()
+        return sum(backend.purge_expired(now) for backend in self.backends)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the metrics."""
+        for backend in self.backends:
+            backend.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._stores = 0
+            self._tier_hits = {backend.name: 0 for backend in self.backends}
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats = {
+                "enabled": self.enabled,
+                "backends": [backend.name for backend in self.backends],
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "tier_hits": dict(self._tier_hits),
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+        stats["entries"] = {backend.name: len(backend) for backend in self.backends}
+        return stats
+
+
+def build_llm_cache() -> LLMResponseCache:
+    """
+    LLMResponseCache from settings (LLM_CACHE_BACKEND: memory, sqlite or tiered).
+
+    Returns:
+        LLMResponseCache
+    """
+    kind = settings.llm_cache_backend.lower()
+    backends: List[CacheBackend] = []
+    if kind in ("memory", "tiered"):
+        backends.append(MemoryCacheBackend(settings.llm_cache_max_entries))
+    if kind in ("sqlite", "tiered"):
+        backends.append(SQLiteCacheBackend(settings.llm_cache_path))
+    if not backends:
+        raise ValueError(f"Unknown LLM_CACHE_BACKEND: {settings.llm_cache_backend}")
+    return LLMResponseCache(backends, enabled=settings.llm_cache_enabled)
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Process-wide LLMResponseCache (created on first use).
+
+    Returns:
+        LLMResponseCache
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = build_llm_cache()
+    return _llm_cache
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Hit/miss metrics of the global LLM response cache."""
+    return get_llm_cache().stats()
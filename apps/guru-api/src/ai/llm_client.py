@@ -3,12 +3,22 @@ LLM client for AI-powered astrological explanations.
 
 This module provides a unified interface to interact with either
 OpenAI API or local LLM services for generating astrological insights.
+
+LLMClient is synchronous (explanation helpers). AsyncLLMClient is the
+non-blocking client used by async routes: one per process, pooled HTTP
+connections, a concurrency cap, timeouts, cancellation and streaming.
 """
 
-from typing import Optional, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Dict, List
+import asyncio
+import json
 import os
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import httpx
 import requests
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.config import settings
 
@@ -113,3 +123,295 @@ class LLMClient:
 # Global LLM client instance
 llm_client = LLMClient()
 
+
+
+class _LoopResources:
+    """Per-event-loop state of AsyncLLMClient (asyncio/httpx objects are bound to one loop)."""
+
+    def __init__(self, client: "AsyncLLMClient"):
+        self.slots = asyncio.Semaphore(client.max_concurrency)
+        self.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(client.timeout, connect=settings.llm_connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections,
+            ),
+        )
+        self.openai = None
+        if client.mode == "openai":
+            self.openai = AsyncOpenAI(
+                api_key=client.openai_api_key,
+                timeout=client.timeout,
+                http_client=self.http,
+            )
+
+
+class AsyncLLMClient:
+    """
+    Non-blocking LLM client (OpenAI or local Ollama-style /api/generate).
+
+    - One instance per process (get_async_llm_client); HTTP connections are pooled
+    - At most max_concurrency generations run at once; the rest wait for a slot
+    - timeout bounds the wait for a slot plus the generation (for stream(),
+      the whole stream up to its last chunk)
+    - Cancelling the awaiting task (e.g. client disconnect) aborts the HTTP
+      request and frees the slot
+
+    Args:
+        openai_api_key: OpenAI key (default: settings.openai_api_key)
+        local_llm_url: Local LLM base URL (default: settings.local_llm_url)
+        max_concurrency: Concurrent generations (default: settings.llm_max_concurrency)
+        timeout: Seconds per call (default: settings.llm_timeout_seconds)
+    """
+
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        local_llm_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.openai_api_key = settings.openai_api_key if openai_api_key is None else openai_api_key
+        self.local_llm_url = settings.local_llm_url if local_llm_url is None else local_llm_url
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.timeout = timeout or settings.llm_timeout_seconds
+        if self.openai_api_key:
+            self.mode = "openai"
+        elif self.local_llm_url:
+            self.mode = "local"
+        else:
+            self.mode = "none"
+        self._resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources]" = weakref.WeakKeyDictionary()
+
+    def model_id(self, model: Optional[str] = None) -> str:
+        """Mode-qualified name of the model a call would use (e.g. for cache keys)."""
+        if self.mode == "openai":
+            return f"openai:{model or settings.openai_model}"
+        if self.mode == "local":
+            return f"local:{settings.local_llm_model}"
+        return "none"
+
+    def _loop_resources(self) -> _LoopResources:
+        loop = asyncio.get_running_loop()
+        resources = self._resources.get(loop)
+        if resources is None:
+            resources = self._resources[loop] = _LoopResources(self)
+        return resources
+
+    @asynccontextmanager
+    async def _slot(self):
+        resources = self._loop_resources()
+        async with resources.slots:
+            yield resources
+
+    def _local_payload(self, prompt: str, system: Optional[str], max_tokens: int, temperature: float,
+                       top_p: Optional[float], json_mode: bool, stream: bool) -> Dict:
+        options = {"temperature": temperature, "num_predict": max_tokens}
+        if top_p is not None:
+            options["top_p"] = top_p
+        payload = {
+            "model": settings.local_llm_model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": options,
+        }
+        if system:
+            payload["system"] = system
+        if json_mode:
+            payload["format"] = "json"
+        return payload
+
+    @staticmethod
+    def _openai_kwargs(prompt: str, system: Optional[str], max_tokens: int, temperature: float,
+                       top_p: Optional[float], json_mode: bool, model: Optional[str]) -> Dict:
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        kwargs = {
+            "model": model or settings.openai_model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if top_p is not None:
+            kwargs["top_p"] = top_p
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a full completion.
+
+        Args:
+            prompt: User prompt
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Optional nucleus sampling
+            json_mode: Ask for a JSON object response
+            model: OpenAI model (default: settings.openai_model; local mode uses settings.local_llm_model)
+
+        Returns:
+            Generated text
+
+        Raises:
+            RuntimeError: No LLM configured
+            TimeoutError: No slot or no response within timeout
+            httpx.HTTPError / openai.APIError: Transport or API failure
+        """
+        if self.mode == "none":
+            raise RuntimeError("No LLM configured. Set OPENAI_API_KEY or LOCAL_LLM_URL.")
+        async with asyncio.timeout(self.timeout):
+            async with self._slot() as resources:
+                if self.mode == "openai":
+                    response = await resources.openai.chat.completions.create(
+                        **self._openai_kwargs(prompt, system, max_tokens, temperature, top_p, json_mode, model)
+                    )
+                    return response.choices[0].message.content or ""
+                response = await resources.http.post(
+                    f"{self.local_llm_url}/api/generate",
+                    json=self._local_payload(prompt, system, max_tokens, temperature, top_p, json_mode, stream=False),
+                )
+                response.raise_for_status()
+                return response.json().get("response", "")
+
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a completion as text chunks (holds one slot until exhausted or closed).
+
+        Args:
+            prompt: User prompt
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Optional nucleus sampling
+            json_mode: Ask for a JSON object response
+            model: OpenAI model (default: settings.openai_model)
+
+        Yields:
+            Text chunks as they arrive
+
+        Raises:
+            RuntimeError: No LLM configured
+            TimeoutError: Stream not finished within timeout (slot wait included)
+        """
+        if self.mode == "none":
+            raise RuntimeError("No LLM configured. Set OPENAI_API_KEY or LOCAL_LLM_URL.")
+        deadline = asyncio.get_running_loop().time() + self.timeout
+        async with AsyncExitStack() as stack:
+            # Deadline scopes never span a yield: a cancellation must not land in the consumer
+            async with asyncio.timeout_at(deadline):
+                resources = await stack.enter_async_context(self._slot())
+                if self.mode == "openai":
+                    source = await resources.openai.chat.completions.create(
+                        stream=True,
+                        **self._openai_kwargs(prompt, system, max_tokens, temperature, top_p, json_mode, model),
+                    )
+                else:
+                    response = await stack.enter_async_context(resources.http.stream(
+                        "POST",
+                        f"{self.local_llm_url}/api/generate",
+                        json=self._local_payload(prompt, system, max_tokens, temperature, top_p, json_mode, stream=True),
+                    ))
+                    response.raise_for_status()
+                    source = response.aiter_lines()
+            async for item in _iterate_until(deadline, source):
+                if self.mode == "openai":
+                    delta = item.choices[0].delta.content if item.choices else None
+                    if delta:
+                        yield delta
+                    continue
+                if not item.strip():
+                    continue
+                data = json.loads(item)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    return
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the current event loop."""
+        resources = self._resources.pop(asyncio.get_running_loop(), None)
+        if resources is not None:
+            await resources.http.aclose()
+
+
+async def _iterate_until(deadline: float, iterable) -> AsyncIterator[Any]:
+    """Items of an async iterable; TimeoutError once the loop time passes deadline."""
+    iterator = aiter(iterable)
+    while True:
+        async with asyncio.timeout_at(deadline):
+            try:
+                item = await anext(iterator)
+            except StopAsyncIteration:
+                return
+        yield item
+
+
+_async_llm_client: Optional[AsyncLLMClient] = None
+
+
+def get_async_llm_client() -> AsyncLLMClient:
+    """
+    Process-wide AsyncLLMClient (created on first use).
+
+    Returns:
+        AsyncLLMClient
+    """
+    global _async_llm_client
+    if _async_llm_client is None:
+        _async_llm_client = AsyncLLMClient()
+    return _async_llm_client
+
+
+async def run_until_disconnected(
+    awaitable: Awaitable[Any],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = 0.5,
+) -> Any:
+    """
+    Await a coroutine, cancelling it if the HTTP client goes away.
+
+    Args:
+        awaitable: Work to run (e.g. an LLM-backed prediction)
+        is_disconnected: Async check, e.g. starlette Request.is_disconnected
+        poll_interval: Seconds between disconnect checks
+
+    Returns:
+        The awaitable's result
+
+    Raises:
+        asyncio.CancelledError: The client disconnected (the work was cancelled)
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await is_disconnected():
+                task.cancel()
+                raise asyncio.CancelledError("client disconnected")
+    finally:
+        if not task.done():
+            task.cancel()
@@ -1,6 +1,9 @@
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
+from src.ai.rewrite_engine import RewriteTable
+
 # Nakshatra span: 13°20' = 360/27 degrees
 NAKSHATRA_SPAN = 360.0 / 27.0
 
@@ -55,9 +58,13 @@ def split_sections(guidance: str) -> Tuple[str, str]:
     return "\n".join(decl_lines), "\n".join(body_lines).strip()
 
 
+_HORIZONTAL_SPACE_RE = re.compile(r"[ \t]+")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
 def normalize_whitespace(text: str) -> str:
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _HORIZONTAL_SPACE_RE.sub(" ", text)
+    text = _EXTRA_BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -93,6 +100,7 @@ DOCTRINAL_LEAK_PATTERNS = [
     (r"\bencourages introspection\b", "favors reflection"),
     (r"\bcalls for introspection\b", "favors reflection"),
 ]
+_ANTI_LEAK_TABLE = RewriteTable(DOCTRINAL_LEAK_PATTERNS, re.IGNORECASE)
 
 
 def apply_anti_leak_sanitizer(text: str) -> str:
@@ -102,10 +110,7 @@ def apply_anti_leak_sanitizer(text: str) -> str:
     """
     if not text or not text.strip():
         return text
-    result = text
-    for pattern, replacement in DOCTRINAL_LEAK_PATTERNS:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-    return result
+    return _ANTI_LEAK_TABLE.apply(text)
 
 
 def sanitize_structured_dict(structured: Dict[str, Any]) -> Dict[str, Any]:
@@ -317,48 +322,56 @@ def _apply_tara_override(body: str, context: Dict[str, Any]) -> str:
     return normalize_whitespace(body)
 
 
-def _enforce_chandra_bala(body: str, context: Dict[str, Any]) -> str:
-    """Chandra Bala authority lock: If Moon in 8th from natal Moon, mandatory exact sentence. No variation."""
+def _chandra_bala_paragraphs(paragraphs: List[str], context: Dict[str, Any]) -> List[str]:
+    """_enforce_chandra_bala on a body already split into paragraphs (modified in place)."""
     transit = context.get("transit") or {}
     moon_data = transit.get("Moon")
     if not isinstance(moon_data, dict):
-        return body
+        return paragraphs
     house_from_moon = moon_data.get("house_from_moon")
     if house_from_moon != 8:
-        return body
-    if CHANDRA_MANDATORY.lower() in body.lower():
-        return body
-    paragraphs = body.split("\n\n")
-    for i, p in enumerate(paragraphs):
-        if "mahadasha" in p.lower() or "antardasha" in p.lower():
+        return paragraphs
+    mandatory = CHANDRA_MANDATORY.lower()
+    lowered = [p.lower() for p in paragraphs]
+    # The sentence has no blank line, so it is present iff one paragraph contains it
+    if any(mandatory in lower for lower in lowered):
+        return paragraphs
+    for i, lower in enumerate(lowered):
+        if "mahadasha" in lower or "antardasha" in lower:
             paragraphs.insert(i, CHANDRA_MANDATORY)
             break
-        if "on this sacred" in p.lower():
+        if "on this sacred" in lower:
             paragraphs.insert(i + 1, CHANDRA_MANDATORY)
             break
     else:
         paragraphs.insert(0, CHANDRA_MANDATORY)
-    return "\n\n".join(paragraphs)
+    return paragraphs
+
+
+def _enforce_chandra_bala(body: str, context: Dict[str, Any]) -> str:
+    """Chandra Bala authority lock: If Moon in 8th from natal Moon, mandatory exact sentence. No variation."""
+    return "\n\n".join(_chandra_bala_paragraphs(body.split("\n\n"), context))
+
+
+# Avastha modifier → canonical sentence; the optional trailing period is matched to avoid a double period
+_AVASTHA_TABLE = RewriteTable(
+    [
+        (rf"(\b(Sun|Moon|Mars|Mercury|Jupiter|Venus|Saturn))\s+{re.escape(raw)}\.?", rf"\1. {canonical}")
+        for raw, canonical in [
+            ("strength amplified", "Strength amplified."),
+            ("expression restrained", "Expression restrained."),
+            ("results manifest externally", "Results manifest externally."),
+            ("results fluctuate", "Results fluctuate."),
+            ("results internalized", "Results internalized."),
+        ]
+    ],
+    re.IGNORECASE,
+)
 
 
 def _fix_avastha_grammar(body: str) -> str:
     """Canonical grammar: 'Planet modifier' → 'Planet. Modifier' (complete sentences)."""
-    planets = r"(Sun|Moon|Mars|Mercury|Jupiter|Venus|Saturn)"
-    for raw, canonical in [
-        ("strength amplified", "Strength amplified."),
-        ("expression restrained", "Expression restrained."),
-        ("results manifest externally", "Results manifest externally."),
-        ("results fluctuate", "Results fluctuate."),
-        ("results internalized", "Results internalized."),
-    ]:
-        # Match optional trailing period to avoid double period
-        body = re.sub(
-            rf"(\b{planets})\s+{re.escape(raw)}\.?",
-            rf"\1. {canonical}",
-            body,
-            flags=re.IGNORECASE,
-        )
-    return body
+    return _AVASTHA_TABLE.apply(body)
 
 
 # Dharma tone: one contextual line per dominant graha (Mahadasha lord)
@@ -417,16 +430,24 @@ def _replace_dharma_paragraphs_in_body(body: str, context: Dict[str, Any]) -> st
     """
     if not body or not body.strip():
         return body
-    paragraphs = [p.strip() for p in body.split("\n\n") if p.strip()]
-    if not paragraphs:
-        return body
+    return "\n\n".join(_dharma_paragraphs(body.split("\n\n"), context))
+
+
+_DHARMA_PARAGRAPH_START_RE = re.compile(r"Do\s|Don'?t\s")
+
+
+def _dharma_paragraphs(paragraphs: List[str], context: Dict[str, Any]) -> List[str]:
+    """_replace_dharma_paragraphs_in_body on a body (not blank) already split into paragraphs."""
     canonical = _enforce_dharma_authority("", context)
     result = []
     dharmas_replaced = False
     for p in paragraphs:
+        p = p.strip()
+        if not p:
+            continue
         lower = p.lower()
         is_dharma = (
-            re.match(r"^Do\s", p) or re.match(r"^Don'?t\s", p)
+            _DHARMA_PARAGRAPH_START_RE.match(p)
             or lower.startswith("remember")
             or "patience" in lower
             or "classical maxim" in lower
@@ -438,7 +459,28 @@ def _replace_dharma_paragraphs_in_body(body: str, context: Dict[str, Any]) -> st
                 dharmas_replaced = True
         else:
             result.append(p)
-    return "\n\n".join(result) if result else body
+    return result
+
+
+# Generic proverbs and motivational filler (replaced with the graha line)
+_DHARMA_PROVERB_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"Patience is a virtue\.?",
+        r"Patience is the key to joy\.?",
+        r"Patience is the companion of wisdom\.?",
+        r"\bRemember,?\s+[^.]*\.",
+        r"The Gita advises:?\s*[^.]*\.",
+    ]
+]
+# Filler with fixed classical alternatives
+_DHARMA_FILLER_TABLE = RewriteTable(
+    [
+        (r"Do focus on\s+[^.]*\.", "Act after reflection."),
+        (r"Do not engage in\s+[^.]*\.", "Avoid haste."),
+    ],
+    re.IGNORECASE,
+)
 
 
 def _apply_dharma_graha_tone(body: str, context: Dict[str, Any]) -> str:
@@ -446,19 +488,9 @@ def _apply_dharma_graha_tone(body: str, context: Dict[str, Any]) -> str:
     time_block = context.get("time") or {}
     mahadasha = (time_block.get("mahadasha_lord") or "").strip()
     repl_line = DHARMA_GRAHA_LINES.get(mahadasha, "Restraint preserves power.")
-    # Remove generic phrases; replace with graha-based line
-    for pat in [
-        r"Patience is a virtue\.?",
-        r"Patience is the key to joy\.?",
-        r"Patience is the companion of wisdom\.?",
-    ]:
-        body = re.sub(pat, repl_line, body, flags=re.IGNORECASE)
-    # Strip motivational filler; replace with classical alternatives
-    body = re.sub(r"\bRemember,?\s+[^.]*\.", repl_line, body, flags=re.IGNORECASE)
-    body = re.sub(r"The Gita advises:?\s*[^.]*\.", repl_line, body, flags=re.IGNORECASE)
-    body = re.sub(r"Do focus on\s+[^.]*\.", "Act after reflection.", body, flags=re.IGNORECASE)
-    body = re.sub(r"Do not engage in\s+[^.]*\.", "Avoid haste.", body, flags=re.IGNORECASE)
-    return body
+    for proverb in _DHARMA_PROVERB_RES:
+        body = proverb.sub(repl_line, body)
+    return _DHARMA_FILLER_TABLE.apply(body)
 
 
 # GuruSuite doctrine: forbidden generic phrases in dharmic_guidance
@@ -472,16 +504,15 @@ DHARMIC_FLUFF_PATTERNS = [
     (r"\bBelieve in yourself\.?\s*", ""),
     (r"\bYou've got this\.?\s*", ""),
 ]
+_DHARMIC_FLUFF_TABLE = RewriteTable(DHARMIC_FLUFF_PATTERNS, re.IGNORECASE)
 
 
 def strip_dharmic_fluff(text: str) -> str:
     """Remove generic motivational fluff from dharmic_guidance. GuruSuite doctrine."""
     if not text or not text.strip():
         return text
-    result = text
-    for pat, repl in DHARMIC_FLUFF_PATTERNS:
-        result = re.sub(pat, repl, result, flags=re.IGNORECASE)
-    return re.sub(r"\n{3,}", "\n\n", result).strip()
+    result = _DHARMIC_FLUFF_TABLE.apply(text)
+    return _EXTRA_BLANK_LINES_RE.sub("\n\n", result).strip()
 
 
 def apply_dharma_graha_tone_to_section(text: str, context: Dict[str, Any]) -> str:
@@ -493,20 +524,21 @@ def apply_dharma_graha_tone_to_section(text: str, context: Dict[str, Any]) -> st
     return strip_dharmic_fluff(out)
 
 
+MAHABHARATA_CADENCE_PATTERNS = [
+    (r"Focus on clear communication\.\s*Don't rush into new partnerships\.", "Guard your speech. Act after reflection, not impulse."),
+    (r"Avoid taking unnecessary risks\.", "Step carefully where destiny tests resolve."),
+    # Dasha openings: Rahu/Ketu first (specific), then Mercury+Venus, then generic
+    (r"Under the influence of Rahu Mahadasha[^.]*\.", "In this Rahu Mahadasha, destiny accelerates through desire and ambition."),
+    (r"Under the influence of Ketu Mahadasha[^.]*\.", "In this Ketu Mahadasha, destiny withdraws through detachment and inner severance."),
+    (r"Under the influence of Mercury Mahadasha and Venus Antardasha[^.]*\.", "In this period of Mercury Mahadasha and Venus Antardasha, the current of destiny flows through intellect and relationship."),
+    (r"Under the influence of (\w+) Mahadasha and (\w+) Antardasha[^.]*\.", r"In this period of \1 Mahadasha and \2 Antardasha, the current of destiny flows through the planetary influences of this period."),
+]
+_MAHABHARATA_CADENCE_TABLE = RewriteTable(MAHABHARATA_CADENCE_PATTERNS, re.IGNORECASE)
+
+
 def _apply_mahabharata_cadence(body: str, context: Dict[str, Any]) -> str:
     """Classical gravity. Ancient Daiva-Jña tone. No drama, no motivation."""
-    replacements = [
-        (r"Focus on clear communication\.\s*Don't rush into new partnerships\.", "Guard your speech. Act after reflection, not impulse."),
-        (r"Avoid taking unnecessary risks\.", "Step carefully where destiny tests resolve."),
-        # Dasha openings: Rahu/Ketu first (specific), then Mercury+Venus, then generic
-        (r"Under the influence of Rahu Mahadasha[^.]*\.", "In this Rahu Mahadasha, destiny accelerates through desire and ambition."),
-        (r"Under the influence of Ketu Mahadasha[^.]*\.", "In this Ketu Mahadasha, destiny withdraws through detachment and inner severance."),
-        (r"Under the influence of Mercury Mahadasha and Venus Antardasha[^.]*\.", "In this period of Mercury Mahadasha and Venus Antardasha, the current of destiny flows through intellect and relationship."),
-        (r"Under the influence of (\w+) Mahadasha and (\w+) Antardasha[^.]*\.", r"In this period of \1 Mahadasha and \2 Antardasha, the current of destiny flows through the planetary influences of this period."),
-    ]
-    for pat, repl in replacements:
-        body = re.sub(pat, repl, body, flags=re.IGNORECASE)
-    return body
+    return _MAHABHARATA_CADENCE_TABLE.apply(body)
 
 
 def _apply_rahu_ketu_dasha_authority(body: str, context: Dict[str, Any]) -> str:
@@ -529,13 +561,15 @@ def _apply_rahu_ketu_dasha_authority(body: str, context: Dict[str, Any]) -> str:
     return body
 
 
+FLUFF_TONE = re.compile(
+    r"\b(amazing|fantastic|incredible|life.?changing|great opportunity|positive vibes|fear not|do not fear|terrible|disaster|catastrophe)\b",
+    re.IGNORECASE,
+)
+
+
 def _strip_fluff_tone(body: str, context: Dict[str, Any]) -> str:
     """No motivational fluff, no exaggerated positivity, no fear-mongering. Balanced classical tone."""
-    fluff = re.compile(
-        r"\b(amazing|fantastic|incredible|life.?changing|great opportunity|positive vibes|fear not|do not fear|terrible|disaster|catastrophe)\b",
-        re.IGNORECASE,
-    )
-    body = fluff.sub("", body)
+    body = FLUFF_TONE.sub("", body)
     time_block = context.get("time") or {}
     md = (time_block.get("mahadasha_lord") or "").strip()
     if md in MALEFIC_MAHADASHA:
@@ -543,23 +577,26 @@ def _strip_fluff_tone(body: str, context: Dict[str, Any]) -> str:
     return normalize_whitespace(body)
 
 
+@lru_cache(maxsize=32)
+def _weak_statement_re(planet: str) -> "re.Pattern":
+    """Span from a planet name to the end of a sentence calling it weak."""
+    return re.compile(rf"{re.escape(planet)}.*weak.*?\.", re.IGNORECASE | re.DOTALL)
+
+
 def validate_shadbala_usage(body: str, context: Dict[str, Any]) -> str:
     """
     Ensure strength statements align with actual Shadbala ranking.
     If planet marked weak in text but strong in context → remove that sentence.
     """
     strength = context.get("strength", {}) or {}
+    if "weak" not in body.lower():
+        return body
     for planet, pdata in strength.items():
         if isinstance(pdata, dict):
             virupas = pdata.get("virupas", 0)
             if virupas >= 450:
                 # Remove sentences that explicitly call this planet "weak"
-                body = re.sub(
-                    rf"{re.escape(planet)}.*weak.*?\.",
-                    "",
-                    body,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
+                body = _weak_statement_re(planet).sub("", body)
     return body
 
 
@@ -605,8 +642,11 @@ def validate_and_format_guidance(guidance: str, context: Dict[str, Any]) -> str:
     body = validate_shadbala_usage(body, context)
     body = _fix_avastha_grammar(body)
     body = _apply_tara_override(body, context)
-    body = _replace_dharma_paragraphs_in_body(body, context)  # ULTRA-TIGHT: after Tara, before Throne
-    body = _enforce_chandra_bala(body, context)
+    # Paragraph passes share one split: dharma replacement (ULTRA-TIGHT: after Tara, before Throne), Chandra Bala
+    paragraphs = body.split("\n\n")
+    if body.strip():
+        paragraphs = _dharma_paragraphs(paragraphs, context)
+    body = "\n\n".join(_chandra_bala_paragraphs(paragraphs, context))
     body = _apply_rahu_ketu_dasha_authority(body, context)
     body = _apply_mahabharata_cadence(body, context)
     body = enforce_throne_activation(body, context)
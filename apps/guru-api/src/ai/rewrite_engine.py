@@ -0,0 +1,153 @@
+"""
+Compiled rewrite tables for LLM guidance text.
+
+The post-processor rewrites guidance with ordered (pattern, replacement)
+tables. Applying them with re.sub compiles (or looks up) every pattern per
+call and scans the whole text once per rule, although a typical guidance
+text triggers only a handful of rules.
+
+RewriteTable compiles each rule once at import and extracts the longest
+literal every match must contain (its keyword, e.g. "dusthana" for
+r"\\bdusthana\\b"). apply() case-folds the text once and runs only the rules
+whose keyword occurs in it; a plain substring test is far cheaper than a
+regex scan, especially a case-insensitive one. The text is re-folded after a
+rule changes it, so the result is identical to sequential re.sub.
+"""
+
+import re
+from typing import List, Optional, Sequence, Tuple
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters but str.lower() does not map
+_IGNORECASE_FOLD = (("İ", "i"), ("ı", "i"), ("ſ", "s"))
+
+
+def _fold(text: str) -> str:
+    """Lowercase text so that an ASCII keyword occurs in it iff re.IGNORECASE would find it."""
+    if not text.isascii():
+        for char, ascii_char in _IGNORECASE_FOLD:
+            if char in text:
+                text = text.replace(char, ascii_char)
+    return text.lower()
+
+
+def required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest literal substring every match of a pattern contains.
+
+    Conservative: groups, character classes and escapes such as \\b or \\s end a
+    literal run, a quantified character is dropped, and a pattern with an
+    alternation has no keyword.
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        The literal, or None when none can be derived
+    """
+    runs: List[str] = []
+    current = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if escaped.isalnum():
+                # \b, \s, \w, \1 ...: not a literal character
+                runs.append(current)
+                current = ""
+            else:
+                current += escaped
+            i += 2
+            continue
+        if char == "|":
+            return None
+        if char in "?*{":
+            # The preceding character is optional
+            runs.append(current[:-1])
+            current = ""
+            if char == "{":
+                i = pattern.index("}", i)
+        elif char == "+":
+            runs.append(current)
+            current = ""
+        elif char in "([":
+            runs.append(current)
+            current = ""
+            i = _skip_bracket(pattern, i)
+            continue
+        elif char in ".^$)]":
+            runs.append(current)
+            current = ""
+        else:
+            current += char
+        i += 1
+    runs.append(current)
+    longest = max(runs, key=len)
+    return longest or None
+
+
+def _skip_bracket(pattern: str, start: int) -> int:
+    """Index after the group or character class opening at start."""
+    opening = pattern[start]
+    closing = ")" if opening == "(" else "]"
+    depth = 0
+    i = start
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if opening == "(" and char == "[":
+            i = _skip_bracket(pattern, i)
+            continue
+        if char == opening and (opening == "(" or i == start):
+            depth += 1
+        elif char == closing and (opening == "(" or i > start + 1):
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError(f"Unbalanced {opening!r} in pattern: {pattern}")
+
+
+class RewriteTable:
+    """
+    Ordered rewrite rules compiled once and screened by keyword.
+
+    Args:
+        rules: (pattern, replacement) pairs, applied in order like re.sub
+        flags: re flags for every rule (e.g. re.IGNORECASE)
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], flags: int = 0):
+        self.rules: List[Tuple[str, str]] = list(rules)
+        self.flags = flags
+        self._ignorecase = bool(flags & re.IGNORECASE)
+        self._compiled = []
+        for pattern, replacement in self.rules:
+            keyword = required_literal(pattern)
+            if keyword is not None and self._ignorecase:
+                # Case folding of ASCII is exact; other scripts have re-specific case rules
+                keyword = _fold(keyword) if keyword.isascii() else None
+            self._compiled.append((re.compile(pattern, flags), replacement, keyword))
+
+    def apply(self, text: str) -> str:
+        """
+        Rewrite text; same result as re.sub with each rule in order.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Rewritten text
+        """
+        if not text:
+            return text
+        haystack = _fold(text) if self._ignorecase else text
+        for regex, replacement, keyword in self._compiled:
+            if keyword is not None and keyword not in haystack:
+                continue
+            text, count = regex.subn(replacement, text)
+            if count:
+                haystack = _fold(text) if self._ignorecase else text
+        return text
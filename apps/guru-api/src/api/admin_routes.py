@@ -13,6 +13,9 @@ from src.db.database import get_db
 from src.db.models import User, Notification
 from src.notifications.notification_engine import run_daily_notifications
 from src.notifications.scheduler import get_scheduler_status
+from src.jyotish.panchanga.panchanga_cache import get_panchanga_cache_stats
+from src.ai.llm_cache import get_llm_cache_stats
+from src.compute.executor import get_compute_stats
 from src.auth.middleware import get_current_user
 
 router = APIRouter()
@@ -82,6 +85,63 @@ async def get_scheduler_status_endpoint(
     return status
 
 
+@router.get("/panchanga-cache-stats")
+async def get_panchanga_cache_stats_endpoint(
+    current_user = Depends(get_current_user)
+):
+    """
+    Get daily Panchanga cache metrics (entries, hits, misses, evictions).
+    
+    Args:
+        current_user: Current authenticated user (must be admin/premium)
+    
+    Returns:
+        Panchanga cache statistics
+    """
+    if current_user.subscription_level not in ["premium", "lifetime"]:
+        raise HTTPException(status_code=403, detail="Premium access required")
+    
+    return get_panchanga_cache_stats()
+
+
+@router.get("/llm-cache-stats")
+async def get_llm_cache_stats_endpoint(
+    current_user = Depends(get_current_user)
+):
+    """
+    Get LLM response cache metrics (hits, misses, stores, entries per backend).
+    
+    Args:
+        current_user: Current authenticated user (must be admin/premium)
+    
+    Returns:
+        LLM response cache statistics
+    """
+    if current_user.subscription_level not in ["premium", "lifetime"]:
+        raise HTTPException(status_code=403, detail="Premium access required")
+    
+    return get_llm_cache_stats()
+
+
+@router.get("/compute-stats")
+async def get_compute_stats_endpoint(
+    current_user = Depends(get_current_user)
+):
+    """
+    Get compute executor metrics (pending tasks, queue depth, timeouts, rejections, latency).
+    
+    Args:
+        current_user: Current authenticated user (must be admin/premium)
+    
+    Returns:
+        Compute executor statistics
+    """
+    if current_user.subscription_level not in ["premium", "lifetime"]:
+        raise HTTPException(status_code=403, detail="Premium access required")
+    
+    return get_compute_stats()
+
+
 @router.get("/notifications-stats")
 async def get_notifications_stats(
     current_user = Depends(get_current_user),
@@ -14,6 +14,7 @@ from src.db.models import User, LoginLog
 from src.auth.auth_utils import hash_password, verify_password
 from src.auth.jwt_handler import create_token, get_user_from_token
 from src.auth.middleware import get_current_user
+from src.notifications.preferences.user_prefs import get_prefs
 
 router = APIRouter()
 security = HTTPBearer()
@@ -73,6 +74,9 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_user)
     
+    # Default notification preferences (puts the user on the delivery schedule)
+    get_prefs(new_user.id, db)
+    
     return {
         "message": "User created successfully",
         "user_id": new_user.id,
@@ -97,6 +97,8 @@ async def get_astro_events(
         
         # Build context and detect events
         context = build_full_context(birth_data)
+        # Persist the natal chart if it was stale and recomputed
+        db.commit()
         events = context.get("events", {})
         
         return {
@@ -146,6 +148,8 @@ async def get_bad_events(
             raise HTTPException(status_code=400, detail="Birth data not found")
         
         context = build_full_context(birth_data)
+        # Persist the natal chart if it was stale and recomputed
+        db.commit()
         events = context.get("events", {})
         
         return {
@@ -184,6 +188,8 @@ async def get_good_events(
             raise HTTPException(status_code=400, detail="Birth data not found")
         
         context = build_full_context(birth_data)
+        # Persist the natal chart if it was stale and recomputed
+        db.commit()
         events = context.get("events", {})
         
         return {
@@ -10,14 +10,18 @@ from typing import Optional, Dict, List
 from datetime import datetime
 import math
 import os
-import logging
 import swisseph as swe
 
 from src.db.schemas import KundliRequest
 from src.db.database import SessionLocal
 from src.db.models import BirthDetail
+from src.jyotish.natal_store import get_stored_kundli_response, store_kundli_response
 from src.jyotish.kundli import calculate_kundli
 from src.jyotish.kundli_engine import generate_kundli
+from src.ephemeris.snapshot import build_ephemeris_snapshot
+from src.compute.executor import ComputeError, compute
+from src.api.responses import FastJSONResponse
+from src.utils.log import get_logger, trace, tracing
 # DEPRECATED: Direct varga imports removed - use varga_engine.py instead
 # from src.jyotish.varga import calculate_navamsa, calculate_dasamsa, varga_degree
 # All varga calculations now go through varga_engine.py (single source of truth)
@@ -45,6 +49,7 @@ from src.jyotish.strength.planet_functional_strength import (
 )
 
 router = APIRouter()
+logger = get_logger("kundli")
 
 
 # ⚠️ GRAHA DRISHTI HELPER — PARĀŚARI RULES ONLY (MODULE LEVEL)
@@ -306,9 +311,9 @@ async def get_navamsa(request: KundliRequest):
     try:
         # Use authoritative varga engine - single source of truth
         from src.jyotish.varga_engine import build_varga_chart
-        from src.jyotish.kundli_engine import generate_kundli
+        from src.jyotish.kundli_engine import generate_kundli, get_house_lord_from_sign
         from src.utils.timezone import local_to_utc
-        from src.utils.converters import get_sign_name_sanskrit
+        from src.utils.converters import get_sign_name, get_sign_name_sanskrit
         import swisseph as swe
         from datetime import datetime
         
@@ -323,23 +328,16 @@ async def get_navamsa(request: KundliRequest):
             swe.GREG_CAL
         )
         
+        # One ephemeris pass for the D1 kundli and the varga inputs
+        snapshot = build_ephemeris_snapshot(jd, request.birth_latitude, request.birth_longitude)
+        
         # Generate D1 kundli
-        base_kundli = generate_kundli(jd, request.birth_latitude, request.birth_longitude)
+        base_kundli = generate_kundli(jd, request.birth_latitude, request.birth_longitude, snapshot=snapshot)
         
         # 🔒 CRITICAL: Use RAW unrounded sidereal longitudes for varga calculations
         # DO NOT use rounded degrees from D1 output - rounding causes varga mismatches
-        from src.ephemeris.planets_jhora_exact import calculate_ascendant_jhora_exact, calculate_all_planets_jhora_exact
-        
-        # Get RAW ascendant longitude (unrounded, exact sidereal)
-        asc_jhora_raw = calculate_ascendant_jhora_exact(jd, lat, lon)
-        d1_ascendant = asc_jhora_raw["longitude"]  # Raw unrounded sidereal longitude
-        
-        # Get RAW planet longitudes (unrounded, exact sidereal)
-        planets_jhora_raw = calculate_all_planets_jhora_exact(jd)
-        d1_planets = {
-            planet_name: planet_data["longitude"]  # Raw unrounded sidereal longitude
-            for planet_name, planet_data in planets_jhora_raw.items()
-        }
+        d1_ascendant = snapshot.ascendant_longitude  # Raw unrounded sidereal longitude
+        d1_planets = snapshot.planet_longitudes  # Raw unrounded sidereal longitudes
         
         # Build D9 chart using authoritative engine
         d9_chart = build_varga_chart(d1_planets, d1_ascendant, 9)
@@ -404,9 +402,9 @@ async def get_dasamsa(request: KundliRequest):
     try:
         # Use authoritative varga engine - single source of truth
         from src.jyotish.varga_engine import build_varga_chart
-        from src.jyotish.kundli_engine import generate_kundli
+        from src.jyotish.kundli_engine import generate_kundli, get_house_lord_from_sign
         from src.utils.timezone import local_to_utc
-        from src.utils.converters import get_sign_name_sanskrit
+        from src.utils.converters import get_sign_name, get_sign_name_sanskrit
         import swisseph as swe
         from datetime import datetime
         
@@ -421,23 +419,16 @@ async def get_dasamsa(request: KundliRequest):
             swe.GREG_CAL
         )
         
+        # One ephemeris pass for the D1 kundli and the varga inputs
+        snapshot = build_ephemeris_snapshot(jd, request.birth_latitude, request.birth_longitude)
+        
         # Generate D1 kundli
-        base_kundli = generate_kundli(jd, request.birth_latitude, request.birth_longitude)
+        base_kundli = generate_kundli(jd, request.birth_latitude, request.birth_longitude, snapshot=snapshot)
         
         # 🔒 CRITICAL: Use RAW unrounded sidereal longitudes for varga calculations
         # DO NOT use rounded degrees from D1 output - rounding causes varga mismatches
-        from src.ephemeris.planets_jhora_exact import calculate_ascendant_jhora_exact, calculate_all_planets_jhora_exact
-        
-        # Get RAW ascendant longitude (unrounded, exact sidereal)
-        asc_jhora_raw = calculate_ascendant_jhora_exact(jd, lat, lon)
-        d1_ascendant = asc_jhora_raw["longitude"]  # Raw unrounded sidereal longitude
-        
-        # Get RAW planet longitudes (unrounded, exact sidereal)
-        planets_jhora_raw = calculate_all_planets_jhora_exact(jd)
-        d1_planets = {
-            planet_name: planet_data["longitude"]  # Raw unrounded sidereal longitude
-            for planet_name, planet_data in planets_jhora_raw.items()
-        }
+        d1_ascendant = snapshot.ascendant_longitude  # Raw unrounded sidereal longitude
+        d1_planets = snapshot.planet_longitudes  # Raw unrounded sidereal longitudes
         
         # Build D10 chart using authoritative engine (with verified Prokerala/JHora logic)
         d10_chart = build_varga_chart(d1_planets, d1_ascendant, 10)
@@ -483,7 +474,748 @@ async def get_dasamsa(request: KundliRequest):
         raise HTTPException(status_code=500, detail=f"Error calculating dasamsa: {str(e)}")
 
 
-@router.get("/kundli")
+def _current_dasha_info(birth_date, hour: int, minute: int, second: int, lat: float, lon: float,
+                        timezone: str, snapshot=None) -> Optional[Dict]:
+    """
+    Current Mahadasha/Antardasha summary for the dashboard (None if it cannot be calculated).
+    """
+    current_dasha_info = None
+    try:
+        from src.jyotish.dasha_drik import calculate_vimshottari_dasha_drik
+        from datetime import datetime as dt
+        time_str = f"{hour:02d}:{minute:02d}" + (f":{second:02d}" if second > 0 else "")
+        dasha_data = calculate_vimshottari_dasha_drik(
+            birth_date, time_str, lat, lon, timezone, dt.now(), snapshot=snapshot
+        )
+        # Extract current dasha
+        current_mahadasha = dasha_data.get("current_mahadasha", {})
+        current_antardasha = dasha_data.get("current_antardasha", {})
+        if current_mahadasha:
+            mahadasha_lord = current_mahadasha.get("lord", "N/A")
+            antardasha_lord = current_antardasha.get("lord", "N/A") if current_antardasha else None
+            current_dasha_info = {
+                "mahadasha": mahadasha_lord,
+                "antardasha": antardasha_lord,
+                "mahadasha_start": current_mahadasha.get("start"),
+                "mahadasha_end": current_mahadasha.get("end"),
+                "display": f"{mahadasha_lord} Dasha" + (f" - {antardasha_lord} Antardasha" if antardasha_lord else "")
+            }
+    except Exception as e:
+        # If dasha calculation fails, continue without it
+        logger.warning("Could not calculate current dasha: %s", e, exc_info=True)
+    return current_dasha_info
+
+
+def _store_kundli_for_user(birth_detail_id: int, inputs: Dict, response: Dict) -> None:
+    """Write a /kundli response onto the user's BirthDetail row (best effort)."""
+    try:
+        db = SessionLocal()
+        try:
+            birth_detail = db.query(BirthDetail).filter(BirthDetail.id == birth_detail_id).first()
+            if birth_detail is not None:
+                store_kundli_response(birth_detail, inputs, response)
+                db.commit()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning("Could not store kundli for birth detail %s (%s)", birth_detail_id, type(e).__name__)
+
+
+# Charts and the other top-level fields of the GET /kundli response
+KUNDLI_CHARTS = ("D1", "D2", "D3", "D4", "D7", "D9", "D10", "D12", "D16", "D20", "D24", "D27", "D30", "D40", "D45", "D60")
+KUNDLI_FIELDS = ("julian_day", "planet_functional_strength", "current_dasha")
+
+
+def _parse_selection(value: Optional[str], allowed: tuple, name: str) -> Optional[set]:
+    """Comma-separated selection query parameter (None selects everything; HTTPException 400 if unknown)."""
+    if value is None:
+        return None
+    selected = {item.strip() for item in value.split(",") if item.strip()}
+    unknown = selected.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {name}: {', '.join(sorted(unknown))}. Allowed: {', '.join(allowed)}"
+        )
+    return selected
+
+
+def compact_table(rows, key_column: Optional[str] = None) -> Dict:
+    """
+    Column/row encoding of a chart table (Planets, Houses or Aspects).
+    
+    Args:
+        rows: List of row dicts, or dict of name -> row dict (Planets)
+        key_column: Column for the dict keys when rows is a dict (e.g. "planet")
+    
+    Returns:
+        {"columns": [...], "rows": [[...], ...]}; columns in first-seen order,
+        None where a row has no value for a column
+    """
+    names = None
+    if isinstance(rows, dict):
+        names, rows = list(rows), list(rows.values())
+    columns = []
+    for row in rows:
+        for column in row:
+            if column not in columns:
+                columns.append(column)
+    encoded = [[row.get(column) for column in columns] for row in rows]
+    if names is not None:
+        columns.insert(0, key_column)
+        encoded = [[name] + values for name, values in zip(names, encoded)]
+    return {"columns": columns, "rows": encoded}
+
+
+def _compact_chart(chart: Dict) -> Dict:
+    compact = dict(chart)
+    if isinstance(chart.get("Planets"), dict):
+        compact["Planets"] = compact_table(chart["Planets"], "planet")
+    for section in ("Houses", "Aspects"):
+        if isinstance(chart.get(section), list):
+            compact[section] = compact_table(chart[section])
+    return compact
+
+
+def select_kundli_response(response: Dict, vargas: Optional[set] = None, fields: Optional[set] = None,
+                           compact: bool = False) -> Dict:
+    """
+    GET /kundli response restricted to the requested charts and fields.
+    
+    The response itself is not modified (stored responses are shared).
+    
+    Args:
+        response: Full kundli response
+        vargas: Charts to keep (e.g. {"D1", "D9"}); None keeps all
+        fields: Non-chart fields to keep (see KUNDLI_FIELDS); None keeps all
+        compact: Encode Planets/Houses/Aspects of each chart with compact_table()
+    
+    Returns:
+        Selected response
+    """
+    if vargas is None and fields is None and not compact:
+        return response
+    selected = {}
+    for key, value in response.items():
+        if key in KUNDLI_CHARTS:
+            if vargas is not None and key not in vargas:
+                continue
+            if compact and isinstance(value, dict):
+                value = _compact_chart(value)
+        elif fields is not None and key not in fields:
+            continue
+        selected[key] = value
+    return selected
+
+
+def _parse_birth_time(dob: str, time: str):
+    """(birth_date, hour, minute, second) from YYYY-MM-DD and HH:MM[:SS] (ValueError if invalid)."""
+    birth_date = datetime.strptime(dob, "%Y-%m-%d").date()
+    time_parts = time.split(':')
+    hour = int(time_parts[0])
+    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+    second = int(time_parts[2]) if len(time_parts) > 2 else 0
+    return birth_date, hour, minute, second
+
+
+def compute_current_dasha(dob: str, time: str, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> Optional[Dict]:
+    """Current dasha for a stored chart (runs in a compute worker, see kundli_get)."""
+    birth_date, hour, minute, second = _parse_birth_time(dob, time)
+    return _current_dasha_info(birth_date, hour, minute, second, lat, lon, timezone)
+
+
+def compute_kundli(dob: str, time: str, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> Dict:
+    """
+    Complete GET /kundli response (runs in a compute worker, see kundli_get).
+    
+    Args:
+        dob: Date of birth (YYYY-MM-DD)
+        time: Time of birth (HH:MM[:SS])
+        lat: Birth latitude
+        lon: Birth longitude
+        timezone: Timezone (default: Asia/Kolkata)
+    
+    Returns:
+        D1, all varga charts and strength payload, plus "current_dasha" when available
+    """
+    birth_date, hour, minute, second = _parse_birth_time(dob, time)
+    
+    # Create local datetime
+    birth_dt_local = datetime.combine(
+        birth_date,
+        datetime.min.time().replace(hour=hour, minute=minute, second=second)
+    )
+
+    # Convert to UTC (Swiss Ephemeris requires UTC)
+    from src.utils.timezone import local_to_utc
+    birth_dt_utc = local_to_utc(birth_dt_local, timezone)
+
+    # Calculate Julian Day with proper UTC conversion
+    # Note: calc_ut() requires UTC, so we convert local time to UTC first
+    jd = swe.julday(
+        birth_dt_utc.year, birth_dt_utc.month, birth_dt_utc.day,
+        birth_dt_utc.hour + birth_dt_utc.minute / 60.0 + birth_dt_utc.second / 3600.0,
+        swe.GREG_CAL
+    )
+
+    # 🔒 SINGLE EPHEMERIS PASS: every downstream consumer (D1, vargas, dasha)
+    # reads from this one immutable snapshot - NO repeated swe.calc_ut()/swe.houses()
+    snapshot = build_ephemeris_snapshot(jd, lat, lon)
+
+    # Generate base D1 Kundli using EXACT JHORA engine
+    base_kundli = generate_kundli(jd, lat, lon, snapshot=snapshot)
+
+    # 🔒 D1 NAKSHATRA LORD ATTACHMENT (ASCENDANT)
+    # Add nakshatra_lord to D1 Ascendant based on existing nakshatra_index
+    if "Ascendant" in base_kundli and "nakshatra_index" in base_kundli["Ascendant"]:
+        base_kundli["Ascendant"]["nakshatra_lord"] = get_nakshatra_lord(
+            base_kundli["Ascendant"]["nakshatra_index"]
+        )
+
+    # 🔒 D1 NAKSHATRA LORD ATTACHMENT (PLANETS)
+    # Add nakshatra_lord to each D1 planet based on existing nakshatra_index
+    for planet_name, pdata in base_kundli.get("Planets", {}).items():
+        if "nakshatra_index" in pdata:
+            pdata["nakshatra_lord"] = get_nakshatra_lord(pdata["nakshatra_index"])
+
+    # Calculate current dasha for dashboard
+    current_dasha_info = _current_dasha_info(birth_date, hour, minute, second, lat, lon, timezone, snapshot=snapshot)
+
+    # ============================================================
+    # AUTHORITATIVE VARGA COMPUTATION - SINGLE SOURCE OF TRUTH
+    # ============================================================
+    # API routes MUST use varga_engine.py - NEVER call calculate_varga() directly
+    # This ensures consistency across all endpoints and eliminates mismatches
+    # ============================================================
+
+    from src.jyotish.varga_engine import build_all_varga_charts_vectorized, compute_vargottama_flags
+    from src.utils.converters import get_sign_name_sanskrit
+
+    # 🔒 CRITICAL: Use RAW unrounded sidereal longitudes for varga calculations
+    # DO NOT use rounded degrees from D1 output - rounding causes varga mismatches
+    # Extract raw longitudes directly from the ephemeris snapshot
+
+    # Get RAW ascendant longitude (unrounded, exact sidereal)
+    asc_jhora_raw = snapshot.ascendant
+    d1_ascendant = snapshot.ascendant_longitude  # Raw unrounded sidereal longitude
+
+    # 🔍 STEP 1A: RAW D1 ASCENDANT (immediately after ephemeris)
+    trace(
+        logger,
+        "STEP 1A: raw D1 ascendant (ephemeris snapshot): longitude=%s sign_index=%s degrees_in_sign=%s d1_ascendant=%s",
+        asc_jhora_raw["longitude"], asc_jhora_raw["sign_index"], asc_jhora_raw["degrees_in_sign"], d1_ascendant,
+    )
+    # 🔒 INVARIANT CHECK: d1_ascendant must equal asc_jhora_raw["longitude"]
+    assert abs(d1_ascendant - asc_jhora_raw["longitude"]) < 1e-10, f"d1_ascendant mismatch: {d1_ascendant} != {asc_jhora_raw['longitude']}"
+
+    # Get RAW planet longitudes (unrounded, exact sidereal)
+    planets_jhora_raw = snapshot.planets
+    d1_planets = snapshot.planet_longitudes  # Raw unrounded sidereal longitudes
+
+    # 🔍 STEP 1B: RAW D1 MOON (for comparison)
+    if "Moon" in planets_jhora_raw:
+        moon_raw = planets_jhora_raw["Moon"]
+        moon_d1_longitude = d1_planets["Moon"]
+        trace(
+            logger,
+            "STEP 1B: raw D1 Moon: longitude=%s sign_index=%s degrees_in_sign=%s moon_d1_longitude=%s",
+            moon_raw["longitude"], moon_raw["sign_index"], moon_raw["degrees_in_sign"], moon_d1_longitude,
+        )
+        # 🔒 INVARIANT CHECK: moon_d1_longitude must equal moon_raw["longitude"]
+        assert abs(moon_d1_longitude - moon_raw["longitude"]) < 1e-10, f"moon_d1_longitude mismatch: {moon_d1_longitude} != {moon_raw['longitude']}"
+
+    # 🔍 STEP 1C: VALUES PASSED INTO build_all_varga_charts_vectorized()
+    trace(
+        logger,
+        "STEP 1C: into build_all_varga_charts_vectorized(): d1_ascendant=%s moon_d1_longitude=%s",
+        d1_ascendant, d1_planets.get("Moon"),
+    )
+    # 🔒 INVARIANT CHECK: No rounding before varga calculation
+    assert isinstance(d1_ascendant, float), f"d1_ascendant must be float, got {type(d1_ascendant)}"
+    assert 0 <= d1_ascendant < 360, f"d1_ascendant out of range: {d1_ascendant}"
+
+    # 🔒 MANDATORY VALIDATION: Ensure d1_planets is not empty before building varga charts
+    if not d1_planets or len(d1_planets) == 0:
+        raise ValueError(f"D1 planets dictionary is empty or None. Cannot build varga charts.")
+    if d1_ascendant is None:
+        raise ValueError(f"D1 ascendant is None. Cannot build varga charts.")
+
+    # Build all varga charts using authoritative engine
+    # This ensures sign and house are computed together atomically
+    # All vargas D2-D60 for all grahas + lagna are computed in ONE vectorized pass
+    # (bit-identical to build_varga_chart() per varga)
+    varga_charts = build_all_varga_charts_vectorized(
+        d1_planets, d1_ascendant, (2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+    )
+    d2_chart = varga_charts[2]
+    d3_chart = varga_charts[3]
+    d4_chart = varga_charts[4]
+
+    # 🔒 MANDATORY D4 VALIDATION: Ensure D4 chart is complete before building response
+    if not d4_chart:
+        raise ValueError("D4 chart is None or empty")
+    if "ascendant" not in d4_chart:
+        raise ValueError("D4 chart is incomplete: missing 'ascendant' key")
+    if not d4_chart.get("ascendant"):
+        raise ValueError("D4 chart ascendant is None or empty")
+    if d4_chart["ascendant"].get("sign_index") is None:
+        raise ValueError(f"D4 chart ascendant is incomplete: sign_index is None. Ascendant data: {d4_chart.get('ascendant')}")
+    if "planets" not in d4_chart:
+        raise ValueError("D4 chart is incomplete: missing 'planets' key")
+    if not d4_chart["planets"] or len(d4_chart["planets"]) == 0:
+        raise ValueError(f"D4 chart is incomplete: planets dictionary is empty. d1_planets had {len(d1_planets)} planets: {list(d1_planets.keys())}")
+
+    d7_chart = varga_charts[7]
+    d9_chart = varga_charts[9]
+    d10_chart = varga_charts[10]
+    # Vargottama (D1 sign == D9 sign): attach to D1 planets only; backend single source of truth
+    vargottama_flags = compute_vargottama_flags(base_kundli["Planets"], d9_chart["planets"])
+    for planet_name, pdata in base_kundli.get("Planets", {}).items():
+        pdata["is_vargottama"] = vargottama_flags.get(planet_name, False)
+
+    # D12 (Dwadasamsa) - Special handling for ascendant (base formula, no +3 correction)
+    # But planets still use standard varga formula
+    d12_chart = varga_charts[12]
+
+    # Additional varga charts (D16-D60)
+    d16_chart = varga_charts[16]
+    d20_chart = varga_charts[20]
+    # D24 is LOCKED to Method 1 (JHora verified) - no method parameter
+    d24_chart = varga_charts[24]
+    d27_chart = varga_charts[27]
+    d30_chart = varga_charts[30]
+    d40_chart = varga_charts[40]
+    d45_chart = varga_charts[45]
+    d60_chart = varga_charts[60]
+
+    # D12 ascendant uses BASE formula (no +3 correction) - recalculate
+    d1_asc_sign = int(d1_ascendant / 30)
+    d1_asc_deg_in_sign = d1_ascendant % 30
+    part = 2.5
+    div_index = int(math.floor(d1_asc_deg_in_sign / part))
+    if div_index >= 12:
+        div_index = 11
+    d12_asc_sign = (d1_asc_sign + div_index) % 12
+    d12_asc_deg_in_sign = (d1_asc_deg_in_sign * 12) % 30
+    d12_asc_longitude = d12_asc_sign * 30 + d12_asc_deg_in_sign
+    from src.utils.converters import normalize_degrees, get_sign_name
+    d12_asc_longitude = normalize_degrees(d12_asc_longitude)
+
+    # Update D12 ascendant with base formula result
+    # CRITICAL: Lagna is ALWAYS in House 1 (Whole Sign system rule)
+    # DO NOT MODIFY — JHora compatible
+    d12_chart["ascendant"] = {
+        "degree": round(d12_asc_longitude, 4),
+        "sign": get_sign_name(d12_asc_sign),
+        "sign_index": d12_asc_sign,
+        "degrees_in_sign": round(d12_asc_deg_in_sign, 4),
+        "house": 1  # Always 1 for lagna (not sign_index + 1)
+    }
+
+    # ============================================================
+    # STANDARDIZED API RESPONSE STRUCTURE
+    # ============================================================
+    # D1 and ALL varga charts must return identical structure:
+    # {
+    #   ascendant: { sign, sign_index, degree, house, sign_sanskrit }
+    #   houses: [{ house: 1..12, sign, sign_index, degree, ... }]
+    #   planets: { planet: { sign, sign_index, house, degree, ... } }
+    # }
+    # DO NOT MODIFY — JHora compatible
+    # ============================================================
+
+    # ⚠️ D1 GRAHA DRISHTI (PLANETARY ASPECTS) — PARĀŚARI RULES ONLY
+    # ⚠️ Compute aspects for D1 using D1's sign_index positions
+    # ⚠️ D1 aspects are computed independently (not reused for other vargas)
+    from src.utils.converters import get_sign_name
+    d1_houses = base_kundli.get("Houses")  # D1 houses from generate_kundli
+    d1_aspects = compute_graha_drishti(
+        base_kundli.get("Planets", {}),
+        houses_array=d1_houses,
+        get_sign_name_fn=get_sign_name
+    )
+    base_kundli["Aspects"] = d1_aspects
+
+    # Helper function to build standardized varga chart response
+    # 🔒 CRITICAL: Explicitly capture get_nakshatra_lord in closure to prevent scoping errors
+    # This ensures the nested function can access the module-level import
+    _get_nakshatra_lord_fn = get_nakshatra_lord  # Explicit closure binding
+
+    def build_standardized_varga_response(varga_chart: Dict, chart_type: str) -> Dict:
+        """Build standardized varga chart response matching D1 structure."""
+        # Import required functions
+        from src.utils.converters import get_sign_name, get_sign_name_sanskrit, get_nakshatra_name, normalize_degrees
+        from src.jyotish.kundli_engine import get_house_lord_from_sign
+
+        # Extract varga number from chart_type (e.g., "D24" -> 24)
+        varga_num = int(chart_type[1:]) if chart_type[1:].isdigit() else 0
+
+        # For D24-D60: NO HOUSE LOGIC (pure sign charts)
+        # For D1-D20: Build houses array using Whole Sign system
+        if varga_num in (24, 27, 30, 40, 45, 60):
+            # Pure sign chart - no houses
+            houses_array = None
+            ascendant_house = None
+        else:
+            # RUNTIME ASSERTION: Lagna house must be 1 for D1-D20
+            assert varga_chart["ascendant"]["house"] == 1, \
+                f"{chart_type} lagna house must be 1, got {varga_chart['ascendant']['house']}"
+
+            # Build houses array for varga using Whole Sign system
+            # 🔒 DO NOT MODIFY — JHora compatible
+            # Whole Sign: House 1 = Varga ascendant sign, House 2 = next sign clockwise, etc.
+            # 🔒 MANDATORY: Normalize asc_sign_index to 0-11 range (data integrity fix)
+            # This ensures house sign_index is NEVER negative or >= 12
+            # Note: sign_index should already be normalized from varga_engine, but we normalize again for safety
+            # 🔒 CRITICAL: _normalize_sign_index is imported from varga_engine.py (canonical source)
+            # DO NOT redefine it here - use the imported function
+
+            # 🔒 MANDATORY: Use ONLY normalized sign_index from build_varga_chart()
+            # DO NOT recompute or override - use the engine output directly
+            asc_sign_index_raw = varga_chart["ascendant"]["sign_index"]
+            asc_sign_index = _normalize_sign_index(asc_sign_index_raw)
+
+            # 🔒 CRITICAL ASSERTION: House 1 sign_index MUST equal Ascendant sign_index
+            # This proves houses are Lagna-relative (not absolute zodiac)
+            # This assertion runs BEFORE response leaves backend
+            expected_house1_sign = asc_sign_index
+
+            houses_array = []
+            for house_num in range(1, 13):
+                # Calculate sign for this house: (asc_sign + house_num - 1) % 12
+                # House 1 = ascendant sign, House 2 = next sign, etc.
+                sign_index = (asc_sign_index + house_num - 1) % 12
+
+                # 🔒 HARD ASSERTION: House sign_index MUST be 0-11 (API response layer)
+                # This is the FINAL validation before response leaves backend
+                if sign_index < 0 or sign_index >= 12:
+                    raise ValueError(
+                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} House {house_num} sign_index={sign_index} "
+                        f"is OUT OF RANGE [0, 11]. asc_sign_index={asc_sign_index}, house_num={house_num}. "
+                        f"This indicates a data integrity violation in the API response layer."
+                    )
+
+                houses_array.append({
+                    "house": house_num,
+                    "sign": get_sign_name(sign_index),
+                    "sign_sanskrit": get_sign_name_sanskrit(sign_index),
+                    "sign_index": sign_index,
+                    "degree": 0.0,  # Varga houses don't have cusps
+                    "degrees_in_sign": 0.0,
+                    "lord": get_house_lord_from_sign(sign_index)
+                })
+
+            # 🔒 CRITICAL ASSERTION: House 1 sign_index MUST equal Ascendant sign_index
+            # This proves houses are constructed correctly from normalized ascendant
+            house1_sign = houses_array[0]["sign_index"]
+            if house1_sign != expected_house1_sign:
+                raise ValueError(
+                    f"FATAL API DATA INTEGRITY ERROR: {chart_type} House-1 sign_index={house1_sign} "
+                    f"does NOT equal Ascendant sign_index={expected_house1_sign}. "
+                    f"This indicates houses are NOT Lagna-relative or normalization failed."
+                )
+
+            # RUNTIME ASSERTION: Must have exactly 12 houses
+            assert len(houses_array) == 12, f"{chart_type} must have exactly 12 houses"
+            ascendant_house = varga_chart["ascendant"]["house"]  # Always 1 for D1-D20
+
+        # Build Ascendant response
+        # 🔒 MANDATORY: Use normalized sign_index (same as used for houses)
+        # DO NOT use raw varga_chart["ascendant"]["sign_index"] - it may be unnormalized
+        # For D1-D20: Use the same normalized asc_sign_index used for houses
+        # For D24-D60: Normalize separately (no houses, but still need normalized sign_index)
+        if varga_num not in (24, 27, 30, 40, 45, 60):
+            asc_sign_index_normalized = asc_sign_index  # Use the same normalized value from houses
+        else:
+            asc_sign_index_normalized = _normalize_sign_index(varga_chart["ascendant"]["sign_index"])
+
+        # ⚠️ NAKSHATRA PER VARGA RULE:
+        # ⚠️ Nakshatra MUST be computed from the VARGA longitude (absolute) for each chart.
+        # ⚠️ NEVER reuse D1 nakshatra for D2–D60. Each varga has its own longitude and nakshatra.
+
+        # Compute absolute varga longitude for Ascendant
+        asc_deg_in_sign = varga_chart["ascendant"]["degrees_in_sign"]
+        asc_longitude = normalize_degrees(asc_sign_index_normalized * 30.0 + asc_deg_in_sign)
+
+        # Compute nakshatra index and pada from VARGA longitude
+        nakshatra_span = 13 + 20.0 / 60.0  # 13°20' per nakshatra
+        pada_size = nakshatra_span / 4.0   # 4 padas per nakshatra
+
+        asc_nak_index = int(asc_longitude // nakshatra_span)
+        if asc_nak_index >= 27:
+            asc_nak_index = 26
+        if asc_nak_index < 0:
+            asc_nak_index = 0
+
+        asc_degrees_in_nakshatra = asc_longitude % nakshatra_span
+        asc_pada = int(asc_degrees_in_nakshatra // pada_size) + 1
+        if asc_pada > 4:
+            asc_pada = 4
+        if asc_pada < 1:
+            asc_pada = 1
+
+        asc_nak_name = get_nakshatra_name(asc_nak_index)
+        asc_nak_lord = _get_nakshatra_lord_fn(asc_nak_index)
+
+        ascendant_response = {
+            "degree": varga_chart["ascendant"]["degree"],
+            "sign": varga_chart["ascendant"]["sign"],
+            "sign_sanskrit": get_sign_name_sanskrit(asc_sign_index_normalized),
+            "sign_index": asc_sign_index_normalized,  # Use normalized sign_index
+            "degrees_in_sign": asc_deg_in_sign,
+            "lord": get_house_lord_from_sign(asc_sign_index_normalized),
+            # Nakshatra data computed from VARGA longitude (per-chart)
+            "nakshatra": asc_nak_name,
+            "nakshatra_index": asc_nak_index,
+            "pada": asc_pada,
+            "nakshatra_lord": asc_nak_lord,
+        }
+
+        # Only add house field for D1-D20
+        if ascendant_house is not None:
+            ascendant_response["house"] = ascendant_house
+
+        # 🔒 NORMALIZE PLANET KEYS: Ensure all planets use snake_case keys (sign_index, degrees_in_sign)
+        # This ensures frontend receives consistent key naming
+        normalized_planets = {}
+        for planet_name, planet_data in varga_chart["planets"].items():
+            # Compute VARGA-based nakshatra for each planet (no D1 reuse)
+            planet_sign_index = planet_data.get("sign_index")
+            planet_deg_in_sign = planet_data.get("degrees_in_sign")
+
+            if planet_sign_index is not None and planet_deg_in_sign is not None:
+                planet_longitude = normalize_degrees(planet_sign_index * 30.0 + planet_deg_in_sign)
+
+                planet_nak_index = int(planet_longitude // nakshatra_span)
+                if planet_nak_index >= 27:
+                    planet_nak_index = 26
+                if planet_nak_index < 0:
+                    planet_nak_index = 0
+
+                planet_degrees_in_nakshatra = planet_longitude % nakshatra_span
+                planet_pada = int(planet_degrees_in_nakshatra // pada_size) + 1
+                if planet_pada > 4:
+                    planet_pada = 4
+                if planet_pada < 1:
+                    planet_pada = 1
+
+                planet_nak_name = get_nakshatra_name(planet_nak_index)
+                planet_nak_lord = _get_nakshatra_lord_fn(planet_nak_index)
+            else:
+                # Fallback: should not normally happen, but keep structure intact
+                planet_nak_index = 0
+                planet_pada = 1
+                planet_nak_name = ""
+                planet_nak_lord = _get_nakshatra_lord_fn(planet_nak_index)
+
+            normalized_planet = {
+                "degree": planet_data.get("degree"),
+                "sign": planet_data.get("sign"),
+                "sign_name": planet_data.get("sign_name") or planet_data.get("sign"),  # Fallback to sign if sign_name missing
+                "sign_index": planet_sign_index,  # Ensure snake_case
+                "degrees_in_sign": planet_deg_in_sign,  # Ensure snake_case
+                # Nakshatra data computed from VARGA longitude (per-chart)
+                "nakshatra": planet_nak_name,
+                "nakshatra_index": planet_nak_index,
+                "pada": planet_pada,
+                "nakshatra_lord": planet_nak_lord,
+            }
+            # Add optional fields if present
+            if "house" in planet_data:
+                normalized_planet["house"] = planet_data["house"]
+            if "degree_dms" in planet_data:
+                normalized_planet["degree_dms"] = planet_data["degree_dms"]
+            if "arcminutes" in planet_data:
+                normalized_planet["arcminutes"] = planet_data["arcminutes"]
+            if "arcseconds" in planet_data:
+                normalized_planet["arcseconds"] = planet_data["arcseconds"]
+            if "degree_formatted" in planet_data:
+                normalized_planet["degree_formatted"] = planet_data["degree_formatted"]
+            normalized_planets[planet_name] = normalized_planet
+
+        # ⚠️ GRAHA DRISHTI (PLANETARY ASPECTS) — PARĀŚARI RULES ONLY
+        # ⚠️ Compute aspects independently for EACH varga chart using THAT varga's sign_index positions
+        # ⚠️ Each varga is treated as a standalone chart with its own aspect relationships
+        # ⚠️ NO reuse of D1 aspects for D2–D60
+        aspects_list = compute_graha_drishti(
+            normalized_planets,
+            houses_array=houses_array,
+            get_sign_name_fn=get_sign_name
+        )
+
+        # 🔒 FINAL API RESPONSE VALIDATION: Assert ALL sign_index values are 0-11
+        # This is the LAST check before response leaves backend
+        response_data = {
+            "Ascendant": ascendant_response,
+            "Houses": houses_array,  # None for D24-D60
+            "Planets": normalized_planets,  # Use normalized planets with snake_case keys
+            "Aspects": aspects_list,  # Graha Drishti computed per varga
+            "chartType": chart_type
+        }
+
+        # Validate Ascendant sign_index
+        if response_data["Ascendant"]["sign_index"] < 0 or response_data["Ascendant"]["sign_index"] >= 12:
+            raise ValueError(
+                f"FATAL API DATA INTEGRITY ERROR: {chart_type} Ascendant sign_index={response_data['Ascendant']['sign_index']} "
+                f"is OUT OF RANGE [0, 11]. This indicates normalization failed."
+            )
+
+        # Validate ALL house sign_index values (if houses exist)
+        if houses_array is not None:
+            for house in houses_array:
+                if house["sign_index"] < 0 or house["sign_index"] >= 12:
+                    raise ValueError(
+                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} House {house['house']} sign_index={house['sign_index']} "
+                        f"is OUT OF RANGE [0, 11]. This indicates a data integrity violation."
+                    )
+
+        # Validate ALL planet sign_index values
+        for planet_name, planet_data in response_data["Planets"].items():
+            if planet_data.get("sign_index") is None:
+                raise ValueError(
+                    f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} missing sign_index. "
+                    f"Planet data: {planet_data}"
+                )
+            if planet_data["sign_index"] < 0 or planet_data["sign_index"] >= 12:
+                raise ValueError(
+                    f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} sign_index={planet_data['sign_index']} "
+                    f"is OUT OF RANGE [0, 11]. This indicates normalization failed."
+                )
+            if planet_data.get("degrees_in_sign") is None:
+                raise ValueError(
+                    f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} missing degrees_in_sign. "
+                    f"Planet data: {planet_data}"
+                )
+
+        return response_data
+
+    # Build standardized response with consistent structure
+    # Include ALL varga charts (D1-D60)
+
+    # 🔒 D4: Build response and log separately to avoid lambda issues
+    d4_response = build_standardized_varga_response(d4_chart, "D4")
+    if tracing(logger) and isinstance(d4_response, dict):
+        trace(
+            logger, "D4 payload (API boundary): keys=%s ascendant=%s houses=%s",
+            list(d4_response), d4_response.get("Ascendant"), len(d4_response.get("Houses") or []),
+        )
+        for h in d4_response.get("Houses") or []:
+            trace(logger, "D4 house %s: sign_index=%s sign=%s", h.get("house"), h.get("sign_index"), h.get("sign"))
+
+    # 🔒 PLANET FUNCTIONAL STRENGTH (D1-ONLY, BACKEND-ONLY)
+    # Compute ancient Jyotish functional strength flags from the FINAL D1 chart.
+    # - Backend-only extension
+    # - D1-only input (base_kundli)
+    # - NO recomputation of planets
+    # - NO prediction logic
+    try:
+        planet_strength = calculate_planet_functional_strength(base_kundli)
+        planet_strength_raw = planet_strength.get("planet_functional_strength", {})
+
+        # 🔒 PLANET KEY NORMALIZATION: Ensure canonical keys (Sun, Moon, Mars, etc.)
+        # Frontend expects EXACT keys: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu, Ketu
+        # This normalization ensures API response shape matches frontend expectations
+        CANONICAL_PLANET_KEYS = {
+            "Sun": "Sun",
+            "Moon": "Moon",
+            "Mars": "Mars",
+            "Mercury": "Mercury",
+            "Jupiter": "Jupiter",
+            "Venus": "Venus",
+            "Saturn": "Saturn",
+            "Rahu": "Rahu",
+            "Ketu": "Ketu",
+            # Common aliases (if any exist in input)
+            "Su": "Sun",
+            "Mo": "Moon",
+            "Ma": "Mars",
+            "Me": "Mercury",
+            "Ju": "Jupiter",
+            "Ve": "Venus",
+            "Sa": "Saturn",
+            "Ra": "Rahu",
+            "Ke": "Ketu",
+        }
+
+        # Expected canonical keys (frontend contract)
+        EXPECTED_KEYS = {"Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"}
+
+        planet_strength_payload = {}
+        for raw_key, strength_data in planet_strength_raw.items():
+            # Normalize key to canonical format
+            canonical_key = CANONICAL_PLANET_KEYS.get(raw_key, raw_key)
+            # Only include if it's a canonical key (frontend expects these exact keys)
+            if canonical_key in EXPECTED_KEYS:
+                planet_strength_payload[canonical_key] = strength_data
+            else:
+                # If key doesn't match any known format, log warning
+                logger.warning(
+                    "Unknown planet key in functional strength: %s (normalized to: %s). Skipping.", raw_key, canonical_key
+                )
+
+    except Exception as e:
+        # Fail-safe: Never break main kundli response if strength engine fails
+        logger.error(
+            "Planet functional strength calculation failed: %s", e
+        )
+        planet_strength_payload = {}
+
+    response = {
+        "julian_day": round(jd, 6),
+        "D1": base_kundli,
+        "D2": build_standardized_varga_response(d2_chart, "D2"),
+        "D3": build_standardized_varga_response(d3_chart, "D3"),
+        "D4": d4_response,
+        "D7": build_standardized_varga_response(d7_chart, "D7"),
+        "D9": build_standardized_varga_response(d9_chart, "D9"),
+        "D10": build_standardized_varga_response(d10_chart, "D10"),
+        "D12": build_standardized_varga_response(d12_chart, "D12"),
+        # Additional varga charts (D16-D60)
+        "D16": build_standardized_varga_response(d16_chart, "D16"),
+        "D20": build_standardized_varga_response(d20_chart, "D20"),
+        "D24": build_standardized_varga_response(d24_chart, "D24"),
+        "D27": build_standardized_varga_response(d27_chart, "D27"),
+        "D30": build_standardized_varga_response(d30_chart, "D30"),
+        "D40": build_standardized_varga_response(d40_chart, "D40"),
+        "D45": build_standardized_varga_response(d45_chart, "D45"),
+        "D60": build_standardized_varga_response(d60_chart, "D60"),
+        # Planet Functional Strength (ancient Jyotish engine; D1-only input)
+        # This is a BACKEND-ONLY, additive payload. Frontend may ignore safely.
+        "planet_functional_strength": planet_strength_payload,
+    }
+
+    # Final payload for D10 verification (Prokerala match)
+    if tracing(logger) and "D10" in response:
+        d10_data = response["D10"]
+        d10_ascendant = d10_data.get("Ascendant", {})
+        trace(
+            logger, "D10 final payload: Ascendant %s (sign_index=%s) -> House %s",
+            d10_ascendant.get("sign_sanskrit"), d10_ascendant.get("sign_index"), d10_ascendant.get("house"),
+        )
+        for planet_name in ["Venus", "Mars"]:
+            if planet_name in d10_data.get("Planets", {}):
+                planet_data = d10_data["Planets"][planet_name]
+                trace(
+                    logger, "D10 final payload: %s %s (sign_index=%s) -> House %s",
+                    planet_name, planet_data.get("sign"), planet_data.get("sign_index"), planet_data.get("house"),
+                )
+
+    trace(logger, "Varga charts in response: %s", [key for key in response if key.startswith("D")])
+
+    # Verify D16-D60 are present
+    required_vargas = ["D16", "D20", "D24", "D27", "D30", "D40", "D45", "D60"]
+    missing_vargas = [v for v in required_vargas if v not in response]
+    if missing_vargas:
+        logger.warning("Missing varga charts in response: %s", missing_vargas)
+    
+    # Add current dasha information if available
+    if current_dasha_info:
+        response["current_dasha"] = current_dasha_info
+    
+    return response
+
+
+@router.get("/kundli", response_class=FastJSONResponse)
 async def kundli_get(
     user_id: Optional[str] = Query(None, description="User ID to lookup birth details from database"),
     dob: Optional[str] = Query(None, description="Date of birth in YYYY-MM-DD format (required if user_id not provided)"),
@@ -491,10 +1223,13 @@ async def kundli_get(
     lat: Optional[float] = Query(None, description="Latitude (required if user_id not provided)"),
     lon: Optional[float] = Query(None, description="Longitude (required if user_id not provided)"),
     timezone: str = Query("Asia/Kolkata", description="Timezone (default: Asia/Kolkata)"),
+    vargas: Optional[str] = Query(None, description="Comma-separated charts to include, e.g. D1,D9 (default: all)"),
+    fields: Optional[str] = Query(None, description="Comma-separated non-chart fields to include: julian_day, planet_functional_strength, current_dasha (default: all)"),
+    compact: bool = Query(False, description="Encode each chart's Planets/Houses/Aspects as columns + rows"),
     # d24_chart_method parameter REMOVED - D24 is locked to Method 1 (JHora verified)
 ):
-    # 🔥 STEP 5: PROVE WHICH BACKEND IS HIT (MANDATORY LOG)
-    print("🔥 KUNDLI HIT — PID:", os.getpid(), flush=True)
+    # 🔥 STEP 5: PROVE WHICH BACKEND IS HIT
+    trace(logger, "kundli hit: pid=%s", os.getpid())
     
     # 🔒 CRITICAL: Hard asserts at API entry point - ensures core helpers are callable
     # This forces immediate failure if scoping/shadowing rules are violated
@@ -522,11 +1257,21 @@ async def kundli_get(
         lat: Birth latitude - required if user_id not provided
         lon: Birth longitude - required if user_id not provided
         timezone: Timezone (default: Asia/Kolkata)
+        vargas: Optional comma-separated charts to return (e.g. "D1,D9")
+        fields: Optional comma-separated non-chart fields to return
+        compact: Encode planet/house/aspect tables as columns + rows
     
     Returns:
-        Complete Kundli with D1 and all varga charts (D2-D60)
+        Complete Kundli with D1 and all varga charts (D2-D60), encoded with
+        FastJSONResponse
     """
+    selected_vargas = _parse_selection(vargas, KUNDLI_CHARTS, "vargas")
+    selected_fields = _parse_selection(fields, KUNDLI_FIELDS, "fields")
+    
     try:
+        # Registered user's BirthDetail row (natal chart store), if found
+        stored_birth_detail = None
+        
         # 🔒 BACKEND FIX: Support user_id lookup from database (optional - falls back to query params if DB unavailable)
         # If user_id is provided, try to lookup birth details from database
         # If database is unavailable, fall back to using birth details from query parameters
@@ -548,12 +1293,13 @@ async def kundli_get(
                         lat = birth_detail.birth_latitude if birth_detail.birth_latitude is not None else lat
                         lon = birth_detail.birth_longitude if birth_detail.birth_longitude is not None else lon
                         timezone = birth_detail.timezone or timezone  # Use stored timezone or fallback to default
+                        stored_birth_detail = birth_detail
                     else:
                         # User not found in database - fall back to query parameters
-                        print(f"⚠️  Warning: user_id {user_id} not found in database. Using birth details from query parameters.")
+                        logger.warning("user_id %s not found in database; using birth details from query parameters", user_id)
                 except Exception as query_error:
                     # Query failed - fall back to query parameters
-                    print(f"⚠️  Warning: Database query failed ({type(query_error).__name__}). Using birth details from query parameters.")
+                    logger.warning("Database query failed (%s); using birth details from query parameters", type(query_error).__name__)
                 finally:
                     try:
                         db.close()
@@ -561,7 +1307,7 @@ async def kundli_get(
                         pass
             except Exception as db_error:
                 # SessionLocal() creation or connection failed - fall back to query parameters
-                print(f"⚠️  Warning: Database unavailable ({type(db_error).__name__}). Using birth details from query parameters.")
+                logger.warning("Database unavailable (%s); using birth details from query parameters", type(db_error).__name__)
                 # Continue with query parameters (dob, time, lat, lon from function params)
         
         # Validate that we have all required birth details (either from DB or query params)
@@ -571,623 +1317,38 @@ async def kundli_get(
                 detail="Missing required birth details. Please provide: dob, time, lat, lon"
             )
         
-        # Parse date and time
-        from datetime import date
-        birth_date = datetime.strptime(dob, "%Y-%m-%d").date()
-        
-        # Parse time
-        time_parts = time.split(':')
-        hour = int(time_parts[0])
-        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-        second = int(time_parts[2]) if len(time_parts) > 2 else 0
-        
-        # Create local datetime
-        birth_dt_local = datetime.combine(
-            birth_date,
-            datetime.min.time().replace(hour=hour, minute=minute, second=second)
-        )
-        
-        # Convert to UTC (Swiss Ephemeris requires UTC)
-        from src.utils.timezone import local_to_utc
-        birth_dt_utc = local_to_utc(birth_dt_local, timezone)
-        
-        # Calculate Julian Day with proper UTC conversion
-        # Note: calc_ut() requires UTC, so we convert local time to UTC first
-        jd = swe.julday(
-            birth_dt_utc.year, birth_dt_utc.month, birth_dt_utc.day,
-            birth_dt_utc.hour + birth_dt_utc.minute / 60.0 + birth_dt_utc.second / 3600.0,
-            swe.GREG_CAL
-        )
-        
-        # Generate base D1 Kundli using EXACT JHORA engine
-        base_kundli = generate_kundli(jd, lat, lon)
-        
-        # 🔒 D1 NAKSHATRA LORD ATTACHMENT (ASCENDANT)
-        # Add nakshatra_lord to D1 Ascendant based on existing nakshatra_index
-        if "Ascendant" in base_kundli and "nakshatra_index" in base_kundli["Ascendant"]:
-            base_kundli["Ascendant"]["nakshatra_lord"] = get_nakshatra_lord(
-                base_kundli["Ascendant"]["nakshatra_index"]
-            )
-        
-        # 🔒 D1 NAKSHATRA LORD ATTACHMENT (PLANETS)
-        # Add nakshatra_lord to each D1 planet based on existing nakshatra_index
-        for planet_name, pdata in base_kundli.get("Planets", {}).items():
-            if "nakshatra_index" in pdata:
-                pdata["nakshatra_lord"] = get_nakshatra_lord(pdata["nakshatra_index"])
-        
-        # Calculate current dasha for dashboard
-        current_dasha_info = None
-        try:
-            from src.jyotish.dasha_drik import calculate_vimshottari_dasha_drik
-            from datetime import datetime as dt
-            time_str = f"{hour:02d}:{minute:02d}" + (f":{second:02d}" if second > 0 else "")
-            dasha_data = calculate_vimshottari_dasha_drik(
-                birth_date, time_str, lat, lon, timezone, dt.now()
-            )
-            # Extract current dasha
-            current_mahadasha = dasha_data.get("current_mahadasha", {})
-            current_antardasha = dasha_data.get("current_antardasha", {})
-            if current_mahadasha:
-                mahadasha_lord = current_mahadasha.get("lord", "N/A")
-                antardasha_lord = current_antardasha.get("lord", "N/A") if current_antardasha else None
-                current_dasha_info = {
-                    "mahadasha": mahadasha_lord,
-                    "antardasha": antardasha_lord,
-                    "mahadasha_start": current_mahadasha.get("start"),
-                    "mahadasha_end": current_mahadasha.get("end"),
-                    "display": f"{mahadasha_lord} Dasha" + (f" - {antardasha_lord} Antardasha" if antardasha_lord else "")
-                }
-        except Exception as e:
-            # If dasha calculation fails, continue without it
-            import traceback
-            print(f"Warning: Could not calculate current dasha: {e}")
-            traceback.print_exc()
-        
-        # ============================================================
-        # AUTHORITATIVE VARGA COMPUTATION - SINGLE SOURCE OF TRUTH
-        # ============================================================
-        # API routes MUST use varga_engine.py - NEVER call calculate_varga() directly
-        # This ensures consistency across all endpoints and eliminates mismatches
-        # ============================================================
-        
-        from src.jyotish.varga_engine import build_varga_chart, get_varga_ascendant_only, compute_vargottama_flags
-        from src.utils.converters import get_sign_name_sanskrit
-        
-        # 🔒 CRITICAL: Use RAW unrounded sidereal longitudes for varga calculations
-        # DO NOT use rounded degrees from D1 output - rounding causes varga mismatches
-        # Extract raw longitudes directly from ephemeris calculations
-        from src.ephemeris.planets_jhora_exact import calculate_ascendant_jhora_exact, calculate_all_planets_jhora_exact
-        
-        # Get RAW ascendant longitude (unrounded, exact sidereal)
-        asc_jhora_raw = calculate_ascendant_jhora_exact(jd, lat, lon)
-        d1_ascendant = asc_jhora_raw["longitude"]  # Raw unrounded sidereal longitude
-        
-        # 🔍 STEP 1A: RAW D1 ASCENDANT (immediately after ephemeris)
-        print("=" * 80)
-        print("🔍 STEP 1A: RAW D1 ASCENDANT (kundli_routes.py - after calculate_ascendant_jhora_exact)")
-        print("=" * 80)
-        print(f"Ascendant longitude = {asc_jhora_raw['longitude']}")
-        print(f"Ascendant sign_index = {asc_jhora_raw['sign_index']}")
-        print(f"Ascendant degrees_in_sign = {asc_jhora_raw['degrees_in_sign']}")
-        print(f"d1_ascendant (extracted) = {d1_ascendant}")
-        # 🔒 INVARIANT CHECK: d1_ascendant must equal asc_jhora_raw["longitude"]
-        assert abs(d1_ascendant - asc_jhora_raw["longitude"]) < 1e-10, f"d1_ascendant mismatch: {d1_ascendant} != {asc_jhora_raw['longitude']}"
-        print("=" * 80)
-        
-        # Get RAW planet longitudes (unrounded, exact sidereal)
-        planets_jhora_raw = calculate_all_planets_jhora_exact(jd)
-        d1_planets = {
-            planet_name: planet_data["longitude"]  # Raw unrounded sidereal longitude
-            for planet_name, planet_data in planets_jhora_raw.items()
-        }
-        
-        # 🔍 STEP 1B: RAW D1 MOON (for comparison)
-        if "Moon" in planets_jhora_raw:
-            moon_raw = planets_jhora_raw["Moon"]
-            moon_d1_longitude = d1_planets["Moon"]
-            print("=" * 80)
-            print("🔍 STEP 1B: RAW D1 MOON (for comparison)")
-            print("=" * 80)
-            print(f"Moon longitude = {moon_raw['longitude']}")
-            print(f"Moon sign_index = {moon_raw['sign_index']}")
-            print(f"Moon degrees_in_sign = {moon_raw['degrees_in_sign']}")
-            print(f"moon_d1_longitude (extracted) = {moon_d1_longitude}")
-            # 🔒 INVARIANT CHECK: moon_d1_longitude must equal moon_raw["longitude"]
-            assert abs(moon_d1_longitude - moon_raw["longitude"]) < 1e-10, f"moon_d1_longitude mismatch: {moon_d1_longitude} != {moon_raw['longitude']}"
-            print("=" * 80)
-        
-        # 🔍 STEP 1C: VALUES PASSED INTO build_varga_chart()
-        print("=" * 80)
-        print("🔍 STEP 1C: VALUES PASSED INTO build_varga_chart() (kundli_routes.py)")
-        print("=" * 80)
-        print(f"d1_ascendant (BEFORE build_varga_chart) = {d1_ascendant}")
-        if "Moon" in d1_planets:
-            print(f"moon_d1_longitude (BEFORE build_varga_chart) = {d1_planets['Moon']}")
-        # 🔒 INVARIANT CHECK: No rounding before varga calculation
-        assert isinstance(d1_ascendant, float), f"d1_ascendant must be float, got {type(d1_ascendant)}"
-        assert 0 <= d1_ascendant < 360, f"d1_ascendant out of range: {d1_ascendant}"
-        print("=" * 80)
-        
-        # 🔒 MANDATORY VALIDATION: Ensure d1_planets is not empty before building varga charts
-        if not d1_planets or len(d1_planets) == 0:
-            raise ValueError(f"D1 planets dictionary is empty or None. Cannot build varga charts.")
-        if d1_ascendant is None:
-            raise ValueError(f"D1 ascendant is None. Cannot build varga charts.")
-        
-        # Build all varga charts using authoritative engine
-        # This ensures sign and house are computed together atomically
-        # All vargas D1-D60 are supported
-        d2_chart = build_varga_chart(d1_planets, d1_ascendant, 2)
-        d3_chart = build_varga_chart(d1_planets, d1_ascendant, 3)
-        d4_chart = build_varga_chart(d1_planets, d1_ascendant, 4)
-        
-        # 🔒 MANDATORY D4 VALIDATION: Ensure D4 chart is complete before building response
-        if not d4_chart:
-            raise ValueError("D4 chart is None or empty")
-        if "ascendant" not in d4_chart:
-            raise ValueError("D4 chart is incomplete: missing 'ascendant' key")
-        if not d4_chart.get("ascendant"):
-            raise ValueError("D4 chart ascendant is None or empty")
-        if d4_chart["ascendant"].get("sign_index") is None:
-            raise ValueError(f"D4 chart ascendant is incomplete: sign_index is None. Ascendant data: {d4_chart.get('ascendant')}")
-        if "planets" not in d4_chart:
-            raise ValueError("D4 chart is incomplete: missing 'planets' key")
-        if not d4_chart["planets"] or len(d4_chart["planets"]) == 0:
-            raise ValueError(f"D4 chart is incomplete: planets dictionary is empty. d1_planets had {len(d1_planets)} planets: {list(d1_planets.keys())}")
-        
-        d7_chart = build_varga_chart(d1_planets, d1_ascendant, 7)
-        d9_chart = build_varga_chart(d1_planets, d1_ascendant, 9)
-        d10_chart = build_varga_chart(d1_planets, d1_ascendant, 10)
-        # Vargottama (D1 sign == D9 sign): attach to D1 planets only; backend single source of truth
-        vargottama_flags = compute_vargottama_flags(base_kundli["Planets"], d9_chart["planets"])
-        for planet_name, pdata in base_kundli.get("Planets", {}).items():
-            pdata["is_vargottama"] = vargottama_flags.get(planet_name, False)
-        
-        # D12 (Dwadasamsa) - Special handling for ascendant (base formula, no +3 correction)
-        # But planets still use standard varga formula
-        d12_chart = build_varga_chart(d1_planets, d1_ascendant, 12)
-        
-        # Additional varga charts (D16-D60)
-        d16_chart = build_varga_chart(d1_planets, d1_ascendant, 16)
-        d20_chart = build_varga_chart(d1_planets, d1_ascendant, 20)
-        # D24 is LOCKED to Method 1 (JHora verified) - no method parameter
-        d24_chart = build_varga_chart(d1_planets, d1_ascendant, 24)
-        d27_chart = build_varga_chart(d1_planets, d1_ascendant, 27)
-        d30_chart = build_varga_chart(d1_planets, d1_ascendant, 30)
-        d40_chart = build_varga_chart(d1_planets, d1_ascendant, 40)
-        d45_chart = build_varga_chart(d1_planets, d1_ascendant, 45)
-        d60_chart = build_varga_chart(d1_planets, d1_ascendant, 60)
-        
-        # D12 ascendant uses BASE formula (no +3 correction) - recalculate
-        d1_asc_sign = int(d1_ascendant / 30)
-        d1_asc_deg_in_sign = d1_ascendant % 30
-        part = 2.5
-        div_index = int(math.floor(d1_asc_deg_in_sign / part))
-        if div_index >= 12:
-            div_index = 11
-        d12_asc_sign = (d1_asc_sign + div_index) % 12
-        d12_asc_deg_in_sign = (d1_asc_deg_in_sign * 12) % 30
-        d12_asc_longitude = d12_asc_sign * 30 + d12_asc_deg_in_sign
-        from src.utils.converters import normalize_degrees, get_sign_name
-        d12_asc_longitude = normalize_degrees(d12_asc_longitude)
-        
-        # Update D12 ascendant with base formula result
-        # CRITICAL: Lagna is ALWAYS in House 1 (Whole Sign system rule)
-        # DO NOT MODIFY — JHora compatible
-        d12_chart["ascendant"] = {
-            "degree": round(d12_asc_longitude, 4),
-            "sign": get_sign_name(d12_asc_sign),
-            "sign_index": d12_asc_sign,
-            "degrees_in_sign": round(d12_asc_deg_in_sign, 4),
-            "house": 1  # Always 1 for lagna (not sign_index + 1)
-        }
-        
-        # ============================================================
-        # STANDARDIZED API RESPONSE STRUCTURE
-        # ============================================================
-        # D1 and ALL varga charts must return identical structure:
-        # {
-        #   ascendant: { sign, sign_index, degree, house, sign_sanskrit }
-        #   houses: [{ house: 1..12, sign, sign_index, degree, ... }]
-        #   planets: { planet: { sign, sign_index, house, degree, ... } }
-        # }
-        # DO NOT MODIFY — JHora compatible
-        # ============================================================
-        
-        # ⚠️ D1 GRAHA DRISHTI (PLANETARY ASPECTS) — PARĀŚARI RULES ONLY
-        # ⚠️ Compute aspects for D1 using D1's sign_index positions
-        # ⚠️ D1 aspects are computed independently (not reused for other vargas)
-        from src.utils.converters import get_sign_name
-        d1_houses = base_kundli.get("Houses")  # D1 houses from generate_kundli
-        d1_aspects = compute_graha_drishti(
-            base_kundli.get("Planets", {}),
-            houses_array=d1_houses,
-            get_sign_name_fn=get_sign_name
-        )
-        base_kundli["Aspects"] = d1_aspects
-        
-        # Helper function to build standardized varga chart response
-        # 🔒 CRITICAL: Explicitly capture get_nakshatra_lord in closure to prevent scoping errors
-        # This ensures the nested function can access the module-level import
-        _get_nakshatra_lord_fn = get_nakshatra_lord  # Explicit closure binding
-        
-        def build_standardized_varga_response(varga_chart: Dict, chart_type: str) -> Dict:
-            """Build standardized varga chart response matching D1 structure."""
-            # Import required functions
-            from src.utils.converters import get_sign_name, get_sign_name_sanskrit, get_nakshatra_name, normalize_degrees
-            from src.jyotish.kundli_engine import get_house_lord_from_sign
-            
-            # Extract varga number from chart_type (e.g., "D24" -> 24)
-            varga_num = int(chart_type[1:]) if chart_type[1:].isdigit() else 0
-            
-            # For D24-D60: NO HOUSE LOGIC (pure sign charts)
-            # For D1-D20: Build houses array using Whole Sign system
-            if varga_num in (24, 27, 30, 40, 45, 60):
-                # Pure sign chart - no houses
-                houses_array = None
-                ascendant_house = None
-            else:
-                # RUNTIME ASSERTION: Lagna house must be 1 for D1-D20
-                assert varga_chart["ascendant"]["house"] == 1, \
-                    f"{chart_type} lagna house must be 1, got {varga_chart['ascendant']['house']}"
-                
-                # Build houses array for varga using Whole Sign system
-                # 🔒 DO NOT MODIFY — JHora compatible
-                # Whole Sign: House 1 = Varga ascendant sign, House 2 = next sign clockwise, etc.
-                # 🔒 MANDATORY: Normalize asc_sign_index to 0-11 range (data integrity fix)
-                # This ensures house sign_index is NEVER negative or >= 12
-                # Note: sign_index should already be normalized from varga_engine, but we normalize again for safety
-                # 🔒 CRITICAL: _normalize_sign_index is imported from varga_engine.py (canonical source)
-                # DO NOT redefine it here - use the imported function
-                
-                # 🔒 MANDATORY: Use ONLY normalized sign_index from build_varga_chart()
-                # DO NOT recompute or override - use the engine output directly
-                asc_sign_index_raw = varga_chart["ascendant"]["sign_index"]
-                asc_sign_index = _normalize_sign_index(asc_sign_index_raw)
-                
-                # 🔒 CRITICAL ASSERTION: House 1 sign_index MUST equal Ascendant sign_index
-                # This proves houses are Lagna-relative (not absolute zodiac)
-                # This assertion runs BEFORE response leaves backend
-                expected_house1_sign = asc_sign_index
-                
-                houses_array = []
-                for house_num in range(1, 13):
-                    # Calculate sign for this house: (asc_sign + house_num - 1) % 12
-                    # House 1 = ascendant sign, House 2 = next sign, etc.
-                    sign_index = (asc_sign_index + house_num - 1) % 12
-                    
-                    # 🔒 HARD ASSERTION: House sign_index MUST be 0-11 (API response layer)
-                    # This is the FINAL validation before response leaves backend
-                    if sign_index < 0 or sign_index >= 12:
-                        raise ValueError(
-                            f"FATAL API DATA INTEGRITY ERROR: {chart_type} House {house_num} sign_index={sign_index} "
-                            f"is OUT OF RANGE [0, 11]. asc_sign_index={asc_sign_index}, house_num={house_num}. "
-                            f"This indicates a data integrity violation in the API response layer."
-                        )
-                    
-                    houses_array.append({
-                        "house": house_num,
-                        "sign": get_sign_name(sign_index),
-                        "sign_sanskrit": get_sign_name_sanskrit(sign_index),
-                        "sign_index": sign_index,
-                        "degree": 0.0,  # Varga houses don't have cusps
-                        "degrees_in_sign": 0.0,
-                        "lord": get_house_lord_from_sign(sign_index)
-                    })
-                
-                # 🔒 CRITICAL ASSERTION: House 1 sign_index MUST equal Ascendant sign_index
-                # This proves houses are constructed correctly from normalized ascendant
-                house1_sign = houses_array[0]["sign_index"]
-                if house1_sign != expected_house1_sign:
-                    raise ValueError(
-                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} House-1 sign_index={house1_sign} "
-                        f"does NOT equal Ascendant sign_index={expected_house1_sign}. "
-                        f"This indicates houses are NOT Lagna-relative or normalization failed."
-                    )
-                
-                # RUNTIME ASSERTION: Must have exactly 12 houses
-                assert len(houses_array) == 12, f"{chart_type} must have exactly 12 houses"
-                ascendant_house = varga_chart["ascendant"]["house"]  # Always 1 for D1-D20
-            
-            # Build Ascendant response
-            # 🔒 MANDATORY: Use normalized sign_index (same as used for houses)
-            # DO NOT use raw varga_chart["ascendant"]["sign_index"] - it may be unnormalized
-            # For D1-D20: Use the same normalized asc_sign_index used for houses
-            # For D24-D60: Normalize separately (no houses, but still need normalized sign_index)
-            if varga_num not in (24, 27, 30, 40, 45, 60):
-                asc_sign_index_normalized = asc_sign_index  # Use the same normalized value from houses
-            else:
-                asc_sign_index_normalized = _normalize_sign_index(varga_chart["ascendant"]["sign_index"])
-            
-            # ⚠️ NAKSHATRA PER VARGA RULE:
-            # ⚠️ Nakshatra MUST be computed from the VARGA longitude (absolute) for each chart.
-            # ⚠️ NEVER reuse D1 nakshatra for D2–D60. Each varga has its own longitude and nakshatra.
-            
-            # Compute absolute varga longitude for Ascendant
-            asc_deg_in_sign = varga_chart["ascendant"]["degrees_in_sign"]
-            asc_longitude = normalize_degrees(asc_sign_index_normalized * 30.0 + asc_deg_in_sign)
-            
-            # Compute nakshatra index and pada from VARGA longitude
-            nakshatra_span = 13 + 20.0 / 60.0  # 13°20' per nakshatra
-            pada_size = nakshatra_span / 4.0   # 4 padas per nakshatra
-            
-            asc_nak_index = int(asc_longitude // nakshatra_span)
-            if asc_nak_index >= 27:
-                asc_nak_index = 26
-            if asc_nak_index < 0:
-                asc_nak_index = 0
-            
-            asc_degrees_in_nakshatra = asc_longitude % nakshatra_span
-            asc_pada = int(asc_degrees_in_nakshatra // pada_size) + 1
-            if asc_pada > 4:
-                asc_pada = 4
-            if asc_pada < 1:
-                asc_pada = 1
-            
-            asc_nak_name = get_nakshatra_name(asc_nak_index)
-            asc_nak_lord = _get_nakshatra_lord_fn(asc_nak_index)
-            
-            ascendant_response = {
-                "degree": varga_chart["ascendant"]["degree"],
-                "sign": varga_chart["ascendant"]["sign"],
-                "sign_sanskrit": get_sign_name_sanskrit(asc_sign_index_normalized),
-                "sign_index": asc_sign_index_normalized,  # Use normalized sign_index
-                "degrees_in_sign": asc_deg_in_sign,
-                "lord": get_house_lord_from_sign(asc_sign_index_normalized),
-                # Nakshatra data computed from VARGA longitude (per-chart)
-                "nakshatra": asc_nak_name,
-                "nakshatra_index": asc_nak_index,
-                "pada": asc_pada,
-                "nakshatra_lord": asc_nak_lord,
-            }
-            
-            # Only add house field for D1-D20
-            if ascendant_house is not None:
-                ascendant_response["house"] = ascendant_house
-            
-            # 🔒 NORMALIZE PLANET KEYS: Ensure all planets use snake_case keys (sign_index, degrees_in_sign)
-            # This ensures frontend receives consistent key naming
-            normalized_planets = {}
-            for planet_name, planet_data in varga_chart["planets"].items():
-                # Compute VARGA-based nakshatra for each planet (no D1 reuse)
-                planet_sign_index = planet_data.get("sign_index")
-                planet_deg_in_sign = planet_data.get("degrees_in_sign")
-                
-                if planet_sign_index is not None and planet_deg_in_sign is not None:
-                    planet_longitude = normalize_degrees(planet_sign_index * 30.0 + planet_deg_in_sign)
-                    
-                    planet_nak_index = int(planet_longitude // nakshatra_span)
-                    if planet_nak_index >= 27:
-                        planet_nak_index = 26
-                    if planet_nak_index < 0:
-                        planet_nak_index = 0
-                    
-                    planet_degrees_in_nakshatra = planet_longitude % nakshatra_span
-                    planet_pada = int(planet_degrees_in_nakshatra // pada_size) + 1
-                    if planet_pada > 4:
-                        planet_pada = 4
-                    if planet_pada < 1:
-                        planet_pada = 1
-                    
-                    planet_nak_name = get_nakshatra_name(planet_nak_index)
-                    planet_nak_lord = _get_nakshatra_lord_fn(planet_nak_index)
-                else:
-                    # Fallback: should not normally happen, but keep structure intact
-                    planet_nak_index = 0
-                    planet_pada = 1
-                    planet_nak_name = ""
-                    planet_nak_lord = _get_nakshatra_lord_fn(planet_nak_index)
-                
-                normalized_planet = {
-                    "degree": planet_data.get("degree"),
-                    "sign": planet_data.get("sign"),
-                    "sign_name": planet_data.get("sign_name") or planet_data.get("sign"),  # Fallback to sign if sign_name missing
-                    "sign_index": planet_sign_index,  # Ensure snake_case
-                    "degrees_in_sign": planet_deg_in_sign,  # Ensure snake_case
-                    # Nakshatra data computed from VARGA longitude (per-chart)
-                    "nakshatra": planet_nak_name,
-                    "nakshatra_index": planet_nak_index,
-                    "pada": planet_pada,
-                    "nakshatra_lord": planet_nak_lord,
-                }
-                # Add optional fields if present
-                if "house" in planet_data:
-                    normalized_planet["house"] = planet_data["house"]
-                if "degree_dms" in planet_data:
-                    normalized_planet["degree_dms"] = planet_data["degree_dms"]
-                if "arcminutes" in planet_data:
-                    normalized_planet["arcminutes"] = planet_data["arcminutes"]
-                if "arcseconds" in planet_data:
-                    normalized_planet["arcseconds"] = planet_data["arcseconds"]
-                if "degree_formatted" in planet_data:
-                    normalized_planet["degree_formatted"] = planet_data["degree_formatted"]
-                normalized_planets[planet_name] = normalized_planet
-            
-            # ⚠️ GRAHA DRISHTI (PLANETARY ASPECTS) — PARĀŚARI RULES ONLY
-            # ⚠️ Compute aspects independently for EACH varga chart using THAT varga's sign_index positions
-            # ⚠️ Each varga is treated as a standalone chart with its own aspect relationships
-            # ⚠️ NO reuse of D1 aspects for D2–D60
-            aspects_list = compute_graha_drishti(
-                normalized_planets,
-                houses_array=houses_array,
-                get_sign_name_fn=get_sign_name
-            )
-            
-            # 🔒 FINAL API RESPONSE VALIDATION: Assert ALL sign_index values are 0-11
-            # This is the LAST check before response leaves backend
-            response_data = {
-                "Ascendant": ascendant_response,
-                "Houses": houses_array,  # None for D24-D60
-                "Planets": normalized_planets,  # Use normalized planets with snake_case keys
-                "Aspects": aspects_list,  # Graha Drishti computed per varga
-                "chartType": chart_type
-            }
-            
-            # Validate Ascendant sign_index
-            if response_data["Ascendant"]["sign_index"] < 0 or response_data["Ascendant"]["sign_index"] >= 12:
-                raise ValueError(
-                    f"FATAL API DATA INTEGRITY ERROR: {chart_type} Ascendant sign_index={response_data['Ascendant']['sign_index']} "
-                    f"is OUT OF RANGE [0, 11]. This indicates normalization failed."
+        # Stored chart for a registered user: only the current dasha is time-dependent
+        kundli_inputs = {"date": dob, "time": time, "lat": lat, "lon": lon, "timezone": timezone}
+        if stored_birth_detail is not None:
+            stored_response = get_stored_kundli_response(stored_birth_detail, kundli_inputs)
+            if stored_response is not None:
+                current_dasha_info = await compute(
+                    "current_dasha", {"dob": dob, "time": time, "lat": lat, "lon": lon, "timezone": timezone}
+                )
+                if current_dasha_info:
+                    stored_response["current_dasha"] = current_dasha_info
+                return FastJSONResponse(
+                    select_kundli_response(stored_response, selected_vargas, selected_fields, compact)
                 )
-            
-            # Validate ALL house sign_index values (if houses exist)
-            if houses_array is not None:
-                for house in houses_array:
-                    if house["sign_index"] < 0 or house["sign_index"] >= 12:
-                        raise ValueError(
-                            f"FATAL API DATA INTEGRITY ERROR: {chart_type} House {house['house']} sign_index={house['sign_index']} "
-                            f"is OUT OF RANGE [0, 11]. This indicates a data integrity violation."
-                        )
-            
-            # Validate ALL planet sign_index values
-            for planet_name, planet_data in response_data["Planets"].items():
-                if planet_data.get("sign_index") is None:
-                    raise ValueError(
-                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} missing sign_index. "
-                        f"Planet data: {planet_data}"
-                    )
-                if planet_data["sign_index"] < 0 or planet_data["sign_index"] >= 12:
-                    raise ValueError(
-                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} sign_index={planet_data['sign_index']} "
-                        f"is OUT OF RANGE [0, 11]. This indicates normalization failed."
-                    )
-                if planet_data.get("degrees_in_sign") is None:
-                    raise ValueError(
-                        f"FATAL API DATA INTEGRITY ERROR: {chart_type} {planet_name} missing degrees_in_sign. "
-                        f"Planet data: {planet_data}"
-                    )
-            
-            return response_data
-        
-        # Build standardized response with consistent structure
-        # Include ALL varga charts (D1-D60)
-        
-        # 🔒 D4: Build response and log separately to avoid lambda issues
-        d4_response = build_standardized_varga_response(d4_chart, "D4")
-        print("=" * 80)
-        print("🔍 MANDATORY D4 PAYLOAD LOG (API BOUNDARY)")
-        print("=" * 80)
-        print(f"D4 Response Keys: {list(d4_response.keys()) if isinstance(d4_response, dict) else 'NOT A DICT'}")
-        print(f"D4 Response Type: {type(d4_response)}")
-        print(f"D4 Ascendant: {d4_response.get('Ascendant', {}) if isinstance(d4_response, dict) else 'N/A'}")
-        print(f"D4 Ascendant sign_index: {d4_response.get('Ascendant', {}).get('sign_index') if isinstance(d4_response, dict) else 'N/A'}")
-        print(f"D4 Houses Count: {len(d4_response.get('Houses', [])) if isinstance(d4_response, dict) else 'N/A'}")
-        if isinstance(d4_response, dict) and d4_response.get('Houses'):
-            for h in d4_response.get('Houses', []):
-                print(f"D4 House {h.get('house')}: sign_index={h.get('sign_index')}, sign={h.get('sign')}")
-        print("=" * 80)
-        
-        # 🔒 PLANET FUNCTIONAL STRENGTH (D1-ONLY, BACKEND-ONLY)
-        # Compute ancient Jyotish functional strength flags from the FINAL D1 chart.
-        # - Backend-only extension
-        # - D1-only input (base_kundli)
-        # - NO recomputation of planets
-        # - NO prediction logic
-        try:
-            planet_strength = calculate_planet_functional_strength(base_kundli)
-            planet_strength_raw = planet_strength.get("planet_functional_strength", {})
-            
-            # 🔒 PLANET KEY NORMALIZATION: Ensure canonical keys (Sun, Moon, Mars, etc.)
-            # Frontend expects EXACT keys: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu, Ketu
-            # This normalization ensures API response shape matches frontend expectations
-            CANONICAL_PLANET_KEYS = {
-                "Sun": "Sun",
-                "Moon": "Moon",
-                "Mars": "Mars",
-                "Mercury": "Mercury",
-                "Jupiter": "Jupiter",
-                "Venus": "Venus",
-                "Saturn": "Saturn",
-                "Rahu": "Rahu",
-                "Ketu": "Ketu",
-                # Common aliases (if any exist in input)
-                "Su": "Sun",
-                "Mo": "Moon",
-                "Ma": "Mars",
-                "Me": "Mercury",
-                "Ju": "Jupiter",
-                "Ve": "Venus",
-                "Sa": "Saturn",
-                "Ra": "Rahu",
-                "Ke": "Ketu",
-            }
-            
-            # Expected canonical keys (frontend contract)
-            EXPECTED_KEYS = {"Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"}
-            
-            planet_strength_payload = {}
-            for raw_key, strength_data in planet_strength_raw.items():
-                # Normalize key to canonical format
-                canonical_key = CANONICAL_PLANET_KEYS.get(raw_key, raw_key)
-                # Only include if it's a canonical key (frontend expects these exact keys)
-                if canonical_key in EXPECTED_KEYS:
-                    planet_strength_payload[canonical_key] = strength_data
-                else:
-                    # If key doesn't match any known format, log warning
-                    logging.getLogger(__name__).warning(
-                        f"Unknown planet key in functional strength: {raw_key} (normalized to: {canonical_key}). Skipping."
-                    )
-            
-        except Exception as e:
-            # Fail-safe: Never break main kundli response if strength engine fails
-            logging.getLogger(__name__).error(
-                "Planet functional strength calculation failed: %s", e
-            )
-            planet_strength_payload = {}
-        
-        response = {
-            "julian_day": round(jd, 6),
-            "D1": base_kundli,
-            "D2": build_standardized_varga_response(d2_chart, "D2"),
-            "D3": build_standardized_varga_response(d3_chart, "D3"),
-            "D4": d4_response,
-            "D7": build_standardized_varga_response(d7_chart, "D7"),
-            "D9": build_standardized_varga_response(d9_chart, "D9"),
-            "D10": build_standardized_varga_response(d10_chart, "D10"),
-            "D12": build_standardized_varga_response(d12_chart, "D12"),
-            # Additional varga charts (D16-D60)
-            "D16": build_standardized_varga_response(d16_chart, "D16"),
-            "D20": build_standardized_varga_response(d20_chart, "D20"),
-            "D24": build_standardized_varga_response(d24_chart, "D24"),
-            "D27": build_standardized_varga_response(d27_chart, "D27"),
-            "D30": build_standardized_varga_response(d30_chart, "D30"),
-            "D40": build_standardized_varga_response(d40_chart, "D40"),
-            "D45": build_standardized_varga_response(d45_chart, "D45"),
-            "D60": build_standardized_varga_response(d60_chart, "D60"),
-            # Planet Functional Strength (ancient Jyotish engine; D1-only input)
-            # This is a BACKEND-ONLY, additive payload. Frontend may ignore safely.
-            "planet_functional_strength": planet_strength_payload,
-        }
-        
-        # CRITICAL: Log final payload for D10 verification (Prokerala match)
-        logger = logging.getLogger(__name__)
-        if "D10" in response:
-            d10_data = response["D10"]
-            logger.info(f"📊 D10 FINAL PAYLOAD (Authoritative Engine):")
-            logger.info(f"   Ascendant: {d10_data.get('Ascendant', {}).get('sign_sanskrit')} (sign_index={d10_data.get('Ascendant', {}).get('sign_index')}) → House {d10_data.get('Ascendant', {}).get('house')}")
-            for planet_name in ["Venus", "Mars"]:
-                if planet_name in d10_data.get("Planets", {}):
-                    planet_data = d10_data["Planets"][planet_name]
-                    logger.info(f"   {planet_name}: {planet_data.get('sign')} (sign_index={planet_data.get('sign_index')}) → House {planet_data.get('house')}")
         
-        # Log all varga charts included in response
-        varga_keys = [key for key in response.keys() if key.startswith("D") and key != "D1"]
-        logger.info(f"✅ VARGA CHARTS INCLUDED IN RESPONSE: {sorted(varga_keys, key=lambda x: int(x[1:]) if x[1:].isdigit() else 999)}")
-        logger.info(f"   Total varga charts: {len(varga_keys)}")
+        # D1 + all vargas are computed in a worker process, off the event loop
+        response = await compute(
+            "kundli", {"dob": dob, "time": time, "lat": lat, "lon": lon, "timezone": timezone}
+        )
+        current_dasha_info = response.pop("current_dasha", None)
         
-        # Verify D16-D60 are present
-        required_vargas = ["D16", "D20", "D24", "D27", "D30", "D40", "D45", "D60"]
-        missing_vargas = [v for v in required_vargas if v not in response]
-        if missing_vargas:
-            logger.warning(f"⚠️  MISSING VARGA CHARTS: {missing_vargas}")
-        else:
-            logger.info(f"✅ All extended varga charts (D16-D60) are included in response")
+        # Persist the natal response for the next request of this user
+        if stored_birth_detail is not None:
+            _store_kundli_for_user(stored_birth_detail.id, kundli_inputs, response)
         
         # Add current dasha information if available
         if current_dasha_info:
             response["current_dasha"] = current_dasha_info
         
-        return response
+        # Plain JSON types: encoded directly, without FastAPI's jsonable_encoder pass
+        return FastJSONResponse(select_kundli_response(response, selected_vargas, selected_fields, compact))
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except ValueError as e:
         raise HTTPException(
             status_code=400, 
@@ -1260,16 +1421,16 @@ async def kundli_transits(
                         lon = birth_detail.birth_longitude if birth_detail.birth_longitude is not None else lon
                         timezone = birth_detail.timezone or timezone
                     else:
-                        print(f"⚠️  Warning: user_id {user_id} not found in database. Using query parameters.")
+                        logger.warning("user_id %s not found in database; using query parameters", user_id)
                 except Exception as query_error:
-                    print(f"⚠️  Warning: Database query failed ({type(query_error).__name__}). Using query parameters.")
+                    logger.warning("Database query failed (%s); using query parameters", type(query_error).__name__)
                 finally:
                     try:
                         db.close()
                     except:
                         pass
             except Exception as db_error:
-                print(f"⚠️  Warning: Database unavailable ({type(db_error).__name__}). Using query parameters.")
+                logger.warning("Database unavailable (%s); using query parameters", type(db_error).__name__)
         
         # Store birth location for fallback (from DB lookup or query params)
         birth_lat = lat
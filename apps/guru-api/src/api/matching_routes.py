@@ -5,7 +5,9 @@ Phase 13: Matchmaking endpoints (Gun Milan, Porutham, Advanced, Full Report).
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List, Literal, Optional, Union
 import swisseph as swe
 
 from src.jyotish.kundli_engine import generate_kundli
@@ -13,6 +15,7 @@ from src.matching.gun_milan import gun_milan
 from src.matching.porutham import porutham
 from src.matching.match_engine import full_match_report
 from src.matching.match_ai import ai_match_interpretation
+from src.matching.match_index import MatchIndex, match_key
 
 router = APIRouter()
 
@@ -240,3 +243,100 @@ async def get_full_match_report(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating match report: {str(e)}")
 
+
+
+class MatchBirthDetails(BaseModel):
+    dob: str
+    time: str
+    lat: float
+    lon: float
+
+
+class MatchCandidate(BaseModel):
+    id: Union[str, int]
+    # Stored match key [moon_nakshatra, moon_sign, manglik_code] from /match/key;
+    # birth details are only needed for candidates without one
+    key: Optional[List[int]] = Field(None, min_length=3, max_length=3)
+    birth_details: Optional[MatchBirthDetails] = None
+
+
+class MatchSearchRequest(BaseModel):
+    profile: MatchBirthDetails
+    profile_gender: Literal["boy", "girl"] = "boy"
+    candidates: List[MatchCandidate]
+    top_k: int = Field(10, ge=1, le=1000)
+    min_guna: float = Field(0, ge=0, le=36)
+    min_porutham: int = Field(0, ge=0, le=10)
+    manglik: Literal["any", "cancelled", "safe"] = "any"
+
+
+def build_match_key(details: MatchBirthDetails) -> tuple:
+    """Match key (moon_nakshatra, moon_sign, manglik_code) from birth details."""
+    kundli, _ = build_kundli(details.dob, details.time, details.lat, details.lon)
+    return match_key(kundli)
+
+
+@router.get("/key")
+async def get_match_key(
+    dob: str = Query(..., description="Date of birth (YYYY-MM-DD)"),
+    time: str = Query(..., description="Time of birth (HH:MM)"),
+    lat: float = Query(..., description="Birth latitude"),
+    lon: float = Query(..., description="Birth longitude")
+):
+    """
+    Compact match key to store with a candidate profile for /match/search.
+    
+    Returns:
+        Match key [moon_nakshatra, moon_sign, manglik_code]
+    """
+    try:
+        return {"key": list(build_match_key(MatchBirthDetails(dob=dob, time=time, lat=lat, lon=lon)))}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculating match key: {str(e)}")
+
+
+@router.post("/search")
+async def search_matches(request: MatchSearchRequest):
+    """
+    Rank a candidate pool against one profile (Guna Milan, Porutham, Manglik filters).
+    
+    Candidates are scored from their match keys in one vectorized pass, so
+    pass stored keys rather than birth details for large pools.
+    
+    Returns:
+        Pool size, number of candidates passing the filters and the top_k matches
+    """
+    try:
+        index = MatchIndex()
+        for candidate in request.candidates:
+            if candidate.key is not None:
+                key = candidate.key
+            elif candidate.birth_details is not None:
+                key = build_match_key(candidate.birth_details)
+            else:
+                raise HTTPException(status_code=400, detail=f"Candidate {candidate.id}: key or birth_details is required")
+            index.add(candidate.id, key)
+        
+        profile_key = build_match_key(request.profile)
+        result = index.search(
+            profile_key,
+            profile_is_boy=request.profile_gender == "boy",
+            top_k=request.top_k,
+            min_guna=request.min_guna,
+            min_porutham=request.min_porutham,
+            manglik=request.manglik,
+        )
+        return {
+            "match_type": "Compatibility Search",
+            "profile_key": list(profile_key),
+            "profile_gender": request.profile_gender,
+            **result
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching matches: {str(e)}")
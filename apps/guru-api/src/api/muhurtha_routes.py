@@ -6,20 +6,27 @@ API endpoints for Muhurtha calculations.
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+import asyncio
 
 from src.auth.middleware import get_current_user
 from src.db.database import SessionLocal
 from src.db.models import User, BirthDetail
+from src.compute.executor import ComputeError, compute
 from src.muhurtha.muhurtha_engine import get_best_muhurtha
+from src.muhurtha.muhurtha_search import merge_muhurtha_results, search_muhurtha_range
 from src.nlg.nlg_muhurtha import format_muhurtha
 from src.jyotish.kundli_engine import generate_kundli
 from src.jyotish.dasha_engine import calculate_vimshottari_dasha
 from src.transit_ai.transit_context_builder import build_transit_context
+from src.utils.timezone import local_to_utc
 import swisseph as swe
 
 router = APIRouter()
 
+# Days per compute task when a range search runs in parallel
+MUHURTHA_DAYS_PER_TASK = 30
+
 
 @router.get("/best-time", response_model=Dict)
 async def get_muhurtha(
@@ -95,3 +102,76 @@ async def get_muhurtha(
     finally:
         db.close()
 
+
+
+@router.get("/search", response_model=Dict)
+async def search_muhurtha(
+    task: str = Query(..., description="Task type: travel, job_application, marriage_talk, investment, property_purchase, business_start, medical_treatment, spiritual_initiation, naming_ceremony"),
+    start_date: Optional[str] = Query(None, description="First date (YYYY-MM-DD, defaults to today)"),
+    days: int = Query(30, ge=1, le=366, description="Number of days to search"),
+    top_k: int = Query(5, ge=1, le=50, description="Number of windows to return"),
+    prune: bool = Query(True, description="Skip Rikta Tithi and Vishti Karana days"),
+    parallel: bool = Query(False, description="Split long ranges across compute workers"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Phase 20: Best Muhurtha windows for a task over a range of days.
+    """
+    db = SessionLocal()
+    try:
+        birth_details = db.query(BirthDetail).filter(BirthDetail.user_id == current_user.id).first()
+        if not birth_details:
+            raise HTTPException(status_code=404, detail="Birth details not found for the user.")
+        
+        first_day = datetime.strptime(start_date, "%Y-%m-%d") if start_date else datetime.now()
+        location = {
+            "latitude": birth_details.birth_latitude,
+            "longitude": birth_details.birth_longitude,
+            "timezone": birth_details.timezone
+        }
+        
+        # Natal chart once for the whole range (as build_transit_context builds it)
+        hour, minute = map(int, birth_details.birth_time.split(':'))
+        birth_dt = birth_details.birth_date.replace(hour=hour, minute=minute, second=0, microsecond=0, tzinfo=None)
+        birth_dt_utc = local_to_utc(birth_dt, birth_details.timezone or "UTC")
+        birth_jd = swe.julday(
+            birth_dt_utc.year, birth_dt_utc.month, birth_dt_utc.day,
+            birth_dt_utc.hour + birth_dt_utc.minute / 60.0,
+            swe.GREG_CAL
+        )
+        natal_chart = generate_kundli(birth_jd, birth_details.birth_latitude, birth_details.birth_longitude)
+        params = {
+            "location": location,
+            "task": task,
+            "natal_asc": natal_chart["Ascendant"]["degree"],
+            "natal_moon": natal_chart["Planets"]["Moon"]["degree"],
+            "top_k": top_k,
+            "prune": prune
+        }
+        
+        chunks = [
+            (offset, min(MUHURTHA_DAYS_PER_TASK, days - offset))
+            for offset in range(0, days, MUHURTHA_DAYS_PER_TASK if parallel else days)
+        ]
+        results = await asyncio.gather(*(
+            compute("muhurtha_range", {
+                "start_date": (first_day + timedelta(days=offset)).strftime("%Y-%m-%d"),
+                "days": length,
+                **params
+            })
+            for offset, length in chunks
+        ))
+        return {
+            "search": merge_muhurtha_results(results, top_k),
+            "generated_at": datetime.now().isoformat()
+        }
+    except HTTPException:
+        raise
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching Muhurtha: {str(e)}")
+    finally:
+        db.close()
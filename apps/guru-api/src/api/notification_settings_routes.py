@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional
+import pytz
 
 from src.db.database import get_db
 from src.auth.middleware import get_current_user
@@ -26,6 +27,7 @@ class NotificationPreferencesRequest(BaseModel):
     language: Optional[str] = None  # english, hindi, kannada
     whatsapp_number: Optional[str] = None
     push_token: Optional[str] = None
+    timezone: Optional[str] = None  # IANA timezone, e.g. Asia/Kolkata
 
 
 @router.get("/preferences")
@@ -48,6 +50,8 @@ async def get_notification_preferences(
     return {
         "user_id": current_user.id,
         "delivery_time": prefs.delivery_time,
+        "timezone": prefs.timezone,
+        "next_delivery_at": prefs.next_delivery_at.isoformat() if prefs.next_delivery_at else None,
         "channel_whatsapp": prefs.channel_whatsapp,
         "channel_email": prefs.channel_email,
         "channel_push": prefs.channel_push,
@@ -84,6 +88,10 @@ async def update_notification_preferences(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid time format. Use HH:MM")
     
+    # Validate timezone
+    if request.timezone and request.timezone not in pytz.all_timezones_set:
+        raise HTTPException(status_code=400, detail="timezone must be an IANA timezone (e.g. Asia/Kolkata)")
+    
     # Validate channel values
     valid_channels = ["enabled", "disabled"]
     if request.channel_whatsapp and request.channel_whatsapp not in valid_channels:
@@ -111,6 +119,7 @@ async def update_notification_preferences(
         language=request.language,
         whatsapp_number=request.whatsapp_number,
         push_token=request.push_token,
+        timezone=request.timezone,
         db=db
     )
     
@@ -118,6 +127,7 @@ async def update_notification_preferences(
         "message": "Notification preferences updated successfully",
         "preferences": {
             "delivery_time": prefs.delivery_time,
+            "timezone": prefs.timezone,
             "channel_whatsapp": prefs.channel_whatsapp,
             "channel_email": prefs.channel_email,
             "channel_push": prefs.channel_push,
@@ -14,7 +14,7 @@ import swisseph as swe
 from src.db.schemas import PanchangRequest
 from src.jyotish.panchang import calculate_panchang
 from src.jyotish.panchang_engine import generate_panchang
-from src.jyotish.panchanga.panchanga_engine import calculate_panchanga
+from src.jyotish.panchanga.panchanga_cache import get_cached_panchanga
 
 router = APIRouter()
 
@@ -132,8 +132,8 @@ def get_panchanga(
         # Validate date format
         datetime.strptime(date, "%Y-%m-%d")
         
-        # Calculate Panchanga
-        panchanga_data = calculate_panchanga(
+        # Calculate Panchanga (cached per date + location)
+        panchanga_data = get_cached_panchanga(
             date=date,
             latitude=lat,
             longitude=lon,
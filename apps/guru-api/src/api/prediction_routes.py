@@ -9,10 +9,12 @@ import logging
 import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import pytz
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.config import settings
@@ -26,8 +28,11 @@ from src.ai.post_processor import (
     apply_dharma_graha_tone_to_section,
     apply_anti_leak_sanitizer,
     sanitize_structured_dict,
+    get_canonical_throne,
 )
-from src.ai.llm_client import LLMClient
+from src.ai.json_stream import JsonObjectStream
+from src.ai.llm_cache import canonical_context, get_llm_cache, make_cache_key, period_end
+from src.ai.llm_client import get_async_llm_client, run_until_disconnected
 from src.jyotish.ai.interpretation_engine import apply_tara_global_tone
 from src.ai.rishi_prompt import (
     RISHI_PRESENCE_PROMPT,
@@ -694,9 +699,14 @@ def _strip_disallowed_retrograde(guidance: str, allowed_retrograde: set) -> str:
     if not guidance or not guidance.strip():
         return guidance
 
+    retro_keywords = ["retrograde", "vakri", "revisitation", "reversal"]
+    guidance_lower = guidance.lower()
+    if not any(k in guidance_lower for k in retro_keywords):
+        # No line can be removed
+        return guidance
+
     allowed = {p.lower() for p in allowed_retrograde}
     planet_names = ["mercury", "venus", "mars", "jupiter", "saturn", "sun", "moon"]
-    retro_keywords = ["retrograde", "vakri", "revisitation", "reversal"]
 
     lines = guidance.split("\n")
     out: List[str] = []
@@ -1241,9 +1251,13 @@ class PredictRequest(BaseModel):
     calculation_date: Optional[str] = None
 
 
-def predict(birth_details: Dict[str, Any], timescale: str = "daily", calculation_date_override: Optional[str] = None) -> Dict[str, Any]:
+def _prepare_prediction(
+    birth_details: Dict[str, Any],
+    timescale: str = "daily",
+    calculation_date_override: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Standalone prediction: build Guru Context and call AI.
+    CPU-bound part of predict(): Guru Context, AI context JSON and backend declarations.
     """
     tz = pytz.timezone(birth_details.get("timezone", "Asia/Kolkata"))
     if calculation_date_override:
@@ -1258,7 +1272,8 @@ def predict(birth_details: Dict[str, Any], timescale: str = "daily", calculation
         calculation_date=calculation_date,
     )
 
-    ai_context = json.loads(json.dumps(context))
+    # Only top-level keys are replaced below, so a shallow copy keeps context intact
+    ai_context = dict(context)
     timezone = birth_details.get("timezone", "Asia/Kolkata")
     if timescale == "daily":
         events = context.get("transit_events")
@@ -1280,8 +1295,6 @@ def predict(birth_details: Dict[str, Any], timescale: str = "daily", calculation
         if yearly_shifts:
             ai_context["yearly_transits"] = yearly_shifts
 
-    guidance = ""
-    openai_key = getattr(settings, "openai_api_key", None)
     seeker_name = birth_details.get("name", "Seeker")
     context_json = json.dumps(ai_context, indent=2)
 
@@ -1314,19 +1327,43 @@ ALLOWED RETROGRADE PLANETS (use Retrograde/Vakri only for these): {allowed_retro
         allowed_retrograde_str = "None"
         allowed_retrograde_set_out = set()
 
-    if openai_key:
-        try:
-            client = LLMClient()
-            if client.mode == "openai" and client.openai_client:
-                # Structured flow for daily: LLM fills interpretation slots only, backend assembles
-                use_structured = timescale == "daily" and declarations_block
-                if use_structured:
-                    severe = context.get("severe_stress", False)
-                    moderate = context.get("moderate_stress", False)
-                    remedy_note = f"REMEDY GATING: severe_stress={severe}, moderate_stress={moderate}. Obey these flags."
-                    context["_allowed_retrograde_names"] = list(allowed_retrograde_set_out)
-                    content_depth_block = _build_content_depth_block(context)
-                    structured_prompt = f"""Seeker: {seeker_name}
+    return {
+        "context": context,
+        "seeker_name": seeker_name,
+        "context_json": context_json,
+        "declarations_block": declarations_block,
+        "allowed_retrograde_str": allowed_retrograde_str,
+        "allowed_retrograde_set_out": allowed_retrograde_set_out,
+        "backend_declarations_section": backend_declarations_section,
+        "ai_context": ai_context,
+        "calculation_date": calculation_date,
+        "timezone": timezone,
+    }
+
+
+STRUCTURED_SYSTEM_PROMPT = GURU_SYSTEM_PROMPT + "\n\nReturn ONLY valid JSON. Keys: greeting, panchanga, dasha, chandra_bala, tara_bala, major_transits, dharmic_guidance, throne, moon_movement, nirnaya, shanti_parihara."
+
+# LLM call parameters shared by /predict and /predict/stream
+PREDICT_LLM_OPTIONS = {"max_tokens": 1400, "temperature": 0.5, "top_p": 0.9, "model": "gpt-4o"}
+
+
+def _uses_structured_flow(prepared: Dict[str, Any], timescale: str) -> bool:
+    """Daily with backend declarations: LLM fills interpretation slots only, backend assembles."""
+    return bool(timescale == "daily" and prepared["declarations_block"])
+
+
+def _build_structured_prompt(prepared: Dict[str, Any]) -> str:
+    """Prompt for the structured (JSON sections) daily flow."""
+    context = prepared["context"]
+    seeker_name = prepared["seeker_name"]
+    context_json = prepared["context_json"]
+    allowed_retrograde_str = prepared["allowed_retrograde_str"]
+    severe = context.get("severe_stress", False)
+    moderate = context.get("moderate_stress", False)
+    remedy_note = f"REMEDY GATING: severe_stress={severe}, moderate_stress={moderate}. Obey these flags."
+    context["_allowed_retrograde_names"] = list(prepared["allowed_retrograde_set_out"])
+    content_depth_block = _build_content_depth_block(context)
+    return f"""Seeker: {seeker_name}
 
 Return ONLY a valid JSON object. No markdown, no code block, no other text.
 Keys (all required, use empty string "" if no content): greeting, panchanga, dasha, chandra_bala, tara_bala, major_transits, dharmic_guidance, throne, moon_movement, nirnaya, shanti_parihara
@@ -1358,70 +1395,14 @@ CONTENT DEPTH ENFORCEMENT (GuruSuite doctrine)
 
 JSON CONTEXT:
 {context_json}"""
-                    try:
-                        _log = logging.getLogger(__name__)
-                        _log.info("[predict] OpenAI structured call starting")
-                        t0 = time.perf_counter()
-                        resp = client.openai_client.chat.completions.create(
-                            model="gpt-4o",
-                            messages=[
-                                {"role": "system", "content": GURU_SYSTEM_PROMPT + "\n\nReturn ONLY valid JSON. Keys: greeting, panchanga, dasha, chandra_bala, tara_bala, major_transits, dharmic_guidance, throne, moon_movement, nirnaya, shanti_parihara."},
-                                {"role": "user", "content": structured_prompt},
-                            ],
-                            max_tokens=1400,
-                            temperature=0.5,
-                            top_p=0.9,
-                            response_format={"type": "json_object"},
-                            timeout=120.0,
-                        )
-                        elapsed = time.perf_counter() - t0
-                        _log.info("[predict] OpenAI structured call completed in %.2fs", elapsed)
-                        raw = (resp.choices[0].message.content or "").strip()
-                        # Strip markdown code blocks if present
-                        if raw.startswith("```"):
-                            raw = re.sub(r"^```(?:json)?\s*", "", raw)
-                            raw = re.sub(r"\s*```$", "", raw)
-                        parsed = json.loads(raw) if raw else {}
-                        if isinstance(parsed, dict):
-                            # Normalize keys: LLM may return Dharmic_guidance, dharmic guidance, etc
-                            parsed = {k.lower().replace(" ", "_"): v for k, v in parsed.items()}
-                            _, structured_out = _assemble_structured_output(
-                                declarations_block, parsed, context, seeker_name
-                            )
-                            # Dharma lock: apply only to dharmic_guidance section
-                            structured_out["dharmic_guidance"] = apply_dharma_graha_tone_to_section(
-                                structured_out.get("dharmic_guidance") or "", context
-                            )
-                            # Nirnaya format lock: backend enforces bullet structure; do not trust LLM formatting
-                            structured_out["nirnaya"] = _enforce_nirnaya_format(
-                                structured_out.get("nirnaya") or ""
-                            )
-                            # Rebuild guidance WITH canonical headings — never flat body
-                            guidance = _build_guidance_with_structure(structured_out)
-                            guidance = _strip_disallowed_retrograde(
-                                guidance, allowed_retrograde_set_out
-                            ) if allowed_retrograde_set_out else guidance
-                            guidance = apply_anti_leak_sanitizer(guidance)
-                            structured_out = sanitize_structured_dict(structured_out)
-                            guidance = _ensure_mandatory_sections_in_guidance(guidance, context)
-                            import logging as _log
-                            _log.getLogger(__name__).debug(
-                                "Structured sections: %s", list(structured_out.keys()),
-                            )
-                            return {
-                                "guidance": guidance,
-                                "structured": structured_out,
-                                "context": context,
-                                "technical_breakdown": {
-                                    "strength": context.get("strength", {}),
-                                    "time": context.get("time", {}),
-                                    "quality": context.get("quality", {}),
-                                },
-                            }
-                    except (json.JSONDecodeError, KeyError, TypeError):
-                        pass
-
-                user_prompt = f"""Seeker Name: {seeker_name}
+
+
+def _build_narrative_prompt(prepared: Dict[str, Any]) -> str:
+    """Prompt for the unstructured (single narrative) flow."""
+    seeker_name = prepared["seeker_name"]
+    context_json = prepared["context_json"]
+    backend_declarations_section = prepared["backend_declarations_section"]
+    return f"""Seeker Name: {seeker_name}
 
 You must produce ONE seamless classical Daivajna daily prediction.
 No headings.
@@ -1723,29 +1704,84 @@ JSON CONTEXT:
 
 Produce one seamless classical Daivajna daily prediction.
 """
-                _log = logging.getLogger(__name__)
-                _log.info("[predict] OpenAI unstructured call starting")
-                t0 = time.perf_counter()
-                response = client.openai_client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": GURU_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    max_tokens=1400,
-                    temperature=0.5,
-                    top_p=0.9,
-                    timeout=120.0,
-                )
-                elapsed = time.perf_counter() - t0
-                _log.info("[predict] OpenAI unstructured call completed in %.2fs", elapsed)
-                guidance = response.choices[0].message.content or ""
-            else:
-                guidance = "Guidance could not be generated (client not openai)."
-        except Exception:
-            guidance = "Guidance could not be generated. Use the technical breakdown below."
-    else:
-        guidance = "OPENAI_API_KEY not set"
+
+
+def _parse_structured_response(raw: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the structured LLM response.
+
+    Returns:
+        Sections with normalized keys, or None if the response is not a JSON object
+    """
+    raw = (raw or "").strip()
+    # Strip markdown code blocks if present
+    if raw.startswith("```"):
+        raw = re.sub(r"^```(?:json)?\s*", "", raw)
+        raw = re.sub(r"\s*```$", "", raw)
+    try:
+        parsed = json.loads(raw) if raw else {}
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    # Normalize keys: LLM may return Dharmic_guidance, dharmic guidance, etc
+    return {k.lower().replace(" ", "_"): v for k, v in parsed.items()}
+
+
+def _prediction_result(context: Dict[str, Any], guidance: str, structured: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Response body of /predict."""
+    result: Dict[str, Any] = {"guidance": guidance}
+    if structured is not None:
+        result["structured"] = structured
+    result["context"] = context
+    result["technical_breakdown"] = {
+        "strength": context.get("strength", {}),
+        "time": context.get("time", {}),
+        "quality": context.get("quality", {}),
+    }
+    return result
+
+
+def _lock_structured_sections(structured: Dict[str, str], context: Dict[str, Any]) -> None:
+    """Backend locks on assembled sections (in place)."""
+    # Dharma lock: apply only to dharmic_guidance section
+    structured["dharmic_guidance"] = apply_dharma_graha_tone_to_section(
+        structured.get("dharmic_guidance") or "", context
+    )
+    # Nirnaya format lock: backend enforces bullet structure; do not trust LLM formatting
+    structured["nirnaya"] = _enforce_nirnaya_format(
+        structured.get("nirnaya") or ""
+    )
+
+
+def _finalize_structured(prepared: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the structured daily prediction from parsed LLM sections."""
+    context = prepared["context"]
+    allowed_retrograde_set_out = prepared["allowed_retrograde_set_out"]
+    _, structured_out = _assemble_structured_output(
+        prepared["declarations_block"], parsed, context, prepared["seeker_name"]
+    )
+    _lock_structured_sections(structured_out, context)
+    # Rebuild guidance WITH canonical headings — never flat body
+    guidance = _build_guidance_with_structure(structured_out)
+    guidance = _strip_disallowed_retrograde(
+        guidance, allowed_retrograde_set_out
+    ) if allowed_retrograde_set_out else guidance
+    guidance = apply_anti_leak_sanitizer(guidance)
+    structured_out = sanitize_structured_dict(structured_out)
+    guidance = _ensure_mandatory_sections_in_guidance(guidance, context)
+    logging.getLogger(__name__).debug(
+        "Structured sections: %s", list(structured_out.keys()),
+    )
+    return _prediction_result(context, guidance, structured_out)
+
+
+def _finalize_guidance(prepared: Dict[str, Any], timescale: str, guidance: str) -> Dict[str, Any]:
+    """Apply backend overrides to narrative guidance (or the LLM failure text) and build the response."""
+    context = prepared["context"]
+    seeker_name = prepared["seeker_name"]
+    declarations_block = prepared["declarations_block"]
+    allowed_retrograde_set_out = prepared["allowed_retrograde_set_out"]
 
     guidance = _apply_daily_moon_transit_override(context, timescale, guidance)
     # Backend-enforced declarations prepended (deterministic structure; no LLM dependence)
@@ -1780,16 +1816,7 @@ Produce one seamless classical Daivajna daily prediction.
         }
         guidance = _build_guidance_with_structure(fallback_structured)
         fallback_structured = sanitize_structured_dict(fallback_structured)
-        return {
-            "guidance": guidance,
-            "structured": fallback_structured,
-            "context": context,
-            "technical_breakdown": {
-                "strength": context.get("strength", {}),
-                "time": context.get("time", {}),
-                "quality": context.get("quality", {}),
-            },
-        }
+        return _prediction_result(context, guidance, fallback_structured)
 
     # Post-LLM validation and formatting layer (final transformation before return)
     if guidance:
@@ -1810,36 +1837,300 @@ Produce one seamless classical Daivajna daily prediction.
                 )
         guidance = _ensure_mandatory_sections_in_guidance(guidance, context)
 
-    import logging as _log
-    _log.getLogger(__name__).debug(
+    logging.getLogger(__name__).debug(
         "Final guidance has NIRNAYA: %s, SHANTI: %s",
         "NIRNAYA" in (guidance or ""),
         "SHANTI" in (guidance or ""),
     )
 
-    return {
-        "guidance": guidance,
-        "context": context,
-        "technical_breakdown": {
-            "strength": context.get("strength", {}),
-            "time": context.get("time", {}),
-            "quality": context.get("quality", {}),
-        },
+    return _prediction_result(context, guidance)
+
+
+def _llm_cache_keys(prepared: Dict[str, Any], timescale: str, model_id: str) -> Tuple[str, str, float]:
+    """
+    Response cache keys for the structured and narrative prompts.
+
+    Returns:
+        (structured_key, narrative_key, expires_at): keyed on the canonical context,
+        valid until the day/month/year ends in the seeker's timezone
+    """
+    cache_context = canonical_context(prepared["ai_context"], timescale, prepared["calculation_date"])
+    cache_context["_seeker"] = prepared["seeker_name"]
+    expires_at = period_end(timescale, prepared["calculation_date"], prepared["timezone"])
+    return (
+        make_cache_key(timescale, cache_context, model_id, variant="structured"),
+        make_cache_key(timescale, cache_context, model_id, variant="narrative"),
+        expires_at,
+    )
+
+
+async def predict(birth_details: Dict[str, Any], timescale: str = "daily", calculation_date_override: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Standalone prediction: build Guru Context and call AI.
+
+    Context building and the response cache (SQLite-backed) run in the
+    threadpool; the LLM call awaits the shared AsyncLLMClient, so a slow
+    generation never blocks the event loop.
+    """
+    prepared = await run_in_threadpool(_prepare_prediction, birth_details, timescale, calculation_date_override)
+
+    guidance = ""
+    client = get_async_llm_client()
+    if client.mode != "none":
+        cache = get_llm_cache()
+        structured_key, narrative_key, cache_expires_at = _llm_cache_keys(
+            prepared, timescale, client.model_id(PREDICT_LLM_OPTIONS["model"])
+        )
+        _log = logging.getLogger(__name__)
+        try:
+            if _uses_structured_flow(prepared, timescale):
+                structured_prompt = _build_structured_prompt(prepared)
+                raw = await run_in_threadpool(cache.get, structured_key)
+                cached = raw is not None
+                if not cached:
+                    _log.info("[predict] LLM structured call starting")
+                    t0 = time.perf_counter()
+                    raw = await client.complete(
+                        structured_prompt,
+                        system=STRUCTURED_SYSTEM_PROMPT,
+                        json_mode=True,
+                        **PREDICT_LLM_OPTIONS,
+                    )
+                    elapsed = time.perf_counter() - t0
+                    _log.info("[predict] LLM structured call completed in %.2fs", elapsed)
+                parsed = _parse_structured_response(raw)
+                if parsed is not None:
+                    try:
+                        result = _finalize_structured(prepared, parsed)
+                    except (KeyError, TypeError):
+                        result = None
+                    if result is not None:
+                        if not cached:
+                            await run_in_threadpool(cache.set, structured_key, (raw or "").strip(), cache_expires_at)
+                        return result
+
+            user_prompt = _build_narrative_prompt(prepared)
+            guidance = await run_in_threadpool(cache.get, narrative_key)
+            if guidance is None:
+                _log.info("[predict] LLM unstructured call starting")
+                t0 = time.perf_counter()
+                guidance = await client.complete(
+                    user_prompt,
+                    system=GURU_SYSTEM_PROMPT,
+                    **PREDICT_LLM_OPTIONS,
+                )
+                elapsed = time.perf_counter() - t0
+                _log.info("[predict] LLM unstructured call completed in %.2fs", elapsed)
+                guidance = guidance or ""
+                if guidance.strip():
+                    await run_in_threadpool(cache.set, narrative_key, guidance, cache_expires_at)
+        except Exception:
+            guidance = "Guidance could not be generated. Use the technical breakdown below."
+    else:
+        guidance = "OPENAI_API_KEY not set"
+
+    return _finalize_guidance(prepared, timescale, guidance)
+
+
+# Sections the structured daily response can carry (streamed as they complete)
+STREAMED_SECTION_KEYS = set(REQUIRED_STRUCTURED_SECTIONS) | {"greeting"}
+
+
+def _finalize_section(prepared: Dict[str, Any], key: str, value: Any) -> str:
+    """
+    One LLM section post-processed exactly as in the assembled structured output.
+    """
+    context = prepared["context"]
+    _, structured = _assemble_structured_output("", {key: value}, context, prepared["seeker_name"])
+    _lock_structured_sections(structured, context)
+    return apply_anti_leak_sanitizer(structured[key])
+
+
+def _section_event(key: str, content: str, source: str, final: bool) -> Tuple[str, Dict[str, Any]]:
+    return "section", {
+        "key": key,
+        "heading": CANONICAL_SECTION_HEADINGS.get(key, ""),
+        "content": content,
+        "source": source,
+        "final": final,
+    }
+
+
+def _backend_section_events(prepared: Dict[str, Any], timescale: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Sections computed without the LLM (daily only).
+
+    Declarations are final. Greeting, Panchanga and throne are provisional:
+    the LLM's versions replace them when they arrive.
+    """
+    if timescale != "daily":
+        return []
+    context = prepared["context"]
+    events = []
+    if prepared["declarations_block"]:
+        events.append(_section_event(
+            "declarations", _format_declarations_for_display(prepared["declarations_block"]), "backend", True
+        ))
+    provisional = [
+        ("greeting", _build_greeting(prepared["seeker_name"], context)),
+        ("panchanga", _build_backend_panchanga(context)),
+        ("throne", get_canonical_throne(context)),
+    ]
+    for key, content in provisional:
+        if content:
+            events.append(_section_event(key, apply_anti_leak_sanitizer(content), "backend", False))
+    return events
+
+
+async def predict_stream(
+    birth_details: Dict[str, Any],
+    timescale: str = "daily",
+    calculation_date_override: Optional[str] = None,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Streaming predict(): yields (event, data) as results become available.
+
+    Events:
+        context: Guru Context and technical breakdown (before any LLM call)
+        section: One section {key, heading, content, source: backend|llm, final}
+        delta: Narrative text chunk {text} (unstructured flow)
+        done: The complete predict() response (authoritative)
+    """
+    prepared = await run_in_threadpool(_prepare_prediction, birth_details, timescale, calculation_date_override)
+    context = prepared["context"]
+    breakdown = _prediction_result(context, "")
+    yield "context", {
+        "timescale": timescale,
+        "context": breakdown["context"],
+        "technical_breakdown": breakdown["technical_breakdown"],
     }
+    for event in _backend_section_events(prepared, timescale):
+        yield event
+
+    client = get_async_llm_client()
+    if client.mode == "none":
+        yield "done", _finalize_guidance(prepared, timescale, "OPENAI_API_KEY not set")
+        return
+
+    cache = get_llm_cache()
+    structured_key, narrative_key, cache_expires_at = _llm_cache_keys(
+        prepared, timescale, client.model_id(PREDICT_LLM_OPTIONS["model"])
+    )
+    _log = logging.getLogger(__name__)
+    try:
+        if _uses_structured_flow(prepared, timescale):
+            raw = await run_in_threadpool(cache.get, structured_key)
+            cached = raw is not None
+            members = JsonObjectStream()
+            if cached:
+                sections = members.feed(raw)
+            else:
+                _log.info("[predict_stream] LLM structured stream starting")
+                chunks: List[str] = []
+                sections = []
+                async for chunk in client.stream(
+                    _build_structured_prompt(prepared),
+                    system=STRUCTURED_SYSTEM_PROMPT,
+                    json_mode=True,
+                    **PREDICT_LLM_OPTIONS,
+                ):
+                    chunks.append(chunk)
+                    for key, value in members.feed(chunk):
+                        key = key.lower().replace(" ", "_")
+                        if key in STREAMED_SECTION_KEYS:
+                            yield _section_event(key, _finalize_section(prepared, key, value), "llm", True)
+                raw = "".join(chunks)
+            for key, value in sections:
+                key = key.lower().replace(" ", "_")
+                if key in STREAMED_SECTION_KEYS:
+                    yield _section_event(key, _finalize_section(prepared, key, value), "llm", True)
+
+            parsed = _parse_structured_response(raw)
+            if parsed is not None:
+                try:
+                    result = _finalize_structured(prepared, parsed)
+                except (KeyError, TypeError):
+                    result = None
+                if result is not None:
+                    if not cached:
+                        await run_in_threadpool(cache.set, structured_key, (raw or "").strip(), cache_expires_at)
+                    yield "done", result
+                    return
+
+        guidance = await run_in_threadpool(cache.get, narrative_key)
+        if guidance is not None:
+            yield "delta", {"text": guidance}
+        else:
+            _log.info("[predict_stream] LLM unstructured stream starting")
+            chunks = []
+            async for chunk in client.stream(
+                _build_narrative_prompt(prepared),
+                system=GURU_SYSTEM_PROMPT,
+                **PREDICT_LLM_OPTIONS,
+            ):
+                chunks.append(chunk)
+                yield "delta", {"text": chunk}
+            guidance = "".join(chunks)
+            if guidance.strip():
+                await run_in_threadpool(cache.set, narrative_key, guidance, cache_expires_at)
+    except Exception:
+        guidance = "Guidance could not be generated. Use the technical breakdown below."
+
+    yield "done", _finalize_guidance(prepared, timescale, guidance)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """One Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
 
 
 @router.post("/predict", response_model=Dict)
-async def post_predict(request: PredictRequest):
+async def post_predict(request: PredictRequest, http_request: Request):
     """
     POST /api/v1/predict — Daily/Monthly/Yearly AI guidance from Guru Context.
+
+    The prediction is cancelled (and its LLM slot freed) if the client disconnects.
     """
     try:
         birth_dict = request.birth_details.model_dump()
-        result = predict(
-            birth_dict,
-            timescale=request.timescale,
-            calculation_date_override=request.calculation_date,
+        result = await run_until_disconnected(
+            predict(
+                birth_dict,
+                timescale=request.timescale,
+                calculation_date_override=request.calculation_date,
+            ),
+            http_request.is_disconnected,
         )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/predict/stream")
+async def post_predict_stream(request: PredictRequest):
+    """
+    POST /api/v1/predict/stream — /predict as Server-Sent Events.
+
+    Emits the Guru Context and backend-computed sections immediately, then LLM
+    sections (daily) or narrative chunks as they arrive, and finally a "done"
+    event with the same body /predict returns. The generation is cancelled if
+    the client disconnects.
+    """
+    birth_dict = request.birth_details.model_dump()
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event, data in predict_stream(
+                birth_dict,
+                timescale=request.timescale,
+                calculation_date_override=request.calculation_date,
+            ):
+                yield _sse(event, data)
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
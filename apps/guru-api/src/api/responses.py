@@ -0,0 +1,27 @@
+"""
+Fast JSON responses for large payloads (GET /kundli).
+
+FastAPI runs jsonable_encoder over a returned dict before json.dumps; for
+the full kundli that walk costs far more than the encoding itself. Payloads
+returned through FastJSONResponse are already plain JSON types (dicts, lists,
+str, int, float, bool, None) and are encoded directly: with orjson when it
+is installed, else with the stdlib encoder JSONResponse uses.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when available (no jsonable_encoder pass)."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -13,6 +13,7 @@ from datetime import datetime, date, time
 from src.db.database import get_db
 from src.db.models import User, BirthDetail
 from src.auth.middleware import get_current_user
+from src.jyotish.natal_store import refresh_natal_chart
 
 router = APIRouter()
 
@@ -133,6 +134,12 @@ async def save_birthdata(
             dasamsa_data=None
         )
         
+        # Natal chart computed once here; readers hydrate it instead of recomputing
+        try:
+            refresh_natal_chart(new_birthdata)
+        except Exception as e:
+            print(f"Warning: Could not precompute natal chart: {e}")
+        
         db.add(new_birthdata)
         db.commit()
         db.refresh(new_birthdata)
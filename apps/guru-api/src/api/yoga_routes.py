@@ -13,6 +13,7 @@ from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
 from src.jyotish.yogas.yoga_engine import detect_all_yogas
 from src.ephemeris.ephemeris_utils import get_ascendant, get_houses, get_ayanamsa
 from src.utils.converters import normalize_degrees, degrees_to_sign
+from src.compute.executor import ComputeError, compute
 
 router = APIRouter()
 
@@ -66,6 +67,68 @@ def prepare_planets_for_yogas(jd: float, lat: float, lon: float):
     return planets, houses_sidereal, asc_sidereal
 
 
+def compute_yoga_analysis(dob: str, time: str, lat: float, lon: float) -> dict:
+    """
+    Yoga analysis for a birth chart (runs in a compute worker).
+    
+    Shared by all /yogas endpoints; each one returns a slice of "yogas".
+    
+    Args:
+        dob: Date of birth (YYYY-MM-DD)
+        time: Time of birth (HH:MM)
+        lat: Birth latitude
+        lon: Birth longitude
+    
+    Returns:
+        Julian day, birth details and the detect_all_yogas() result
+    """
+    # Parse date and time
+    dt = datetime.strptime(f"{dob} {time}", "%Y-%m-%d %H:%M")
+
+    # Calculate Julian Day
+    jd = swe.julday(
+        dt.year, dt.month, dt.day,
+        dt.hour + dt.minute / 60.0,
+        swe.GREG_CAL
+    )
+
+    # Prepare planet and house data
+    planets, houses_list, asc = prepare_planets_for_yogas(jd, lat, lon)
+
+    # Convert houses to required format
+    houses = []
+    # Add ascendant as house 1
+    asc_sign, _ = degrees_to_sign(asc)
+    houses.append({
+        "house": 1,
+        "degree": asc,
+        "sign": asc_sign
+    })
+
+    # Add houses 2-12
+    for i, house_degree in enumerate(houses_list):
+        sign_num, _ = degrees_to_sign(house_degree)
+        houses.append({
+            "house": i + 2,  # Houses 2-12
+            "degree": house_degree,
+            "sign": sign_num
+        })
+
+    # Detect all yogas
+    yoga_analysis = detect_all_yogas(planets, houses)
+
+    return {
+        "julian_day": round(jd, 6),
+        "birth_details": {
+            "date": dob,
+            "time": time,
+            "latitude": lat,
+            "longitude": lon
+        },
+        "yogas": yoga_analysis
+    }
+
+
 @router.get("/all")
 async def get_all_yogas(
     dob: str = Query(..., description="Date of birth in YYYY-MM-DD format"),
@@ -92,51 +155,9 @@ async def get_all_yogas(
         Complete yoga analysis
     """
     try:
-        # Parse date and time
-        dt = datetime.strptime(f"{dob} {time}", "%Y-%m-%d %H:%M")
-        
-        # Calculate Julian Day
-        jd = swe.julday(
-            dt.year, dt.month, dt.day,
-            dt.hour + dt.minute / 60.0,
-            swe.GREG_CAL
-        )
-        
-        # Prepare planet and house data
-        planets, houses_list, asc = prepare_planets_for_yogas(jd, lat, lon)
-        
-        # Convert houses to required format
-        houses = []
-        # Add ascendant as house 1
-        asc_sign, _ = degrees_to_sign(asc)
-        houses.append({
-            "house": 1,
-            "degree": asc,
-            "sign": asc_sign
-        })
-        
-        # Add houses 2-12
-        for i, house_degree in enumerate(houses_list):
-            sign_num, _ = degrees_to_sign(house_degree)
-            houses.append({
-                "house": i + 2,  # Houses 2-12
-                "degree": house_degree,
-                "sign": sign_num
-            })
-        
-        # Detect all yogas
-        yoga_analysis = detect_all_yogas(planets, houses)
-        
-        return {
-            "julian_day": round(jd, 6),
-            "birth_details": {
-                "date": dob,
-                "time": time,
-                "latitude": lat,
-                "longitude": lon
-            },
-            "yogas": yoga_analysis
-        }
+        return await compute("yogas", {"dob": dob, "time": time, "lat": lat, "lon": lon})
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid date/time format: {str(e)}")
     except Exception as e:
@@ -163,25 +184,14 @@ async def get_major_yogas(
         Major yogas only
     """
     try:
-        dt = datetime.strptime(f"{dob} {time}", "%Y-%m-%d %H:%M")
-        jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0, swe.GREG_CAL)
-        
-        planets, houses_list, asc = prepare_planets_for_yogas(jd, lat, lon)
-        
-        houses = []
-        for i, house_degree in enumerate(houses_list):
-            sign_num, _ = degrees_to_sign(house_degree)
-            houses.append({"house": i + 2, "degree": house_degree, "sign": sign_num})
-        
-        asc_sign, _ = degrees_to_sign(asc)
-        houses.insert(0, {"house": 1, "degree": asc, "sign": asc_sign})
-        
-        yoga_analysis = detect_all_yogas(planets, houses)
+        yoga_analysis = (await compute("yogas", {"dob": dob, "time": time, "lat": lat, "lon": lon}))["yogas"]
         
         return {
             "major_yogas": yoga_analysis["major_yogas"],
             "count": len(yoga_analysis["major_yogas"])
         }
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error detecting major yogas: {str(e)}")
 
@@ -206,25 +216,14 @@ async def get_planetary_yogas(
         Planetary yogas only
     """
     try:
-        dt = datetime.strptime(f"{dob} {time}", "%Y-%m-%d %H:%M")
-        jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0, swe.GREG_CAL)
-        
-        planets, houses_list, asc = prepare_planets_for_yogas(jd, lat, lon)
-        
-        houses = []
-        for i, house_degree in enumerate(houses_list):
-            sign_num, _ = degrees_to_sign(house_degree)
-            houses.append({"house": i + 2, "degree": house_degree, "sign": sign_num})
-        
-        asc_sign, _ = degrees_to_sign(asc)
-        houses.insert(0, {"house": 1, "degree": asc, "sign": asc_sign})
-        
-        yoga_analysis = detect_all_yogas(planets, houses)
+        yoga_analysis = (await compute("yogas", {"dob": dob, "time": time, "lat": lat, "lon": lon}))["yogas"]
         
         return {
             "planetary_yogas": yoga_analysis["by_type"]["planetary"],
             "count": len(yoga_analysis["by_type"]["planetary"])
         }
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error detecting planetary yogas: {str(e)}")
 
@@ -249,25 +248,14 @@ async def get_house_yogas(
         House-based yogas only
     """
     try:
-        dt = datetime.strptime(f"{dob} {time}", "%Y-%m-%d %H:%M")
-        jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0, swe.GREG_CAL)
-        
-        planets, houses_list, asc = prepare_planets_for_yogas(jd, lat, lon)
-        
-        houses = []
-        for i, house_degree in enumerate(houses_list):
-            sign_num, _ = degrees_to_sign(house_degree)
-            houses.append({"house": i + 2, "degree": house_degree, "sign": sign_num})
-        
-        asc_sign, _ = degrees_to_sign(asc)
-        houses.insert(0, {"house": 1, "degree": asc, "sign": asc_sign})
-        
-        yoga_analysis = detect_all_yogas(planets, houses)
+        yoga_analysis = (await compute("yogas", {"dob": dob, "time": time, "lat": lat, "lon": lon}))["yogas"]
         
         return {
             "house_yogas": yoga_analysis["by_type"]["house_based"],
             "count": len(yoga_analysis["by_type"]["house_based"])
         }
+    except ComputeError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error detecting house yogas: {str(e)}")
 
@@ -0,0 +1,3 @@
+"""
+CPU-bound astrology computation off the event loop (process pool).
+"""
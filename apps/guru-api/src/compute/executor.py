@@ -0,0 +1,320 @@
+"""
+Compute executor - CPU-bound chart calculations in a process pool.
+
+pyswisseph keeps global state and most of the engines hold the GIL, so
+threads give no multi-core scaling inside one API worker. Heavy handlers
+(kundli, yogas, shadbala, ...) submit their calculation instead:
+
+    result = await compute("kundli", {"dob": ..., "time": ..., "lat": ..., "lon": ...})
+
+- Workers are forked from a forkserver that has already imported the engines.
+  Each worker sets the ephemeris path and Lahiri sid mode and warms the
+  ephemeris files once in its initializer.
+- Tasks run under the submitting request's id and trace flag, so worker log
+  records carry the request id and per-request traces reach the workers.
+- Backpressure: at most COMPUTE_MAX_PENDING tasks are queued or running.
+  Beyond that compute() raises ComputeBusyError (HTTP 503) at once instead
+  of letting requests pile up.
+- Each task has a timeout (ComputeTimeoutError, HTTP 504). A task that has
+  not started is cancelled. A running one keeps its slot until it finishes,
+  so the backpressure count stays honest.
+- COMPUTE_WORKERS=0 runs tasks in a thread pool instead (development, tests).
+
+Task kinds map to importable functions taking the birth parameters as keyword
+arguments and returning picklable results (COMPUTE_TASKS).
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.config import settings
+from src.utils.log import configure_logging, current_request, request_context
+
+# kind -> "module:function"
+COMPUTE_TASKS: Dict[str, str] = {
+    "kundli": "src.api.kundli_routes:compute_kundli",
+    "current_dasha": "src.api.kundli_routes:compute_current_dasha",
+    "yogas": "src.api.yoga_routes:compute_yoga_analysis",
+    "shadbala": "src.api.strength_routes:compute_shadbala",
+    "ashtakavarga": "src.api.strength_routes:compute_ashtakavarga",
+    "strength_yogas": "src.api.strength_routes:compute_strength_yogas",
+    "yogas_timeline": "src.api.strength_routes:compute_yogas_timeline",
+    "muhurtha_range": "src.muhurtha.muhurtha_search:search_muhurtha_range",
+}
+
+# Imported once in the forkserver so every worker starts warm
+_PRELOAD_MODULES = ["swisseph", "src.ephemeris.ephemeris_utils"] + sorted(
+    {path.split(":")[0] for path in COMPUTE_TASKS.values()}
+)
+
+
+class ComputeError(Exception):
+    """Executor could not run a task (not raised for errors inside the task)."""
+
+    status_code = 500
+
+
+class ComputeBusyError(ComputeError):
+    """Too many tasks pending."""
+
+    status_code = 503
+
+
+class ComputeTimeoutError(ComputeError, TimeoutError):
+    """Task did not finish within its timeout."""
+
+    status_code = 504
+
+
+_task_functions: Dict[str, Callable[..., Any]] = {}
+
+
+def _resolve(path: str) -> Callable[..., Any]:
+    function = _task_functions.get(path)
+    if function is None:
+        module_name, _, attribute = path.partition(":")
+        function = getattr(importlib.import_module(module_name), attribute)
+        _task_functions[path] = function
+    return function
+
+
+def _init_worker() -> None:
+    """Worker initializer: ephemeris path, Lahiri sid mode, warm ephemeris files."""
+    import swisseph as swe
+
+    from src.ephemeris import context as swe_context
+    from src.ephemeris.ephemeris_utils import init_swisseph
+
+    init_swisseph()
+    # Workers are off the request path; a queue thread would only lose records at exit
+    configure_logging(use_queue=False)
+    # First calc_ut opens and caches the ephemeris files for this process
+    swe_context.calc(2451545.0, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
+    for path in set(COMPUTE_TASKS.values()):
+        try:
+            _resolve(path)
+        except Exception as e:
+            print(f"Warning: compute worker could not load {path}: {e}")
+
+
+def _run_task(path: str, params: Dict[str, Any], request_id: Optional[str] = None, traced: bool = False) -> Any:
+    # Workers (and pool threads) do not inherit the request context
+    with request_context(request_id, traced):
+        return _resolve(path)(**params)
+
+
+def _warm_up(delay: float) -> int:
+    # Held briefly so that concurrent warm-up calls start every worker
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ComputeExecutor:
+    """
+    Process pool with backpressure, per-task timeouts and queue metrics.
+
+    Args:
+        workers: Worker processes (0 runs tasks in a thread pool instead)
+        max_pending: Maximum tasks queued or running
+        timeout: Default per-task timeout in seconds
+        start_method: multiprocessing start method ("forkserver", "spawn", "fork")
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        max_pending: int = 64,
+        timeout: float = 30.0,
+        start_method: str = "forkserver",
+    ):
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        self.workers = max(0, workers)
+        # Tasks that can run at once (thread mode: ThreadPoolExecutor's default size)
+        self.capacity = self.workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.start_method = start_method
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._max_pending_seen = 0
+        self._tasks: Dict[str, int] = {}
+        # kind -> [finished tasks, total seconds from submit to finish]
+        self._latency: Dict[str, list] = {}
+
+    @property
+    def mode(self) -> str:
+        return "process" if self.workers else "thread"
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None and not self.workers:
+                    self._pool = ThreadPoolExecutor(max_workers=self.capacity, thread_name_prefix="compute")
+                elif self._pool is None:
+                    context = multiprocessing.get_context(self.start_method)
+                    if self.start_method == "forkserver":
+                        context.set_forkserver_preload(_PRELOAD_MODULES)
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=context, initializer=_init_worker
+                    )
+        return self._pool
+
+    async def start(self) -> None:
+        """Pre-start every worker process (otherwise they start on first use)."""
+        if not self.workers:
+            return
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, _warm_up, 0.2) for _ in range(self.workers))
+        )
+
+    def _finish(self, kind: str, started: float, failed: bool) -> None:
+        with self._lock:
+            self._pending -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            latency = self._latency.setdefault(kind, [0, 0.0])
+            latency[0] += 1
+            latency[1] += time.perf_counter() - started
+
+    async def compute(self, kind: str, birth_params: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a registered task and wait for its result without blocking the loop.
+
+        Args:
+            kind: Task kind (key of COMPUTE_TASKS)
+            birth_params: Keyword arguments for the task function
+            timeout: Seconds to wait (default: executor timeout)
+
+        Returns:
+            The task's return value (exceptions raised by the task propagate)
+
+        Raises:
+            KeyError: Unknown kind
+            ComputeBusyError: Too many tasks pending
+            ComputeTimeoutError: Task took longer than the timeout
+        """
+        path = COMPUTE_TASKS[kind]
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ComputeBusyError(f"Compute queue full ({self._pending} pending); retry shortly")
+            self._pending += 1
+            self._submitted += 1
+            self._max_pending_seen = max(self._max_pending_seen, self._pending)
+            self._tasks[kind] = self._tasks.get(kind, 0) + 1
+        started = time.perf_counter()
+        pool = self._get_pool()
+        try:
+            future = pool.submit(_run_task, path, dict(birth_params), *current_request())
+        except BrokenExecutor as e:
+            self._finish(kind, started, failed=True)
+            self._discard(pool)
+            raise ComputeError("Compute workers unavailable; retry shortly") from e
+        except Exception:
+            self._finish(kind, started, failed=True)
+            raise
+        # The slot is released when the task really ends, even after a timeout
+        future.add_done_callback(
+            lambda f: self._finish(kind, started, failed=f.cancelled() or f.exception() is not None)
+        )
+        try:
+            # Cancelling the wrapper cancels the task if it has not started yet
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout if timeout is not None else self.timeout
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise ComputeTimeoutError(f"{kind} did not finish within {timeout or self.timeout:g}s") from None
+        except BrokenExecutor as e:
+            # A worker died (e.g. killed by the OS); the next task starts a fresh pool
+            self._discard(pool)
+            raise ComputeError("Compute worker crashed; retry shortly") from e
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput metrics."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "queue_depth": max(0, self._pending - self.capacity),
+                "max_pending_seen": self._max_pending_seen,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timeouts": self._timeouts,
+                "rejected": self._rejected,
+                "tasks": dict(self._tasks),
+                # Submit to finish, including time queued
+                "mean_latency_ms": {
+                    kind: round(seconds / count * 1000, 1) for kind, (count, seconds) in self._latency.items()
+                },
+            }
+
+    def _discard(self, pool: Executor) -> None:
+        with self._pool_lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (queued tasks are cancelled)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_compute_executor: Optional[ComputeExecutor] = None
+_compute_executor_lock = threading.Lock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """
+    Process-wide ComputeExecutor (created from settings on first use).
+
+    Returns:
+        ComputeExecutor
+    """
+    global _compute_executor
+    if _compute_executor is None:
+        with _compute_executor_lock:
+            if _compute_executor is None:
+                _compute_executor = ComputeExecutor(
+                    workers=settings.compute_workers,
+                    max_pending=settings.compute_max_pending,
+                    timeout=settings.compute_timeout_seconds,
+                    start_method=settings.compute_start_method,
+                )
+    return _compute_executor
+
+
+async def compute(kind: str, birth_params: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+    """Run a CPU-bound task on the global executor (see ComputeExecutor.compute)."""
+    return await get_compute_executor().compute(kind, birth_params, timeout=timeout)
+
+
+def get_compute_stats() -> Dict[str, Any]:
+    """Metrics of the global compute executor."""
+    return get_compute_executor().stats()
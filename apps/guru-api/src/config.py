@@ -6,6 +6,7 @@ Loads configuration from .env file and provides typed access to settings.
 """
 
 import os
+import tempfile
 from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -36,6 +37,27 @@ class Settings(BaseSettings):
     local_llm_url: Optional[str] = os.getenv("LOCAL_LLM_URL")
     local_llm_model: str = os.getenv("LOCAL_LLM_MODEL", "llama2")
     
+    # Async LLM client (per process): concurrent generations, timeouts, connection pool
+    llm_max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    llm_timeout_seconds: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+    llm_connect_timeout_seconds: float = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "10"))
+    llm_max_connections: int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+    
+    # LLM response cache (content-addressed; backend: memory, sqlite or tiered)
+    llm_cache_enabled: bool = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    llm_cache_backend: str = os.getenv("LLM_CACHE_BACKEND", "memory")
+    llm_cache_max_entries: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+    llm_cache_path: str = os.getenv(
+        "LLM_CACHE_PATH",
+        os.path.join(tempfile.gettempdir(), "guru-llm-cache", "responses.sqlite3")
+    )
+    
+    # Compute executor (per API worker): process pool for CPU-bound chart endpoints (0 = thread pool)
+    compute_workers: int = int(os.getenv("COMPUTE_WORKERS", str(min(4, os.cpu_count() or 1))))
+    compute_max_pending: int = int(os.getenv("COMPUTE_MAX_PENDING", "64"))
+    compute_timeout_seconds: float = float(os.getenv("COMPUTE_TIMEOUT_SECONDS", "30"))
+    compute_start_method: str = os.getenv("COMPUTE_START_METHOD", "forkserver")
+
     # Swiss Ephemeris Path
     se_path: Optional[str] = os.getenv("SE_PATH")
     
@@ -59,6 +81,48 @@ class Settings(BaseSettings):
     fcm_server_key: Optional[str] = os.getenv("FCM_SERVER_KEY")
     google_application_credentials: Optional[str] = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     
+    # Daily Panchanga cache (keyed by date + location snapped to a grid)
+    panchanga_cache_max_entries: int = int(os.getenv("PANCHANGA_CACHE_MAX_ENTRIES", "4096"))
+    panchanga_cache_grid_deg: float = float(os.getenv("PANCHANGA_CACHE_GRID_DEG", "0.01"))
+    panchanga_cache_warm_cities: int = int(os.getenv("PANCHANGA_CACHE_WARM_CITIES", "16"))
+    
+    # Shared daily sky context (keyed by Julian Day + location snapped to a grid)
+    sky_context_max_locations: int = int(os.getenv("SKY_CONTEXT_MAX_LOCATIONS", "4096"))
+    sky_context_grid_deg: float = float(os.getenv("SKY_CONTEXT_GRID_DEG", "0.01"))
+    
+    # Shared transit table (memory-mapped .npy files)
+    transit_table_dir: str = os.getenv(
+        "TRANSIT_TABLE_DIR",
+        os.path.join(tempfile.gettempdir(), "guru-transit-table")
+    )
+    
+    # Daily notification batch job (NOTIFICATION_WORKERS processes per API worker)
+    notification_batch_size: int = int(os.getenv("NOTIFICATION_BATCH_SIZE", "500"))
+    notification_workers: int = int(os.getenv("NOTIFICATION_WORKERS", str(min(4, os.cpu_count() or 1))))
+    notification_checkpoint_dir: str = os.getenv(
+        "NOTIFICATION_CHECKPOINT_DIR",
+        os.path.join(tempfile.gettempdir(), "guru-notification-checkpoints")
+    )
+    
+    # Multi-channel delivery workers (concurrent sends per channel, retry/backoff)
+    delivery_whatsapp_workers: int = int(os.getenv("DELIVERY_WHATSAPP_WORKERS", "4"))
+    delivery_email_workers: int = int(os.getenv("DELIVERY_EMAIL_WORKERS", "8"))
+    delivery_push_workers: int = int(os.getenv("DELIVERY_PUSH_WORKERS", "4"))
+    delivery_max_attempts: int = int(os.getenv("DELIVERY_MAX_ATTEMPTS", "3"))
+    delivery_retry_backoff_seconds: float = float(os.getenv("DELIVERY_RETRY_BACKOFF_SECONDS", "2.0"))
+    delivery_send_timeout_seconds: float = float(os.getenv("DELIVERY_SEND_TIMEOUT_SECONDS", "120"))
+    # Due deliveries claimed per query; small enough to finish well within the 15-minute lease
+    delivery_claim_batch_size: int = int(os.getenv("DELIVERY_CLAIM_BATCH_SIZE", "50"))
+
+    # Logging (src.utils.log): levels, per-subsystem levels ("varga=DEBUG,kundli=INFO"), text|json,
+    # queue handler, and debug traces for listed X-Request-IDs or a sampled share of requests
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_levels: str = os.getenv("LOG_LEVELS", "")
+    log_format: str = os.getenv("LOG_FORMAT", "text")
+    log_queue: bool = os.getenv("LOG_QUEUE", "False").lower() == "true"
+    log_trace_request_ids: str = os.getenv("LOG_TRACE_REQUEST_IDS", "")
+    log_trace_sample_rate: float = float(os.getenv("LOG_TRACE_SAMPLE_RATE", "0"))
+
     class Config:
         """Pydantic config for settings."""
         env_file = ".env"
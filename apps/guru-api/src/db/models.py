@@ -176,6 +176,8 @@ class NotificationPreferences(Base):
     language = Column(String, default="english", nullable=False)  # english, hindi, kannada
     whatsapp_number = Column(String, nullable=True)  # WhatsApp number (if different from phone)
     push_token = Column(String, nullable=True)  # FCM push token
+    timezone = Column(String, default="Asia/Kolkata", nullable=True)  # IANA timezone of delivery_time
+    next_delivery_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Next delivery (UTC), due-time index
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
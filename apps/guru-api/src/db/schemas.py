@@ -52,9 +52,8 @@ class BirthDetailResponse(BirthDetailBase):
     """Schema for birth detail response."""
     id: int
     user_id: int
-    kundli_data: Optional[Dict[str, Any]] = None
-    navamsa_data: Optional[Dict[str, Any]] = None
-    dasamsa_data: Optional[Dict[str, Any]] = None
+    # kundli_data / navamsa_data / dasamsa_data hold the stored natal chart (src.jyotish.natal_store);
+    # they are served by /kundli, not echoed with the birth details
     created_at: datetime
     updated_at: Optional[datetime] = None
     
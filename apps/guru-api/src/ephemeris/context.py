@@ -0,0 +1,207 @@
+"""
+Ephemeris context - one entry point for Swiss Ephemeris modes and calculations.
+
+Swiss Ephemeris keeps the sidereal mode, topocentric observer and ephemeris
+path in C globals. The pyswisseph build used here keeps them per thread
+(Swiss Ephemeris TLS): a threadpool thread starts with the default
+Fagan/Bradley ayanamsa, no observer and no ephemeris path. Engines therefore
+called swe.set_sid_mode() before almost every calculation and swe.set_topo()
+before every sunrise.
+
+Every state-dependent call goes through this module instead of swisseph:
+
+    from src.ephemeris import context as swe_context
+
+    xx, ret = swe_context.calc(jd, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
+    ayanamsa = swe_context.get_ayanamsa_ut(jd)
+    res, tret = swe_context.rise_trans(jd, swe.SUN, swe.CALC_RISE, geopos, 0.0, 0.0, flags)
+
+- Each wrapper applies the modes it needs (Lahiri for sidereal results, the
+  observer from geopos for FLG_TOPOCTR) and makes the call under one
+  re-entrant lock, so no other thread can change the mode in between.
+  The lock is held only for that one call. pyswisseph holds the GIL during
+  a calculation anyway, so it costs no parallelism.
+- The active modes are tracked for each thread (process-wide for builds
+  without TLS) and applied only when they differ. A redundant
+  swe.set_sid_mode() is not free: it also discards the positions Swiss
+  Ephemeris saved for the last calculation.
+- The ephemeris path is process-wide: set once, applied lazily in each thread.
+"""
+
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+# (sid_mode, t0, ayan_t0) - the only ayanamsa used by the engines
+SID_MODE_LAHIRI: Tuple[int, float, float] = (swe.SIDM_LAHIRI, 0.0, 0.0)
+
+
+def _state_is_thread_local() -> bool:
+    """True if this pyswisseph build keeps sidereal mode etc. per thread."""
+    readings = []
+
+    def probe(set_mode: bool) -> None:
+        if set_mode:
+            swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+        readings.append(swe.get_ayanamsa_ut(2451545.0))
+
+    for set_mode in (True, False):
+        thread = threading.Thread(target=probe, args=(set_mode,))
+        thread.start()
+        thread.join()
+    return readings[0] != readings[1]
+
+
+# Sentinel: set_ephe_path() has not been called (Swiss Ephemeris default path)
+_NOT_CONFIGURED = object()
+
+
+class _AppliedState:
+    """Modes applied to Swiss Ephemeris."""
+
+    def __init__(self):
+        self.sid_mode: Optional[Tuple[int, float, float]] = None
+        self.topo: Optional[Tuple[float, float, float]] = None
+        self.ephe_path = _NOT_CONFIGURED
+
+
+class _ThreadAppliedState(_AppliedState, threading.local):
+    """Per-thread copy for TLS builds (every thread starts with nothing applied)."""
+
+
+THREAD_LOCAL_STATE = _state_is_thread_local()
+
+_lock = threading.RLock()
+_applied = _ThreadAppliedState() if THREAD_LOCAL_STATE else _AppliedState()
+# Process-wide ephemeris path (None: Swiss Ephemeris default directory)
+_ephe_path = _NOT_CONFIGURED
+_counters: Dict[str, int] = {"sid_mode_set": 0, "sid_mode_skipped": 0, "topo_set": 0, "topo_skipped": 0}
+
+
+def _apply_ephe_path() -> None:
+    if _ephe_path is not _NOT_CONFIGURED and _applied.ephe_path != _ephe_path:
+        swe.set_ephe_path(_ephe_path)
+        _applied.ephe_path = _ephe_path
+
+
+def _apply_sid_mode(mode: Tuple[int, float, float]) -> None:
+    if mode == _applied.sid_mode:
+        _counters["sid_mode_skipped"] += 1
+        return
+    swe.set_sid_mode(*mode)
+    _applied.sid_mode = mode
+    _counters["sid_mode_set"] += 1
+
+
+def _apply_topo(geopos: Sequence[float]) -> None:
+    topo = (float(geopos[0]), float(geopos[1]), float(geopos[2]) if len(geopos) > 2 else 0.0)
+    if topo == _applied.topo:
+        _counters["topo_skipped"] += 1
+        return
+    swe.set_topo(*topo)
+    _applied.topo = topo
+    _counters["topo_set"] += 1
+
+
+def set_ephe_path(path: Optional[str]) -> None:
+    """
+    Set the ephemeris file path for every thread (sidereal mode and observer are kept).
+
+    Args:
+        path: Directory with .se1 files (None or "": Swiss Ephemeris default)
+    """
+    global _ephe_path
+    with _lock:
+        _ephe_path = path or None
+        _apply_ephe_path()
+
+
+def set_sid_mode(mode: int = swe.SIDM_LAHIRI, t0: float = 0.0, ayan_t0: float = 0.0) -> None:
+    """
+    Set the sidereal mode for the current thread (no-op if it is already active).
+
+    Args:
+        mode: Swiss Ephemeris sidereal mode (default: Lahiri)
+        t0: Reference date for user-defined ayanamsa
+        ayan_t0: Ayanamsa at t0
+    """
+    with _lock:
+        _apply_ephe_path()
+        _apply_sid_mode((int(mode), float(t0), float(ayan_t0)))
+
+
+def calc(jd: float, body: int, flags: int, sid_mode: Tuple[int, float, float] = SID_MODE_LAHIRI):
+    """
+    swe.calc_ut() with the sidereal mode guaranteed for FLG_SIDEREAL flags.
+
+    Args:
+        jd: Julian Day (UT)
+        body: Swiss Ephemeris body number
+        flags: Calculation flags
+        sid_mode: (mode, t0, ayan_t0) used when flags include FLG_SIDEREAL
+
+    Returns:
+        (xx, retflags) exactly as swe.calc_ut()
+    """
+    with _lock:
+        _apply_ephe_path()
+        if flags & swe.FLG_SIDEREAL:
+            _apply_sid_mode(sid_mode)
+        return swe.calc_ut(jd, body, flags)
+
+
+def houses(jd: float, lat: float, lon: float, hsys: bytes = b'P'):
+    """swe.houses() (tropical cusps and ascmc)."""
+    with _lock:
+        return swe.houses(jd, lat, lon, hsys)
+
+
+def houses_ex(jd: float, lat: float, lon: float, hsys: bytes = b'P', flags: int = 0,
+              sid_mode: Tuple[int, float, float] = SID_MODE_LAHIRI):
+    """swe.houses_ex() with the sidereal mode guaranteed for FLG_SIDEREAL flags."""
+    with _lock:
+        if flags & swe.FLG_SIDEREAL:
+            _apply_sid_mode(sid_mode)
+        return swe.houses_ex(jd, lat, lon, hsys, flags)
+
+
+def get_ayanamsa(jd: float, sid_mode: Tuple[int, float, float] = SID_MODE_LAHIRI) -> float:
+    """swe.get_ayanamsa() (Ephemeris Time) for the given sidereal mode."""
+    with _lock:
+        _apply_sid_mode(sid_mode)
+        return swe.get_ayanamsa(jd)
+
+
+def get_ayanamsa_ut(jd: float, sid_mode: Tuple[int, float, float] = SID_MODE_LAHIRI) -> float:
+    """swe.get_ayanamsa_ut() for the given sidereal mode."""
+    with _lock:
+        _apply_sid_mode(sid_mode)
+        return swe.get_ayanamsa_ut(jd)
+
+
+def rise_trans(jd: float, body: int, rsmi: int, geopos: Sequence[float],
+               atpress: float = 0.0, attemp: float = 0.0, flags: int = swe.FLG_SWIEPH):
+    """
+    swe.rise_trans() with the topocentric observer set from geopos for FLG_TOPOCTR.
+
+    Returns:
+        (res, tret) exactly as swe.rise_trans()
+    """
+    with _lock:
+        _apply_ephe_path()
+        if flags & swe.FLG_TOPOCTR:
+            _apply_topo(geopos)
+        return swe.rise_trans(jd, body, rsmi, geopos, atpress, attemp, flags)
+
+
+def get_ephemeris_state() -> Dict:
+    """Modes active in the current thread and how many switches were applied or skipped."""
+    with _lock:
+        return {
+            "thread_local": THREAD_LOCAL_STATE,
+            "sid_mode": _applied.sid_mode,
+            "topo": _applied.topo,
+            "ephe_path": None if _ephe_path is _NOT_CONFIGURED else _ephe_path,
+            **_counters,
+        }
@@ -10,6 +10,7 @@ import os
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+from src.ephemeris import context as swe_context
 from src.utils.timezone import get_julian_day
 from src.utils.converters import normalize_degrees, degrees_to_sign, get_sign_name
 
@@ -47,11 +48,11 @@ def init_swisseph():
     Sets the ephemeris path and ayanamsa.
     """
     # Set ayanamsa to Lahiri (Chitra Paksha) for Vedic astrology
-    swe.set_sid_mode(SE_SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(SE_SIDM_LAHIRI)
     
     # Set ephemeris path if directory exists
     if EPHE_PATH and os.path.exists(EPHE_PATH):
-        swe.set_ephe_path(EPHE_PATH)
+        swe_context.set_ephe_path(EPHE_PATH)
 
 
 def initialize_ephemeris():
@@ -90,14 +91,14 @@ def calculate_planet_position(
         - speed_distance: Speed in distance (AU/day)
     """
     # Initialize Drik mode (Lahiri Ayanamsa)
-    swe.set_sid_mode(SE_SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(SE_SIDM_LAHIRI)
     
     # Use proper flags for Drik Panchang calculation
     # FLG_SIDEREAL returns sidereal positions directly (no manual ayanamsa subtraction needed)
     flag = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_TRUEPOS | swe.FLG_SPEED
     
     # Calculate position (already in sidereal due to FLG_SIDEREAL flag)
-    xx, ret = swe.calc_ut(julian_day, planet, flag)
+    xx, ret = swe_context.calc(julian_day, planet, flag)
     
     if ret < 0:
         raise ValueError(f"Error calculating planet {planet}: {ret}")
@@ -135,7 +136,7 @@ def calculate_all_planets(julian_day: float) -> Dict[str, Dict[str, float]]:
         Dictionary with planet names as keys and position data as values
     """
     # Initialize Drik mode
-    swe.set_sid_mode(SE_SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(SE_SIDM_LAHIRI)
     
     planets = {
         "Sun": SE_SUN,
@@ -190,7 +191,7 @@ def calculate_houses(
         - house_1 through house_12: House cusp longitudes
     """
     # Calculate houses using houses_ex for more control
-    cusps, ascmc = swe.houses_ex(julian_day, latitude, longitude, house_system)
+    cusps, ascmc = swe_context.houses_ex(julian_day, latitude, longitude, house_system)
     
     if cusps is None:
         raise ValueError("Error calculating houses")
@@ -229,7 +230,7 @@ def get_ascendant(julian_day: float, latitude: float, longitude: float) -> float
     Returns:
         Ascendant longitude in degrees
     """
-    _, ascmc = swe.houses(julian_day, latitude, longitude, SE_HOUSE_PLACIDUS)
+    _, ascmc = swe_context.houses(julian_day, latitude, longitude, SE_HOUSE_PLACIDUS)
     return normalize_degrees(ascmc[0])
 
 
@@ -246,7 +247,7 @@ def get_houses(julian_day: float, latitude: float, longitude: float) -> List[flo
         List of 12 house cusp longitudes (indices 0-11 correspond to houses 1-12)
     """
     # Use houses() - returns tuple where cusps[1] through cusps[12] are house cusps
-    cusps, ascmc = swe.houses(julian_day, latitude, longitude, SE_HOUSE_PLACIDUS)
+    cusps, ascmc = swe_context.houses(julian_day, latitude, longitude, SE_HOUSE_PLACIDUS)
     # cusps is a tuple/list where indices 1-12 are house cusps (index 0 is typically 0 or unused)
     # Handle both cases: if cusps[0] exists and is valid, or if we start from index 1
     if len(cusps) >= 13:
@@ -269,7 +270,7 @@ def get_ayanamsa(julian_day: float) -> float:
     Returns:
         Ayanamsa in degrees
     """
-    ayanamsa = swe.get_ayanamsa(julian_day)
+    ayanamsa = swe_context.get_ayanamsa(julian_day)
     return ayanamsa
 
 
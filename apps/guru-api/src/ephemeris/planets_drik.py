@@ -13,6 +13,7 @@ import swisseph as swe
 from typing import Dict, List
 from datetime import datetime
 
+from src.ephemeris import context as swe_context
 from src.utils.converters import normalize_degrees
 
 
@@ -54,7 +55,7 @@ SE_RAHU = swe.TRUE_NODE  # TRUE NODE (not mean node)
 def init_drik_mode():
     """Initialize Swiss Ephemeris in Drik Panchang mode."""
     # Set Lahiri Ayanamsa
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
 
 
 def get_rashi(longitude: float) -> Dict[str, any]:
@@ -130,7 +131,7 @@ def calculate_planet_drik(julian_day: float, planet_id: int) -> Dict[str, any]:
     flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_TRUEPOS | swe.FLG_SPEED
     
     # Calculate position (already in sidereal due to FLG_SIDEREAL flag)
-    xx, ret = swe.calc_ut(julian_day, planet_id, flags)
+    xx, ret = swe_context.calc(julian_day, planet_id, flags)
     
     if ret < 0:
         raise ValueError(f"Error calculating planet {planet_id}: {ret}")
@@ -14,13 +14,14 @@ import swisseph as swe
 from typing import Dict
 import math
 
+from src.ephemeris import context as swe_context
 from src.utils.converters import normalize_degrees
 
 
 def init_jhora_mode():
     """Initialize Swiss Ephemeris in JHORA mode."""
     # Set Lahiri Ayanamsa (N.C. Lahiri corrected)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
 
 
 def calculate_planet_jhora(julian_day: float, planet_id: int) -> Dict:
@@ -46,7 +47,7 @@ def calculate_planet_jhora(julian_day: float, planet_id: int) -> Dict:
     # Step 1: Compute tropical longitude using swe.calc_ut() WITHOUT FLG_SIDEREAL
     # swe.calc_ut() uses UTC, which is what we have (jd_ut)
     # We do NOT use FLG_SIDEREAL flag - we want tropical, then convert manually
-    xx, ret = swe.calc_ut(julian_day, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    xx, ret = swe_context.calc(julian_day, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
     
     if ret < 0:
         raise ValueError(f"Error calculating planet {planet_id}: {ret}")
@@ -58,7 +59,7 @@ def calculate_planet_jhora(julian_day: float, planet_id: int) -> Dict:
     speed_longitude = xx[3]
     
     # Step 2: Compute ayanamsa
-    ayanamsa = swe.get_ayanamsa(julian_day)
+    ayanamsa = swe_context.get_ayanamsa(julian_day)
     
     # Step 3: Compute sidereal longitude
     sidereal_lon = normalize_degrees(tropical_lon - ayanamsa)
@@ -207,7 +208,7 @@ def calculate_ascendant_jhora(julian_day: float, latitude: float, longitude: flo
     # swe.houses() uses TT internally, but we pass JD_UT
     # For exact JHORA match, we may need to convert JD_UT to JD_TT first
     # But let's try swe.houses() directly first
-    result = swe.houses(julian_day, latitude, longitude, b'P')  # Placidus
+    result = swe_context.houses(julian_day, latitude, longitude, b'P')  # Placidus
     if result is None:
         raise ValueError("Error calculating houses")
     
@@ -215,7 +216,7 @@ def calculate_ascendant_jhora(julian_day: float, latitude: float, longitude: flo
     tropical_asc = ascmc[0]
     
     # Step 2: Compute ayanamsa
-    ayanamsa = swe.get_ayanamsa(julian_day)
+    ayanamsa = swe_context.get_ayanamsa(julian_day)
     
     # Step 3: Convert to sidereal
     sidereal_asc = normalize_degrees(tropical_asc - ayanamsa)
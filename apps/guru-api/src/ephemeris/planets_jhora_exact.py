@@ -9,13 +9,17 @@ import swisseph as swe
 from typing import Dict
 import math
 
+from src.ephemeris import context as swe_context
 from src.utils.converters import normalize_degrees
+from src.utils.log import get_logger, trace
+
+logger = get_logger("ephemeris")
 
 
 def init_jhora_exact():
     """Initialize Swiss Ephemeris in EXACT JHORA mode."""
     # Set Lahiri Ayanamsa (SIDM_LAHIRI)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     # Set ephemeris path (if needed)
     # swe.set_ephe_path("./ephe")
 
@@ -44,7 +48,7 @@ def calculate_planet_jhora_exact(julian_day: float, planet_id: int) -> Dict:
     # FLG_SPEED is needed for retrograde detection
     flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
     
-    xx, ret = swe.calc_ut(julian_day, planet_id, flags)
+    xx, ret = swe_context.calc(julian_day, planet_id, flags)
     
     if ret < 0:
         raise ValueError(f"Error calculating planet {planet_id}: {ret}")
@@ -121,27 +125,22 @@ def calculate_ascendant_jhora_exact(julian_day: float, latitude: float, longitud
     # Step 1: Calculate houses using houses_ex() with FLG_SIDEREAL
     # FLG_SIDEREAL returns sidereal positions directly (no manual ayanamsa subtraction)
     # b'P' = Placidus house system (JHORA style)
-    result = swe.houses_ex(julian_day, latitude, longitude, b'P', swe.FLG_SIDEREAL)
+    result = swe_context.houses_ex(julian_day, latitude, longitude, b'P', swe.FLG_SIDEREAL)
     if result is None:
         raise ValueError("Error calculating houses")
     
     cusps, ascmc = result
     sidereal_asc = float(ascmc[0])  # Ascendant (already sidereal due to FLG_SIDEREAL)
     
-    # 🔍 D4 TRACE STEP 1: Swiss Ephemeris raw output
-    print("=" * 80)
-    print("🔍 D4 TRACE STEP 1: Swiss Ephemeris Output (calculate_ascendant_jhora_exact)")
-    print("=" * 80)
-    print(f"Raw swe.houses_ex() ascmc[0] = {ascmc[0]}")
-    print(f"sidereal_asc BEFORE modulo = {sidereal_asc}")
-    
+    raw_asc = sidereal_asc
+
     # Step 2: Normalize sidereal ascendant
     sidereal_asc = sidereal_asc % 360.0
     if sidereal_asc < 0:
         sidereal_asc += 360.0
-    
-    print(f"sidereal_asc AFTER modulo = {sidereal_asc}")
-    print("=" * 80)
+
+    # 🔍 D4 TRACE STEP 1: Swiss Ephemeris raw output
+    trace(logger, "D4 trace step 1: swe.houses_ex() ascmc[0]=%s, sidereal_asc after modulo=%s", raw_asc, sidereal_asc)
     
     # Convert to DMS EXACTLY as specified (NO ROUNDING, NO ceil)
     sign_index = int(sidereal_asc // 30.0)
@@ -0,0 +1,127 @@
+"""
+Ephemeris Snapshot - single-pass Swiss Ephemeris state for one chart.
+
+A snapshot captures every raw ephemeris value a natal chart needs
+(ascendant, planet longitudes/speeds, house cusps, ayanamsa) for one
+(Julian Day, latitude, longitude). It is computed ONCE per request and
+passed to every downstream consumer (kundli engine, varga engine, dasha)
+so that the same swe.calc_ut() / swe.houses() calls are never repeated.
+
+🔒 DO NOT MODIFY THE CALCULATION LOGIC - values are produced by the SAME
+JHORA-exact / Drik functions the engines used before, in the same order.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import swisseph as swe
+
+from src.ephemeris.ephemeris_utils import init_swisseph, get_houses, get_ayanamsa
+from src.ephemeris.planets_jhora_exact import (
+    calculate_ascendant_jhora_exact,
+    calculate_all_planets_jhora_exact,
+)
+from src.utils.converters import normalize_degrees
+
+
+@dataclass(frozen=True)
+class EphemerisSnapshot:
+    """
+    Immutable raw ephemeris state for one (jd, lat, lon).
+
+    Attributes:
+        julian_day: Julian Day Number (UTC - jd_ut)
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        ayanamsa: Lahiri ayanamsa at julian_day
+        ascendant: JHORA-exact ascendant data (calculate_ascendant_jhora_exact format)
+        planets: JHORA-exact planet data keyed by planet name (Sun..Ketu)
+        houses_sidereal: 12 Placidus cusps converted to sidereal (houses 1-12)
+        drik_moon_longitude: Moon longitude with Drik flags (FLG_TRUEPOS) for Vimshottari
+    """
+    julian_day: float
+    latitude: float
+    longitude: float
+    ayanamsa: float
+    ascendant: Mapping[str, float]
+    planets: Mapping[str, Mapping[str, float]]
+    houses_sidereal: Tuple[float, ...]
+    drik_moon_longitude: float
+
+    @property
+    def ascendant_longitude(self) -> float:
+        """Raw unrounded sidereal ascendant longitude (0-360)."""
+        return self.ascendant["longitude"]
+
+    @property
+    def planet_longitudes(self) -> Dict[str, float]:
+        """Raw unrounded sidereal longitudes {planet_name: longitude} for varga input."""
+        return {name: data["longitude"] for name, data in self.planets.items()}
+
+
+def build_ephemeris_snapshot(julian_day: float, latitude: float, longitude: float) -> EphemerisSnapshot:
+    """
+    Compute the ephemeris snapshot for a chart (ONE pass over Swiss Ephemeris).
+
+    Args:
+        julian_day: Julian Day Number (UTC - jd_ut)
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+
+    Returns:
+        EphemerisSnapshot shared by generate_kundli(), build_varga_chart() and
+        calculate_vimshottari_dasha_drik()
+    """
+    # Imported here: drik_panchang_engine lives in src.jyotish, which imports src.ephemeris
+    from src.jyotish.drik_panchang_engine import calculate_planet_drik
+
+    init_swisseph()
+
+    asc_jhora = calculate_ascendant_jhora_exact(julian_day, latitude, longitude)
+
+    # Houses: tropical Placidus cusps converted to sidereal (same as generate_kundli)
+    ayanamsa = get_ayanamsa(julian_day)
+    houses_tropical = get_houses(julian_day, latitude, longitude)
+    houses_sidereal = tuple(normalize_degrees(h - ayanamsa) for h in houses_tropical)
+
+    planets_jhora = calculate_all_planets_jhora_exact(julian_day)
+
+    # Vimshottari uses the Drik Moon (FLG_TRUEPOS) - keep it bit-identical to the dasha engine
+    drik_moon = calculate_planet_drik(julian_day, swe.MOON)
+
+    return EphemerisSnapshot(
+        julian_day=julian_day,
+        latitude=latitude,
+        longitude=longitude,
+        ayanamsa=ayanamsa,
+        ascendant=MappingProxyType(dict(asc_jhora)),
+        planets=MappingProxyType({
+            name: MappingProxyType(dict(data)) for name, data in planets_jhora.items()
+        }),
+        houses_sidereal=houses_sidereal,
+        drik_moon_longitude=drik_moon["longitude"],
+    )
+
+
+def ensure_ephemeris_snapshot(
+    snapshot: Optional[EphemerisSnapshot],
+    julian_day: float,
+    latitude: float,
+    longitude: float
+) -> EphemerisSnapshot:
+    """
+    Return the given snapshot, or build one when the caller did not pass it.
+
+    Raises:
+        ValueError: If the snapshot was computed for a different jd/location
+    """
+    if snapshot is None:
+        return build_ephemeris_snapshot(julian_day, latitude, longitude)
+    if (snapshot.julian_day, snapshot.latitude, snapshot.longitude) != (julian_day, latitude, longitude):
+        raise ValueError(
+            f"EphemerisSnapshot mismatch: snapshot is for jd={snapshot.julian_day}, "
+            f"lat={snapshot.latitude}, lon={snapshot.longitude}; requested jd={julian_day}, "
+            f"lat={latitude}, lon={longitude}"
+        )
+    return snapshot
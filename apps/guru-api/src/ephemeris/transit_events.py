@@ -0,0 +1,328 @@
+"""
+Transit Event Index - exact sign/nakshatra ingresses and retrograde stations.
+
+Monthly/yearly shifts and the yoga activation forecast used to step day by day
+(or 5, 7, 15, 30 days) and compare signs, which can misdate an ingress by up
+to one step and miss a sign visited for less than one step.
+
+The index scans the shared transit table (12 h cadence) for every change of
+sign, nakshatra and direction, then root-finds each event on Swiss Ephemeris:
+- Ingress: safeguarded Newton on the longitude (speed from FLG_SPEED)
+- Station: regula falsi on the speed
+Events are stored once per process, sorted by JD, and queried by time range.
+
+🔒 SAME EPHEMERIS AS get_planet_positions(): calculate_planet_position()
+(Drik flags, Lahiri, TRUE NODE; Ketu = Rahu + 180°).
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.ephemeris.ephemeris_utils import (
+    SE_SUN, SE_MOON, SE_MERCURY, SE_VENUS, SE_MARS, SE_JUPITER, SE_SATURN, SE_RAHU,
+    init_swisseph, calculate_planet_position,
+)
+from src.ephemeris.transit_table import TABLE_PLANETS, TABLE_STEP_DAYS, get_transit_table
+
+EVENT_PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Rahu", "Ketu")
+
+# Grahas with retrograde stations (Sun/Moon are always direct, the nodes always retrograde)
+STATION_PLANETS = ("Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+
+# Event kinds and their longitude span in degrees
+EVENT_SPANS = {
+    "sign": 30.0,
+    "nakshatra": 360.0 / 27.0,
+}
+EVENT_KINDS = ("sign", "nakshatra", "station")
+
+# Root-finding: 1e-6 day ≈ 0.09 s
+EVENT_TOLERANCE_DAYS = 1e-6
+EVENT_MAX_ITERATIONS = 40
+
+_SWE_IDS = {
+    "Sun": SE_SUN, "Moon": SE_MOON, "Mercury": SE_MERCURY, "Venus": SE_VENUS,
+    "Mars": SE_MARS, "Jupiter": SE_JUPITER, "Saturn": SE_SATURN, "Rahu": SE_RAHU,
+}
+
+
+@dataclass(frozen=True)
+class TransitEvent:
+    """
+    One exact transit event.
+
+    Attributes:
+        jd: Julian Day (UT) of the event
+        planet: Graha name
+        kind: "sign", "nakshatra" or "station"
+        from_index: Sign (0-11) / nakshatra (0-26) left; sign at a station
+        to_index: Sign / nakshatra entered; sign at a station
+        retrograde: Ingress made in retrograde motion / station turning retrograde
+    """
+    jd: float
+    planet: str
+    kind: str
+    from_index: int
+    to_index: int
+    retrograde: bool
+
+
+def _motion(planet: str, jd: float) -> Tuple[float, float]:
+    """Exact (longitude 0-360, speed deg/day) of a graha; Ketu = Rahu + 180°."""
+    pos = calculate_planet_position(jd, _SWE_IDS["Rahu" if planet == "Ketu" else planet])
+    longitude = pos["longitude"]
+    if planet == "Ketu":
+        longitude = (longitude + 180.0) % 360.0
+    return longitude, pos["speed_longitude"]
+
+
+def _refine_ingress(planet: str, boundary: float, jd_low: float, jd_high: float, jd_guess: float) -> float:
+    """JD in [jd_low, jd_high] where the longitude crosses boundary (safeguarded Newton)."""
+
+    def offset(jd):
+        longitude, speed = _motion(planet, jd)
+        return (longitude - boundary + 180.0) % 360.0 - 180.0, speed
+
+    f_low, _ = offset(jd_low)
+    jd = jd_guess
+    for _ in range(EVENT_MAX_ITERATIONS):
+        f, speed = offset(jd)
+        if (f < 0) == (f_low < 0):
+            jd_low, f_low = jd, f
+        else:
+            jd_high = jd
+        step = -f / speed if speed else 0.0
+        candidate = jd + step
+        if not speed or not (jd_low < candidate < jd_high):
+            candidate = (jd_low + jd_high) / 2.0
+        if abs(candidate - jd) < EVENT_TOLERANCE_DAYS or jd_high - jd_low < EVENT_TOLERANCE_DAYS:
+            return candidate
+        jd = candidate
+    return jd
+
+
+def _refine_station(planet: str, jd_low: float, jd_high: float) -> float:
+    """JD in [jd_low, jd_high] where the speed changes sign (Illinois regula falsi)."""
+    s_low = _motion(planet, jd_low)[1]
+    s_high = _motion(planet, jd_high)[1]
+    side = 0
+    jd = (jd_low + jd_high) / 2.0
+    for _ in range(EVENT_MAX_ITERATIONS):
+        if s_high == s_low:
+            jd = (jd_low + jd_high) / 2.0
+        else:
+            jd = jd_high - s_high * (jd_high - jd_low) / (s_high - s_low)
+        s = _motion(planet, jd)[1]
+        if (s < 0) == (s_high < 0):
+            jd_high, s_high = jd, s
+            if side == -1:
+                s_low /= 2.0
+            side = -1
+        else:
+            jd_low, s_low = jd, s
+            if side == 1:
+                s_high /= 2.0
+            side = 1
+        if jd_high - jd_low < EVENT_TOLERANCE_DAYS or s == 0.0:
+            break
+    return jd
+
+
+def scan_transit_events(
+    planet: str,
+    jds: np.ndarray,
+    longitudes: np.ndarray,
+    speeds: np.ndarray,
+) -> List[TransitEvent]:
+    """
+    Exact events of one graha between consecutive samples.
+
+    Args:
+        planet: Graha name
+        jds: Sample Julian Days (ascending, step small enough for one crossing per step)
+        longitudes: Sampled longitudes (0-360)
+        speeds: Sampled speeds (deg/day)
+
+    Returns:
+        Events sorted by JD
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64) % 360.0
+    speeds = np.asarray(speeds, dtype=np.float64)
+    events: List[TransitEvent] = []
+
+    for kind, span in EVENT_SPANS.items():
+        count = int(round(360.0 / span))
+        index = np.floor(longitudes / span).astype(int) % count
+        for i in np.nonzero(index[1:] != index[:-1])[0]:
+            from_index, to_index = int(index[i]), int(index[i + 1])
+            delta = (longitudes[i + 1] - longitudes[i] + 180.0) % 360.0 - 180.0
+            retrograde = bool(delta < 0)
+            boundary = ((from_index if retrograde else to_index) * span) % 360.0
+            # Linear first guess inside the bracket
+            fraction = ((boundary - longitudes[i] + 180.0) % 360.0 - 180.0) / delta if delta else 0.5
+            jd_guess = float(jds[i] + min(max(fraction, 0.0), 1.0) * (jds[i + 1] - jds[i]))
+            jd = _refine_ingress(planet, boundary, float(jds[i]), float(jds[i + 1]), jd_guess)
+            events.append(TransitEvent(jd, planet, kind, from_index, to_index, retrograde))
+
+    if planet in STATION_PLANETS:
+        for i in np.nonzero((speeds[1:] < 0) != (speeds[:-1] < 0))[0]:
+            jd = _refine_station(planet, float(jds[i]), float(jds[i + 1]))
+            sign = int(_motion(planet, jd)[0] // 30.0) % 12
+            events.append(TransitEvent(jd, planet, "station", sign, sign, bool(speeds[i + 1] < 0)))
+
+    events.sort(key=lambda event: event.jd)
+    return events
+
+
+def scan_transit_events_exact(planet: str, jd_start: float, jd_end: float, step: float = TABLE_STEP_DAYS) -> List[TransitEvent]:
+    """
+    scan_transit_events() on exact ephemeris samples (for ranges outside the table).
+
+    Args:
+        planet: Graha name
+        jd_start: First Julian Day (UT)
+        jd_end: Last Julian Day (UT)
+        step: Sample cadence in days
+
+    Returns:
+        Events with jd_start <= jd <= jd_end, sorted by JD
+    """
+    init_swisseph()
+    rows = int(np.ceil((jd_end - jd_start) / step)) + 1
+    jds = jd_start + np.arange(rows) * step
+    samples = np.array([_motion(planet, float(jd)) for jd in jds])
+    events = scan_transit_events(planet, jds, samples[:, 0], samples[:, 1])
+    return [event for event in events if jd_start <= event.jd <= jd_end]
+
+
+class TransitEventIndex:
+    """
+    Sorted transit events over [jd_start, jd_end], queried by time range.
+
+    Attributes:
+        jd_start: First Julian Day covered
+        jd_end: Last Julian Day covered
+        events: Tuple of TransitEvent sorted by JD
+    """
+
+    def __init__(self, jd_start: float, jd_end: float, events: Iterable[TransitEvent]):
+        self.jd_start = float(jd_start)
+        self.jd_end = float(jd_end)
+        self.events = tuple(sorted(events, key=lambda event: event.jd))
+        self._jds = [event.jd for event in self.events]
+
+    def covers(self, jd_start: float, jd_end: float) -> bool:
+        """True if [jd_start, jd_end] lies inside the index."""
+        return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+    def query(
+        self,
+        jd_start: float,
+        jd_end: float,
+        planets: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[TransitEvent]:
+        """
+        Events with jd_start <= jd <= jd_end.
+
+        Args:
+            jd_start: Range start (Julian Day, UT)
+            jd_end: Range end (Julian Day, UT)
+            planets: Restrict to these grahas (default: all)
+            kinds: Restrict to these kinds (default: all)
+
+        Returns:
+            Events sorted by JD
+        """
+        planets = set(planets) if planets is not None else None
+        kinds = set(kinds) if kinds is not None else None
+        lo = bisect_left(self._jds, jd_start)
+        hi = bisect_right(self._jds, jd_end)
+        return [
+            event for event in self.events[lo:hi]
+            if (planets is None or event.planet in planets) and (kinds is None or event.kind in kinds)
+        ]
+
+
+def build_transit_event_index(table=None) -> TransitEventIndex:
+    """
+    Build the event index over a transit table window.
+
+    Args:
+        table: TransitTable (default: the shared get_transit_table())
+
+    Returns:
+        TransitEventIndex covering the table window
+    """
+    init_swisseph()
+    table = table if table is not None else get_transit_table()
+    rows = table.longitudes.shape[0]
+    jds = table.jd_start + np.arange(rows) * table.step
+    events: List[TransitEvent] = []
+    for planet in EVENT_PLANETS:
+        if planet == "Ketu":
+            col = TABLE_PLANETS.index("Rahu")
+            longitudes = (np.asarray(table.longitudes[:, col], dtype=np.float64) + 180.0) % 360.0
+        else:
+            col = TABLE_PLANETS.index(planet)
+            longitudes = table.longitudes[:, col]
+        events.extend(scan_transit_events(planet, jds, longitudes, table.speeds[:, col]))
+    return TransitEventIndex(table.jd_start, table.jd_end, events)
+
+
+_index: Optional[TransitEventIndex] = None
+_index_table = None
+_index_lock = threading.Lock()
+
+
+def get_transit_event_index() -> TransitEventIndex:
+    """Shared event index over the shared transit table (built once per table)."""
+    global _index, _index_table
+    table = get_transit_table()
+    if _index is not None and _index_table is table:
+        return _index
+    with _index_lock:
+        if _index is None or _index_table is not table:
+            _index, _index_table = build_transit_event_index(table), table
+        return _index
+
+
+def find_transit_events(
+    jd_start: float,
+    jd_end: float,
+    planets: Iterable[str] = EVENT_PLANETS,
+    kinds: Optional[Iterable[str]] = None,
+) -> List[TransitEvent]:
+    """
+    Exact transit events in [jd_start, jd_end].
+
+    Range query on the shared index; ranges outside the table window are
+    scanned on exact ephemeris for the requested grahas only.
+
+    Args:
+        jd_start: Range start (Julian Day, UT)
+        jd_end: Range end (Julian Day, UT)
+        planets: Grahas to include
+        kinds: Event kinds to include (default: all)
+
+    Returns:
+        Events sorted by JD
+    """
+    planets = tuple(planets)
+    index = get_transit_event_index()
+    if index.covers(jd_start, jd_end):
+        return index.query(jd_start, jd_end, planets, kinds)
+
+    kinds = set(kinds) if kinds is not None else None
+    events: List[TransitEvent] = []
+    for planet in planets:
+        events.extend(
+            event for event in scan_transit_events_exact(planet, jd_start, jd_end)
+            if kinds is None or event.kind in kinds
+        )
+    events.sort(key=lambda event: event.jd)
+    return events
@@ -0,0 +1,278 @@
+"""
+Transit Table - shared sidereal transit positions for all users.
+
+Transit (gochar) longitudes depend only on time, never on the user. Daily,
+monthly and yearly scans used to call get_planet_positions() day by day for
+every request; the table computes the grahas ONCE over a rolling window
+(2 years back, 5 years ahead) at a fixed cadence and every caller reads it.
+
+Storage: float32 longitude + speed per graha per step (~0.3 MB at 12 h cadence),
+saved as .npy and memory-mapped on load, so every worker process shares the
+same pages. Lookups are O(1): cubic Hermite interpolation between the two
+bracketing rows using the stored speeds (max error ~2e-5°, the float32 limit).
+
+🔒 SAME EPHEMERIS AS get_planet_positions(): calculate_all_planets()
+(Drik flags, Lahiri, TRUE NODE). Outside the window the lookups fall back to
+calculate_all_planets() directly.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import swisseph as swe
+
+from src.ephemeris.ephemeris_utils import init_swisseph, calculate_all_planets
+from src.utils.converters import normalize_degrees
+
+# Grahas stored in the table (Ketu is derived from Rahu, as in calculate_all_planets)
+TABLE_PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Rahu")
+ALL_PLANETS = TABLE_PLANETS + ("Ketu",)
+
+# Rolling window and cadence
+TABLE_YEARS_BACK = 2
+TABLE_YEARS_AHEAD = 5
+TABLE_STEP_DAYS = 0.5
+
+# Bump when the stored layout or the ephemeris flags change
+TABLE_FORMAT_VERSION = 1
+
+
+class TransitTable:
+    """
+    Transit longitudes/speeds of the grahas at a fixed cadence.
+
+    Attributes:
+        jd_start: Julian Day (UT) of row 0
+        step: Cadence in days
+        longitudes: float32 array (rows, len(TABLE_PLANETS)) of sidereal longitudes
+        speeds: float32 array (rows, len(TABLE_PLANETS)) of speeds in degrees/day
+    """
+
+    def __init__(self, jd_start: float, step: float, longitudes: np.ndarray, speeds: np.ndarray):
+        if longitudes.shape != speeds.shape or longitudes.shape[1] != len(TABLE_PLANETS):
+            raise ValueError(f"Transit table shape mismatch: {longitudes.shape} vs {speeds.shape}")
+        if longitudes.shape[0] < 2:
+            raise ValueError("Transit table needs at least 2 rows")
+        self.jd_start = float(jd_start)
+        self.step = float(step)
+        self.longitudes = longitudes
+        self.speeds = speeds
+
+    @property
+    def jd_end(self) -> float:
+        """Julian Day of the last row."""
+        return self.jd_start + (self.longitudes.shape[0] - 1) * self.step
+
+    def covers(self, jd: float) -> bool:
+        """True if jd lies inside the table window."""
+        return self.jd_start <= jd <= self.jd_end
+
+    def _interpolate(self, jd: float):
+        """Hermite-interpolated (longitudes, speeds) of TABLE_PLANETS at jd (float64)."""
+        x = (jd - self.jd_start) / self.step
+        row = min(int(x), self.longitudes.shape[0] - 2)
+        u = x - row
+        lon0 = self.longitudes[row].astype(np.float64)
+        lon1 = self.longitudes[row + 1].astype(np.float64)
+        speed0 = self.speeds[row].astype(np.float64)
+        speed1 = self.speeds[row + 1].astype(np.float64)
+
+        # Unwrap across 360° (no graha moves 180° in one step)
+        delta = np.remainder(lon1 - lon0 + 180.0, 360.0) - 180.0
+        h = self.step
+        u2 = u * u
+        u3 = u2 * u
+        offset = (u3 - 2.0 * u2 + u) * h * speed0 + (-2.0 * u3 + 3.0 * u2) * delta + (u3 - u2) * h * speed1
+        longitudes = np.remainder(lon0 + offset, 360.0)
+        speeds = speed0 + (speed1 - speed0) * u
+        return longitudes, speeds
+
+    def positions(self, jd: float) -> Dict[str, float]:
+        """
+        Sidereal longitudes of all grahas at jd (get_planet_positions() format).
+
+        Args:
+            jd: Julian Day Number (UT), inside the window
+
+        Returns:
+            {planet_name: longitude} for Sun..Saturn, Rahu, Ketu
+        """
+        if not self.covers(jd):
+            raise ValueError(f"JD {jd} outside transit table [{self.jd_start}, {self.jd_end}]")
+        longitudes, _ = self._interpolate(jd)
+        result = {name: float(longitudes[i]) for i, name in enumerate(TABLE_PLANETS)}
+        result["Ketu"] = normalize_degrees(result["Rahu"] + 180)
+        return result
+
+    def speeds_at(self, jd: float) -> Dict[str, float]:
+        """
+        Speeds in degrees/day of all grahas at jd (calculate_all_planets() convention).
+
+        Args:
+            jd: Julian Day Number (UT), inside the window
+
+        Returns:
+            {planet_name: speed_longitude} for Sun..Saturn, Rahu, Ketu
+        """
+        if not self.covers(jd):
+            raise ValueError(f"JD {jd} outside transit table [{self.jd_start}, {self.jd_end}]")
+        _, speeds = self._interpolate(jd)
+        result = {name: float(speeds[i]) for i, name in enumerate(TABLE_PLANETS)}
+        result["Ketu"] = -result["Rahu"]
+        return result
+
+    def longitude(self, planet: str, jd: float) -> float:
+        """Sidereal longitude of one graha at jd."""
+        return self.positions(jd)[planet]
+
+
+def build_transit_table(jd_start: float, jd_end: float, step: float = TABLE_STEP_DAYS) -> TransitTable:
+    """
+    Compute a transit table with calculate_all_planets() at every step.
+
+    Args:
+        jd_start: First Julian Day (UT)
+        jd_end: Last Julian Day (UT), rounded up to a whole step
+        step: Cadence in days
+
+    Returns:
+        In-memory TransitTable
+    """
+    init_swisseph()
+    rows = int(np.ceil((jd_end - jd_start) / step)) + 1
+    longitudes = np.empty((rows, len(TABLE_PLANETS)), dtype=np.float32)
+    speeds = np.empty((rows, len(TABLE_PLANETS)), dtype=np.float32)
+    for row in range(rows):
+        planets = calculate_all_planets(jd_start + row * step)
+        for col, name in enumerate(TABLE_PLANETS):
+            longitudes[row, col] = planets[name]["longitude"]
+            speeds[row, col] = planets[name]["speed_longitude"]
+    return TransitTable(jd_start, step, longitudes, speeds)
+
+
+def save_transit_table(table: TransitTable, path: str) -> None:
+    """
+    Write the table as <path>.npy (rows, 2, planets) + <path>.json header, atomically.
+
+    Args:
+        table: TransitTable to save
+        path: File path without extension
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    data = np.stack([np.asarray(table.longitudes), np.asarray(table.speeds)], axis=1)
+    header = {
+        "version": TABLE_FORMAT_VERSION,
+        "jd_start": table.jd_start,
+        "step": table.step,
+        "rows": int(data.shape[0]),
+        "planets": list(TABLE_PLANETS),
+    }
+    fd, tmp_npy = tempfile.mkstemp(dir=directory, suffix=".npy")
+    with os.fdopen(fd, "wb") as f:
+        np.save(f, data)
+    fd, tmp_json = tempfile.mkstemp(dir=directory, suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(header, f)
+    os.replace(tmp_npy, path + ".npy")
+    os.replace(tmp_json, path + ".json")
+
+
+def load_transit_table(path: str) -> Optional[TransitTable]:
+    """
+    Memory-map a table written by save_transit_table().
+
+    Args:
+        path: File path without extension
+
+    Returns:
+        TransitTable backed by a read-only memory map, or None if missing/stale
+    """
+    try:
+        with open(path + ".json") as f:
+            header = json.load(f)
+        if header.get("version") != TABLE_FORMAT_VERSION or header.get("planets") != list(TABLE_PLANETS):
+            return None
+        data = np.load(path + ".npy", mmap_mode="r")
+        if data.shape != (header["rows"], 2, len(TABLE_PLANETS)):
+            return None
+        return TransitTable(header["jd_start"], header["step"], data[:, 0, :], data[:, 1, :])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _window_for_year(year: int):
+    """(jd_start, jd_end) of the rolling window anchored on Jan 1 of year."""
+    jd_start = swe.julday(year - TABLE_YEARS_BACK, 1, 1, 0.0, swe.GREG_CAL)
+    jd_end = swe.julday(year + TABLE_YEARS_AHEAD + 1, 1, 1, 0.0, swe.GREG_CAL)
+    return jd_start, jd_end
+
+
+_table: Optional[TransitTable] = None
+_table_year: Optional[int] = None
+_table_lock = threading.Lock()
+
+
+def get_transit_table(year: Optional[int] = None) -> TransitTable:
+    """
+    Shared transit table for the window around year (default: current UTC year).
+
+    Loaded from TRANSIT_TABLE_DIR (memory-mapped) when present, otherwise built
+    once and saved there for the next process.
+
+    Args:
+        year: Anchor year of the rolling window
+
+    Returns:
+        TransitTable
+    """
+    global _table, _table_year
+    if year is None:
+        year = datetime.utcnow().year
+    if _table is not None and _table_year == year:
+        return _table
+    with _table_lock:
+        if _table is not None and _table_year == year:
+            return _table
+        from src.config import settings
+
+        jd_start, jd_end = _window_for_year(year)
+        path = os.path.join(
+            settings.transit_table_dir,
+            f"transit_table_v{TABLE_FORMAT_VERSION}_{year}_{TABLE_STEP_DAYS:g}d",
+        )
+        table = load_transit_table(path)
+        if table is None or table.jd_start != jd_start or table.jd_end < jd_end:
+            table = build_transit_table(jd_start, jd_end, TABLE_STEP_DAYS)
+            try:
+                save_transit_table(table, path)
+                table = load_transit_table(path) or table
+            except OSError as e:
+                print(f"Warning: Could not save transit table to {path}: {e}")
+        _table, _table_year = table, year
+        return table
+
+
+def get_transit_positions(jd: float) -> Dict[str, float]:
+    """
+    Sidereal transit longitudes at jd from the shared table.
+
+    Drop-in for get_planet_positions() in day-stepping transit scans; falls back
+    to calculate_all_planets() outside the table window.
+
+    Args:
+        jd: Julian Day Number (UT)
+
+    Returns:
+        {planet_name: longitude} for Sun..Saturn, Rahu, Ketu
+    """
+    table = get_transit_table()
+    if table.covers(jd):
+        return table.positions(jd)
+    init_swisseph()
+    return {name: data["longitude"] for name, data in calculate_all_planets(jd).items()}
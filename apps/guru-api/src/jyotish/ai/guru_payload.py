@@ -138,6 +138,34 @@ def _daily_moon_shift(
         return []
 
 
+def _sign_shift_entries(events, timezone: str) -> List[Dict[str, Any]]:
+    """
+    Shift payload entries for exact sign-ingress events (transit_events index).
+    Nakshatras are read just before / just after the ingress boundary.
+    """
+    from src.jyotish.panchanga.panchanga_engine import _jd_to_datetime
+
+    result: List[Dict[str, Any]] = []
+    for event in events:
+        dt_shift = _jd_to_datetime(event.jd, timezone)
+        date_str = dt_shift.strftime("%b %d")  # Example: "Feb 08"
+        boundary = ((event.from_index if event.retrograde else event.to_index) * 30.0) % 360.0
+        direction = -1.0 if event.retrograde else 1.0
+        from_nak = get_nakshatra_pada(normalize_degrees(boundary - direction * 1e-6)).get("name", "")
+        to_nak = get_nakshatra_pada(normalize_degrees(boundary + direction * 1e-6)).get("name", "")
+
+        result.append({
+            "planet": event.planet,
+            "date": date_str,
+            "from_sign_index": event.from_index,
+            "to_sign_index": event.to_index,
+            "from_nakshatra": from_nak,
+            "to_nakshatra": to_nak,
+            "is_retrograde": event.retrograde,
+        })
+    return result
+
+
 def _monthly_planet_shifts(
     calculation_date: datetime,
     timezone: str,
@@ -145,14 +173,12 @@ def _monthly_planet_shifts(
 ) -> List[Dict[str, Any]]:
     """
     Deterministic JD-based monthly sign change detection.
-    Detects ALL sign changes within the calendar month.
+    Detects ALL sign changes within the calendar month (exact ingress times).
     Numeric-only payload.
     """
     try:
         from src.utils.timezone import local_to_utc, get_julian_day
-        from src.jyotish.kundli_engine import get_planet_positions
-        from src.utils.converters import normalize_degrees
-        from src.jyotish.panchanga.panchanga_engine import _jd_to_datetime
+        from src.ephemeris.transit_events import find_transit_events
 
         year = calculation_date.year
         month = calculation_date.month
@@ -172,49 +198,8 @@ def _monthly_planet_shifts(
 
         planets_to_track = ["Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
 
-        result: List[Dict[str, Any]] = []
-
-        # initial sign snapshot
-        prev_positions = get_planet_positions(jd_start)
-
-        prev_signs = {}
-        for p in planets_to_track:
-            lon = normalize_degrees(prev_positions.get(p, 0))
-            prev_signs[p] = int(lon // 30) % 12
-
-        jd = jd_start + 1  # start stepping day by day
-
-        while jd < jd_end:
-            positions = get_planet_positions(jd)
-
-            for p in planets_to_track:
-                lon = normalize_degrees(positions.get(p, 0))
-                current_sign = int(lon // 30) % 12
-
-                if current_sign != prev_signs[p]:
-                    dt_shift = _jd_to_datetime(jd, timezone)
-                    date_str = dt_shift.strftime("%b %d")  # Example: "Feb 08"
-                    from_lon = normalize_degrees(prev_positions.get(p, 0))
-                    to_lon = normalize_degrees(positions.get(p, 0))
-                    from_nak = get_nakshatra_pada(from_lon).get("name", "")
-                    to_nak = get_nakshatra_pada(to_lon).get("name", "")
-                    is_retro = (current_sign == (prev_signs[p] - 1) % 12)
-
-                    result.append({
-                        "planet": p,
-                        "date": date_str,
-                        "from_sign_index": prev_signs[p],
-                        "to_sign_index": current_sign,
-                        "from_nakshatra": from_nak,
-                        "to_nakshatra": to_nak,
-                        "is_retrograde": is_retro,
-                    })
-
-                    prev_signs[p] = current_sign
-
-            jd += 1  # step 1 day
-
-        return result
+        events = find_transit_events(jd_start, jd_end, planets_to_track, kinds=("sign",))
+        return _sign_shift_entries([e for e in events if e.jd < jd_end], timezone)
 
     except Exception:
         return []
@@ -227,14 +212,12 @@ def _yearly_planet_shifts(
 ) -> List[Dict[str, Any]]:
     """
     Deterministic 12-month sign change detection.
-    Tracks Jupiter and Saturn only.
+    Tracks Jupiter and Saturn only (exact ingress times).
     Numeric-only payload.
     """
     try:
         from src.utils.timezone import local_to_utc, get_julian_day
-        from src.jyotish.kundli_engine import get_planet_positions
-        from src.utils.converters import normalize_degrees
-        from src.jyotish.panchanga.panchanga_engine import _jd_to_datetime
+        from src.ephemeris.transit_events import find_transit_events
 
         # 12-month rolling window
         start_dt = calculation_date.replace(hour=12, minute=0, second=0, microsecond=0)
@@ -248,48 +231,8 @@ def _yearly_planet_shifts(
 
         planets_to_track = ["Jupiter", "Saturn"]
 
-        result: List[Dict[str, Any]] = []
-
-        prev_positions = get_planet_positions(jd_start)
-
-        prev_signs = {}
-        for p in planets_to_track:
-            lon = normalize_degrees(prev_positions.get(p, 0))
-            prev_signs[p] = int(lon // 30) % 12
-
-        jd = jd_start + 5  # step 5 days for performance
-
-        while jd < jd_end:
-            positions = get_planet_positions(jd)
-
-            for p in planets_to_track:
-                lon = normalize_degrees(positions.get(p, 0))
-                current_sign = int(lon // 30) % 12
-
-                if current_sign != prev_signs[p]:
-                    dt_shift = _jd_to_datetime(jd, timezone)
-                    date_str = dt_shift.strftime("%b %d")
-                    from_lon = normalize_degrees(prev_positions.get(p, 0))
-                    to_lon = normalize_degrees(positions.get(p, 0))
-                    from_nak = get_nakshatra_pada(from_lon).get("name", "")
-                    to_nak = get_nakshatra_pada(to_lon).get("name", "")
-                    is_retro = (current_sign == (prev_signs[p] - 1) % 12)
-
-                    result.append({
-                        "planet": p,
-                        "date": date_str,
-                        "from_sign_index": prev_signs[p],
-                        "to_sign_index": current_sign,
-                        "from_nakshatra": from_nak,
-                        "to_nakshatra": to_nak,
-                        "is_retrograde": is_retro,
-                    })
-
-                    prev_signs[p] = current_sign
-
-            jd += 5  # 5-day step
-
-        return result
+        events = find_transit_events(jd_start, jd_end, planets_to_track, kinds=("sign",))
+        return _sign_shift_entries([e for e in events if e.jd < jd_end], timezone)
 
     except Exception:
         return []
@@ -524,9 +467,9 @@ def build_guru_context(
     # Panchanga (stub if not available)
     panchanga = {}
     try:
-        from src.jyotish.panchanga.panchanga_engine import calculate_panchanga
+        from src.jyotish.panchanga.panchanga_cache import get_cached_panchanga
         date_str = calculation_date.strftime("%Y-%m-%d")
-        panchanga = calculate_panchanga(date_str, lat, lon, timezone) or {}
+        panchanga = get_cached_panchanga(date_str, lat, lon, timezone) or {}
     except Exception:
         try:
             from src.jyotish.panchang import calculate_panchang
@@ -36,6 +36,23 @@ def get_current_dasha_lord(birth_datetime: datetime, current_datetime: datetime,
     """
     try:
         dasha_data = calculate_vimshottari_dasha(birth_datetime, moon_degree)
+    except:
+        return "Moon"  # Default
+    return current_dasha_lord(dasha_data, current_datetime)
+
+
+def current_dasha_lord(dasha_data: Dict, current_datetime: datetime) -> str:
+    """
+    Phase 7: Mahadasha lord running at current_datetime in a calculate_vimshottari_dasha() result.
+    
+    Args:
+        dasha_data: calculate_vimshottari_dasha() output (e.g. the stored natal dasha)
+        current_datetime: Current datetime
+    
+    Returns:
+        Current dasha lord name
+    """
+    try:
         mahadashas = dasha_data.get("mahadasha", [])
         
         # Find current dasha
@@ -114,16 +131,45 @@ def compute_daily(
     Returns:
         Complete daily impact dictionary
     """
-    # Get current planet positions
-    current_planets = get_planet_positions(current_jd)
-    moon_degree = current_planets["Moon"]
+    # Day/location part (same for every user at this location)
+    factors = compute_daily_sky_factors(current_jd, lat, lon)
     
     # Get birth planet positions (for dasha)
     birth_planets = get_planet_positions(birth_jd)
     birth_moon_degree = birth_planets["Moon"]
     
+    # Get current dasha lord
+    current_datetime = datetime.now() if birth_datetime is None else birth_datetime
+    dasha_lord = get_current_dasha_lord(
+        birth_datetime or current_datetime,
+        current_datetime,
+        birth_moon_degree
+    )
+    
+    return score_daily(factors, dasha_lord, current_datetime)
+
+
+def compute_daily_sky_factors(current_jd: float, lat: float, lon: float, current_planets: Dict = None) -> Dict:
+    """
+    Phase 7: User-independent part of compute_daily() (depends only on the day and location).
+    
+    Args:
+        current_jd: Current Julian Day
+        lat: Geographic latitude
+        lon: Geographic longitude
+        current_planets: get_planet_positions(current_jd), if already computed
+    
+    Returns:
+        Dict with moon_degree, moon_info, transits, house_impacts, moon_house,
+        shadbala and moon_house_bindus
+    """
+    # Get current planet positions
+    if current_planets is None:
+        current_planets = get_planet_positions(current_jd)
+    moon_degree = current_planets["Moon"]
+    
     # Get transits
-    transits_data = get_transits(current_jd, lat, lon)
+    transits_data = get_transits(current_jd, lat, lon, planets=current_planets)
     transits = transits_data["transits"]
     house_impacts = transits_data["house_impacts"]
     
@@ -132,7 +178,6 @@ def compute_daily(
     
     # Calculate Shadbala for current positions
     shadbala = calculate_shadbala(current_jd, lat, lon)
-    moon_shadbala = shadbala.get("Moon", {}).get("total_shadbala", 50.0)
     
     # Calculate Ashtakavarga
     asc = get_ascendant(current_jd, lat, lon)
@@ -145,13 +190,35 @@ def compute_daily(
     sav = ashtakavarga.get("SAV", {})
     moon_house_bindus = sav.get(f"house_{moon_house}", 0)
     
-    # Get current dasha lord
-    current_datetime = datetime.now() if birth_datetime is None else birth_datetime
-    current_dasha_lord = get_current_dasha_lord(
-        birth_datetime or current_datetime,
-        current_datetime,
-        birth_moon_degree
-    )
+    return {
+        "moon_degree": moon_degree,
+        # Get Moon daily effects
+        "moon_info": moon_daily_effects(moon_degree),
+        "transits": transits,
+        "house_impacts": house_impacts,
+        "moon_house": moon_house,
+        "shadbala": shadbala,
+        "moon_house_bindus": moon_house_bindus
+    }
+
+
+def score_daily(factors: Dict, current_dasha_lord: str, current_datetime: datetime) -> Dict:
+    """
+    Phase 7: Per-user part of compute_daily(): weighted score from the day's factors.
+    
+    Args:
+        factors: compute_daily_sky_factors() output (not modified)
+        current_dasha_lord: Mahadasha lord of the user
+        current_datetime: Datetime for the day lord and timing windows
+    
+    Returns:
+        Complete daily impact dictionary (shares nested objects with factors)
+    """
+    transits = factors["transits"]
+    shadbala = factors["shadbala"]
+    moon_house = factors["moon_house"]
+    moon_house_bindus = factors["moon_house_bindus"]
+    moon_shadbala = shadbala.get("Moon", {}).get("total_shadbala", 50.0)
     
     # Get dasha lord strength
     dasha_lord_strength = shadbala.get(current_dasha_lord, {}).get("total_shadbala", 50.0)
@@ -190,8 +257,7 @@ def compute_daily(
         summary = "Caution Day"
         rating = "Caution"
     
-    # Get Moon daily effects
-    moon_info = moon_daily_effects(moon_degree)
+    moon_info = factors["moon_info"]
     
     # Determine good/bad time windows (simplified)
     current_hour = current_datetime.hour
@@ -224,6 +290,6 @@ def compute_daily(
             "current_hour": current_hour
         },
         "lucky_color": moon_info["lucky_color"],
-        "house_impacts": house_impacts
+        "house_impacts": factors["house_impacts"]
     }
 
@@ -0,0 +1,289 @@
+"""
+Daily Sky Context - the day's sky computed once and shared by every user.
+
+The daily notification and delivery builders called get_planet_positions(),
+generate_panchang() and compute_daily() per user at the same noon Julian Day,
+although the sky is identical for everyone:
+
+- SkyContext (one per Julian Day): sidereal longitudes, speeds, retrograde
+  flags and signs of the grahas, tithi/nakshatra/yoga/karana, and the exact
+  Moon sign changes of the day.
+- LocalSky (one per Julian Day and location grid cell): transit houses from
+  the local ascendant, house impacts, Shadbala, Ashtakavarga bindus and
+  sunrise/sunset - everything in compute_daily() that depends on the place.
+
+Per user only the stored natal chart is read (current dasha lord, weekday,
+timing windows), so a notification run costs one ephemeris pass per day and
+location cell instead of one per user.
+
+🔒 LocalSky is calculated AT THE GRID POINT (SKY_CONTEXT_GRID_DEG, default
+0.01° like the Panchanga cache), so a result never depends on which user
+asked first. A grid of 0 keys by the exact coordinates and reproduces
+compute_daily() / generate_panchang() exactly.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import swisseph as swe
+
+from src.config import settings
+from src.ephemeris.ephemeris_utils import calculate_all_planets, init_swisseph
+from src.ephemeris.transit_events import scan_transit_events_exact
+from src.jyotish.daily.daily_engine import compute_daily_sky_factors, current_dasha_lord, score_daily
+from src.jyotish.panchang_engine import calculate_panchang_elements, get_sunrise_sunset
+from src.utils.converters import degrees_to_sign
+
+# Days kept in memory (yesterday's run may still be finishing after midnight)
+SKY_CONTEXT_MAX_DAYS = 3
+
+
+@dataclass(frozen=True)
+class SkyContext:
+    """
+    Location-independent sky of one Julian Day (shared; treat as read-only).
+
+    Attributes:
+        jd: Julian Day (noon of the date in the daily builders)
+        date: Calendar date of jd
+        planets: Sidereal longitudes (same as get_planet_positions(jd))
+        speeds: Longitude speeds in degrees/day
+        retrograde: Retrograde flags
+        signs: Sign numbers (0-11)
+        panchang: calculate_panchang_elements() (no sunrise/sunset)
+        moon_sign_changes: Exact Moon ingresses within jd ± 12 h
+    """
+    jd: float
+    date: datetime
+    planets: Dict[str, float]
+    speeds: Dict[str, float]
+    retrograde: Dict[str, bool]
+    signs: Dict[str, int]
+    panchang: Dict
+    moon_sign_changes: List[Dict]
+
+
+@dataclass(frozen=True)
+class LocalSky:
+    """
+    Sky of one Julian Day at one location grid point (shared; treat as read-only).
+
+    Attributes:
+        sky: Location-independent SkyContext
+        latitude: Grid latitude
+        longitude: Grid longitude
+        factors: compute_daily_sky_factors() at this point
+        sunrise: Local sunrise (HH:MM:SS)
+        sunset: Local sunset (HH:MM:SS)
+    """
+    sky: SkyContext
+    latitude: float
+    longitude: float
+    factors: Dict
+    sunrise: str
+    sunset: str
+
+    def panchang(self) -> Dict:
+        """generate_panchang() for this day and location (a private copy)."""
+        panchang = copy.deepcopy(self.sky.panchang)
+        panchang["sunrise"] = self.sunrise
+        panchang["sunset"] = self.sunset
+        return panchang
+
+    def daily_for_natal(self, natal: Dict) -> Dict:
+        """
+        compute_daily() for a user from the stored natal chart (a private copy).
+
+        Args:
+            natal: get_natal_chart() result (birth_datetime, dasha)
+
+        Returns:
+            Same dictionary as compute_daily(birth_jd, jd, lat, lon, birth_datetime)
+        """
+        birth_datetime = natal["birth_datetime"]
+        dasha_lord = current_dasha_lord(natal["dasha"], birth_datetime)
+        return copy.deepcopy(score_daily(self.factors, dasha_lord, birth_datetime))
+
+
+def build_sky_context(jd: float) -> SkyContext:
+    """
+    Compute the location-independent sky of a Julian Day.
+
+    Args:
+        jd: Julian Day
+
+    Returns:
+        SkyContext
+    """
+    init_swisseph()
+    positions = calculate_all_planets(jd)
+    year, month, day, _ = swe.revjul(jd, swe.GREG_CAL)
+    date = datetime(year, month, day)
+
+    moon_sign_changes = [
+        {
+            "jd": event.jd,
+            "from_sign": event.from_index,
+            "to_sign": event.to_index,
+        }
+        for event in scan_transit_events_exact("Moon", jd - 0.5, jd + 0.5)
+        if event.kind == "sign"
+    ]
+
+    return SkyContext(
+        jd=jd,
+        date=date,
+        planets={name: data["longitude"] for name, data in positions.items()},
+        speeds={name: data["speed_longitude"] for name, data in positions.items()},
+        retrograde={name: data["speed_longitude"] < 0 for name, data in positions.items()},
+        signs={name: degrees_to_sign(data["longitude"])[0] for name, data in positions.items()},
+        panchang=calculate_panchang_elements(jd, date),
+        moon_sign_changes=moon_sign_changes,
+    )
+
+
+def build_local_sky(sky: SkyContext, latitude: float, longitude: float) -> LocalSky:
+    """
+    Compute the location-dependent part of a day's sky.
+
+    Args:
+        sky: SkyContext of the day
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+
+    Returns:
+        LocalSky
+    """
+    sunrise, sunset = get_sunrise_sunset(sky.jd, latitude, longitude)
+    return LocalSky(
+        sky=sky,
+        latitude=latitude,
+        longitude=longitude,
+        factors=compute_daily_sky_factors(sky.jd, latitude, longitude, current_planets=dict(sky.planets)),
+        sunrise=sunrise,
+        sunset=sunset,
+    )
+
+
+LocalSkyKey = Tuple[float, float, float]
+
+
+class SkyContextCache:
+    """
+    Thread-safe cache of SkyContexts (per day) and LocalSkies (LRU per day and grid cell).
+
+    Args:
+        max_locations: Maximum cached LocalSkies (least recently used evicted)
+        grid_deg: Location grid in degrees (<= 0 disables snapping)
+    """
+
+    def __init__(self, max_locations: int = 4096, grid_deg: float = 0.01):
+        if max_locations < 1:
+            raise ValueError(f"max_locations must be >= 1, got {max_locations}")
+        self.max_locations = max_locations
+        self.grid_deg = grid_deg
+        self._skies: "OrderedDict[float, SkyContext]" = OrderedDict()
+        self._locals: "OrderedDict[LocalSkyKey, LocalSky]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def snap(self, value: float) -> float:
+        """Snap a coordinate to the cache grid."""
+        if self.grid_deg <= 0:
+            return float(value)
+        return round(round(float(value) / self.grid_deg) * self.grid_deg, 6)
+
+    def sky(self, jd: float) -> SkyContext:
+        """SkyContext of a Julian Day, computed at most once while cached."""
+        key = round(jd, 6)
+        with self._lock:
+            sky = self._skies.get(key)
+            if sky is not None:
+                self._skies.move_to_end(key)
+                return sky
+
+        sky = build_sky_context(jd)
+
+        with self._lock:
+            sky = self._skies.setdefault(key, sky)
+            self._skies.move_to_end(key)
+            while len(self._skies) > SKY_CONTEXT_MAX_DAYS:
+                dropped, _ = self._skies.popitem(last=False)
+                for local_key in [k for k in self._locals if k[0] == dropped]:
+                    del self._locals[local_key]
+        return sky
+
+    def local(self, jd: float, latitude: float, longitude: float) -> LocalSky:
+        """
+        LocalSky of a Julian Day at the grid point nearest (latitude, longitude).
+
+        Args:
+            jd: Julian Day
+            latitude: Geographic latitude
+            longitude: Geographic longitude
+
+        Returns:
+            LocalSky (shared; use its panchang()/daily_for_natal() copies)
+        """
+        key = (round(jd, 6), self.snap(latitude), self.snap(longitude))
+        with self._lock:
+            local = self._locals.get(key)
+            if local is not None:
+                self._locals.move_to_end(key)
+                self._hits += 1
+                return local
+            self._misses += 1
+
+        # Calculate outside the lock: concurrent misses for different cells run in parallel
+        local = build_local_sky(self.sky(jd), key[1], key[2])
+
+        with self._lock:
+            local = self._locals.setdefault(key, local)
+            self._locals.move_to_end(key)
+            while len(self._locals) > self.max_locations:
+                self._locals.popitem(last=False)
+        return local
+
+    def clear(self) -> None:
+        """Drop all entries and reset the metrics."""
+        with self._lock:
+            self._skies.clear()
+            self._locals.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "days": len(self._skies),
+                "locations": len(self._locals),
+                "max_locations": self.max_locations,
+                "grid_deg": self.grid_deg,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+sky_context_cache = SkyContextCache(
+    max_locations=settings.sky_context_max_locations,
+    grid_deg=settings.sky_context_grid_deg,
+)
+
+
+def get_sky_context(jd: float) -> SkyContext:
+    """Shared SkyContext of a Julian Day (see SkyContextCache.sky)."""
+    return sky_context_cache.sky(jd)
+
+
+def get_local_sky(jd: float, latitude: float, longitude: float) -> LocalSky:
+    """Shared LocalSky of a Julian Day and location (see SkyContextCache.local)."""
+    return sky_context_cache.local(jd, latitude, longitude)
@@ -10,6 +10,13 @@ from src.jyotish.dasha.vimshottari_engine import (
     get_nakshatra_lord,
     calculate_balance_of_dasha
 )
+from src.jyotish.dasha.timeline import (
+    DashaPeriod,
+    VimshottariTimeline,
+    get_vimshottari_timeline,
+    get_vimshottari_timeline_for_birth,
+    locate_period
+)
 
 __all__ = [
     "calculate_vimshottari_dasha",
@@ -17,5 +24,10 @@ __all__ = [
     "calculate_pratyantardashas",
     "get_nakshatra_from_longitude",
     "get_nakshatra_lord",
-    "calculate_balance_of_dasha"
+    "calculate_balance_of_dasha",
+    "DashaPeriod",
+    "VimshottariTimeline",
+    "get_vimshottari_timeline",
+    "get_vimshottari_timeline_for_birth",
+    "locate_period"
 ]
@@ -0,0 +1,288 @@
+"""
+Vimshottari Timeline - one canonical dasha tree per birth chart.
+
+The 120-year Mahadasha cycle is built once per (birth JD, ayanamsa, local birth
+datetime) and memoized. Sub-periods (Antardasha, Pratyantardasha, Sookshma,
+Prana) are built lazily, only for the periods actually visited, and cached.
+Lookups are bisect-based at every level: period_at() is O(depth · log 9).
+
+🔒 SAME RULES AS vimshottari_engine.calculate_vimshottari_dasha():
+- Mahadasha anchored at the start of the birth nakshatra (Prokerala)
+- Year = 365.25 days; sub-period = parent × lord years / 120, clipped to parent end
+"""
+
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+from src.ephemeris import context as swe_context
+from src.jyotish.dasha.vimshottari_engine import (
+    DASHA_SEQUENCE,
+    DASHA_YEARS,
+    calculate_balance_of_dasha,
+    get_nakshatra_from_longitude,
+)
+from src.jyotish.drik_panchang_engine import calculate_all_planets_drik, get_julian_day_utc
+
+# Depth 1-5
+DASHA_LEVELS = ("mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana")
+
+# Memoized timelines (birth charts) kept in memory
+TIMELINE_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class DashaPeriod:
+    """
+    One Vimshottari period.
+
+    Attributes:
+        lords: Lords from Mahadasha down to this period (length = depth)
+        start: Start datetime (local birth time frame)
+        end: End datetime
+    """
+    lords: Tuple[str, ...]
+    start: datetime
+    end: datetime
+
+    @property
+    def lord(self) -> str:
+        """Lord of this period."""
+        return self.lords[-1]
+
+    @property
+    def depth(self) -> int:
+        """1 = Mahadasha ... 5 = Prana."""
+        return len(self.lords)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Engine format: {"planet", "start", "end"} with ISO datetimes."""
+        return {
+            "planet": self.lord,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+        }
+
+
+def locate_period(periods: Sequence[DashaPeriod], when: datetime) -> Optional[DashaPeriod]:
+    """
+    First period with start <= when <= end (bisect on contiguous periods).
+
+    Args:
+        periods: Contiguous periods sorted by start
+        when: Datetime to look up
+
+    Returns:
+        Matching period, or None if when is outside the periods
+    """
+    i = bisect_left(periods, when, key=lambda period: period.end)
+    if i < len(periods) and periods[i].start <= when:
+        return periods[i]
+    return None
+
+
+class VimshottariTimeline:
+    """
+    Lazily expanded Vimshottari tree for one birth.
+
+    Args:
+        birth_datetime: Local birth datetime (naive, as in the dasha engine)
+        moon_longitude: Sidereal (Lahiri, Drik) Moon longitude at birth
+    """
+
+    def __init__(self, birth_datetime: datetime, moon_longitude: float):
+        self.birth_datetime = birth_datetime
+        self.moon_longitude = moon_longitude
+        self._children: Dict[Tuple[str, ...], Tuple[DashaPeriod, ...]] = {}
+        self._lock = threading.Lock()
+
+        nakshatra_info = get_nakshatra_from_longitude(moon_longitude)
+        dasha_lord = nakshatra_info["lord"]
+        balance_info = calculate_balance_of_dasha(moon_longitude, nakshatra_info["index"])
+        self.nakshatra = nakshatra_info
+
+        dasha_period_years = DASHA_YEARS[dasha_lord]
+        remaining_dasha_days = dasha_period_years * balance_info["remaining_fraction"] * 365.25
+        elapsed_dasha_days = dasha_period_years * balance_info["elapsed_fraction"] * 365.25
+
+        # Mahadasha anchored at the ACTUAL START of the birth nakshatra
+        mahadashas = []
+        start = birth_datetime - timedelta(days=elapsed_dasha_days)
+        end = birth_datetime + timedelta(days=remaining_dasha_days)
+        mahadashas.append(DashaPeriod((dasha_lord,), start, end))
+        lord_index = DASHA_SEQUENCE.index(dasha_lord)
+        for i in range(1, 9):
+            lord = DASHA_SEQUENCE[(lord_index + i) % 9]
+            start, end = end, end + timedelta(days=DASHA_YEARS[lord] * 365.25)
+            mahadashas.append(DashaPeriod((lord,), start, end))
+        self.mahadashas: Tuple[DashaPeriod, ...] = tuple(mahadashas)
+
+    def children(self, period: DashaPeriod) -> Tuple[DashaPeriod, ...]:
+        """
+        Sub-periods of a period (built on first access, then cached).
+
+        Formula: sub years = product of lord years / 120^(depth) (e.g. AD = MD × AD / 120)
+
+        Args:
+            period: Parent period (depth 1-4)
+
+        Returns:
+            Contiguous sub-periods starting with the parent's lord
+        """
+        cached = self._children.get(period.lords)
+        if cached is not None:
+            return cached
+        if period.depth >= len(DASHA_LEVELS):
+            raise ValueError(f"Prana (depth {len(DASHA_LEVELS)}) is the deepest Vimshottari level")
+
+        years_product = 1
+        for lord in period.lords:
+            years_product *= DASHA_YEARS[lord]
+        divisor = 120 ** period.depth
+
+        children = []
+        current_date = period.start
+        lord_index = DASHA_SEQUENCE.index(period.lord)
+        for i in range(9):
+            lord = DASHA_SEQUENCE[(lord_index + i) % 9]
+            sub_days = (years_product * DASHA_YEARS[lord]) / divisor * 365.25
+            end_date = current_date + timedelta(days=sub_days)
+            # Don't exceed parent end date
+            if end_date > period.end:
+                end_date = period.end
+            children.append(DashaPeriod(period.lords + (lord,), current_date, end_date))
+            current_date = end_date
+            if current_date >= period.end:
+                break
+
+        result = tuple(children)
+        with self._lock:
+            self._children.setdefault(period.lords, result)
+        return self._children[period.lords]
+
+    def path_at(self, when: datetime, depth: int = 3) -> Tuple[DashaPeriod, ...]:
+        """
+        Running periods from Mahadasha down to depth at when.
+
+        Args:
+            when: Datetime (same frame as birth_datetime)
+            depth: 1 (Mahadasha) ... 5 (Prana)
+
+        Returns:
+            Tuple of periods (shorter than depth, or empty, if when is outside the cycle)
+        """
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"depth must be 1-{len(DASHA_LEVELS)}, got {depth}")
+        path = []
+        periods: Sequence[DashaPeriod] = self.mahadashas
+        for level in range(depth):
+            period = locate_period(periods, when)
+            if period is None:
+                break
+            path.append(period)
+            if level + 1 < depth:
+                periods = self.children(period)
+        return tuple(path)
+
+    def period_at(self, when: datetime, depth: int = 1) -> Optional[DashaPeriod]:
+        """
+        Running period at depth (1 = Mahadasha ... 5 = Prana), or None outside the cycle.
+        """
+        path = self.path_at(when, depth)
+        return path[-1] if len(path) == depth else None
+
+    def periods_between(self, start: datetime, end: datetime, depth: int = 2) -> List[DashaPeriod]:
+        """
+        All periods at depth overlapping [start, end], in time order.
+
+        Only the branches overlapping the range are expanded.
+
+        Args:
+            start: Range start
+            end: Range end
+            depth: 1 (Mahadasha) ... 5 (Prana)
+
+        Returns:
+            List of periods (not clipped to the range)
+        """
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"depth must be 1-{len(DASHA_LEVELS)}, got {depth}")
+        result: List[DashaPeriod] = []
+
+        def collect(periods: Sequence[DashaPeriod]):
+            i = bisect_left(periods, start, key=lambda period: period.end)
+            for period in periods[i:]:
+                if period.start > end:
+                    break
+                if period.depth == depth:
+                    result.append(period)
+                else:
+                    collect(self.children(period))
+
+        collect(self.mahadashas)
+        return result
+
+
+_timelines: "OrderedDict[tuple, VimshottariTimeline]" = OrderedDict()
+_timelines_lock = threading.Lock()
+
+
+def get_vimshottari_timeline(birth_datetime: datetime, jd: float) -> VimshottariTimeline:
+    """
+    Memoized timeline for a birth (key: birth JD, ayanamsa, local birth datetime).
+
+    Args:
+        birth_datetime: Local birth datetime (naive)
+        jd: Birth Julian Day (UTC)
+
+    Returns:
+        Shared VimshottariTimeline (treat as read-only)
+    """
+    key = (jd, swe.SIDM_LAHIRI, birth_datetime)
+    with _timelines_lock:
+        timeline = _timelines.get(key)
+        if timeline is not None:
+            _timelines.move_to_end(key)
+            return timeline
+
+    # FORCE Lahiri Ayanamsa (CRITICAL for Drik Panchang accuracy)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    moon_longitude = calculate_all_planets_drik(jd)["Moon"]["longitude"]
+    timeline = VimshottariTimeline(birth_datetime, moon_longitude)
+
+    with _timelines_lock:
+        timeline = _timelines.setdefault(key, timeline)
+        _timelines.move_to_end(key)
+        while len(_timelines) > TIMELINE_CACHE_SIZE:
+            _timelines.popitem(last=False)
+    return timeline
+
+
+def get_vimshottari_timeline_for_birth(birth_date: str, birth_time: str, timezone: str) -> VimshottariTimeline:
+    """
+    Memoized timeline from birth details (same parsing as calculate_vimshottari_dasha).
+
+    Args:
+        birth_date: Birth date in YYYY-MM-DD format
+        birth_time: Birth time in HH:MM or HH:MM:SS format
+        timezone: Timezone string (e.g., 'Asia/Kolkata')
+
+    Returns:
+        Shared VimshottariTimeline (treat as read-only)
+    """
+    birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d").date()
+    time_parts = birth_time.split(':')
+    hour = int(time_parts[0])
+    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+    second = int(time_parts[2]) if len(time_parts) > 2 else 0
+    birth_datetime = datetime.combine(
+        birth_date_obj,
+        datetime.min.time().replace(hour=hour, minute=minute, second=second)
+    )
+    jd = get_julian_day_utc(birth_date_obj, birth_time, timezone)
+    return get_vimshottari_timeline(birth_datetime, jd)
@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import swisseph as swe
 
+from src.ephemeris import context as swe_context
 from src.jyotish.drik_panchang_engine import (
     get_julian_day_utc,
     calculate_all_planets_drik,
@@ -171,160 +172,57 @@ def calculate_vimshottari_dasha(
         - pratyantardashas: Pratyantar Dasha periods (optional)
     """
     # FORCE Lahiri Ayanamsa (CRITICAL for Drik Panchang accuracy)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     if calculation_date is None:
         calculation_date = datetime.now()
     
-    # Parse birth date
-    birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d").date()
-    
-    # Parse birth time
-    time_parts = birth_time.split(':')
-    hour = int(time_parts[0])
-    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-    second = int(time_parts[2]) if len(time_parts) > 2 else 0
-    
-    # Create birth datetime
-    birth_datetime = datetime.combine(
-        birth_date_obj,
-        datetime.min.time().replace(hour=hour, minute=minute, second=second)
-    )
-    
-    # Calculate Julian Day (get_julian_day_utc expects date and time string)
-    jd = get_julian_day_utc(birth_date_obj, birth_time, timezone)
-    
-    # Re-assert Lahiri Ayanamsa (some functions may reset it)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-    
-    # Get Moon position using Drik Panchang method
-    planets_drik = calculate_all_planets_drik(jd)
-    moon_data = planets_drik["Moon"]
-    moon_longitude = moon_data["longitude"]
-    
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra_from_longitude(moon_longitude)
-    nakshatra_index = nakshatra_info["index"]
-    nakshatra_name = nakshatra_info["name"]
-    dasha_lord = nakshatra_info["lord"]
-    
-    # Calculate balance of dasha at birth
-    balance_info = calculate_balance_of_dasha(moon_longitude, nakshatra_index)
-    remaining_fraction = balance_info["remaining_fraction"]
-    elapsed_fraction = balance_info["elapsed_fraction"]
-    
-    # Calculate remaining mahadasha period
-    dasha_period_years = DASHA_YEARS[dasha_lord]
-    remaining_dasha_years = dasha_period_years * remaining_fraction
-    remaining_dasha_days = remaining_dasha_years * 365.25
-    
-    # ***ABSOLUTE MAHADASHA ANCHOR (PROKERALA CORRECT)***
-    # Compute elapsed days in current Mahadasha
-    elapsed_dasha_years = dasha_period_years * elapsed_fraction
-    elapsed_dasha_days = elapsed_dasha_years * 365.25
-    
-    # Mahadasha start datetime = birth_datetime - elapsed_days
-    # This anchors the Mahadasha at the ACTUAL START of the Nakshatra cycle
-    mahadasha_start_datetime = birth_datetime - timedelta(days=elapsed_dasha_days)
-    
-    # Build mahadasha sequence (full 120-year cycle)
-    mahadasha_list = []
-    current_date = mahadasha_start_datetime
-    current_lord_index = DASHA_SEQUENCE.index(dasha_lord)
-    
-    # First dasha (starts at anchor, ends at birth + remaining)
-    first_end = birth_datetime + timedelta(days=remaining_dasha_days)
-    mahadasha_list.append({
-        "planet": dasha_lord,
-        "start": mahadasha_start_datetime.isoformat(),
-        "end": first_end.isoformat()
-    })
-    
-    current_date = first_end
-    
-    # Next 8 dashas (complete cycle)
-    for i in range(1, 9):
-        lord = DASHA_SEQUENCE[(current_lord_index + i) % 9]
-        period_years = DASHA_YEARS[lord]
-        period_days = period_years * 365.25
-        
-        end_date = current_date + timedelta(days=period_days)
-        
-        mahadasha_list.append({
-            "planet": lord,
-            "start": current_date.isoformat(),
-            "end": end_date.isoformat()
-        })
-        
-        current_date = end_date
+    # Canonical timeline (memoized per birth): 120-year Mahadasha cycle anchored at
+    # the ACTUAL START of the birth nakshatra, sub-periods built lazily
+    from src.jyotish.dasha.timeline import get_vimshottari_timeline_for_birth, locate_period
+    timeline = get_vimshottari_timeline_for_birth(birth_date, birth_time, timezone)
+    birth_datetime = timeline.birth_datetime
     
-    # Find current mahadasha
-    current_mahadasha = None
-    for dasha in mahadasha_list:
-        start = datetime.fromisoformat(dasha["start"].replace('Z', '+00:00'))
-        end = datetime.fromisoformat(dasha["end"].replace('Z', '+00:00'))
-        if start <= calculation_date <= end:
-            current_mahadasha = dasha
-            break
+    mahadasha_list = [maha.to_dict() for maha in timeline.mahadashas]
     
-    if current_mahadasha is None:
+    # Find current mahadasha
+    current_maha = locate_period(timeline.mahadashas, calculation_date)
+    if current_maha is None:
         # If calculation_date is before birth, use first dasha
         # If after 120 years, use last dasha
         if calculation_date < birth_datetime:
-            current_mahadasha = mahadasha_list[0]
+            current_maha = timeline.mahadashas[0]
         else:
-            current_mahadasha = mahadasha_list[-1]
-    
-    # Calculate antardashas for all mahadashas
-    antardashas_dict = {}
-    for maha in mahadasha_list:
-        maha_lord = maha["planet"]
-        maha_start = datetime.fromisoformat(maha["start"].replace('Z', '+00:00'))
-        maha_end = datetime.fromisoformat(maha["end"].replace('Z', '+00:00'))
-        
-        antardashas = calculate_antardashas(maha_lord, maha_start, maha_end)
-        antardashas_dict[maha_lord] = antardashas
+            current_maha = timeline.mahadashas[-1]
+    current_mahadasha = current_maha.to_dict()
     
-    # Find current antardasha
-    current_antardasha = None
-    current_antardashas = antardashas_dict.get(current_mahadasha["planet"], [])
-    for antardasha in current_antardashas:
-        start = datetime.fromisoformat(antardasha["start"].replace('Z', '+00:00'))
-        end = datetime.fromisoformat(antardasha["end"].replace('Z', '+00:00'))
-        if start <= calculation_date <= end:
-            current_antardasha = antardasha
-            break
+    # Antardashas for all mahadashas
+    antardashas_dict = {
+        maha.lord: [antara.to_dict() for antara in timeline.children(maha)]
+        for maha in timeline.mahadashas
+    }
     
-    if current_antardasha is None and current_antardashas:
-        current_antardasha = current_antardashas[0]
+    # Find current antardasha
+    current_antardashas = timeline.children(current_maha)
+    current_antara = locate_period(current_antardashas, calculation_date)
+    if current_antara is None and current_antardashas:
+        current_antara = current_antardashas[0]
+    current_antardasha = current_antara.to_dict() if current_antara else None
     
-    # Calculate pratyantardashas for current antardasha
+    # Pratyantardashas for current antardasha
     current_pratyantar = None
     pratyantardashas_dict = {}
     
-    if current_antardasha:
-        maha_lord = current_mahadasha["planet"]
-        antara_lord = current_antardasha["planet"]
-        antara_start = datetime.fromisoformat(current_antardasha["start"].replace('Z', '+00:00'))
-        antara_end = datetime.fromisoformat(current_antardasha["end"].replace('Z', '+00:00'))
-        
-        pratyantardashas = calculate_pratyantardashas(
-            maha_lord, antara_lord, antara_start, antara_end
-        )
-        
-        key = f"{maha_lord}-{antara_lord}"
-        pratyantardashas_dict[key] = pratyantardashas
+    if current_antara:
+        pratyantardashas = timeline.children(current_antara)
+        key = f"{current_maha.lord}-{current_antara.lord}"
+        pratyantardashas_dict[key] = [pratyantar.to_dict() for pratyantar in pratyantardashas]
         
         # Find current pratyantar
-        for pratyantar in pratyantardashas:
-            start = datetime.fromisoformat(pratyantar["start"].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(pratyantar["end"].replace('Z', '+00:00'))
-            if start <= calculation_date <= end:
-                current_pratyantar = pratyantar
-                break
-        
-        if current_pratyantar is None and pratyantardashas:
-            current_pratyantar = pratyantardashas[0]
+        current_praty = locate_period(pratyantardashas, calculation_date)
+        if current_praty is None and pratyantardashas:
+            current_praty = pratyantardashas[0]
+        current_pratyantar = current_praty.to_dict() if current_praty else None
     
     # Build current dasha object
     current_dasha = {
@@ -12,13 +12,14 @@ Vimshottari Dasha Rules:
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 from src.jyotish.drik_panchang_engine import (
     calculate_all_planets_drik,
     get_julian_day_utc,
     NAKSHATRA_SIZE
 )
 from src.ephemeris.planets_drik import get_nakshatra_pada
+from src.ephemeris.snapshot import EphemerisSnapshot
 
 
 # Vimshottari Dasha periods (in years) - JHORA standard
@@ -56,7 +57,8 @@ def calculate_vimshottari_dasha_drik(
     birth_latitude: float,
     birth_longitude: float,
     timezone: str,
-    calculation_date: datetime = None
+    calculation_date: datetime = None,
+    snapshot: Optional[EphemerisSnapshot] = None
 ) -> Dict:
     """
     Calculate Vimshottari Dasha using Drik Panchang & JHORA methodology.
@@ -68,6 +70,8 @@ def calculate_vimshottari_dasha_drik(
         birth_longitude: Birth longitude
         timezone: Timezone string
         calculation_date: Date to calculate dasha for (defaults to current date)
+        snapshot: Optional EphemerisSnapshot of the birth chart; its Drik Moon is
+                  reused instead of recomputing all planets
     
     Returns:
         Complete dasha structure matching JHORA
@@ -75,14 +79,17 @@ def calculate_vimshottari_dasha_drik(
     if calculation_date is None:
         calculation_date = datetime.now()
     
-    # Calculate Julian Day
-    jd = get_julian_day_utc(birth_date, birth_time, timezone)
-    
-    # Get Moon position (Drik Panchang method)
-    planets_drik = calculate_all_planets_drik(jd)
-    moon_data = planets_drik["Moon"]
+    if snapshot is not None:
+        # Moon already computed with Drik flags in the request's snapshot
+        moon_longitude = snapshot.drik_moon_longitude
+    else:
+        # Calculate Julian Day
+        jd = get_julian_day_utc(birth_date, birth_time, timezone)
+        
+        # Get Moon position (Drik Panchang method)
+        planets_drik = calculate_all_planets_drik(jd)
+        moon_longitude = planets_drik["Moon"]["longitude"]
     
-    moon_longitude = moon_data["longitude"]
     moon_nakshatra_data = get_nakshatra_pada(moon_longitude)
     moon_nakshatra_index = moon_nakshatra_data["index"]
     moon_nakshatra_name = moon_nakshatra_data["name"]
@@ -19,6 +19,7 @@ import swisseph as swe
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+from src.ephemeris import context as swe_context
 from src.utils.converters import normalize_degrees
 from src.utils.timezone import local_to_utc
 
@@ -52,7 +53,7 @@ NAKSHATRA_NAMES = [
 
 def init_drik_mode():
     """Initialize Swiss Ephemeris in Drik Panchang mode."""
-    swe.set_sid_mode(DRIK_AYANAMSA, 0, 0)
+    swe_context.set_sid_mode(DRIK_AYANAMSA)
 
 
 def get_julian_day_utc(birth_date: datetime, birth_time: str, timezone: str) -> float:
@@ -106,7 +107,7 @@ def calculate_planet_drik(julian_day: float, planet_id: int) -> Dict:
     init_drik_mode()
     
     # Calculate with proper flags
-    xx, ret = swe.calc_ut(julian_day, planet_id, DRIK_FLAGS)
+    xx, ret = swe_context.calc(julian_day, planet_id, DRIK_FLAGS)
     
     if ret < 0:
         raise ValueError(f"Error calculating planet {planet_id}: {ret}")
@@ -223,7 +224,7 @@ def calculate_houses_drik(julian_day: float, latitude: float, longitude: float,
     init_drik_mode()
     
     # Calculate houses (tropical)
-    result = swe.houses_ex(julian_day, latitude, longitude, house_system)
+    result = swe_context.houses_ex(julian_day, latitude, longitude, house_system)
     
     if result is None or len(result) < 2:
         raise ValueError("Error calculating houses")
@@ -231,7 +232,7 @@ def calculate_houses_drik(julian_day: float, latitude: float, longitude: float,
     cusps, ascmc = result
     
     # Get ayanamsa for sidereal conversion
-    ayanamsa = swe.get_ayanamsa(julian_day)
+    ayanamsa = swe_context.get_ayanamsa(julian_day)
     
     # Convert to sidereal
     asc_tropical = ascmc[0]
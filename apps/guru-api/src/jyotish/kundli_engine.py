@@ -7,7 +7,7 @@ following ancient Vedic rules and using Swiss Ephemeris.
 
 import swisseph as swe
 import math
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from src.ephemeris.ephemeris_utils import (
@@ -17,6 +17,7 @@ from src.ephemeris.ephemeris_utils import (
     calculate_all_planets,
     get_ayanamsa
 )
+from src.ephemeris.snapshot import EphemerisSnapshot, ensure_ephemeris_snapshot
 from src.utils.converters import normalize_degrees
 
 
@@ -238,7 +239,8 @@ def get_degrees_in_sign(degree: float) -> float:
 def generate_kundli(
     julian_day: float,
     latitude: float,
-    longitude: float
+    longitude: float,
+    snapshot: Optional[EphemerisSnapshot] = None
 ) -> Dict:
     """
     Generate complete Kundli (D1 Rasi chart) for given parameters.
@@ -253,6 +255,8 @@ def generate_kundli(
         julian_day: Julian Day Number
         latitude: Geographic latitude
         longitude: Geographic longitude
+        snapshot: Optional precomputed EphemerisSnapshot for the same jd/location.
+                  When omitted, one is built here (single ephemeris pass either way).
     
     Returns:
         Complete Kundli dictionary with:
@@ -260,25 +264,19 @@ def generate_kundli(
         - Planets: {planet_name: {degree, sign, degrees_in_sign, house}}
         - Houses: [{house: 1-12, degree, sign, degrees_in_sign}]
     """
-    init_swisseph()
+    # All raw ephemeris values come from ONE snapshot (ascendant, houses, planets)
+    snapshot = ensure_ephemeris_snapshot(snapshot, julian_day, latitude, longitude)
     
-    # Calculate ascendant using EXACT JHORA method
-    from src.ephemeris.planets_jhora_exact import calculate_ascendant_jhora_exact
-    asc_jhora = calculate_ascendant_jhora_exact(julian_day, latitude, longitude)
+    # Ascendant using EXACT JHORA method
+    asc_jhora = snapshot.ascendant
     asc_sidereal = asc_jhora["longitude"]
     
-    # Calculate houses using JHORA method (tropical then convert to sidereal)
-    # Get ayanamsa for house conversion
-    ayanamsa = get_ayanamsa(julian_day)
-    houses_tropical = get_houses(julian_day, latitude, longitude)
-    # Convert to sidereal
-    houses_sidereal = [normalize_degrees(h - ayanamsa) for h in houses_tropical]
+    # Houses using JHORA method (tropical converted to sidereal in the snapshot)
+    houses_sidereal = list(snapshot.houses_sidereal)
     
     # Get full planet data with nakshatra, pada, retrograde info (EXACT JHORA format)
-    # Use EXACT JHORA method: swe.calc_ut() (tropical) + manual ayanamsa subtraction
-    from src.ephemeris.planets_jhora_exact import calculate_all_planets_jhora_exact, calculate_ascendant_jhora_exact
     from src.ephemeris.planets_drik import get_nakshatra_pada, get_rashi
-    planets_full_jhora = calculate_all_planets_jhora_exact(julian_day)
+    planets_full_jhora = snapshot.planets
     
     # Convert JHORA format to expected format
     planets_full = {}
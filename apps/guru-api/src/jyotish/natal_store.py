@@ -0,0 +1,232 @@
+"""
+Natal Chart Store - computed natal charts persisted on BirthDetail.
+
+A registered user's natal chart never changes, yet the daily notification,
+delivery, Live Guru and /kundli (user_id) paths regenerated it on every call.
+The chart is computed once (on birth-detail save, or lazily on first read),
+stored in BirthDetail.kundli_data / navamsa_data / dasamsa_data and hydrated
+on read, so the natal part of a request is a single row fetch.
+
+Every record is stamped with natal_engine_version(): NATAL_ENGINE_VERSION
+(bumped by hand, like the varga engine freeze), the layout schema and the
+Swiss Ephemeris version. A bump of any of them, or a change of the birth
+inputs, makes the record stale and it is recomputed.
+
+kundli_data layout:
+    {
+        "engine_version": str,
+        "inputs": {date, time, lat, lon, timezone},
+        "natal": {birth_jd, birth_datetime, kundli, birth_planets, dasha, yogas},
+        "kundli": {"inputs": {...}, "response": /kundli response without D9/D10}
+    }
+navamsa_data / dasamsa_data: D9 / D10 of the stored /kundli response.
+"""
+
+import copy
+from datetime import datetime
+from typing import Dict, Optional
+
+import swisseph as swe
+
+from src.db.models import BirthDetail
+from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
+from src.jyotish.dasha_engine import calculate_vimshottari_dasha
+from src.jyotish.yogas.yoga_engine import detect_all_yogas
+from src.utils.converters import degrees_to_sign
+
+# Bump when the stored layout changes
+NATAL_STORE_SCHEMA = 1
+
+# Bump by hand when the stored charts' results change (D1, vargas, dasha, yogas,
+# functional strength). Edits that keep the output identical (logging,
+# refactors) must not bump it: every stored chart is recomputed after a bump.
+NATAL_ENGINE_VERSION = "NATAL_2026_10"
+
+
+def natal_engine_version() -> str:
+    """
+    Version stamp of stored natal charts.
+
+    Returns:
+        NATAL_ENGINE_VERSION, layout schema and Swiss Ephemeris version
+    """
+    return f"{NATAL_ENGINE_VERSION};schema={NATAL_STORE_SCHEMA};swe={swe.version}"
+
+
+def birth_inputs(birth_detail: BirthDetail) -> Dict:
+    """Birth inputs a stored chart depends on (JSON-comparable)."""
+    return {
+        "date": birth_detail.birth_date.strftime("%Y-%m-%d") if birth_detail.birth_date else None,
+        "time": birth_detail.birth_time,
+        "lat": birth_detail.birth_latitude,
+        "lon": birth_detail.birth_longitude,
+        "timezone": birth_detail.timezone,
+    }
+
+
+def birth_datetime_of(birth_detail: BirthDetail) -> datetime:
+    """Birth datetime as used by the notification engines (naive, HH:MM)."""
+    hour, minute = map(int, birth_detail.birth_time.split(':')[:2])
+    return datetime.combine(birth_detail.birth_date, datetime.min.time().replace(hour=hour, minute=minute))
+
+
+def yoga_inputs(kundli: Dict):
+    """
+    Planets/houses structures for detect_all_yogas() from a generate_kundli() result.
+
+    Args:
+        kundli: generate_kundli() output
+
+    Returns:
+        (planets, houses)
+    """
+    planets = {}
+    asc_deg = kundli['Ascendant']['degree']
+    for p, d in kundli['Planets'].items():
+        if p in ["Rahu", "Ketu"]:
+            continue
+        sign_num, _ = degrees_to_sign(d['degree'])
+        rel_pos = (d['degree'] - asc_deg) % 360
+        house_num = int(rel_pos / 30) + 1
+        if house_num > 12:
+            house_num = 1
+        planets[p] = {'degree': d['degree'], 'sign': sign_num, 'house': house_num}
+
+    houses = []
+    asc_sign, _ = degrees_to_sign(asc_deg)
+    houses.append({'house': 1, 'degree': asc_deg, 'sign': asc_sign})
+    for h in kundli['Houses']:
+        sign_num, _ = degrees_to_sign(h['degree'])
+        houses.append({'house': h['house'], 'degree': h['degree'], 'sign': sign_num})
+    return planets, houses
+
+
+def compute_natal_chart(birth_detail: BirthDetail) -> Dict:
+    """
+    Natal structures shared by the notification, delivery and Live Guru paths.
+
+    Args:
+        birth_detail: Birth detail record
+
+    Returns:
+        JSON-serializable natal chart (see module docstring)
+    """
+    birth_datetime = birth_datetime_of(birth_detail)
+    birth_jd = swe.julday(
+        birth_datetime.year, birth_datetime.month, birth_datetime.day,
+        birth_datetime.hour + birth_datetime.minute / 60.0,
+        swe.GREG_CAL
+    )
+    kundli = generate_kundli(birth_jd, birth_detail.birth_latitude, birth_detail.birth_longitude)
+    birth_planets = get_planet_positions(birth_jd)
+    dasha = calculate_vimshottari_dasha(birth_datetime, birth_planets["Moon"])
+    planets, houses = yoga_inputs(kundli)
+    yogas = detect_all_yogas(planets, houses)
+    return {
+        "birth_jd": birth_jd,
+        "birth_datetime": birth_datetime.isoformat(),
+        "kundli": kundli,
+        "birth_planets": birth_planets,
+        "dasha": dasha,
+        "yogas": yogas,
+    }
+
+
+def _hydrate_natal(natal: Dict) -> Dict:
+    """Deep copy of a stored natal chart with birth_datetime parsed back."""
+    natal = copy.deepcopy(natal)
+    natal["birth_datetime"] = datetime.fromisoformat(natal["birth_datetime"])
+    return natal
+
+
+def _record(birth_detail: BirthDetail) -> Dict:
+    """Current kundli_data if it matches this engine version and the birth inputs, else a fresh stamp."""
+    stored = birth_detail.kundli_data
+    if (
+        isinstance(stored, dict)
+        and stored.get("engine_version") == natal_engine_version()
+        and stored.get("inputs") == birth_inputs(birth_detail)
+    ):
+        return stored
+    return {"engine_version": natal_engine_version(), "inputs": birth_inputs(birth_detail)}
+
+
+def refresh_natal_chart(birth_detail: BirthDetail) -> Dict:
+    """
+    Compute the natal chart and stamp it onto birth_detail.kundli_data.
+
+    The row is persisted by the owning session's next commit.
+
+    Args:
+        birth_detail: Birth detail record
+
+    Returns:
+        Hydrated natal chart
+    """
+    natal = compute_natal_chart(birth_detail)
+    record = dict(_record(birth_detail))
+    record["natal"] = natal
+    birth_detail.kundli_data = record
+    return _hydrate_natal(natal)
+
+
+def get_natal_chart(birth_detail: BirthDetail) -> Dict:
+    """
+    Natal chart of a registered user: stored copy if fresh, else recomputed and stored.
+
+    A recomputed chart is persisted by the owning session's next commit, so
+    read-only callers must commit too.
+
+    Args:
+        birth_detail: Birth detail record
+
+    Returns:
+        Dict with birth_jd, birth_datetime (datetime), kundli, birth_planets, dasha, yogas
+    """
+    natal = _record(birth_detail).get("natal")
+    if natal is not None:
+        return _hydrate_natal(natal)
+    return refresh_natal_chart(birth_detail)
+
+
+def get_stored_kundli_response(birth_detail: BirthDetail, inputs: Dict) -> Optional[Dict]:
+    """
+    Stored /kundli response (D1-D60) for these effective inputs, or None if missing/stale.
+
+    Args:
+        birth_detail: Birth detail record
+        inputs: Effective {date, time, lat, lon, timezone} of the request
+
+    Returns:
+        Response dict (without current_dasha) or None. Only the top level is
+        a new dict: the charts are shared with birth_detail and must not be
+        modified in place.
+    """
+    stored = _record(birth_detail).get("kundli")
+    if not stored or stored.get("inputs") != inputs:
+        return None
+    if birth_detail.navamsa_data is None or birth_detail.dasamsa_data is None:
+        return None
+    response = dict(stored["response"])
+    response["D9"] = birth_detail.navamsa_data
+    response["D10"] = birth_detail.dasamsa_data
+    return response
+
+
+def store_kundli_response(birth_detail: BirthDetail, inputs: Dict, response: Dict) -> None:
+    """
+    Stamp a /kundli response onto birth_detail (D9/D10 in their own columns).
+
+    The row is persisted by the owning session's next commit.
+
+    Args:
+        birth_detail: Birth detail record
+        inputs: Effective {date, time, lat, lon, timezone} of the request
+        response: /kundli response without current_dasha
+    """
+    compact = {key: value for key, value in response.items() if key not in ("D9", "D10", "current_dasha")}
+    record = dict(_record(birth_detail))
+    record["kundli"] = {"inputs": inputs, "response": compact}
+    birth_detail.kundli_data = record
+    birth_detail.navamsa_data = response.get("D9")
+    birth_detail.dasamsa_data = response.get("D10")
@@ -266,6 +266,26 @@ def generate_panchang(jd: float, date_obj: datetime, latitude: float = 0.0, long
     Returns:
         Complete Panchang dictionary
     """
+    panchang = calculate_panchang_elements(jd, date_obj)
+    
+    # Get sunrise and sunset
+    sunrise, sunset = get_sunrise_sunset(jd, latitude, longitude)
+    panchang["sunrise"] = sunrise
+    panchang["sunset"] = sunset
+    return panchang
+
+
+def calculate_panchang_elements(jd: float, date_obj: datetime) -> Dict:
+    """
+    Phase 4: Location-independent part of generate_panchang() (everything but sunrise/sunset).
+    
+    Args:
+        jd: Julian Day Number (at noon for the date)
+        date_obj: Date object
+    
+    Returns:
+        Panchang dictionary without sunrise/sunset
+    """
     # Calculate all Panchang elements
     tithi_name, tithi_num, tithi_elapsed = calculate_tithi(jd)
     karana_name, karana_index = calculate_karana(tithi_num)
@@ -278,9 +298,6 @@ def generate_panchang(jd: float, date_obj: datetime, latitude: float = 0.0, long
     sun_tropical, moon_tropical = get_sun_moon_longitudes(jd)
     sun_sidereal, moon_sidereal = get_sun_moon_sidereal(jd)
     
-    # Get sunrise and sunset
-    sunrise, sunset = get_sunrise_sunset(jd, latitude, longitude)
-    
     return {
         "date": date_obj.strftime("%Y-%m-%d"),
         "julian_day": round(jd, 6),
@@ -312,8 +329,5 @@ def generate_panchang(jd: float, date_obj: datetime, latitude: float = 0.0, long
         "moon": {
             "tropical_degree": round(moon_tropical, 4),
             "sidereal_degree": round(moon_sidereal, 4)
-        },
-        "sunrise": sunrise,
-        "sunset": sunset
+        }
     }
-
@@ -6,5 +6,6 @@ JHora / Prokerala Standard Mode.
 """
 
 from .panchanga_engine import calculate_panchanga
+from .panchanga_cache import get_cached_panchanga
 
-__all__ = ["calculate_panchanga"]
+__all__ = ["calculate_panchanga", "get_cached_panchanga"]
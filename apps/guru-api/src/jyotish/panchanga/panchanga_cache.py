@@ -0,0 +1,206 @@
+"""
+Daily Panchanga Cache - one calculation per (date, location, timezone)
+
+calculate_panchanga() depends only on the date and the location, so every user
+in the same city gets the same Panchanga. Results are kept in a bounded LRU
+cache keyed by the date and the location snapped to a grid
+(PANCHANGA_CACHE_GRID_DEG, default 0.01° ≈ 1 km).
+
+🔒 The Panchanga is calculated AT THE GRID POINT, so a cached result never
+depends on which user asked first.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pytz
+
+from src.config import settings
+from src.jyotish.panchanga.panchanga_engine import calculate_panchanga
+
+# Top cities pre-computed before the morning notification burst: (name, lat, lon, tz)
+WARM_CITIES = [
+    ("Bengaluru", 12.9716, 77.5946, "Asia/Kolkata"),
+    ("Mumbai", 19.0760, 72.8777, "Asia/Kolkata"),
+    ("Delhi", 28.6139, 77.2090, "Asia/Kolkata"),
+    ("Chennai", 13.0827, 80.2707, "Asia/Kolkata"),
+    ("Hyderabad", 17.3850, 78.4867, "Asia/Kolkata"),
+    ("Kolkata", 22.5726, 88.3639, "Asia/Kolkata"),
+    ("Pune", 18.5204, 73.8567, "Asia/Kolkata"),
+    ("Ahmedabad", 23.0225, 72.5714, "Asia/Kolkata"),
+    ("Jaipur", 26.9124, 75.7873, "Asia/Kolkata"),
+    ("Lucknow", 26.8467, 80.9462, "Asia/Kolkata"),
+    ("Dubai", 25.2048, 55.2708, "Asia/Dubai"),
+    ("Singapore", 1.3521, 103.8198, "Asia/Singapore"),
+    ("London", 51.5074, -0.1278, "Europe/London"),
+    ("New York", 40.7128, -74.0060, "America/New_York"),
+    ("San Francisco", 37.7749, -122.4194, "America/Los_Angeles"),
+    ("Sydney", -33.8688, 151.2093, "Australia/Sydney"),
+]
+
+PanchangaKey = Tuple[str, float, float, str]
+
+
+class PanchangaCache:
+    """
+    Thread-safe LRU cache of calculate_panchanga() results.
+
+    Args:
+        max_entries: Maximum number of cached Panchangas (least recently used evicted)
+        grid_deg: Location grid in degrees (<= 0 disables snapping)
+    """
+
+    def __init__(self, max_entries: int = 4096, grid_deg: float = 0.01):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.grid_deg = grid_deg
+        self._entries: "OrderedDict[PanchangaKey, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def snap(self, value: float) -> float:
+        """Snap a coordinate to the cache grid."""
+        if self.grid_deg <= 0:
+            return float(value)
+        return round(round(float(value) / self.grid_deg) * self.grid_deg, 6)
+
+    def make_key(self, date: str, latitude: float, longitude: float, timezone: str) -> PanchangaKey:
+        """Cache key: (date, snapped latitude, snapped longitude, timezone)."""
+        return (date, self.snap(latitude), self.snap(longitude), timezone)
+
+    def get(self, date: str, latitude: float, longitude: float, timezone: str) -> Dict:
+        """
+        Panchanga for the date and location, calculated at most once per grid cell.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            latitude: Geographic latitude
+            longitude: Geographic longitude
+            timezone: Timezone string (e.g., 'Asia/Kolkata')
+
+        Returns:
+            Same dictionary as calculate_panchanga() (a private copy per caller)
+        """
+        key = self.make_key(date, latitude, longitude, timezone)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(cached)
+            self._misses += 1
+
+        # Calculate outside the lock: concurrent misses for different keys run in parallel
+        result = calculate_panchanga(key[0], key[1], key[2], key[3])
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return copy.deepcopy(result)
+
+    def warm(self, locations: Iterable[Tuple[float, float, str]], dates: Iterable[str]) -> int:
+        """
+        Pre-compute Panchangas for every (location, date) pair.
+
+        Args:
+            locations: Iterable of (latitude, longitude, timezone)
+            dates: Iterable of YYYY-MM-DD dates
+
+        Returns:
+            Number of Panchangas newly calculated
+        """
+        dates = list(dates)
+        calculated = 0
+        for latitude, longitude, timezone in locations:
+            for date in dates:
+                key = self.make_key(date, latitude, longitude, timezone)
+                with self._lock:
+                    if key in self._entries:
+                        continue
+                self.get(date, latitude, longitude, timezone)
+                calculated += 1
+        return calculated
+
+    def clear(self) -> None:
+        """Drop all entries and reset the metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "grid_deg": self.grid_deg,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+panchanga_cache = PanchangaCache(
+    max_entries=settings.panchanga_cache_max_entries,
+    grid_deg=settings.panchanga_cache_grid_deg,
+)
+
+
+def get_cached_panchanga(date: str, latitude: float, longitude: float, timezone: str) -> Dict[str, Any]:
+    """
+    Cached calculate_panchanga() (see PanchangaCache.get).
+
+    Args:
+        date: Date in YYYY-MM-DD format
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        timezone: Timezone string (e.g., 'Asia/Kolkata')
+
+    Returns:
+        Dictionary with complete Panchanga data
+    """
+    return panchanga_cache.get(date, latitude, longitude, timezone)
+
+
+def get_panchanga_cache_stats() -> Dict[str, Any]:
+    """Hit/miss metrics of the global Panchanga cache."""
+    return panchanga_cache.stats()
+
+
+def warm_panchanga_cache(top_n: Optional[int] = None, date: Optional[str] = None) -> int:
+    """
+    Pre-compute today's Panchanga for the top N cities (each in its own timezone).
+
+    Run shortly after midnight so the 6 AM notification burst only reads the cache.
+
+    Args:
+        top_n: Number of WARM_CITIES to warm (default: settings.panchanga_cache_warm_cities)
+        date: Date in YYYY-MM-DD format (default: today in each city's timezone)
+
+    Returns:
+        Number of Panchangas newly calculated
+    """
+    if top_n is None:
+        top_n = settings.panchanga_cache_warm_cities
+    calculated = 0
+    for _, latitude, longitude, timezone in WARM_CITIES[:top_n]:
+        city_date = date or datetime.now(pytz.timezone(timezone)).strftime("%Y-%m-%d")
+        try:
+            calculated += panchanga_cache.warm([(latitude, longitude, timezone)], [city_date])
+        except Exception as e:
+            print(f"Warning: Could not warm Panchanga for {latitude},{longitude}: {e}")
+    return calculated
@@ -19,7 +19,9 @@ from typing import Dict, Tuple, Optional
 import pytz
 from math import floor
 
+from src.ephemeris import context as swe_context
 from src.ephemeris.ephemeris_utils import init_swisseph, calculate_planet_position
+from src.jyotish.panchanga.transition_solver import find_next_transition, solve_transition
 from src.utils.converters import normalize_degrees, degrees_to_sign, get_sign_name
 from src.utils.timezone import get_julian_day, get_timezone
 
@@ -28,7 +30,10 @@ init_swisseph()
 
 # FORCE Lahiri Ayanamsa (Chitra Paksha) - CRITICAL for Drik Panchang accuracy
 # This must be set explicitly before any sidereal calculations
-swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+
+# Amavasya/Purnima search: 45-day window halved 5 times → < 1.5 days (one crossing)
+AMAVASYA_PURNIMA_BRACKET_STEPS = 5
 
 # Tithi names (30 tithis in a lunar month)
 TITHI_NAMES = [
@@ -167,7 +172,7 @@ def calculate_sunrise_sunset(
     # This enables surface-level observation matching Prokerala's calculation
     # The 36-second gap is exactly the time it takes the Sun to move its own radius
     # when parallax is correctly calculated for topocentric positions
-    swe.set_topo(longitude, latitude, 0.0)
+    # (swe_context.rise_trans sets the observer from geopos for FLG_TOPOCTR)
     
     # CRITICAL: Use simplified stable refraction model (Prokerala/Drik standard)
     # When pressure = 0, Swiss Ephemeris uses simplified, stable refraction model
@@ -192,7 +197,7 @@ def calculate_sunrise_sunset(
     # Calculate apparent sunrise using disc center logic
     flags = swe.BIT_DISC_CENTER | swe.FLG_SWIEPH | swe.FLG_TOPOCTR
     
-    result_rise = swe.rise_trans(
+    result_rise = swe_context.rise_trans(
         jd_utc,             # Julian Day at 00:00 UTC (CRITICAL)
         swe.SUN,            # Planet ID
         swe.CALC_RISE,      # Calculation flag: rise
@@ -203,7 +208,7 @@ def calculate_sunrise_sunset(
     )
     
     # Calculate sunset (same standard, no correction needed)
-    result_set = swe.rise_trans(
+    result_set = swe_context.rise_trans(
         jd_utc,             # Julian Day at 00:00 UTC (CRITICAL)
         swe.SUN,            # Planet ID
         swe.CALC_SET,       # Calculation flag: set
@@ -288,50 +293,6 @@ def _format_end_time(jd: float, jd_current: float, timezone_str: str) -> str:
         return end_dt.strftime("%I:%M %p, %b %d").lstrip('0')
 
 
-def _find_exact_transition(
-    jd_start: float,
-    target_value: float,
-    calculation_func,
-    timezone_str: str,
-    max_iterations: int = 20,
-    tolerance: float = 0.0001
-) -> float:
-    """
-    Find exact JD when a value crosses a boundary using binary search.
-    
-    Args:
-        jd_start: Starting Julian Day
-        target_value: Target boundary value (e.g., 12.0 for tithi, 13.333 for nakshatra)
-        calculation_func: Function that takes JD and returns current value
-        timezone_str: Timezone for formatting
-        max_iterations: Maximum binary search iterations
-        tolerance: Tolerance in degrees
-    
-    Returns:
-        Exact JD of transition
-    """
-    # Initial search window (up to 2 days ahead)
-    jd_low = jd_start
-    jd_high = jd_start + 2.0
-    
-    # Binary search for exact transition
-    for _ in range(max_iterations):
-        jd_mid = (jd_low + jd_high) / 2.0
-        current_value = calculation_func(jd_mid)
-        
-        # Check if we've crossed the boundary
-        if abs(current_value - target_value) < tolerance:
-            return jd_mid
-        
-        if current_value < target_value:
-            jd_low = jd_mid
-        else:
-            jd_high = jd_mid
-    
-    # Fallback: use linear interpolation
-    return (jd_low + jd_high) / 2.0
-
-
 def calculate_tithi(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[str, any]:
     """
     Calculate Tithi using Drik Siddhanta formula.
@@ -352,14 +313,14 @@ def calculate_tithi(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[str,
         - end_time: Time when tithi ends (as datetime for calculation)
     """
     # FORCE Lahiri Ayanamsa before calculation (CRITICAL for Drik Panchang)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     # Get Sun and Moon sidereal longitudes (will use Lahiri Ayanamsa)
     sun_pos = calculate_planet_position(jd, swe.SUN)
     moon_pos = calculate_planet_position(jd, swe.MOON)
     
     # Re-assert ayanamsa after position calculation (some functions may reset it)
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     sun_long = sun_pos["longitude"]
     moon_long = moon_pos["longitude"]
@@ -394,38 +355,13 @@ def calculate_tithi(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[str,
     sun_speed = sun_pos["speed_longitude"]
     relative_speed = moon_speed - sun_speed
     
-    # Calculate exact end time using high-precision binary search
-    # CRITICAL: Use binary search for exact boundary, not linear interpolation
+    # Calculate exact end time using the Newton transition solver
+    # CRITICAL: Solve for the exact boundary, not linear interpolation
     target_diff = (tithi_num + 1) * 12.0  # Next tithi boundary
     if target_diff >= 360.0:
         target_diff = 0.0
     
-    # Binary search for exact tithi boundary
-    jd_low = jd
-    jd_high = jd + 2.0  # Search up to 2 days ahead
-    tolerance = 0.00001  # ~0.86 seconds
-    
-    for _ in range(60):  # High precision
-        jd_mid = (jd_low + jd_high) / 2.0
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-        sun_pos_mid = calculate_planet_position(jd_mid, swe.SUN)
-        moon_pos_mid = calculate_planet_position(jd_mid, swe.MOON)
-        diff_mid = normalize_degrees(moon_pos_mid["longitude"] - sun_pos_mid["longitude"])
-        
-        diff_to_target = abs(diff_mid - target_diff)
-        if diff_to_target > 180.0:
-            diff_to_target = 360.0 - diff_to_target
-        
-        if diff_to_target < (tolerance * 12.0):  # Convert to degrees
-            jd_end = jd_mid
-            break
-        
-        if diff_mid < target_diff or (diff_mid > target_diff + 180.0):
-            jd_low = jd_mid
-        else:
-            jd_high = jd_mid
-    else:
-        jd_end = (jd_low + jd_high) / 2.0
+    jd_end = find_next_transition(jd, "tithi", target_diff)
     
     end_time_str = _format_end_time(jd_end, jd, timezone_str)
     
@@ -467,7 +403,7 @@ def calculate_nakshatra(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[s
         - end_time: Time when nakshatra ends
     """
     # FORCE Lahiri Ayanamsa before calculation
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     """
     Calculate Nakshatra using Drik Siddhanta formula.
     
@@ -511,35 +447,9 @@ def calculate_nakshatra(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[s
     elif pada_num < 1:
         pada_num = 1
     
-    # Calculate exact end time using binary search
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    # Calculate exact end time using the Newton transition solver
     target_nak_long = ((nak_index + 1) % 27) * nakshatra_span
-    
-    # Binary search for exact nakshatra boundary
-    jd_low = jd
-    jd_high = jd + 2.0
-    tolerance = 0.00001
-    
-    for _ in range(60):
-        jd_mid = (jd_low + jd_high) / 2.0
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-        moon_pos_mid = calculate_planet_position(jd_mid, swe.MOON)
-        moon_long_mid = moon_pos_mid["longitude"]
-        
-        diff_to_target = abs(moon_long_mid - target_nak_long)
-        if diff_to_target > 180.0:
-            diff_to_target = 360.0 - diff_to_target
-        
-        if diff_to_target < (tolerance * nakshatra_span):
-            jd_end = jd_mid
-            break
-        
-        if moon_long_mid < target_nak_long:
-            jd_low = jd_mid
-        else:
-            jd_high = jd_mid
-    else:
-        jd_end = (jd_low + jd_high) / 2.0
+    jd_end = find_next_transition(jd, "nakshatra", target_nak_long)
     
     end_time_str = _format_end_time(jd_end, jd, timezone_str)
     
@@ -576,7 +486,7 @@ def calculate_yoga(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[str, a
         - end_time: Time when yoga ends
     """
     # FORCE Lahiri Ayanamsa before calculation
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     """
     Calculate Yoga using Drik Siddhanta formula.
     
@@ -622,36 +532,9 @@ def calculate_yoga(jd: float, timezone_str: str = "Asia/Kolkata") -> Dict[str, a
     sun_speed = sun_pos["speed_longitude"]
     relative_speed = moon_speed + sun_speed
     
-    # Calculate exact end time using binary search
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    # Calculate exact end time using the Newton transition solver
     target_yoga_long = ((yoga_index + 1) % 27) * yoga_span
-    
-    # Binary search for exact yoga boundary
-    jd_low = jd
-    jd_high = jd + 2.0
-    tolerance = 0.00001
-    
-    for _ in range(60):
-        jd_mid = (jd_low + jd_high) / 2.0
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-        sun_pos_mid = calculate_planet_position(jd_mid, swe.SUN)
-        moon_pos_mid = calculate_planet_position(jd_mid, swe.MOON)
-        yoga_long_mid = normalize_degrees(sun_pos_mid["longitude"] + moon_pos_mid["longitude"])
-        
-        diff_to_target = abs(yoga_long_mid - target_yoga_long)
-        if diff_to_target > 180.0:
-            diff_to_target = 360.0 - diff_to_target
-        
-        if diff_to_target < (tolerance * yoga_span):
-            jd_end = jd_mid
-            break
-        
-        if yoga_long_mid < target_yoga_long:
-            jd_low = jd_mid
-        else:
-            jd_high = jd_mid
-    else:
-        jd_end = (jd_low + jd_high) / 2.0
+    jd_end = find_next_transition(jd, "yoga", target_yoga_long)
     
     end_time_str = _format_end_time(jd_end, jd, timezone_str)
     
@@ -687,27 +570,23 @@ def calculate_karana_array(jd_sunrise: float, jd_next_sunrise: float, timezone_s
     karanas = []
     current_jd = jd_sunrise
     
+    # FORCE Lahiri Ayanamsa before calculation
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    
+    # Get Sun and Moon positions at sunrise
+    sun_pos = calculate_planet_position(jd_sunrise, swe.SUN)
+    moon_pos = calculate_planet_position(jd_sunrise, swe.MOON)
+    
+    # Calculate angular difference (Moon - Sun)
+    diff = normalize_degrees(moon_pos["longitude"] - sun_pos["longitude"])
+    
+    # Half-tithi (karana) number at sunrise (0-59, each = 6°)
+    half_tithi_num = int(diff // 6.0) % 60
+    
     # Iterate through karanas until next sunrise
     while current_jd < jd_next_sunrise:
-        # Get Sun and Moon positions
-        sun_pos = calculate_planet_position(current_jd, swe.SUN)
-        moon_pos = calculate_planet_position(current_jd, swe.MOON)
-        
-        sun_long = sun_pos["longitude"]
-        moon_long = moon_pos["longitude"]
-        
-        # Calculate angular difference (Moon - Sun)
-        diff = normalize_degrees(moon_long - sun_long)
-        
-        # Tithi number (0-29)
-        tithi_num = int(diff // 12.0)
-        if tithi_num >= 30:
-            tithi_num = 29
-        elif tithi_num < 0:
-            tithi_num = 0
-        
-        # FORCE Lahiri Ayanamsa before calculation
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+        # Tithi number (0-29) and which half of it we are in
+        tithi_num = half_tithi_num // 2
         
         # Karana calculation: Each tithi has 2 karanas (each = 6°)
         # Karana index formula: Based on tithi number and which half of tithi
@@ -718,35 +597,17 @@ def calculate_karana_array(jd_sunrise: float, jd_next_sunrise: float, timezone_s
         # Corrected formula:
         #   First karana: index = ((N * 2 - 1) % 11 + 11) % 11
         #   Second karana: index = (N * 2) % 11
-        
-        elapsed_in_tithi = diff % 12.0
-        
-        if elapsed_in_tithi < 6.0:
+        if half_tithi_num % 2 == 0:
             # First karana of tithi
             # Formula: (tithi_num * 2 - 1) % 11, but handle negative
             karana_index = ((tithi_num * 2 - 1) % 11 + 11) % 11
-            elapsed_in_karana = elapsed_in_tithi
-            remaining = 6.0 - elapsed_in_karana
         else:
             # Second karana of tithi
             karana_index = (tithi_num * 2) % 11
-            elapsed_in_karana = elapsed_in_tithi - 6.0
-            remaining = 6.0 - elapsed_in_karana
-        
-        # Calculate elapsed in current karana (0-6°)
-        elapsed_in_karana = diff % 6.0
-        remaining = 6.0 - elapsed_in_karana
         
-        # Calculate when this karana ends
-        moon_speed = moon_pos["speed_longitude"]
-        sun_speed = sun_pos["speed_longitude"]
-        relative_speed = moon_speed - sun_speed
-        
-        if relative_speed > 0:
-            time_to_next = remaining / relative_speed
-            jd_end = current_jd + time_to_next
-        else:
-            jd_end = current_jd + 0.5  # Half day fallback
+        # This karana ends when Moon - Sun reaches the next 6° boundary
+        target_diff = ((half_tithi_num + 1) % 60) * 6.0
+        jd_end = find_next_transition(current_jd, "karana", target_diff)
         
         # Don't exceed next sunrise
         if jd_end > jd_next_sunrise:
@@ -761,6 +622,7 @@ def calculate_karana_array(jd_sunrise: float, jd_next_sunrise: float, timezone_s
         
         # Move to next karana
         current_jd = jd_end
+        half_tithi_num = (half_tithi_num + 1) % 60
         
         # Safety: prevent infinite loop (max 4 karanas per day)
         if len(karanas) >= 4:
@@ -780,7 +642,8 @@ def find_exact_amavasya_purnima(jd_start: float, target_angle: float, search_day
     For Amavasya: target_angle = 0° (Moon - Sun = 0°)
     For Purnima: target_angle = 180° (Moon - Sun = 180°)
     
-    Uses binary search to find exact moment with high precision.
+    Narrows the search window by bisection, then finds the exact moment with
+    the Newton transition solver.
     
     Args:
         jd_start: Starting Julian Day (search backwards from here)
@@ -794,8 +657,9 @@ def find_exact_amavasya_purnima(jd_start: float, target_angle: float, search_day
     jd_high = jd_start
     tolerance = 0.00001  # ~0.86 seconds (high precision)
     
-    # Binary search for exact moment
-    for iteration in range(60):  # Max 60 iterations for high precision
+    # Coarse bracketing: the same window decisions as the original binary search,
+    # until the window is narrower than half a lunation (one crossing at most)
+    for iteration in range(AMAVASYA_PURNIMA_BRACKET_STEPS):
         jd_mid = (jd_low + jd_high) / 2.0
         
         sun_pos = calculate_planet_position(jd_mid, swe.SUN)
@@ -816,7 +680,7 @@ def find_exact_amavasya_purnima(jd_start: float, target_angle: float, search_day
         time_tolerance = angular_distance / 12.0  # Approximate relative speed
         
         if time_tolerance < tolerance:
-            return jd_mid
+            break
         
         # Adjust search window based on current position
         if target_angle == 180.0:
@@ -835,9 +699,12 @@ def find_exact_amavasya_purnima(jd_start: float, target_angle: float, search_day
                 jd_low = jd_mid
             else:
                 jd_high = jd_mid
+    else:
+        jd_mid = (jd_low + jd_high) / 2.0
     
-    # Return best estimate (midpoint)
-    return (jd_low + jd_high) / 2.0
+    # Exact moment: Newton refinement on the crossing inside the window
+    element = "purnima" if target_angle == 180.0 else "amavasya"
+    return solve_transition(jd_mid, element, target_angle % 360.0)
 
 
 def get_lunar_month_info(jd: float) -> Dict[str, any]:
@@ -866,7 +733,7 @@ def get_lunar_month_info(jd: float) -> Dict[str, any]:
         - is_adhika_masa: Boolean indicating if current month is Adhika Masa
     """
     # FORCE Lahiri Ayanamsa before calculation
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     # AMANTA: Month name = Sun's sign at the Amavasya that ENDS the current month
     # Find the NEXT Amavasya (the one that will end the current month)
@@ -1069,7 +936,7 @@ def calculate_panchanga(
     paksha = tithi["current"]["paksha"]
     
     # FORCE Lahiri Ayanamsa before all calculations
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     # Get lunar month information (Amanta, Purnimanta, Adhika Masa)
     lunar_month_info = get_lunar_month_info(jd_sunrise)
@@ -0,0 +1,115 @@
+"""
+Panchanga Transition Solver - Newton iteration on Sun/Moon angles
+
+Every Panchanga end time is the moment a Sun/Moon angle crosses a boundary:
+- Tithi / Karana / Amavasya / Purnima: Moon - Sun (elongation)
+- Nakshatra: Moon longitude
+- Yoga: Moon + Sun
+
+calculate_planet_position() already returns the daily speed (FLG_SPEED), so the
+angle's rate is known at every step and Newton's method converges in 2-4
+iterations instead of 20-60 bisection steps.
+
+🔒 SAME EPHEMERIS AS panchanga_engine.py (calculate_planet_position, Lahiri)
+"""
+
+from typing import Tuple
+
+import swisseph as swe
+
+from src.ephemeris import context as swe_context
+from src.ephemeris.ephemeris_utils import calculate_planet_position
+
+# Angle tracked by each Panchanga element
+ELEMENT_ANGLES = {
+    "tithi": "elongation",
+    "karana": "elongation",
+    "amavasya": "elongation",
+    "purnima": "elongation",
+    "nakshatra": "moon",
+    "yoga": "sum",
+}
+
+# Convergence: 1e-7° of Moon-Sun motion is ~1 ms
+TRANSITION_TOLERANCE_DEG = 1e-7
+TRANSITION_MAX_ITERATIONS = 10
+
+
+def panchanga_angle(jd: float, element: str) -> Tuple[float, float]:
+    """
+    Sun/Moon angle for a Panchanga element and its rate of change.
+
+    Args:
+        jd: Julian Day Number
+        element: Key of ELEMENT_ANGLES ("tithi", "nakshatra", "yoga", "karana", ...)
+
+    Returns:
+        Tuple of (angle in degrees 0-360, rate in degrees/day)
+
+    Raises:
+        ValueError: If element is unknown
+    """
+    kind = ELEMENT_ANGLES.get(element)
+    if kind is None:
+        raise ValueError(f"Unknown Panchanga element: {element}")
+
+    moon_pos = calculate_planet_position(jd, swe.MOON)
+    if kind == "moon":
+        return moon_pos["longitude"] % 360.0, moon_pos["speed_longitude"]
+
+    sun_pos = calculate_planet_position(jd, swe.SUN)
+    if kind == "elongation":
+        angle = moon_pos["longitude"] - sun_pos["longitude"]
+        rate = moon_pos["speed_longitude"] - sun_pos["speed_longitude"]
+    else:
+        angle = moon_pos["longitude"] + sun_pos["longitude"]
+        rate = moon_pos["speed_longitude"] + sun_pos["speed_longitude"]
+    return angle % 360.0, rate
+
+
+def solve_transition(jd_guess: float, element: str, target: float) -> float:
+    """
+    Refine the JD at which the element's angle equals target (Newton's method).
+
+    Converges to the crossing nearest jd_guess (crossings of one element are
+    at least ~27 days apart, so any guess within a few days is unambiguous).
+
+    Args:
+        jd_guess: Initial Julian Day estimate
+        element: Key of ELEMENT_ANGLES
+        target: Target angle in degrees (0-360)
+
+    Returns:
+        JD of the crossing
+    """
+    # FORCE Lahiri Ayanamsa before calculation
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+
+    jd = jd_guess
+    for _ in range(TRANSITION_MAX_ITERATIONS):
+        angle, rate = panchanga_angle(jd, element)
+        # Signed shortest distance to target (-180, 180]
+        delta = (target - angle + 180.0) % 360.0 - 180.0
+        jd += delta / rate
+        if abs(delta) < TRANSITION_TOLERANCE_DEG:
+            break
+    return jd
+
+
+def find_next_transition(jd_start: float, element: str, target: float) -> float:
+    """
+    JD of the first crossing of target at or after jd_start.
+
+    Args:
+        jd_start: Starting Julian Day
+        element: Key of ELEMENT_ANGLES
+        target: Target angle in degrees (e.g. next tithi boundary)
+
+    Returns:
+        JD of the crossing
+    """
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    angle, rate = panchanga_angle(jd_start, element)
+    ahead = (target - angle) % 360.0
+    return solve_transition(jd_start + ahead / rate, element, target)
+
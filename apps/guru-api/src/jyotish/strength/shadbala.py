@@ -21,12 +21,18 @@ Shadbala consists of six types of strength:
 import swisseph as swe
 import math
 import os
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from src.ephemeris import context as swe_context
 from src.jyotish.strength.friendships import relationship, get_combined_friendship
 from src.jyotish.kundli_engine import get_planet_positions, get_sign
 from src.jyotish.varga_drik import calculate_varga
+from src.jyotish.varga_vectorized import compute_all_varga_arrays
 from src.jyotish.panchanga.panchanga_engine import calculate_sunrise_sunset, get_lunar_month_info
 from src.ephemeris.ephemeris_utils import (
     get_ascendant,
@@ -62,14 +68,14 @@ def _init_ephemeris_path():
             seplm_check = os.path.join(path, "seplm48.se1")
             if os.path.exists(seplm_check) or os.path.exists(os.path.join(path, "seplm")):
                 try:
-                    swe.set_ephe_path(path)
+                    swe_context.set_ephe_path(path)
                     return path
                 except Exception:
                     continue
     
     # If no path found, try to set empty path (Swiss Ephemeris will use default)
     try:
-        swe.set_ephe_path("")
+        swe_context.set_ephe_path("")
     except Exception:
         pass
     
@@ -79,7 +85,7 @@ def _init_ephemeris_path():
 _ephe_path = _init_ephemeris_path()
 
 # Set Lahiri Ayanamsa explicitly
-swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+swe_context.set_sid_mode(swe.SIDM_LAHIRI)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONSTANTS
@@ -395,53 +401,64 @@ def get_dignity_points(planet: str, sign_index: int, sign_lord: str, planet_degr
     return get_compound_dignity(planet, sign_lord, house_diff)
 
 
-def calculate_saptavargaja_bala(planet: str, planet_degree: float, jd: float, ascendant: float) -> float:
+# Saptavarga used by Saptavargaja Bala: D1, D2, D3, D7, D9, D12, D30
+SAPTAVARGAS = (1, 2, 3, 7, 9, 12, 30)
+
+
+def get_saptavarga_signs(longitude: float) -> Tuple[int, ...]:
     """
-    Calculate Saptavargaja Bala using EXACT Varga-Internal Friendship Logic.
+    Sign index (0-11) of a longitude in each of the SAPTAVARGAS.
     
-    Temporary Friendship must be calculated individually for each of the 7 Varga charts.
+    Args:
+        longitude: Sidereal longitude (D1)
+    
+    Returns:
+        Tuple of sign indices aligned with SAPTAVARGAS
+    """
+    signs = []
+    for v in SAPTAVARGAS:
+        if v == 1:
+            sign, _ = degrees_to_sign(longitude)
+        else:
+            sign = calculate_varga(longitude, v)["sign"]
+        signs.append(sign)
+    return tuple(signs)
+
+
+def _saptavargaja_from_signs(
+    planet: str,
+    planet_signs: Tuple[int, ...],
+    lord_signs: Mapping[str, Tuple[int, ...]]
+) -> float:
+    """
+    Saptavargaja points from precomputed Saptavarga signs.
     
     Args:
         planet: Planet name
-        planet_degree: Planet's sidereal longitude (D1)
-        jd: Julian Day Number
-        ascendant: Ascendant longitude (unused)
+        planet_signs: Planet's sign in each of the SAPTAVARGAS
+        lord_signs: Saptavarga signs of every available planet (sign lords)
     
     Returns:
-        Saptavargaja Bala in virupas (raw sum, will be normalized)
+        Saptavargaja Bala in virupas (raw sum)
     """
-    # Get all planet positions (D1) for finding sign lords in each varga
-    all_planet_longs = get_planet_positions(jd)
-    
-    vargas = [1, 2, 3, 7, 9, 12, 30]  # D1, D2, D3, D7, D9, D12, D30
     total_points = 0.0
     
-    for v in vargas:
+    for varga_index, v in enumerate(SAPTAVARGAS):
         # 1. Get Planet's sign in THIS varga
-        if v == 1:
-            p_v_sign, _ = degrees_to_sign(planet_degree)
-        else:
-            varga_data = calculate_varga(planet_degree, v)
-            p_v_sign = varga_data["sign"]
+        p_v_sign = planet_signs[varga_index]
         
         v_lord = SIGN_LORDS.get(p_v_sign, "")
         if not v_lord:
             continue
         
         # 2. Get the Sign Lord's position in THIS SAME varga
-        if v_lord not in all_planet_longs:
+        if v_lord not in lord_signs:
             # Sign lord not found, use default
             points = get_compound_dignity(planet, v_lord, 0)
             total_points += points
             continue
         
-        lord_long = all_planet_longs[v_lord]
-        
-        if v == 1:
-            l_v_sign, _ = degrees_to_sign(lord_long)
-        else:
-            lord_varga_data = calculate_varga(lord_long, v)
-            l_v_sign = lord_varga_data["sign"]
+        l_v_sign = lord_signs[v_lord][varga_index]
         
         # 3. Calculate House Diff (1-12) INSIDE the Varga Chart
         # Temporary Friendship depends on varga-specific house placement
@@ -473,6 +490,30 @@ def calculate_saptavargaja_bala(planet: str, planet_degree: float, jd: float, as
     return total_points
 
 
+def calculate_saptavargaja_bala(planet: str, planet_degree: float, jd: float, ascendant: float) -> float:
+    """
+    Calculate Saptavargaja Bala using EXACT Varga-Internal Friendship Logic.
+    
+    Temporary Friendship must be calculated individually for each of the 7 Varga charts.
+    
+    Args:
+        planet: Planet name
+        planet_degree: Planet's sidereal longitude (D1)
+        jd: Julian Day Number
+        ascendant: Ascendant longitude (unused)
+    
+    Returns:
+        Saptavargaja Bala in virupas (raw sum, will be normalized)
+    """
+    # Get all planet positions (D1) for finding sign lords in each varga
+    all_planet_longs = get_planet_positions(jd)
+    lord_signs = {
+        lord: get_saptavarga_signs(lord_long) for lord, lord_long in all_planet_longs.items()
+    }
+    
+    return _saptavargaja_from_signs(planet, get_saptavarga_signs(planet_degree), lord_signs)
+
+
 def calculate_ojhayugmarasiamsa_bala(planet: str, planet_degree: float) -> float:
     """
     Calculate Ojhayugmarasiamsa Bala (Odd/Even sign strength).
@@ -589,7 +630,7 @@ def calculate_kendradi_bala(planet_degree: float, jd: float, lat: float, lon: fl
         houses_dict = calculate_houses(jd, lat, lon, SE_HOUSE_PLACIDUS)
         
         # Get ayanamsa for sidereal conversion
-        ayanamsa = swe.get_ayanamsa(jd)
+        ayanamsa = swe_context.get_ayanamsa(jd)
         
         # Convert house cusps to sidereal and find which house contains the planet
         planet_tropical = normalize_degrees(planet_degree + ayanamsa)
@@ -713,6 +754,51 @@ def calculate_sthana_bala(planet: str, planet_degree: float, jd: float, ascendan
 # 2️⃣ DIG BALA (Directional Strength)
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Dig Bala strongest house per planet (weakest point is 180° away)
+DIG_BALA_STRONGEST_HOUSE = {
+    "Sun": 10,
+    "Mars": 10,
+    "Moon": 4,
+    "Venus": 4,
+    "Jupiter": 1,
+    "Mercury": 1,
+    "Saturn": 7
+}
+
+
+def get_bhava_cusps_sidereal(jd: float, lat: float, lon: float) -> Tuple[float, ...]:
+    """
+    Placidus bhava START (sandhi) cusps converted to sidereal (Lahiri).
+    
+    Args:
+        jd: Julian Day Number
+        lat: Latitude
+        lon: Longitude
+    
+    Returns:
+        Tuple of 12 sidereal cusps (indices 0-11 = houses 1-12)
+    
+    Raises:
+        ValueError: If house calculation fails
+    """
+    # Get Ayanamsa (Lahiri)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa = swe_context.get_ayanamsa_ut(jd)
+    
+    # Get Tropical Cusps
+    result = swe_context.houses(jd, lat, lon, b'P')
+    if result is None:
+        raise ValueError("Error calculating houses")
+    cusps_tropical, ascmc = result
+    
+    # Convert to Sidereal
+    if len(cusps_tropical) >= 13:
+        return tuple(normalize_degrees(cusps_tropical[i] - ayanamsa) for i in range(1, 13))
+    elif len(cusps_tropical) == 12:
+        return tuple(normalize_degrees(cusps_tropical[i - 1] - ayanamsa) for i in range(1, 13))
+    raise ValueError(f"Unexpected cusps length: {len(cusps_tropical)}")
+
+
 def calculate_dig_bala(planet: str, planet_degree: float, ascendant: float, jd: float = None, lat: float = None, lon: float = None) -> float:
     """
     Calculate Dig Bala (Directional strength) using BHAVA START (Sandhi).
@@ -738,43 +824,16 @@ def calculate_dig_bala(planet: str, planet_degree: float, ascendant: float, jd:
         Dig Bala in virupas (scaled by DIGBALA_SCALE)
     """
     # Determine strongest house for this planet
-    if planet in ["Sun", "Mars"]:
-        strongest_house = 10
-    elif planet in ["Moon", "Venus"]:
-        strongest_house = 4
-    elif planet in ["Jupiter", "Mercury"]:
-        strongest_house = 1
-    elif planet == "Saturn":
-        strongest_house = 7
-    else:
+    strongest_house = DIG_BALA_STRONGEST_HOUSE.get(planet)
+    if strongest_house is None:
         return 0.0
     
     # Get strongest point: Use Bhava START if geometry available, else whole-sign fallback
     if jd is not None and lat is not None and lon is not None:
         try:
-            # Get Ayanamsa (Lahiri)
-            swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-            ayanamsa = swe.get_ayanamsa_ut(jd)
-            
-            # Get Tropical Cusps
-            result = swe.houses(jd, lat, lon, b'P')
-            if result is None:
-                raise ValueError("Error calculating houses")
-            cusps_tropical, ascmc = result
-            
-            # Convert to Sidereal
-            cusps_sidereal = {}
-            if len(cusps_tropical) >= 13:
-                for i in range(1, 13):
-                    cusps_sidereal[i] = normalize_degrees(cusps_tropical[i] - ayanamsa)
-            elif len(cusps_tropical) == 12:
-                for i in range(1, 13):
-                    cusps_sidereal[i] = normalize_degrees(cusps_tropical[i-1] - ayanamsa)
-            else:
-                raise ValueError(f"Unexpected cusps length: {len(cusps_tropical)}")
-            
+            cusps_sidereal = get_bhava_cusps_sidereal(jd, lat, lon)
             # Use Bhava START (Sandhi) as strongest point
-            strongest_degree = normalize_degrees(cusps_sidereal[strongest_house])
+            strongest_degree = normalize_degrees(cusps_sidereal[strongest_house - 1])
         except Exception:
             # Fallback to whole-sign if geometry calculation fails
             strongest_degree = normalize_degrees(ascendant + (strongest_house - 1) * 30.0)
@@ -809,7 +868,183 @@ def calculate_dig_bala(planet: str, planet_degree: float, ascendant: float, jd:
 # 3️⃣ KĀLA BALA (Temporal Strength)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def calculate_nathonnatha_bala(planet: str, jd: float, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> float:
+@dataclass(frozen=True)
+class ShadbalaDayFrame:
+    """
+    Per-chart Kala Bala inputs (computed ONCE per chart, shared by every planet).
+
+    Every Kala Bala sub-component used to redo the same swe.revjul() /
+    swe.rise_trans() / swe.calc_ut() work for the same date and location.
+    The frame holds those raw values so calculate_shadbala() pays for them once.
+
+    Optional fields are None when the underlying calculation failed; each bala
+    then applies exactly the fallback it applied before.
+
+    Attributes:
+        julian_day: Birth Julian Day
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        timezone: Timezone string
+        local_day_hours: (birth_hour, sunrise_hour, sunset_hour) for Nathonnatha/Tribhaga
+        sunrise_jd: Sunrise JD (with Vedic correction)
+        sunset_jd: Sunset JD
+        next_sunrise_jd: Next day's sunrise JD (with Vedic correction)
+        vara_lord: Weekday lord (first hora lord)
+        hora_lord: Prokerala/JHora unequal hora lord at birth
+        paksha_longitudes: (moon_longitude, sun_longitude) for Paksha Bala
+        masa_lord: Amanta month lord for Masa Bala
+        declinations: Sidereal declination per planet for Ayana Bala
+    """
+    julian_day: float
+    latitude: float
+    longitude: float
+    timezone: str
+    local_day_hours: Optional[Tuple[float, float, float]]
+    sunrise_jd: Optional[float]
+    sunset_jd: Optional[float]
+    next_sunrise_jd: Optional[float]
+    vara_lord: Optional[str]
+    hora_lord: Optional[str]
+    paksha_longitudes: Tuple[float, float]
+    masa_lord: Optional[str]
+    declinations: Mapping[str, Optional[float]]
+
+
+def build_shadbala_day_frame(jd: float, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> ShadbalaDayFrame:
+    """
+    Compute the Kala Bala day frame for a chart.
+
+    Args:
+        jd: Julian Day Number
+        lat: Latitude
+        lon: Longitude
+        timezone: Timezone string
+
+    Returns:
+        ShadbalaDayFrame shared by all Kala Bala sub-components
+    """
+    try:
+        local_day_hours = _get_local_day_hours(jd, lat, lon, timezone)
+    except Exception:
+        local_day_hours = None
+
+    # Prokerala hora inputs (same try-scope as the per-planet hora calculation)
+    try:
+        sunrise_jd, sunset_jd, next_sunrise_jd = get_sunrise_sunset_jds(jd, lat, lon, timezone)
+        vara_lord = get_vara_lord_from_jd(jd)
+        hora_lord = get_hora_lord_prokerala(jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
+    except Exception:
+        sunrise_jd = sunset_jd = next_sunrise_jd = None
+        vara_lord = hora_lord = None
+
+    try:
+        masa_lord = get_masa_lord_from_jd(jd)
+    except Exception:
+        masa_lord = None
+
+    return ShadbalaDayFrame(
+        julian_day=jd,
+        latitude=lat,
+        longitude=lon,
+        timezone=timezone,
+        local_day_hours=local_day_hours,
+        sunrise_jd=sunrise_jd,
+        sunset_jd=sunset_jd,
+        next_sunrise_jd=next_sunrise_jd,
+        vara_lord=vara_lord,
+        hora_lord=hora_lord,
+        paksha_longitudes=_get_paksha_longitudes(jd),
+        masa_lord=masa_lord,
+        declinations=MappingProxyType({
+            planet: _get_ayana_declination(planet, jd) for planet in PLANET_TO_SE
+        }),
+    )
+
+
+def ensure_shadbala_day_frame(
+    day_frame: Optional[ShadbalaDayFrame],
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str
+) -> ShadbalaDayFrame:
+    """
+    Return the given day frame, or build one when the caller did not pass it.
+
+    Raises:
+        ValueError: If the frame was computed for a different jd/location/timezone
+    """
+    if day_frame is None:
+        return build_shadbala_day_frame(jd, lat, lon, timezone)
+    if (day_frame.julian_day, day_frame.latitude, day_frame.longitude, day_frame.timezone) != (jd, lat, lon, timezone):
+        raise ValueError(
+            f"ShadbalaDayFrame mismatch: frame is for jd={day_frame.julian_day}, "
+            f"lat={day_frame.latitude}, lon={day_frame.longitude}, tz={day_frame.timezone}; "
+            f"requested jd={jd}, lat={lat}, lon={lon}, tz={timezone}"
+        )
+    return day_frame
+
+
+def _get_local_day_hours(jd: float, lat: float, lon: float, timezone: str) -> Tuple[float, float, float]:
+    """
+    Birth hour and local sunrise/sunset hours (Nathonnatha / Tribhaga inputs).
+
+    Returns:
+        Tuple of (birth_hour, sunrise_hour, sunset_hour)
+
+    Raises:
+        ValueError: If sunrise/sunset calculation fails
+    """
+    # Get date from JD
+    revjul_result = swe.revjul(jd, swe.GREG_CAL)
+    if isinstance(revjul_result, tuple) and len(revjul_result) >= 4:
+        year, month, day, hour = revjul_result[0], revjul_result[1], revjul_result[2], revjul_result[3]
+    else:
+        # Fallback: calculate from JD directly
+        jd_int = int(jd)
+        jd_frac = jd - jd_int
+        # Approximate conversion
+        year = 2000
+        month = 1
+        day = 1
+        hour = (jd_frac * 24.0)
+    date_obj = datetime(int(year), int(month), int(day), int(hour), int((hour % 1) * 60))
+    
+    # Calculate actual sunrise and sunset
+    sunrise_str, sunset_str = calculate_sunrise_sunset(date_obj, lat, lon, timezone)
+    
+    # Parse sunrise/sunset times
+    sunrise_parts = sunrise_str.split(":")
+    sunset_parts = sunset_str.split(":")
+    sunrise_hour = int(sunrise_parts[0]) + int(sunrise_parts[1]) / 60.0
+    sunset_hour = int(sunset_parts[0]) + int(sunset_parts[1]) / 60.0
+    
+    return hour, sunrise_hour, sunset_hour
+
+
+def _resolve_local_day_hours(
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str,
+    day_frame: Optional[ShadbalaDayFrame]
+) -> Tuple[float, float, float]:
+    """Local day hours from the frame, or computed directly when no frame is given."""
+    if day_frame is None:
+        return _get_local_day_hours(jd, lat, lon, timezone)
+    if day_frame.local_day_hours is None:
+        raise ValueError("Sunrise/sunset calculation failed")
+    return day_frame.local_day_hours
+
+
+def calculate_nathonnatha_bala(
+    planet: str,
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str = "Asia/Kolkata",
+    day_frame: Optional[ShadbalaDayFrame] = None
+) -> float:
     """
     Calculate Nathonnatha Bala (Day/Night strength) using BPHS slab logic.
     
@@ -823,38 +1058,16 @@ def calculate_nathonnatha_bala(planet: str, jd: float, lat: float, lon: float, t
         lat: Latitude
         lon: Longitude
         timezone: Timezone string
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Nathonnatha Bala in virupas (60 or 0, slab logic)
     """
     try:
-        # Get date from JD
-        revjul_result = swe.revjul(jd, swe.GREG_CAL)
-        if isinstance(revjul_result, tuple) and len(revjul_result) >= 4:
-            year, month, day, hour = revjul_result[0], revjul_result[1], revjul_result[2], revjul_result[3]
-        else:
-            # Fallback: calculate from JD directly
-            jd_int = int(jd)
-            jd_frac = jd - jd_int
-            # Approximate conversion
-            year = 2000
-            month = 1
-            day = 1
-            hour = (jd_frac * 24.0)
-        date_obj = datetime(int(year), int(month), int(day), int(hour), int((hour % 1) * 60))
-        
-        # Calculate actual sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date_obj, lat, lon, timezone)
-        
-        # Parse sunrise/sunset times
-        sunrise_parts = sunrise_str.split(":")
-        sunset_parts = sunset_str.split(":")
-        sunrise_hour = int(sunrise_parts[0]) + int(sunrise_parts[1]) / 60.0
-        sunset_hour = int(sunset_parts[0]) + int(sunset_parts[1]) / 60.0
+        hour, sunrise_hour, sunset_hour = _resolve_local_day_hours(jd, lat, lon, timezone, day_frame)
         
         # Get current time in hours (0-24)
         current_hour = hour + ((hour % 1) * 60) / 60.0
-        
         # EXACT Nathonnatha Formula:
         # Find the distance from Noon or Midnight
         # Nato = abs(Current_Time - Midnight)
@@ -901,7 +1114,18 @@ def calculate_nathonnatha_bala(planet: str, jd: float, lat: float, lon: float, t
     return 0.0
 
 
-def calculate_paksha_bala(planet: str, jd: float) -> float:
+def _get_paksha_longitudes(jd: float) -> Tuple[float, float]:
+    """Moon and Sun longitudes for Paksha Bala: (moon_longitude, sun_longitude)."""
+    moon_result = swe_context.calc(jd, SE_MOON, swe.FLG_SWIEPH)
+    sun_result = swe_context.calc(jd, SE_SUN, swe.FLG_SWIEPH)
+    
+    # swe.calc_ut returns (xx, ret) where xx is array of coordinates
+    moon_longitude = moon_result[0][0] if moon_result and len(moon_result) > 0 and moon_result[0] else 0.0
+    sun_longitude = sun_result[0][0] if sun_result and len(sun_result) > 0 and sun_result[0] else 0.0
+    return moon_longitude, sun_longitude
+
+
+def calculate_paksha_bala(planet: str, jd: float, day_frame: Optional[ShadbalaDayFrame] = None) -> float:
     """
     Calculate Paksha Bala (Lunar phase strength) using bucket logic.
     
@@ -913,16 +1137,15 @@ def calculate_paksha_bala(planet: str, jd: float) -> float:
     Args:
         planet: Planet name
         jd: Julian Day Number
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Paksha Bala in virupas
     """
-    moon_result = swe.calc_ut(jd, SE_MOON, swe.FLG_SWIEPH)
-    sun_result = swe.calc_ut(jd, SE_SUN, swe.FLG_SWIEPH)
-    
-    # swe.calc_ut returns (xx, ret) where xx is array of coordinates
-    moon_longitude = moon_result[0][0] if moon_result and len(moon_result) > 0 and moon_result[0] else 0.0
-    sun_longitude = sun_result[0][0] if sun_result and len(sun_result) > 0 and sun_result[0] else 0.0
+    if day_frame is None:
+        moon_longitude, sun_longitude = _get_paksha_longitudes(jd)
+    else:
+        moon_longitude, sun_longitude = day_frame.paksha_longitudes
     
     # EXACT Paksha Bala Formula:
     # Formula: 60 * (Moon_Sun_Sep) / 180. Max 60 at Purnima.
@@ -959,7 +1182,14 @@ def calculate_paksha_bala(planet: str, jd: float) -> float:
     return max(0.0, min(60.0, paksha))
 
 
-def calculate_tribhaga_bala(planet: str, jd: float, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> float:
+def calculate_tribhaga_bala(
+    planet: str,
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str = "Asia/Kolkata",
+    day_frame: Optional[ShadbalaDayFrame] = None
+) -> float:
     """
     Calculate Tribhaga Bala (Time of day strength - thirds).
     
@@ -978,6 +1208,7 @@ def calculate_tribhaga_bala(planet: str, jd: float, lat: float, lon: float, time
         lat: Latitude
         lon: Longitude
         timezone: Timezone string
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Tribhaga Bala in virupas
@@ -987,29 +1218,7 @@ def calculate_tribhaga_bala(planet: str, jd: float, lat: float, lon: float, time
         return 60.0
     
     try:
-        # Get date from JD
-        revjul_result = swe.revjul(jd, swe.GREG_CAL)
-        if isinstance(revjul_result, tuple) and len(revjul_result) >= 4:
-            year, month, day, hour = revjul_result[0], revjul_result[1], revjul_result[2], revjul_result[3]
-        else:
-            # Fallback: calculate from JD directly
-            jd_int = int(jd)
-            jd_frac = jd - jd_int
-            # Approximate conversion
-            year = 2000
-            month = 1
-            day = 1
-            hour = (jd_frac * 24.0)
-        date_obj = datetime(int(year), int(month), int(day), int(hour), int((hour % 1) * 60))
-        
-        # Calculate actual sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date_obj, lat, lon, timezone)
-        
-        # Parse sunrise/sunset times
-        sunrise_parts = sunrise_str.split(":")
-        sunset_parts = sunset_str.split(":")
-        sunrise_hour = int(sunrise_parts[0]) + int(sunrise_parts[1]) / 60.0
-        sunset_hour = int(sunset_parts[0]) + int(sunset_parts[1]) / 60.0
+        hour, sunrise_hour, sunset_hour = _resolve_local_day_hours(jd, lat, lon, timezone, day_frame)
         
         # Get current time in hours (0-24)
         current_hour = hour + ((hour % 1) * 60) / 60.0
@@ -1107,7 +1316,59 @@ def calculate_varsha_bala(planet: str, jd: float) -> float:
     return 0.0
 
 
-def calculate_masa_bala(planet: str, jd: float, lat: float = 0.0, lon: float = 0.0, timezone: str = "Asia/Kolkata") -> float:
+def get_masa_lord_from_jd(jd: float) -> str:
+    """
+    Get Amanta lunar month lord (Masa Lord) from Julian Day.
+    
+    Args:
+        jd: Julian Day Number
+    
+    Returns:
+        Month lord planet name
+    """
+    # Get Amanta lunar month info using Panchanga engine
+    lunar_month_info = get_lunar_month_info(jd)
+    
+    if lunar_month_info and "amanta_month" in lunar_month_info:
+        # Map Vedic month name to month lord
+        # Chaitra = Sun, Vaisakha = Moon, Jyeshtha = Mars, etc.
+        month_name = lunar_month_info["amanta_month"]
+        month_to_lord = {
+            "Chaitra": "Sun",
+            "Vaisakha": "Moon",
+            "Jyeshtha": "Mars",
+            "Ashadha": "Mercury",
+            "Shravana": "Jupiter",
+            "Bhadrapada": "Venus",
+            "Ashvina": "Saturn",
+            "Kartika": "Sun",
+            "Margashirsha": "Moon",
+            "Pausha": "Mars",
+            "Magha": "Mercury",
+            "Phalguna": "Jupiter"
+        }
+        return month_to_lord.get(month_name, "Sun")
+    
+    # Fallback: approximate from solar month
+    revjul_result = swe.revjul(jd, swe.GREG_CAL)
+    if isinstance(revjul_result, tuple) and len(revjul_result) >= 4:
+        month = int(revjul_result[1])
+    else:
+        month = int((jd % 365.25) / 30.44) + 1
+    
+    # Approximate month lords (Chaitra = Sun, Vaishakha = Moon, etc.)
+    month_lords = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sun", "Moon", "Mars", "Mercury", "Jupiter"]
+    return month_lords[(month - 1) % len(month_lords)]
+
+
+def calculate_masa_bala(
+    planet: str,
+    jd: float,
+    lat: float = 0.0,
+    lon: float = 0.0,
+    timezone: str = "Asia/Kolkata",
+    day_frame: Optional[ShadbalaDayFrame] = None
+) -> float:
     """
     Calculate Masa Bala (Month lord strength) using Amanta lunar month.
     
@@ -1120,46 +1381,18 @@ def calculate_masa_bala(planet: str, jd: float, lat: float = 0.0, lon: float = 0
         lat: Latitude (for lunar month calculation)
         lon: Longitude (for lunar month calculation)
         timezone: Timezone string
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Masa Bala in virupas (30 if planet is month lord, else 0)
     """
     try:
-        # Get Amanta lunar month info using Panchanga engine
-        lunar_month_info = get_lunar_month_info(jd)
-        
-        if lunar_month_info and "amanta_month" in lunar_month_info:
-            # Map Vedic month name to month lord
-            # Chaitra = Sun, Vaisakha = Moon, Jyeshtha = Mars, etc.
-            month_name = lunar_month_info["amanta_month"]
-            month_to_lord = {
-                "Chaitra": "Sun",
-                "Vaisakha": "Moon",
-                "Jyeshtha": "Mars",
-                "Ashadha": "Mercury",
-                "Shravana": "Jupiter",
-                "Bhadrapada": "Venus",
-                "Ashvina": "Saturn",
-                "Kartika": "Sun",
-                "Margashirsha": "Moon",
-                "Pausha": "Mars",
-                "Magha": "Mercury",
-                "Phalguna": "Jupiter"
-            }
-            month_lord = month_to_lord.get(month_name, "Sun")
-            return 30.0 if month_lord == planet else 0.0
-        
-        # Fallback: approximate from solar month
-        revjul_result = swe.revjul(jd, swe.GREG_CAL)
-        if isinstance(revjul_result, tuple) and len(revjul_result) >= 4:
-            month = int(revjul_result[1])
+        if day_frame is None:
+            month_lord = get_masa_lord_from_jd(jd)
+        elif day_frame.masa_lord is None:
+            return 0.0
         else:
-            month = int((jd % 365.25) / 30.44) + 1
-        
-        # Approximate month lords (Chaitra = Sun, Vaishakha = Moon, etc.)
-        month_lords = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sun", "Moon", "Mars", "Mercury", "Jupiter"]
-        month_lord = month_lords[(month - 1) % len(month_lords)]
-        
+            month_lord = day_frame.masa_lord
         return 30.0 if month_lord == planet else 0.0
     except Exception:
         return 0.0
@@ -1255,14 +1488,13 @@ def get_sunrise_sunset_jds(jd: float, lat: float, lon: float, timezone: str) ->
     
     # Calculate sunrise/sunset for current day
     jd_utc = swe.julday(date_local.year, date_local.month, date_local.day, 0.0, swe.GREG_CAL)
-    swe.set_topo(lon, lat, 0.0)
     geopos = [lon, lat, 0.0]
     atpress = 0.0
     attemp = 0.0
     flags = swe.BIT_DISC_CENTER | swe.FLG_SWIEPH | swe.FLG_TOPOCTR
     
-    result_rise = swe.rise_trans(jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
-    result_set = swe.rise_trans(jd_utc, swe.SUN, swe.CALC_SET, geopos, atpress, attemp, flags)
+    result_rise = swe_context.rise_trans(jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
+    result_set = swe_context.rise_trans(jd_utc, swe.SUN, swe.CALC_SET, geopos, atpress, attemp, flags)
     
     if result_rise[0] < 0 or result_set[0] < 0:
         raise ValueError("Sunrise/sunset calculation failed")
@@ -1275,7 +1507,7 @@ def get_sunrise_sunset_jds(jd: float, lat: float, lon: float, timezone: str) ->
     # Calculate next day's sunrise
     next_date_obj = date_local + timedelta(days=1)
     next_jd_utc = swe.julday(next_date_obj.year, next_date_obj.month, next_date_obj.day, 0.0, swe.GREG_CAL)
-    result_next_rise = swe.rise_trans(next_jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
+    result_next_rise = swe_context.rise_trans(next_jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
     
     if result_next_rise[0] < 0:
         raise ValueError("Next sunrise calculation failed")
@@ -1287,14 +1519,13 @@ def get_sunrise_sunset_jds(jd: float, lat: float, lon: float, timezone: str) ->
     return sunrise_jd, sunset_jd, next_sunrise_jd
 
 
-def calculate_hora_bala_prokerala(
-    planet: str,
+def get_hora_lord_prokerala(
     birth_jd: float,
     sunrise_jd: float,
     sunset_jd: float,
     next_sunrise_jd: float,
     vara_lord: str
-) -> float:
+) -> str:
     """
     PROKERALA / JHORA UNEQUAL HORA IMPLEMENTATION
 
@@ -1305,7 +1536,6 @@ def calculate_hora_bala_prokerala(
     4. REQUIRES next_sunrise_jd passed from the caller.
 
     Args:
-        planet: Planet name
         birth_jd: Birth Julian Day
         sunrise_jd: Sunrise JD (with Vedic correction)
         sunset_jd: Sunset JD
@@ -1313,7 +1543,7 @@ def calculate_hora_bala_prokerala(
         vara_lord: Weekday lord (first hora lord)
     
     Returns:
-        Hora Bala in virupas (60 if planet is hora lord, else 0)
+        Hora lord planet name
     """
     # Day birth
     if sunrise_jd <= birth_jd < sunset_jd:
@@ -1360,8 +1590,32 @@ def calculate_hora_bala_prokerala(
         raise ValueError(f"Invalid vara_lord: {vara_lord}")
 
     hora_pointer = (start_idx + hora_index) % 7
-    hora_lord = sequence[hora_pointer]
+    return sequence[hora_pointer]
+
+
+def calculate_hora_bala_prokerala(
+    planet: str,
+    birth_jd: float,
+    sunrise_jd: float,
+    sunset_jd: float,
+    next_sunrise_jd: float,
+    vara_lord: str
+) -> float:
+    """
+    Hora Bala from the Prokerala/JHora unequal hora lord.
+    
+    Args:
+        planet: Planet name
+        birth_jd: Birth Julian Day
+        sunrise_jd: Sunrise JD (with Vedic correction)
+        sunset_jd: Sunset JD
+        next_sunrise_jd: Next day's sunrise JD (with Vedic correction)
+        vara_lord: Weekday lord (first hora lord)
     
+    Returns:
+        Hora Bala in virupas (60 if planet is hora lord, else 0)
+    """
+    hora_lord = get_hora_lord_prokerala(birth_jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
     return 60.0 if hora_lord == planet else 0.0
 
 
@@ -1383,7 +1637,59 @@ def calculate_hora_bala(planet: str, jd: float, lat: float = 0.0, lon: float = 0
     return 60.0 if hora_lord == planet else 0.0
 
 
-def calculate_ayana_bala(planet: str, jd: float) -> float:
+def calculate_hora_bala_for_chart(
+    planet: str,
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str,
+    day_frame: Optional[ShadbalaDayFrame] = None
+) -> float:
+    """
+    Hora Bala as used by Kala Bala: Prokerala unequal hora, legacy fallback on failure.
+    
+    Args:
+        planet: Planet name
+        jd: Julian Day Number
+        lat: Latitude
+        lon: Longitude
+        timezone: Timezone string
+        day_frame: Precomputed day frame for this chart (optional)
+    
+    Returns:
+        Hora Bala in virupas
+    """
+    if day_frame is not None:
+        if day_frame.hora_lord is None:
+            return calculate_hora_bala(planet, jd, lat, lon, timezone)
+        return 60.0 if day_frame.hora_lord == planet else 0.0
+    
+    # Get sunrise/sunset/next_sunrise JDs and vara lord for Prokerala hora calculation
+    try:
+        sunrise_jd, sunset_jd, next_sunrise_jd = get_sunrise_sunset_jds(jd, lat, lon, timezone)
+        vara_lord = get_vara_lord_from_jd(jd)
+        return calculate_hora_bala_prokerala(planet, jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
+    except Exception:
+        # Fallback to legacy function if calculation fails
+        return calculate_hora_bala(planet, jd, lat, lon, timezone)
+
+
+def _get_ayana_declination(planet: str, jd: float) -> Optional[float]:
+    """Sidereal declination of a planet for Ayana Bala (None if unavailable)."""
+    if planet not in PLANET_TO_SE:
+        return None
+    
+    planet_num = PLANET_TO_SE[planet]
+    result = swe_context.calc(jd, planet_num, swe.FLG_SIDEREAL)
+    
+    if not result or len(result) < 1 or not result[0] or len(result[0]) < 2:
+        return None
+    
+    # Get declination in degrees
+    return result[0][1]
+
+
+def calculate_ayana_bala(planet: str, jd: float, day_frame: Optional[ShadbalaDayFrame] = None) -> float:
     """
     Calculate Ayana Bala using EXACT BPHS/JHora formula.
     
@@ -1395,6 +1701,7 @@ def calculate_ayana_bala(planet: str, jd: float) -> float:
     Args:
         planet: Planet name
         jd: Julian Day Number
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Ayana Bala in virupas
@@ -1402,15 +1709,13 @@ def calculate_ayana_bala(planet: str, jd: float) -> float:
     if planet not in PLANET_TO_SE:
         return 0.0
     
-    planet_num = PLANET_TO_SE[planet]
-    result = swe.calc_ut(jd, planet_num, swe.FLG_SIDEREAL)
-    
-    if not result or len(result) < 1 or not result[0] or len(result[0]) < 2:
+    if day_frame is None:
+        decl = _get_ayana_declination(planet, jd)
+    else:
+        decl = day_frame.declinations.get(planet)
+    if decl is None:
         return 0.0
     
-    # Get declination in degrees
-    decl = result[0][1]
-    
     # EXACT formula per planet type
     if planet in ["Sun", "Mars", "Jupiter", "Venus"]:
         ayana = 30 + (decl * 1.25)
@@ -1437,7 +1742,8 @@ def calculate_kala_bala_no_ayana(
     lon: float,
     timezone: str,
     all_planets: Dict[str, float],
-    ascendant: float
+    ascendant: float,
+    day_frame: Optional[ShadbalaDayFrame] = None
 ) -> float:
     """
     Calculate Kala Bala EXCLUDING Ayana (for Yuddha calculation).
@@ -1451,25 +1757,20 @@ def calculate_kala_bala_no_ayana(
         timezone: Timezone string
         all_planets: Dictionary of all planet positions
         ascendant: Ascendant longitude
+        day_frame: Precomputed day frame for this chart (built if not given)
     
     Returns:
         Kala Bala without Ayana component
     """
-    nathonnatha = calculate_nathonnatha_bala(planet, jd, lat, lon, timezone)
-    paksha = calculate_paksha_bala(planet, jd)
-    tribhaga = calculate_tribhaga_bala(planet, jd, lat, lon, timezone)
+    day_frame = ensure_shadbala_day_frame(day_frame, jd, lat, lon, timezone)
+    
+    nathonnatha = calculate_nathonnatha_bala(planet, jd, lat, lon, timezone, day_frame)
+    paksha = calculate_paksha_bala(planet, jd, day_frame)
+    tribhaga = calculate_tribhaga_bala(planet, jd, lat, lon, timezone, day_frame)
     varsha = calculate_varsha_bala(planet, jd)
-    masa = calculate_masa_bala(planet, jd, lat, lon, timezone)
+    masa = calculate_masa_bala(planet, jd, lat, lon, timezone, day_frame)
     dina = calculate_dina_bala(planet, jd)
-    
-    # Get sunrise/sunset/next_sunrise JDs and vara lord for Prokerala hora calculation
-    try:
-        sunrise_jd, sunset_jd, next_sunrise_jd = get_sunrise_sunset_jds(jd, lat, lon, timezone)
-        vara_lord = get_vara_lord_from_jd(jd)
-        hora = calculate_hora_bala_prokerala(planet, jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
-    except Exception:
-        # Fallback to legacy function if calculation fails
-        hora = calculate_hora_bala(planet, jd, lat, lon, timezone)
+    hora = calculate_hora_bala_for_chart(planet, jd, lat, lon, timezone, day_frame)
     
     # Ayana EXCLUDED
     yuddha = 0.0  # Yuddha is calculated separately
@@ -1485,7 +1786,8 @@ def calculate_yuddha_bala(
     lat: float,
     lon: float,
     ascendant: float,
-    timezone: str = "Asia/Kolkata"
+    timezone: str = "Asia/Kolkata",
+    day_frame: Optional[ShadbalaDayFrame] = None
 ) -> float:
     """
     Calculate Yuddha Bala (Planetary war strength) - REQUIRED FOR 2026.
@@ -1509,6 +1811,7 @@ def calculate_yuddha_bala(
         lon: Longitude
         ascendant: Ascendant longitude
         timezone: Timezone string
+        day_frame: Precomputed day frame for this chart (optional)
     
     Returns:
         Yuddha Bala adjustment in virupas (capped ≤15)
@@ -1533,14 +1836,14 @@ def calculate_yuddha_bala(
             # Compute Shadbala EXCLUDING Ayana & Drik
             planet_sthana = calculate_sthana_bala(planet, planet_degree, jd, ascendant, lat, lon)
             planet_dig = calculate_dig_bala(planet, planet_degree, ascendant, jd, lat, lon)
-            planet_kala_no_ayana = calculate_kala_bala_no_ayana(planet, planet_degree, jd, lat, lon, timezone, all_planets, ascendant)
+            planet_kala_no_ayana = calculate_kala_bala_no_ayana(planet, planet_degree, jd, lat, lon, timezone, all_planets, ascendant, day_frame)
             planet_cheshta = calculate_cheshta_bala(planet, jd, all_planets.get("Moon", 0.0), all_planets.get("Sun", 0.0))
             planet_naisargika = NAISARGIKA_BALA.get(planet, 0.0)
             planet_strength = planet_sthana + planet_dig + planet_kala_no_ayana + planet_cheshta + planet_naisargika
             
             other_sthana = calculate_sthana_bala(other_planet, other_degree, jd, ascendant, lat, lon)
             other_dig = calculate_dig_bala(other_planet, other_degree, ascendant, jd, lat, lon)
-            other_kala_no_ayana = calculate_kala_bala_no_ayana(other_planet, other_degree, jd, lat, lon, timezone, all_planets, ascendant)
+            other_kala_no_ayana = calculate_kala_bala_no_ayana(other_planet, other_degree, jd, lat, lon, timezone, all_planets, ascendant, day_frame)
             other_cheshta = calculate_cheshta_bala(other_planet, jd, all_planets.get("Moon", 0.0), all_planets.get("Sun", 0.0))
             other_naisargika = NAISARGIKA_BALA.get(other_planet, 0.0)
             other_strength = other_sthana + other_dig + other_kala_no_ayana + other_cheshta + other_naisargika
@@ -1569,7 +1872,8 @@ def calculate_kala_bala(
     lon: float,
     timezone: str,
     all_planets: Dict[str, float],
-    ascendant: float
+    ascendant: float,
+    day_frame: Optional[ShadbalaDayFrame] = None
 ) -> float:
     """
     Calculate complete Kala Bala (Temporal strength).
@@ -1594,28 +1898,23 @@ def calculate_kala_bala(
         timezone: Timezone string
         all_planets: Dictionary of all planet positions
         ascendant: Ascendant longitude
+        day_frame: Precomputed day frame for this chart (built if not given)
     
     Returns:
         Kala Bala in virupas
     """
-    nathonnatha = calculate_nathonnatha_bala(planet, jd, lat, lon, timezone)
-    paksha = calculate_paksha_bala(planet, jd)
-    tribhaga = calculate_tribhaga_bala(planet, jd, lat, lon, timezone)
+    day_frame = ensure_shadbala_day_frame(day_frame, jd, lat, lon, timezone)
+    
+    nathonnatha = calculate_nathonnatha_bala(planet, jd, lat, lon, timezone, day_frame)
+    paksha = calculate_paksha_bala(planet, jd, day_frame)
+    tribhaga = calculate_tribhaga_bala(planet, jd, lat, lon, timezone, day_frame)
     varsha = calculate_varsha_bala(planet, jd)
-    masa = calculate_masa_bala(planet, jd, lat, lon, timezone)
+    masa = calculate_masa_bala(planet, jd, lat, lon, timezone, day_frame)
     dina = calculate_dina_bala(planet, jd)
+    hora = calculate_hora_bala_for_chart(planet, jd, lat, lon, timezone, day_frame)
     
-    # Get sunrise/sunset/next_sunrise JDs and vara lord for Prokerala hora calculation
-    try:
-        sunrise_jd, sunset_jd, next_sunrise_jd = get_sunrise_sunset_jds(jd, lat, lon, timezone)
-        vara_lord = get_vara_lord_from_jd(jd)
-        hora = calculate_hora_bala_prokerala(planet, jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
-    except Exception:
-        # Fallback to legacy function if calculation fails
-        hora = calculate_hora_bala(planet, jd, lat, lon, timezone)
-    
-    ayana = calculate_ayana_bala(planet, jd)
-    yuddha = calculate_yuddha_bala(planet, planet_degree, all_planets, jd, lat, lon, ascendant, timezone)
+    ayana = calculate_ayana_bala(planet, jd, day_frame)
+    yuddha = calculate_yuddha_bala(planet, planet_degree, all_planets, jd, lat, lon, ascendant, timezone, day_frame)
     
     return nathonnatha + paksha + tribhaga + varsha + masa + dina + hora + ayana + yuddha
 
@@ -1624,6 +1923,38 @@ def calculate_kala_bala(
 # 4️⃣ CHEṢṬĀ BALA (Motional Strength)
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Direct motion constants (JHora style)
+DIRECT_CHESHTA_CONSTANTS = {
+    "Mercury": 18.20,
+    "Venus": 49.76,
+    "Mars": 37.68,
+    "Jupiter": 29.83,
+    "Saturn": 56.95
+}
+
+
+def get_cheshta_speed(planet: str, jd: float) -> Optional[float]:
+    """
+    Daily speed in longitude used for the Cheshta Bala retrograde check.
+    
+    Args:
+        planet: Planet name
+        jd: Julian Day Number
+    
+    Returns:
+        Speed in degrees/day, or None if unavailable
+    """
+    try:
+        planet_num = PLANET_TO_SE[planet]
+        result = swe_context.calc(jd, planet_num, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        
+        if result and len(result) > 0 and result[0] and len(result[0]) > 3:
+            return result[0][3]  # Speed in longitude
+    except Exception:
+        pass
+    return None
+
+
 def calculate_cheshta_bala(planet: str, jd: float, moon_longitude: float, sun_longitude: float) -> float:
     """
     Calculate Cheshta Bala using JHora constants ONLY (NO speed math, NO angular math).
@@ -1649,27 +1980,11 @@ def calculate_cheshta_bala(planet: str, jd: float, moon_longitude: float, sun_lo
     if planet == "Sun" or planet == "Moon":
         return 0.0
     
-    # Direct motion constants (JHora style)
-    DIRECT_CHESHTA_CONSTANTS = {
-        "Mercury": 18.20,
-        "Venus": 49.76,
-        "Mars": 37.68,
-        "Jupiter": 29.83,
-        "Saturn": 56.95
-    }
-    
     # Check retrograde status
-    try:
-        planet_num = PLANET_TO_SE[planet]
-        result = swe.calc_ut(jd, planet_num, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        
-        if result and len(result) > 0 and result[0] and len(result[0]) > 3:
-            speed = result[0][3]  # Speed in longitude
-            if speed < 0:
-                # Retrograde → 60
-                return 60.0
-    except Exception:
-        pass
+    speed = get_cheshta_speed(planet, jd)
+    if speed is not None and speed < 0:
+        # Retrograde → 60
+        return 60.0
     
     # Direct motion → return exact constant
     return DIRECT_CHESHTA_CONSTANTS.get(planet, 0.0)
@@ -1745,109 +2060,369 @@ def calculate_drik_bala(
 
 
 # ═══════════════════════════════════════════════════════════════════════════
-# MAIN SHADBALA CALCULATION
+# BATCH (COLUMNAR) SHADBALA
 # ═══════════════════════════════════════════════════════════════════════════
+"""
+All seven planets are computed together from ONE set of ephemeris inputs:
+    • ShadbalaSnapshot  - every Swiss Ephemeris value Shadbala reads (once per chart)
+    • Input matrix      - 7 × N (longitude, speed, Saptavarga signs) built once
+    • ShadbalaTable     - one float64 array per bala / sub-bala (row = planet)
 
-def calculate_shadbala(
-    jd: float,
-    lat: float,
-    lon: float,
-    timezone: str = "Asia/Kolkata"
-) -> Dict:
+🔒 NUMERICALLY IDENTICAL to the per-planet functions above (same formulas,
+   same operation order) - enforced by tests/test_shadbala_batch.py
+"""
+
+# Input matrix columns (one row per planet)
+SHADBALA_INPUT_COLUMNS: Tuple[str, ...] = (
+    "longitude", "speed", "degrees_in_sign",
+    "d1_sign", "d2_sign", "d3_sign", "d7_sign", "d9_sign", "d12_sign", "d30_sign",
+)
+
+# Shadbala planets (Rahu/Ketu have no Shadbala)
+SHADBALA_EXCLUDED = ("Rahu", "Ketu")
+
+
+@dataclass(frozen=True)
+class ShadbalaSnapshot:
     """
-    Calculate complete BPHS Shadbala (Six-fold Strength) for all planets.
+    Immutable Shadbala inputs for one chart.
     
-    This is the main Shadbala calculation function following BPHS formulas exactly.
+    Shadbala reads Drik (FLG_TRUEPOS, true node) positions, so it has its own
+    snapshot rather than the JHORA-exact EphemerisSnapshot used by /kundli.
+    
+    Attributes:
+        julian_day: Julian Day Number
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        timezone: Timezone string
+        planets: Sidereal longitudes of all grahas (get_planet_positions, incl. Rahu/Ketu)
+        ascendant: Ascendant longitude (get_ascendant)
+        bhava_cusps: Sidereal bhava START cusps for Dig Bala (None if unavailable)
+        speeds: Cheshta Bala speed per planet (None if unavailable)
+        day_frame: Kala Bala day frame
+    """
+    julian_day: float
+    latitude: float
+    longitude: float
+    timezone: str
+    planets: Mapping[str, float]
+    ascendant: float
+    bhava_cusps: Optional[Tuple[float, ...]]
+    speeds: Mapping[str, Optional[float]]
+    day_frame: ShadbalaDayFrame
+
+    @property
+    def shadbala_planets(self) -> Tuple[str, ...]:
+        """Planets that get Shadbala, in chart order (row order of the table)."""
+        return tuple(name for name in self.planets if name not in SHADBALA_EXCLUDED)
+
+
+def build_shadbala_snapshot(jd: float, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> ShadbalaSnapshot:
+    """
+    Compute every ephemeris input Shadbala needs (ONE pass over Swiss Ephemeris).
     
     Args:
         jd: Julian Day Number
         lat: Geographic latitude
         lon: Geographic longitude
+        timezone: Timezone string
     
     Returns:
-        Dictionary with complete Shadbala for each planet including all sub-components
+        ShadbalaSnapshot for calculate_shadbala_batch()
     """
     # Ensure Lahiri Ayanamsa
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     # Get planet positions (sidereal)
     planets = get_planet_positions(jd)
     
-    # Get ascendant and houses
+    # Get ascendant
     asc = get_ascendant(jd, lat, lon)
-    houses_list = get_houses(jd, lat, lon)
     
-    # Get signs for all planets
-    planet_signs = {}
-    for planet_name, planet_degree in planets.items():
-        sign_num, _ = degrees_to_sign(planet_degree)
-        planet_signs[planet_name] = sign_num
+    try:
+        bhava_cusps = get_bhava_cusps_sidereal(jd, lat, lon)
+    except Exception:
+        bhava_cusps = None
+    
+    return ShadbalaSnapshot(
+        julian_day=jd,
+        latitude=lat,
+        longitude=lon,
+        timezone=timezone,
+        planets=MappingProxyType(dict(planets)),
+        ascendant=asc,
+        bhava_cusps=bhava_cusps,
+        speeds=MappingProxyType({planet: get_cheshta_speed(planet, jd) for planet in PLANET_TO_SE}),
+        day_frame=build_shadbala_day_frame(jd, lat, lon, timezone),
+    )
+
+
+@dataclass(frozen=True)
+class ShadbalaTable:
+    """
+    Columnar Shadbala: one unrounded float64 array per component.
+    
+    Attributes:
+        planets: Row labels (planet names)
+        inputs: 7 × N input matrix (columns = SHADBALA_INPUT_COLUMNS)
+        columns: Component name → array aligned with planets
+    """
+    planets: Tuple[str, ...]
+    inputs: np.ndarray
+    columns: Mapping[str, np.ndarray]
+
+    def column(self, name: str) -> Dict[str, float]:
+        """One component as {planet: value}."""
+        return {planet: float(value) for planet, value in zip(self.planets, self.columns[name])}
+
+
+def build_shadbala_input_matrix(snapshot: ShadbalaSnapshot) -> np.ndarray:
+    """
+    Build the 7 × N Shadbala input matrix (rows = snapshot.shadbala_planets).
     
-    # Get Moon and Sun longitudes for Cheshta Bala
-    moon_longitude = planets.get("Moon", 0.0)
-    sun_longitude = planets.get("Sun", 0.0)
+    Args:
+        snapshot: Shadbala snapshot
     
-    shadbala_results = {}
+    Returns:
+        float64 array with columns SHADBALA_INPUT_COLUMNS
+    """
+    names = snapshot.shadbala_planets
+    longitudes = np.array([snapshot.planets[name] for name in names], dtype=np.float64)
+    speeds = np.array(
+        [np.nan if snapshot.speeds.get(name) is None else snapshot.speeds[name] for name in names],
+        dtype=np.float64
+    )
+    varga_signs = compute_all_varga_arrays(longitudes, SAPTAVARGAS)
+    
+    matrix = np.empty((len(names), len(SHADBALA_INPUT_COLUMNS)), dtype=np.float64)
+    matrix[:, 0] = longitudes
+    matrix[:, 1] = speeds
+    # degrees_to_sign(): normalize_degrees(longitude) % 30
+    matrix[:, 2] = np.remainder(np.remainder(longitudes, 360), 30.0)
+    for offset, v in enumerate(SAPTAVARGAS):
+        matrix[:, 3 + offset] = varga_signs[v][0]
+    return matrix
+
+
+def _batch_uchcha(names: Tuple[str, ...], longitudes: np.ndarray) -> np.ndarray:
+    """Uchcha Bala column (calculate_uchcha_bala)."""
+    deep_debilitation = np.array([DEEP_DEBILITATION_DEGREES[name] for name in names])
+    diff1 = np.abs(np.remainder(longitudes, 360) - deep_debilitation)
+    angular_distance = np.minimum(diff1, 360.0 - diff1)
+    return np.clip(angular_distance / 3.0, 0.0, 60.0)
+
+
+def _batch_ojhayugmarasiamsa(names: Tuple[str, ...], d1_signs: np.ndarray, d9_signs: np.ndarray) -> np.ndarray:
+    """Ojhayugmarasiamsa Bala column (calculate_ojhayugmarasiamsa_bala)."""
+    female = np.array([name in ["Moon", "Venus"] for name in names])
+    d1_odd = (d1_signs % 2 == 0)  # 0,2,4,6,8,10 are odd
+    d9_odd = (d9_signs % 2 == 0)
+    d1_score = np.where(female, ~d1_odd, d1_odd) * 15.0
+    d9_score = np.where(female, ~d9_odd, d9_odd) * 15.0
+    return d1_score + d9_score
+
+
+def _batch_kendradi(longitudes: np.ndarray, ascendant: float) -> np.ndarray:
+    """Kendradi Bala column (calculate_kendradi_bala_whole_sign)."""
+    relative_pos = np.remainder(longitudes - ascendant, 360)
+    house_num = np.floor(relative_pos / 30.0).astype(np.int64) + 1
+    house_num = np.where(house_num > 12, 1, house_num)
+    base_value = np.select(
+        [np.isin(house_num, [1, 4, 7, 10]), np.isin(house_num, [2, 5, 8, 11])],
+        [60.0, 30.0],
+        15.0
+    )
+    return base_value * SHADBALA_CONFIG["KENDRADI_SCALE"]
+
+
+def _batch_drekkana(names: Tuple[str, ...], degrees_in_sign: np.ndarray) -> np.ndarray:
+    """Drekkana Bala column (calculate_drekkana_bala)."""
+    decan = np.minimum(np.floor(degrees_in_sign / 10.0).astype(np.int64), 2)
+    # Male → 1st decan, Female → 2nd decan, Neutral → 3rd decan
+    target = np.array([0 if name in ["Sun", "Mars", "Jupiter"] else (1 if name in ["Moon", "Venus"] else 2) for name in names])
+    return np.where(decan == target, 15.0, 0.0)
+
+
+def _batch_dig(names: Tuple[str, ...], longitudes: np.ndarray, snapshot: ShadbalaSnapshot) -> np.ndarray:
+    """Dig Bala column (calculate_dig_bala with bhava geometry)."""
+    strongest_house = np.array([DIG_BALA_STRONGEST_HOUSE[name] for name in names])
+    if snapshot.bhava_cusps is not None:
+        strongest_degree = np.remainder(np.array(snapshot.bhava_cusps)[strongest_house - 1], 360)
+    else:
+        # Fallback to whole-sign if geometry calculation fails
+        strongest_degree = np.remainder(snapshot.ascendant + (strongest_house - 1) * 30.0, 360)
+    weakest_degree = np.remainder(strongest_degree + 180.0, 360)
+    diff1 = np.abs(np.remainder(longitudes, 360) - weakest_degree)
+    diff = np.minimum(diff1, 360.0 - diff1)
+    dig = (diff / 3.0) * DIGBALA_SCALE
+    # Sun-specific multiplier (x * 1.0 is exact for every other planet)
+    dig = dig * np.array([SHADBALA_CONFIG["DIGBALA_SUN_MULTIPLIER"] if name == "Sun" else 1.0 for name in names])
+    return np.clip(dig, 0.0, 60.0)
+
+
+def _batch_cheshta(names: Tuple[str, ...], speeds: np.ndarray) -> np.ndarray:
+    """Cheshta Bala column (calculate_cheshta_bala)."""
+    constants = np.array([DIRECT_CHESHTA_CONSTANTS.get(name, 0.0) for name in names])
+    luminary = np.array([name in ("Sun", "Moon") for name in names])
+    # NaN speed (unavailable) compares False → direct motion constant
+    cheshta = np.where(speeds < 0, 60.0, constants)
+    return np.where(luminary, 0.0, cheshta)
+
+
+def _batch_drik(targets: np.ndarray, snapshot: ShadbalaSnapshot, names: Tuple[str, ...]) -> np.ndarray:
+    """Drik Bala column before rounding (calculate_drik_bala total_drishti / 4)."""
+    total_drishti = np.zeros(len(targets))
+    MALEFICS = ["Sun", "Mars", "Saturn"]
     
-    # Calculate Shadbala for each planet
-    for planet_name, planet_degree in planets.items():
-        if planet_name in ["Rahu", "Ketu"]:
+    # Accumulate aspecting planets one column at a time (same order as the scalar loop)
+    for aspecting_p, p_long in snapshot.planets.items():
+        if aspecting_p in ["Rahu", "Ketu"]:
             continue
-        
-        # 1. Naisargika Bala (Natural strength)
-        naisargika = NAISARGIKA_BALA.get(planet_name, 0.0)
-        
-        # 2. Cheshta Bala (Motional strength)
-        cheshta = calculate_cheshta_bala(planet_name, jd, moon_longitude, sun_longitude)
-        
-        # 3. Sthana Bala (Positional strength) - with sub-components
-        # Calculate sub-components for breakdown
-        uchcha = calculate_uchcha_bala(planet_name, planet_degree)
-        saptavargaja_raw = calculate_saptavargaja_bala(planet_name, planet_degree, jd, asc)
-        saptavargaja = saptavargaja_raw / SHADBALA_CONFIG["SAPTAVARGAJA_DIVISOR"]
-        ojhayugmarasiamsa = calculate_ojhayugmarasiamsa_bala(planet_name, planet_degree)
-        kendradi = calculate_kendradi_bala_whole_sign(planet_degree, asc)
-        drekkana = calculate_drekkana_bala(planet_name, planet_degree)
-        sthana = calculate_sthana_bala(planet_name, planet_degree, jd, asc, lat, lon)
-        
-        # 4. Dig Bala (Directional strength)
-        dig = calculate_dig_bala(planet_name, planet_degree, asc, jd, lat, lon)
-        
-        # 5. Kala Bala (Temporal strength) - with sub-components
-        nathonnatha = calculate_nathonnatha_bala(planet_name, jd, lat, lon, timezone)
-        paksha = calculate_paksha_bala(planet_name, jd)
-        tribhaga = calculate_tribhaga_bala(planet_name, jd, lat, lon, timezone)
-        varsha = calculate_varsha_bala(planet_name, jd)
-        masa = calculate_masa_bala(planet_name, jd, lat, lon, timezone)
-        dina = calculate_dina_bala(planet_name, jd)
-        # Get sunrise/sunset/next_sunrise JDs and vara lord for Prokerala hora calculation
-        try:
-            sunrise_jd, sunset_jd, next_sunrise_jd = get_sunrise_sunset_jds(jd, lat, lon, timezone)
-            vara_lord = get_vara_lord_from_jd(jd)
-            hora = calculate_hora_bala_prokerala(planet_name, jd, sunrise_jd, sunset_jd, next_sunrise_jd, vara_lord)
-        except Exception:
-            # Fallback to legacy function if calculation fails
-            hora = calculate_hora_bala(planet_name, jd, lat, lon, timezone)
-        ayana = calculate_ayana_bala(planet_name, jd)
-        kala = calculate_kala_bala(planet_name, planet_degree, jd, lat, lon, timezone, planets, asc)
-        
-        # 6. Drik Bala (Aspectual strength)
-        drik = calculate_drik_bala(planet_name, planet_degree, planets, planet_signs)
-        
-        # Total Shadbala (in Virupas)
-        total_virupas = naisargika + cheshta + sthana + dig + kala + drik
-        
-        # Shadbala in Rupas (Virupas / 60)
-        rupas = total_virupas / 60.0
-        
-        # Minimum Requirement
-        minimum = MINIMUM_REQUIREMENT.get(planet_name, 0.0)
-        
-        # Ratio (Total Virupas / Minimum Virupas)
-        ratio = total_virupas / minimum if minimum > 0 else 0.0
-        
-        # Calculate BPHS-derived status
-        status = calculate_bphs_status(ratio)
+        sep = np.remainder(targets - p_long, 360.0)
+        sep = np.where(sep > 180, 360.0 - sep, sep)
+        val = np.select(
+            [
+                (30 <= sep) & (sep <= 60),
+                (60 < sep) & (sep <= 90),
+                (90 < sep) & (sep <= 120),
+                (120 < sep) & (sep <= 150),
+                (150 < sep) & (sep <= 180),
+            ],
+            [
+                (sep - 30) * 0.25,
+                15 + (sep - 60) * 0.75,
+                45 + (sep - 90) * 0.50,
+                60 - (sep - 120) * 1.0,
+                (sep - 150) * 2.0,
+            ],
+            0.0
+        )
+        multiplier = -1 if aspecting_p in MALEFICS else 1
+        contributes = (np.array([name != aspecting_p for name in names])) & (sep >= 30) & (sep <= 180)
+        total_drishti = np.where(contributes, total_drishti + (val * multiplier), total_drishti)
+    
+    return total_drishti / 4.0
+
+
+def calculate_shadbala_batch(snapshot: ShadbalaSnapshot) -> ShadbalaTable:
+    """
+    Calculate all six balas for all seven planets as columns.
+    
+    Args:
+        snapshot: Shadbala snapshot (build_shadbala_snapshot)
+    
+    Returns:
+        ShadbalaTable with unrounded component arrays
+    """
+    names = snapshot.shadbala_planets
+    jd, lat, lon, timezone = snapshot.julian_day, snapshot.latitude, snapshot.longitude, snapshot.timezone
+    day_frame = snapshot.day_frame
+    asc = snapshot.ascendant
+    
+    inputs = build_shadbala_input_matrix(snapshot)
+    longitudes = inputs[:, 0]
+    signs = inputs[:, 3:].astype(np.int64)
+    
+    # 1. Naisargika Bala
+    naisargika = np.array([NAISARGIKA_BALA.get(name, 0.0) for name in names])
+    
+    # 2. Cheshta Bala
+    cheshta = _batch_cheshta(names, inputs[:, 1])
+    
+    # 3. Sthana Bala - Saptavargaja uses the Saptavarga signs of all 7 lords
+    lord_signs = {name: tuple(int(sign) for sign in signs[row]) for row, name in enumerate(names)}
+    for name, longitude in snapshot.planets.items():
+        if name not in lord_signs:
+            lord_signs[name] = get_saptavarga_signs(longitude)
+    uchcha = _batch_uchcha(names, longitudes)
+    saptavargaja = np.array([
+        _saptavargaja_from_signs(name, lord_signs[name], lord_signs) for name in names
+    ]) / SHADBALA_CONFIG["SAPTAVARGAJA_DIVISOR"]
+    ojhayugmarasiamsa = _batch_ojhayugmarasiamsa(names, signs[:, SAPTAVARGAS.index(1)], signs[:, SAPTAVARGAS.index(9)])
+    kendradi = _batch_kendradi(longitudes, asc)
+    drekkana = _batch_drekkana(names, inputs[:, 2])
+    sthana = uchcha + saptavargaja + ojhayugmarasiamsa + kendradi + drekkana
+    
+    # 4. Dig Bala
+    dig = _batch_dig(names, longitudes, snapshot)
+    
+    # 5. Kala Bala - calendar sub-components come from the shared day frame
+    kala_components = {
+        key: np.array([fn(name) for name in names])
+        for key, fn in (
+            ("nathonnatha_bala", lambda p: calculate_nathonnatha_bala(p, jd, lat, lon, timezone, day_frame)),
+            ("paksha_bala", lambda p: calculate_paksha_bala(p, jd, day_frame)),
+            ("tribhaga_bala", lambda p: calculate_tribhaga_bala(p, jd, lat, lon, timezone, day_frame)),
+            ("varsha_bala", lambda p: calculate_varsha_bala(p, jd)),
+            ("masa_bala", lambda p: calculate_masa_bala(p, jd, lat, lon, timezone, day_frame)),
+            ("dina_bala", lambda p: calculate_dina_bala(p, jd)),
+            ("hora_bala", lambda p: calculate_hora_bala_for_chart(p, jd, lat, lon, timezone, day_frame)),
+            ("ayana_bala", lambda p: calculate_ayana_bala(p, jd, day_frame)),
+        )
+    }
+    all_planets = dict(snapshot.planets)
+    yuddha = np.array([
+        calculate_yuddha_bala(name, all_planets[name], all_planets, jd, lat, lon, asc, timezone, day_frame)
+        for name in names
+    ])
+    kala = (
+        kala_components["nathonnatha_bala"] + kala_components["paksha_bala"] + kala_components["tribhaga_bala"]
+        + kala_components["varsha_bala"] + kala_components["masa_bala"] + kala_components["dina_bala"]
+        + kala_components["hora_bala"] + kala_components["ayana_bala"] + yuddha
+    )
+    
+    # 6. Drik Bala (rounded like calculate_drik_bala - the total uses the rounded value)
+    drik = np.array([round(float(value), 2) for value in _batch_drik(longitudes, snapshot, names)])
+    
+    # Totals
+    total_virupas = naisargika + cheshta + sthana + dig + kala + drik
+    minimum = np.array([MINIMUM_REQUIREMENT.get(name, 0.0) for name in names])
+    ratio = np.divide(total_virupas, minimum, out=np.zeros_like(total_virupas), where=minimum > 0)
+    
+    columns = {
+        "naisargika_bala": naisargika,
+        "cheshta_bala": cheshta,
+        "uchcha_bala": uchcha,
+        "saptavargaja_bala": saptavargaja,
+        "ojhayugmarasiamsa_bala": ojhayugmarasiamsa,
+        "kendradi_bala": kendradi,
+        "drekkana_bala": drekkana,
+        "sthana_bala": sthana,
+        "dig_bala": dig,
+        **kala_components,
+        "yuddha_bala": yuddha,
+        "kala_bala": kala,
+        "drik_bala": drik,
+        "total_shadbala": total_virupas,
+        "shadbala_in_rupas": total_virupas / 60.0,
+        "minimum_requirement": minimum,
+        "ratio": ratio,
+    }
+    for column in columns.values():
+        column.setflags(write=False)
+    inputs.setflags(write=False)
+    
+    return ShadbalaTable(planets=names, inputs=inputs, columns=MappingProxyType(columns))
+
+
+def shadbala_table_to_dict(table: ShadbalaTable) -> Dict:
+    """
+    Convert a ShadbalaTable to the calculate_shadbala() response format.
+    
+    Args:
+        table: Columnar Shadbala
+    
+    Returns:
+        Dictionary with complete Shadbala for each planet including all sub-components
+    """
+    def _value(name: str, row: int) -> float:
+        # Round Python floats (np.round differs from round())
+        return round(float(table.columns[name][row]), 2)
+    
+    shadbala_results = {}
+    for row, planet_name in enumerate(table.planets):
+        ratio = float(table.columns["ratio"][row])
+        drik = float(table.columns["drik_bala"][row])
         
         # Calculate Ishta Phala and Kashta Phala
         # Ishta Phala = benefic strength, Kashta Phala = malefic strength
@@ -1856,34 +2431,35 @@ def calculate_shadbala(
         kashta_phala = abs(min(0.0, drik))  # Negative Drik Bala
         
         shadbala_results[planet_name] = {
-            "naisargika_bala": round(naisargika, 2),
-            "cheshta_bala": round(cheshta, 2),
-            "sthana_bala": round(sthana, 2),
+            "naisargika_bala": _value("naisargika_bala", row),
+            "cheshta_bala": _value("cheshta_bala", row),
+            "sthana_bala": _value("sthana_bala", row),
             "sthana_bala_components": {
-                "uchcha_bala": round(uchcha, 2),
-                "saptavargaja_bala": round(saptavargaja, 2),
-                "ojhayugmarasiamsa_bala": round(ojhayugmarasiamsa, 2),
-                "kendradi_bala": round(kendradi, 2),
-                "drekkana_bala": round(drekkana, 2)
+                "uchcha_bala": _value("uchcha_bala", row),
+                "saptavargaja_bala": _value("saptavargaja_bala", row),
+                "ojhayugmarasiamsa_bala": _value("ojhayugmarasiamsa_bala", row),
+                "kendradi_bala": _value("kendradi_bala", row),
+                "drekkana_bala": _value("drekkana_bala", row)
             },
-            "dig_bala": round(dig, 2),
-            "kala_bala": round(kala, 2),
+            "dig_bala": _value("dig_bala", row),
+            "kala_bala": _value("kala_bala", row),
             "kala_bala_components": {
-                "nathonnatha_bala": round(nathonnatha, 2),
-                "paksha_bala": round(paksha, 2),
-                "tribhaga_bala": round(tribhaga, 2),
-                "varsha_bala": round(varsha, 2),
-                "masa_bala": round(masa, 2),
-                "dina_bala": round(dina, 2),
-                "hora_bala": round(hora, 2),
-                "ayana_bala": round(ayana, 2)
+                "nathonnatha_bala": _value("nathonnatha_bala", row),
+                "paksha_bala": _value("paksha_bala", row),
+                "tribhaga_bala": _value("tribhaga_bala", row),
+                "varsha_bala": _value("varsha_bala", row),
+                "masa_bala": _value("masa_bala", row),
+                "dina_bala": _value("dina_bala", row),
+                "hora_bala": _value("hora_bala", row),
+                "ayana_bala": _value("ayana_bala", row)
             },
             "drik_bala": round(drik, 2),
-            "total_shadbala": round(total_virupas, 2),
-            "shadbala_in_rupas": round(rupas, 2),
-            "minimum_requirement": round(minimum, 2),
+            "total_shadbala": _value("total_shadbala", row),
+            "shadbala_in_rupas": _value("shadbala_in_rupas", row),
+            "minimum_requirement": _value("minimum_requirement", row),
             "ratio": round(ratio, 2),
-            "status": status,
+            # Calculate BPHS-derived status
+            "status": calculate_bphs_status(ratio),
             "ishta_phala": round(ishta_phala, 2),
             "kashta_phala": round(kashta_phala, 2)
         }
@@ -1901,6 +2477,34 @@ def calculate_shadbala(
     return shadbala_results
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# MAIN SHADBALA CALCULATION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def calculate_shadbala(
+    jd: float,
+    lat: float,
+    lon: float,
+    timezone: str = "Asia/Kolkata"
+) -> Dict:
+    """
+    Calculate complete BPHS Shadbala (Six-fold Strength) for all planets.
+    
+    This is the main Shadbala calculation function following BPHS formulas exactly.
+    All planets are computed together by calculate_shadbala_batch().
+    
+    Args:
+        jd: Julian Day Number
+        lat: Geographic latitude
+        lon: Geographic longitude
+    
+    Returns:
+        Dictionary with complete Shadbala for each planet including all sub-components
+    """
+    snapshot = build_shadbala_snapshot(jd, lat, lon, timezone)
+    return shadbala_table_to_dict(calculate_shadbala_batch(snapshot))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # DEBUG FUNCTION - FOUNDATION VERIFICATION MODE
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1925,7 +2529,7 @@ def debug_raw_shadbala_inputs(date: str, time: str, lat: float, lon: float, time
     print()
     
     # FORCE Lahiri Ayanamsa (Chitra Paksha) explicitly
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     
     # A. TIME & ASTRONOMY BASE
     print("### A. TIME & ASTRONOMY BASE")
@@ -1957,8 +2561,8 @@ def debug_raw_shadbala_inputs(date: str, time: str, lat: float, lon: float, time
     # CRITICAL: Use get_ayanamsa_ut() with UTC JD + manual 5 arc-second correction
     # Prokerala uses True Lahiri (Chitra Paksha) with specific Delta-T handling
     # The 5" gap is due to Delta-T table differences - apply manual correction
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-    ayanamsa_raw = swe.get_ayanamsa_ut(jd)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa_raw = swe_context.get_ayanamsa_ut(jd)
     # Manual 5 arc-second correction to match Prokerala/Drik standard
     correction = 5.0 / 3600.0  # 5 arc-seconds to degrees
     ayanamsa = ayanamsa_raw + correction
@@ -1986,14 +2590,13 @@ def debug_raw_shadbala_inputs(date: str, time: str, lat: float, lon: float, time
         date_local = dt.astimezone(tz)
     
     jd_utc = swe.julday(date_local.year, date_local.month, date_local.day, 0.0, swe.GREG_CAL)
-    swe.set_topo(lon, lat, 0.0)
     geopos = [lon, lat, 0.0]
     atpress = 0.0
     attemp = 0.0
     flags = swe.BIT_DISC_CENTER | swe.FLG_SWIEPH | swe.FLG_TOPOCTR
     
-    result_rise = swe.rise_trans(jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
-    result_set = swe.rise_trans(jd_utc, swe.SUN, swe.CALC_SET, geopos, atpress, attemp, flags)
+    result_rise = swe_context.rise_trans(jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
+    result_set = swe_context.rise_trans(jd_utc, swe.SUN, swe.CALC_SET, geopos, atpress, attemp, flags)
     
     if result_rise[0] >= 0 and result_set[0] >= 0:
         sunrise_jd_astronomical = result_rise[1][0]
@@ -2058,7 +2661,7 @@ def debug_raw_shadbala_inputs(date: str, time: str, lat: float, lon: float, time
     from datetime import timedelta
     next_date_local = date_local + timedelta(days=1)
     next_jd_utc = swe.julday(next_date_local.year, next_date_local.month, next_date_local.day, 0.0, swe.GREG_CAL)
-    result_next_rise = swe.rise_trans(next_jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
+    result_next_rise = swe_context.rise_trans(next_jd_utc, swe.SUN, swe.CALC_RISE, geopos, atpress, attemp, flags)
     
     if result_next_rise[0] >= 0:
         next_sunrise_jd_astronomical = result_next_rise[1][0]
@@ -2264,7 +2867,7 @@ def debug_raw_shadbala_inputs(date: str, time: str, lat: float, lon: float, time
     for planet_name in planet_order:
         if planet_name in PLANET_TO_SE_DEBUG:
             planet_num = PLANET_TO_SE_DEBUG[planet_name]
-            result = swe.calc_ut(jd, planet_num, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            result = swe_context.calc(jd, planet_num, swe.FLG_SWIEPH | swe.FLG_SPEED)
             
             if result and len(result) > 0 and result[0] and len(result[0]) > 3:
                 # 20. Speed (deg/day)
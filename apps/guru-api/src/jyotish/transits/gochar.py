@@ -5,7 +5,7 @@ This module calculates planetary transits and their effects on houses.
 """
 
 from math import floor
-from typing import Dict, List
+from typing import Dict, List, Optional
 from src.jyotish.kundli_engine import get_planet_positions
 from src.ephemeris.ephemeris_utils import get_ascendant, get_ayanamsa
 from src.jyotish.transits.aspects import get_planet_aspects, calculate_aspect_strength
@@ -38,7 +38,7 @@ def calculate_transit_house(planet_degree: float, ascendant_degree: float) -> in
     return house
 
 
-def get_transits(jd: float, lat: float, lon: float) -> Dict:
+def get_transits(jd: float, lat: float, lon: float, planets: Optional[Dict[str, float]] = None) -> Dict:
     """
     Phase 7: Calculate all planetary transits (Gochar).
     
@@ -52,6 +52,7 @@ def get_transits(jd: float, lat: float, lon: float) -> Dict:
         jd: Julian Day Number (for current date/time)
         lat: Geographic latitude
         lon: Geographic longitude
+        planets: get_planet_positions(jd), if already computed
     
     Returns:
         Complete transit data dictionary
@@ -62,7 +63,8 @@ def get_transits(jd: float, lat: float, lon: float) -> Dict:
     asc_sidereal = normalize_degrees(asc_tropical - ayanamsa)
     
     # Get planet positions (sidereal)
-    planets = get_planet_positions(jd)
+    if planets is None:
+        planets = get_planet_positions(jd)
     
     transits = {}
     
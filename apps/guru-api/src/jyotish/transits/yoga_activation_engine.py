@@ -20,10 +20,14 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import swisseph as swe
 
+from src.ephemeris import context as swe_context
 from src.jyotish.yogas.yoga_engine import detect_all_yogas, YOGA_LEAD_RULES
 from src.jyotish.dasha.vimshottari_engine import calculate_vimshottari_dasha
+from src.jyotish.dasha.timeline import get_vimshottari_timeline_for_birth
 from src.jyotish.transits.gochar import get_transits
 from src.jyotish.kundli_engine import get_planet_positions as _get_planet_positions
+from src.ephemeris.transit_events import find_transit_events
+from src.jyotish.panchanga.panchanga_engine import _jd_to_datetime
 from src.jyotish.strength.ashtakavarga import (
     calculate_bhinnashtakavarga,
     PLANETS as BAV_PLANETS,
@@ -139,33 +143,19 @@ def _find_sign_ingresses(
     step_days: int,
 ) -> List[Tuple[datetime, int]]:
     """
-    Find approximate sign-ingress dates for a planet in [start_dt, end_dt].
+    Find sign-ingress dates for a planet in [start_dt, end_dt].
     Returns list of (datetime, sign_index) at each sign change. Ingress-based scanning.
+    Exact ingress times from the transit event index (rounded up to the minute, so the
+    planet is already in the new sign); step_days, lat and lon are no longer needed.
     """
     out: List[Tuple[datetime, int]] = []
     try:
-        current = start_dt
-        jd_prev = get_julian_day(local_to_utc(current.replace(tzinfo=None), timezone))
-        transits_prev = get_transits(jd_prev, lat, lon).get("transits") or {}
-        sign_prev = transits_prev.get(planet_name, {}).get("sign")
-        if sign_prev is None:
-            return out
-        if isinstance(sign_prev, dict):
-            sign_prev = sign_prev.get("sign_index", sign_prev.get("sign", 0))
-        sign_prev = int(sign_prev)
-        while current <= end_dt:
-            current = current + timedelta(days=step_days)
-            jd = get_julian_day(local_to_utc(current.replace(tzinfo=None), timezone))
-            transits = get_transits(jd, lat, lon).get("transits") or {}
-            t_sign = transits.get(planet_name, {}).get("sign")
-            if t_sign is None:
-                continue
-            if isinstance(t_sign, dict):
-                t_sign = t_sign.get("sign_index", t_sign.get("sign", 0))
-            t_sign = int(t_sign)
-            if t_sign != sign_prev:
-                out.append((current, t_sign))
-                sign_prev = t_sign
+        jd_start = get_julian_day(local_to_utc(start_dt.replace(tzinfo=None), timezone))
+        jd_end = get_julian_day(local_to_utc(end_dt.replace(tzinfo=None), timezone))
+        for event in find_transit_events(jd_start, jd_end, (planet_name,), kinds=("sign",)):
+            local_dt = _jd_to_datetime(event.jd, timezone).replace(tzinfo=None)
+            local_dt = local_dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+            out.append((local_dt.replace(tzinfo=start_dt.tzinfo), event.to_index))
     except Exception:
         pass
     return out
@@ -186,7 +176,7 @@ def _get_bindu_at_transit(
         return None
     try:
         asc_tropical = get_ascendant(transit_jd, lat, lon)
-        ayanamsa = swe.get_ayanamsa_ut(transit_jd)
+        ayanamsa = swe_context.get_ayanamsa_ut(transit_jd)
         asc_sidereal = normalize_degrees(asc_tropical - ayanamsa)
         houses_list = get_houses(transit_jd, lat, lon)
         houses_sidereal = [normalize_degrees(h - ayanamsa) for h in houses_list]
@@ -347,30 +337,20 @@ def evaluate_transit_activation_forecast(
     for plist in yoga_participants.values():
         participants_set.update(plist)
 
-    dasha = calculate_vimshottari_dasha(dob, time, lat, lon, timezone, calculation_date=today)
-    mahadashas = dasha.get("mahadashas") or []
-    antardashas_dict = dasha.get("antardashas") or {}
+    try:
+        timeline = get_vimshottari_timeline_for_birth(dob, time, timezone)
+    except Exception:
+        return []
     windows: List[Tuple[datetime, datetime, str, str]] = []
-    for m in mahadashas:
-        ms = datetime.fromisoformat(m["start"].replace("Z", "+00:00"))
-        me = datetime.fromisoformat(m["end"].replace("Z", "+00:00"))
-        if me < today or ms > end_date:
+    # MD-AD periods overlapping [today, end_date] (range query on the memoized tree)
+    for period in timeline.periods_between(today, end_date, depth=2):
+        md_lord, ad_lord = period.lords
+        if md_lord not in participants_set or ad_lord not in participants_set:
             continue
-        md_lord = m["planet"]
-        if md_lord not in participants_set:
-            continue
-        for ad in antardashas_dict.get(md_lord, []):
-            astart = datetime.fromisoformat(ad["start"].replace("Z", "+00:00"))
-            aend = datetime.fromisoformat(ad["end"].replace("Z", "+00:00"))
-            if aend < today or astart > end_date:
-                continue
-            ad_lord = ad["planet"]
-            if ad_lord not in participants_set:
-                continue
-            w_start = max(astart, today)
-            w_end = min(aend, end_date)
-            if w_start < w_end:
-                windows.append((w_start, w_end, md_lord, ad_lord))
+        w_start = max(period.start, today)
+        w_end = min(period.end, end_date)
+        if w_start < w_end:
+            windows.append((w_start, w_end, md_lord, ad_lord))
 
     forecast: List[Dict] = []
     seen: set = set()
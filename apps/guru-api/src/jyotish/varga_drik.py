@@ -100,6 +100,9 @@ import swisseph as swe
 import math
 from typing import Dict, Optional
 from src.utils.converters import normalize_degrees, get_sign_name
+from src.utils.log import get_logger, trace
+
+logger = get_logger("varga")
 
 
 def calculate_varga_sign(sign_index: int, long_in_sign: float, varga: str, chart_method: Optional[int] = None) -> int:
@@ -626,14 +629,10 @@ def calculate_varga(planet_longitude: float, varga_type: int, chart_method: Opti
     """
     # 🔍 STEP 1D: VALUES RECEIVED BY calculate_varga() (D4 ONLY)
     if varga_type == 4 and is_ascendant:
-        print("=" * 80)
-        print("🔍 STEP 1D: VALUES RECEIVED BY calculate_varga() (varga_drik.py - D4 Ascendant)")
-        print("=" * 80)
-        print(f"planet_longitude at function entry (BEFORE normalize_degrees) = {planet_longitude}")
+        trace(logger, "STEP 1D: calculate_varga() D4 Ascendant received planet_longitude=%s", planet_longitude)
         # 🔒 INVARIANT CHECK: planet_longitude must equal d1_ascendant from build_varga_chart
         assert isinstance(planet_longitude, float), f"planet_longitude must be float, got {type(planet_longitude)}"
         assert 0 <= planet_longitude < 360, f"planet_longitude out of range: {planet_longitude}"
-        print("=" * 80)
     
     # 🔒 SURGICAL FIX: Calculate degrees_in_sign directly from raw planet_longitude
     # This ensures maximum precision - no intermediate normalization steps
@@ -648,16 +647,13 @@ def calculate_varga(planet_longitude: float, varga_type: int, chart_method: Opti
     
     # 🔍 STEP 1E: VALUES INSIDE calculate_varga() FOR D4 (D4 ONLY)
     if varga_type == 4 and is_ascendant:
-        print("=" * 80)
-        print("🔍 STEP 1E: VALUES INSIDE calculate_varga() FOR D4 (varga_drik.py - D4 Ascendant)")
-        print("=" * 80)
-        print(f"longitude (AFTER normalize_degrees) = {longitude}")
-        print(f"sign_num = {sign_num}")
-        print(f"degrees_in_sign = {degrees_in_sign}")
+        trace(
+            logger, "STEP 1E: calculate_varga() D4 Ascendant longitude=%s sign_num=%s degrees_in_sign=%s",
+            longitude, sign_num, degrees_in_sign,
+        )
         # 🔒 INVARIANT CHECK: degrees_in_sign must match D1 degrees_in_sign
         expected_deg_in_sign = planet_longitude % 30.0
         assert abs(degrees_in_sign - expected_deg_in_sign) < 1e-10, f"degrees_in_sign mismatch: {degrees_in_sign} != {expected_deg_in_sign} (from {planet_longitude})"
-        print("=" * 80)
     
     if varga_type == 1:
         # D1 = Rashi (main chart) - no transformation
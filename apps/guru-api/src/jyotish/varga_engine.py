@@ -22,12 +22,17 @@ All varga computation MUST go through this engine.
 """
 
 import math
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+import numpy as np
 from src.jyotish.varga_drik import calculate_varga as _calculate_varga_internal
+from src.jyotish.varga_vectorized import SUPPORTED_VARGAS, compute_all_varga_arrays
 from src.utils.converters import normalize_degrees, get_sign_name
+from src.utils.log import get_logger, trace, tracing
 
-# 🔥 STEP 4: HARD FAIL TEST - Module loading verification
-print("🔥 varga_engine loaded", __file__, flush=True)
+logger = get_logger("varga")
+
+# 🔥 STEP 4: Module loading verification
+trace(logger, "varga_engine loaded: %s", __file__)
 
 # 🔒 STEP 1: SINGLE SOURCE OF TRUTH - TOP LEVEL DEFINITION ONLY
 # This function MUST exist at module top-level, immediately after imports
@@ -111,15 +116,10 @@ def build_varga_chart(
     try:
         # 🔍 STEP 1C CONTINUED: VALUES RECEIVED BY build_varga_chart()
         if varga_type == 4:
-            print("=" * 80)
-            print("🔍 STEP 1C CONTINUED: VALUES RECEIVED BY build_varga_chart() (varga_engine.py)")
-            print("=" * 80)
-            print(f"d1_ascendant received = {d1_ascendant}")
-            print(f"varga_type = {varga_type}")
+            trace(logger, "STEP 1C continued: build_varga_chart() received d1_ascendant=%s varga_type=%s", d1_ascendant, varga_type)
             # 🔒 INVARIANT CHECK: d1_ascendant unchanged from API extraction
             assert isinstance(d1_ascendant, float), f"d1_ascendant must be float, got {type(d1_ascendant)}"
             assert 0 <= d1_ascendant < 360, f"d1_ascendant out of range: {d1_ascendant}"
-            print("=" * 80)
         
         # Calculate varga ascendant
         # NOTE: D24 is locked to method 1, chart_method parameter is ignored for D24
@@ -153,14 +153,9 @@ def build_varga_chart(
         
         # 🔒 D4 VERIFICATION LOG (MANDATORY) - Initialize table header
         if varga_type == 4:
-            print("=" * 80)
-            print("🔒 D4 VERIFICATION TABLE")
-            print("=" * 80)
-            print(f"{'Planet':<12} | {'Longitude':<12} | {'D4 Sign':<12} | {'D4 House':<12}")
-            print("-" * 80)
             # Log Ascendant first
             d4_asc_sign_name = get_sign_name(varga_asc_sign_index)
-            print(f"{'Ascendant':<12} | {d1_ascendant:>11.6f}° | {d4_asc_sign_name:<12} | {1:<12}")
+            trace(logger, "D4 verification: %-12s | %11.6f° | %-12s | %s", "Ascendant", d1_ascendant, d4_asc_sign_name, 1)
             
             # 🔍 STEP 2: VERIFY INVARIANTS - Moon vs Ascendant comparison
             if "Moon" in d1_planets:
@@ -168,15 +163,13 @@ def build_varga_chart(
                 moon_varga_data = _calculate_varga_internal(moon_d1_longitude, varga_type, chart_method=chart_method if varga_type != 24 else None)
                 moon_d4_sign = _normalize_sign_index(moon_varga_data["sign"])
                 moon_d4_sign_name = get_sign_name(moon_d4_sign)
-                print("=" * 80)
-                print("🔍 STEP 2: VERIFY INVARIANTS - Moon vs Ascendant D4 Comparison")
-                print("=" * 80)
-                print(f"Moon D1 longitude = {moon_d1_longitude}")
-                print(f"Moon D4 sign = {moon_d4_sign} ({moon_d4_sign_name})")
-                print(f"Moon D4 degrees_in_sign = {moon_varga_data.get('degrees_in_sign')}")
-                print(f"Ascendant D1 longitude = {d1_ascendant}")
-                print(f"Ascendant D4 sign = {varga_asc_sign_index} ({d4_asc_sign_name})")
-                print(f"Ascendant D4 degrees_in_sign = {varga_asc_data.get('degrees_in_sign')}")
+                trace(
+                    logger,
+                    "STEP 2: Moon vs Ascendant D4: Moon D1=%s D4 sign=%s (%s) degrees_in_sign=%s; "
+                    "Ascendant D1=%s D4 sign=%s (%s) degrees_in_sign=%s",
+                    moon_d1_longitude, moon_d4_sign, moon_d4_sign_name, moon_varga_data.get("degrees_in_sign"),
+                    d1_ascendant, varga_asc_sign_index, d4_asc_sign_name, varga_asc_data.get("degrees_in_sign"),
+                )
                 # 🔒 INVARIANT CHECK: Ascendant and Moon follow identical math path
                 # Both should use same calculate_varga() function
                 assert "longitude" in moon_varga_data, "Moon D4 missing longitude"
@@ -195,7 +188,6 @@ def build_varga_chart(
                     d1_asc_deg_in_sign += 30.0
                 assert abs(varga_asc_data["degrees_in_sign"] - d1_asc_deg_in_sign) < 1e-10, \
                     f"Ascendant D4 degrees_in_sign must equal D1 degrees_in_sign ({d1_asc_deg_in_sign}), got {varga_asc_data['degrees_in_sign']}"
-                print("=" * 80)
         
         # For D24-D60: NO HOUSE CALCULATION (pure sign charts)
         # For D1-D20: Calculate house using Whole Sign system
@@ -319,19 +311,16 @@ def build_varga_chart(
                 planet_response["house"] = varga_house
             
             # 🔒 D4 VERIFICATION LOG (MANDATORY) - Log each planet
-            if varga_type == 4:
-                d4_sign_name = get_sign_name(varga_sign_index)
-                print(f"{planet_name:<12} | {d1_longitude:>11.6f}° | {d4_sign_name:<12} | {varga_house:<12}")
+            if varga_type == 4 and tracing(logger):
+                trace(
+                    logger, "D4 verification: %-12s | %11.6f° | %-12s | %s",
+                    planet_name, d1_longitude, get_sign_name(varga_sign_index), varga_house,
+                )
             
             result["planets"][planet_name] = planet_response
         
         # 🔒 D4 VERIFICATION LOG (MANDATORY) - Close table
         if varga_type == 4:
-            print("-" * 80)
-            print("🔒 VERIFICATION: Compare above table line-by-line with Prokerala D4")
-            print("If ANY mismatch → BUG IS IN MATH, NOT UI")
-            print("=" * 80)
-            
             # 🔒 MANDATORY D4 COMPLETENESS CHECK: Ensure result is complete before returning
             if not result or "ascendant" not in result:
                 raise ValueError(f"D4 result missing ascendant: {result}")
@@ -347,9 +336,6 @@ def build_varga_chart(
                 raise ValueError(f"D4 planets count mismatch: expected {len(d1_planets)} planets, got {len(result['planets'])}. Missing: {set(d1_planets.keys()) - set(result['planets'].keys())}")
         
         # Debug logging for validation (1995-05-16 18:38 Bangalore test case)
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # For D24-D60: Log full_longitude, varga_longitude, varga_sign (NO HOUSE - pure sign charts)
         if varga_type in (24, 27, 30, 40, 45, 60):
             # Log Ascendant
@@ -367,7 +353,10 @@ def build_varga_chart(
             # Use normalized sign_index from result (already normalized above)
             assert asc_varga_sign == result['ascendant']['sign_index'], \
                 f"Debug log sign mismatch: calculated={asc_varga_sign}, result={result['ascendant']['sign_index']}"
-            logger.info(f"🔍 D{varga_type} DEBUG (Ascendant): full_longitude={asc_full_longitude:.6f}°, varga_longitude={asc_varga_longitude:.6f}°, varga_sign={asc_varga_sign} ({result['ascendant']['sign']}) [PURE SIGN CHART - NO HOUSE]")
+            trace(
+                logger, "D%s (Ascendant): full_longitude=%.6f°, varga_longitude=%.6f°, varga_sign=%s (%s) [pure sign chart]",
+                varga_type, asc_full_longitude, asc_varga_longitude, asc_varga_sign, result["ascendant"]["sign"],
+            )
             
             # Log Sun
             if "Sun" in d1_planets:
@@ -379,7 +368,10 @@ def build_varga_chart(
                 # Use normalized sign_index from result (already normalized above)
                 assert sun_varga_sign == result["planets"]["Sun"]["sign_index"], \
                     f"Debug log sign mismatch: calculated={sun_varga_sign}, result={result['planets']['Sun']['sign_index']}"
-                logger.info(f"🔍 D{varga_type} DEBUG (Sun): full_longitude={sun_full_longitude:.6f}°, varga_longitude={sun_varga_longitude:.6f}°, varga_sign={sun_varga_sign} ({result['planets']['Sun']['sign']}) [PURE SIGN CHART - NO HOUSE]")
+                trace(
+                    logger, "D%s (Sun): full_longitude=%.6f°, varga_longitude=%.6f°, varga_sign=%s (%s) [pure sign chart]",
+                    varga_type, sun_full_longitude, sun_varga_longitude, sun_varga_sign, result["planets"]["Sun"]["sign"],
+                )
             
             # Log Moon
             if "Moon" in d1_planets:
@@ -391,14 +383,18 @@ def build_varga_chart(
                 # Use normalized sign_index from result (already normalized above)
                 assert moon_varga_sign == result["planets"]["Moon"]["sign_index"], \
                     f"Debug log sign mismatch: calculated={moon_varga_sign}, result={result['planets']['Moon']['sign_index']}"
-                logger.info(f"🔍 D{varga_type} DEBUG (Moon): full_longitude={moon_full_longitude:.6f}°, varga_longitude={moon_varga_longitude:.6f}°, varga_sign={moon_varga_sign} ({result['planets']['Moon']['sign']}) [PURE SIGN CHART - NO HOUSE]")
+                trace(
+                    logger, "D%s (Moon): full_longitude=%.6f°, varga_longitude=%.6f°, varga_sign=%s (%s) [pure sign chart]",
+                    varga_type, moon_full_longitude, moon_varga_longitude, moon_varga_sign, result["planets"]["Moon"]["sign"],
+                )
         else:
             # For D1-D20: Log raw varga sign outputs for verification
-            logger.info(f"🔍 D{varga_type} RAW VARGA SIGNS:")
-            logger.info(f"   Ascendant: sign_index={result['ascendant']['sign_index']}, sign={result['ascendant']['sign']}, house={result['ascendant']['house']}")
-            for planet_name in sorted(result["planets"].keys()):
-                planet_data = result["planets"][planet_name]
-                logger.info(f"   {planet_name}: sign_index={planet_data['sign_index']}, sign={planet_data['sign']}, house={planet_data['house']}")
+            if tracing(logger):
+                for planet_name, point in [("Ascendant", result["ascendant"])] + sorted(result["planets"].items()):
+                    trace(
+                        logger, "D%s raw varga sign: %s sign_index=%s, sign=%s, house=%s",
+                        varga_type, planet_name, point["sign_index"], point["sign"], point["house"],
+                    )
         
         # RUNTIME ASSERTION: Verify all planets have valid houses (1-12) - ONLY for D1-D20
         if varga_type not in (24, 27, 30, 40, 45, 60):
@@ -445,6 +441,83 @@ def build_all_varga_charts(
     return results
 
 
+def _varga_point_response(varga_longitude: float, sign_index: int, degrees_in_sign: float) -> Dict:
+    """Build one ascendant/planet entry exactly as build_varga_chart() does."""
+    # 🔒 DO NOT MODIFY — JHora compatible (same DMS math as build_varga_chart)
+    dms_degrees = int(math.floor(degrees_in_sign))
+    dms_minutes_float = (degrees_in_sign - dms_degrees) * 60.0
+    dms_minutes = int(math.floor(dms_minutes_float))
+    dms_seconds = int(math.floor((dms_minutes_float - dms_minutes) * 60.0))
+    return {
+        "degree": round(varga_longitude, 4),
+        "sign": get_sign_name(sign_index),
+        "sign_index": sign_index,
+        "degrees_in_sign": round(degrees_in_sign, 4),
+        "degree_dms": dms_degrees,
+        "arcminutes": dms_minutes,
+        "arcseconds": dms_seconds,
+        "degree_formatted": f"{dms_degrees}° {dms_minutes:02d}′ {dms_seconds:02d}″"
+    }
+
+
+def build_all_varga_charts_vectorized(
+    d1_planets: Dict[str, float],
+    d1_ascendant: float,
+    varga_types: Sequence[int] = SUPPORTED_VARGAS
+) -> Dict[int, Dict]:
+    """
+    Build all varga charts for all grahas + lagna in ONE NumPy pass.
+    
+    Output is bit-identical to calling build_varga_chart() once per varga
+    (locked by tests/test_varga_vectorized.py), without per-planet
+    calculate_varga() calls or per-chart debug recomputation.
+    
+    Args:
+        d1_planets: Dictionary of {planet_name: D1_longitude} (RAW, unrounded)
+        d1_ascendant: D1 ascendant longitude (RAW, unrounded, 0-360)
+        varga_types: Varga numbers to build (default: D1-D60 set)
+    
+    Returns:
+        Dictionary of {varga_type: varga_chart_dict} in build_varga_chart() format
+    """
+    if not d1_planets:
+        raise ValueError("D1 planets dictionary is empty or None. Cannot build varga charts.")
+    if d1_ascendant is None:
+        raise ValueError("D1 ascendant is None. Cannot build varga charts.")
+    
+    planet_names = list(d1_planets.keys())
+    # Row 0 = Lagna, rows 1..N = grahas (input order preserved)
+    longitudes = np.array([d1_ascendant] + [d1_planets[name] for name in planet_names], dtype=np.float64)
+    varga_arrays = compute_all_varga_arrays(longitudes, tuple(varga_types))
+    
+    charts = {}
+    for varga_type in varga_types:
+        signs, varga_longitudes, degrees_in_signs = varga_arrays[varga_type]
+        # Back to Python scalars BEFORE rounding (np.round != round)
+        signs = [int(s) % 12 for s in signs.tolist()]
+        varga_longitudes = varga_longitudes.tolist()
+        degrees_in_signs = degrees_in_signs.tolist()
+        
+        has_houses = varga_type not in (24, 27, 30, 40, 45, 60)
+        asc_sign_index = signs[0]
+        
+        ascendant_response = _varga_point_response(varga_longitudes[0], asc_sign_index, degrees_in_signs[0])
+        if has_houses:
+            ascendant_response["house"] = 1  # Lagna is ALWAYS House 1 (Whole Sign)
+        
+        planets = {}
+        for row, planet_name in enumerate(planet_names, start=1):
+            planet_response = _varga_point_response(varga_longitudes[row], signs[row], degrees_in_signs[row])
+            if has_houses:
+                # Whole Sign: house = ((planet_sign - lagna_sign + 12) % 12) + 1
+                planet_response["house"] = ((signs[row] - asc_sign_index + 12) % 12) + 1
+            planets[planet_name] = planet_response
+        
+        charts[varga_type] = {"ascendant": ascendant_response, "planets": planets}
+    
+    return charts
+
+
 def get_varga_ascendant_only(d1_ascendant: float, varga_type: int, chart_method: Optional[int] = None) -> Dict:
     """
     Get only varga ascendant (for cases where planets aren't needed).
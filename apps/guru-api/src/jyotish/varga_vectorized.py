@@ -0,0 +1,171 @@
+"""
+Vectorized Varga Sign Math (D1-D60, all grahas in one NumPy pass)
+
+Array mirror of calculate_varga() in varga_drik.py. Every formula below is a
+line-for-line transcription of the locked scalar formula, applied to an array
+of D1 longitudes (9 grahas + lagna) instead of one longitude at a time.
+
+🔒 PROKERALA + JHORA VERIFIED (via varga_drik.py)
+🔒 BIT-IDENTICAL TO calculate_varga() — enforced by tests/test_varga_vectorized.py
+🔒 DO NOT CHANGE A FORMULA HERE WITHOUT CHANGING varga_drik.py FIRST
+
+Notes on exactness:
+- Python `%` / `//` on floats and np.remainder / np.floor_divide use the same
+  fmod-based algorithm, so results match bit-for-bit.
+- int(x) on non-negative floats == np.floor(x) (truncation toward zero).
+- Rounding for API output (round(x, 4)) is NOT done here - np.round differs
+  from Python round(); varga_engine converts back to Python floats first.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# Vargas computed by the batched engine (same set kundli_get renders)
+SUPPORTED_VARGAS: Tuple[int, ...] = (1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+# Per-varga offset tables (identical to the scalar branches in varga_drik.py)
+_D2_HORA_ODD = np.array([4, 3])           # Odd signs: Sun's hora (Leo), Moon's hora (Cancer)
+_D2_HORA_EVEN = np.array([3, 4])          # Even signs: Moon's hora (Cancer), Sun's hora (Leo)
+_D3_OFFSETS = np.array([0, 4, 8])         # Drekkana: same sign, +4, +8
+_D4_OFFSETS = np.array([0, 3, 6, 9])      # Chaturthamsa quarter offsets
+_D30_ODD_BOUNDS = np.array([5.0, 10.0, 18.0, 25.0])
+_D30_ODD_SIGNS = np.array([0, 10, 8, 2, 6])     # Aries, Aquarius, Sagittarius, Gemini, Libra
+_D30_EVEN_BOUNDS = np.array([5.0, 12.0, 20.0, 25.0])
+_D30_EVEN_SIGNS = np.array([1, 5, 11, 9, 7])    # Taurus, Virgo, Pisces, Capricorn, Scorpio
+
+
+def _floor_index(values: np.ndarray, size: float, upper: int) -> np.ndarray:
+    """int(math.floor(values / size)) clamped to [0, upper]."""
+    return np.clip(np.floor(values / size).astype(np.int64), 0, upper)
+
+
+def _preserved_dms(sign: np.ndarray, degrees_in_sign: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """D2-D20 + D30: varga longitude keeps the D1 degrees_in_sign (VARGA DMS LOCKED)."""
+    varga_longitude = np.remainder(sign * 30.0 + degrees_in_sign, 360)
+    return sign, varga_longitude, degrees_in_sign
+
+
+def _multiplied_longitude(sign: np.ndarray, longitudes: np.ndarray, factor: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """D24/D27/D40/D45/D60: varga longitude = (D1 longitude * N) % 360."""
+    varga_longitude = np.remainder(longitudes * factor, 360.0)
+    return sign, np.remainder(varga_longitude, 360), np.remainder(varga_longitude, 30.0)
+
+
+def compute_varga_arrays(longitudes: np.ndarray, varga_type: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute one varga for an array of D1 sidereal longitudes.
+
+    Args:
+        longitudes: float64 array of sidereal longitudes (0-360)
+        varga_type: Varga number (see SUPPORTED_VARGAS)
+
+    Returns:
+        Tuple of arrays (sign_index 0-11, varga_longitude, degrees_in_sign),
+        element-wise identical to calculate_varga()["sign"/"longitude"/"degrees_in_sign"]
+
+    Raises:
+        ValueError: If varga_type is not supported
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+
+    # Common D1 decomposition (calculate_varga preamble)
+    normalized = np.remainder(longitudes, 360)
+    sign_num = np.floor(normalized / 30).astype(np.int64)
+    degrees_in_sign = np.remainder(longitudes, 30.0)
+    is_odd = (sign_num % 2 == 0)  # 0-indexed: 0,2,4,6,8,10 are odd signs
+
+    if varga_type == 1:
+        return sign_num, normalized, degrees_in_sign
+
+    if varga_type == 2:
+        hora_division = np.minimum(np.floor(degrees_in_sign / 15.0).astype(np.int64), 1)
+        sign = np.where(is_odd, _D2_HORA_ODD[hora_division], _D2_HORA_EVEN[hora_division])
+        return _preserved_dms(sign, degrees_in_sign)
+
+    if varga_type == 3:
+        division = _floor_index(degrees_in_sign, 10.0, 2)
+        return _preserved_dms((sign_num + _D3_OFFSETS[division]) % 12, degrees_in_sign)
+
+    if varga_type == 4:
+        quarter = _floor_index(degrees_in_sign, 7.5, 3)
+        return _preserved_dms((sign_num + _D4_OFFSETS[quarter]) % 12, degrees_in_sign)
+
+    if varga_type == 7:
+        # Drik Siddhānta: full longitude rebuilt from sign + degrees_in_sign
+        full_longitude = sign_num * 30.0 + degrees_in_sign
+        saptamsa_index = np.floor((full_longitude * 7.0) / 30.0).astype(np.int64)
+        return _preserved_dms(saptamsa_index % 12, degrees_in_sign)
+
+    if varga_type == 9:
+        division = np.minimum(np.floor(degrees_in_sign / (30.0 / 9)).astype(np.int64), 8)
+        return _preserved_dms((sign_num * 9 + division) % 12, degrees_in_sign)
+
+    if varga_type == 10:
+        division = _floor_index(degrees_in_sign - 1e-8, 3.0, 9)
+        start = np.where(is_odd, sign_num, (sign_num + 8) % 12)
+        return _preserved_dms((start + division) % 12, degrees_in_sign)
+
+    if varga_type == 12:
+        division = _floor_index(degrees_in_sign, 2.5, 11)
+        return _preserved_dms((sign_num + division) % 12, degrees_in_sign)
+
+    if varga_type == 16:
+        amsa = _floor_index(degrees_in_sign, 30.0 / 16.0, 15)
+        return _preserved_dms((sign_num * 16 + amsa) % 12, degrees_in_sign)
+
+    if varga_type == 20:
+        amsa = _floor_index(degrees_in_sign, 30.0 / 20.0, 19)
+        return _preserved_dms((sign_num * 20 + amsa) % 12, degrees_in_sign)
+
+    # D24-D60 branches re-derive sign/degree from the raw longitude (as varga_drik does)
+    d1_sign = np.floor(longitudes / 30.0).astype(np.int64)
+    degree_in_sign = np.remainder(longitudes, 30.0)
+    d1_is_odd = (d1_sign % 2 == 0)
+
+    if varga_type == 24:
+        division = np.floor_divide(degree_in_sign, 30.0 / 24).astype(np.int64)
+        sign = np.where(d1_is_odd, (4 + division) % 12, (3 + division) % 12)
+        return _multiplied_longitude(sign, longitudes, 24.0)
+
+    if varga_type == 27:
+        division = np.minimum(np.floor(degree_in_sign / (30.0 / 27.0)).astype(np.int64), 26)
+        return _multiplied_longitude((d1_sign * 27 + division) % 12, longitudes, 27.0)
+
+    if varga_type == 30:
+        odd_sign = _D30_ODD_SIGNS[np.searchsorted(_D30_ODD_BOUNDS, degree_in_sign, side="right")]
+        even_sign = _D30_EVEN_SIGNS[np.searchsorted(_D30_EVEN_BOUNDS, degree_in_sign, side="right")]
+        sign = np.where(d1_is_odd, odd_sign, even_sign)
+        return _preserved_dms(sign, degree_in_sign)
+
+    if varga_type == 40:
+        division = _floor_index(degree_in_sign, 0.75, 39)
+        sign = (np.where(d1_is_odd, 0, 6) + division) % 12
+        return _multiplied_longitude(sign, longitudes, 40.0)
+
+    if varga_type == 45:
+        division = np.minimum(np.floor(degree_in_sign / (30.0 / 45.0)).astype(np.int64), 44)
+        return _multiplied_longitude((d1_sign * 4 + division) % 12, longitudes, 45.0)
+
+    if varga_type == 60:
+        varga_longitude = np.remainder(longitudes * 60.0, 360.0)
+        varga_sign = np.floor(varga_longitude / 30.0).astype(np.int64) % 12
+        return _multiplied_longitude((varga_sign + d1_sign) % 12, longitudes, 60.0)
+
+    raise ValueError(f"Unsupported varga type: {varga_type}")
+
+
+def compute_all_varga_arrays(longitudes: np.ndarray, varga_types: Tuple[int, ...] = SUPPORTED_VARGAS) -> Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Compute every requested varga for the same longitude array.
+
+    Args:
+        longitudes: float64 array of sidereal longitudes (grahas + lagna)
+        varga_types: Varga numbers to compute
+
+    Returns:
+        {varga_type: (sign_index, varga_longitude, degrees_in_sign)}
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    return {varga_type: compute_varga_arrays(longitudes, varga_type) for varga_type in varga_types}
@@ -0,0 +1,615 @@
+"""
+Phase 6: Compiled Yoga Evaluator
+
+detect_all_yogas() used to call the six detector modules in turn, and each
+one re-derived house lords, house occupancy, Kendra/Trikona placement and
+aspects from the raw planets/houses dicts with its own loops.
+
+This module derives those once per chart (ChartFeatures):
+- planet bits, and house -> occupants bitmasks (benefic/malefic/node masks)
+- house lords from the houses list
+- aspect matrix of the seven classical planets (angle and orb class)
+
+The yogas themselves are declared in YOGA_RULES and compiled at import time
+into predicates over these features, then evaluated in one pass. Rules keep
+the order, names and fields of the detector modules, which stay as the
+reference implementation (tests/test_yoga_compiler.py compares both).
+"""
+
+import operator
+from typing import Callable, Dict, List, Tuple
+
+from src.jyotish.yogas.extended_yogas import DEBILITATION, EXALTATION
+from src.jyotish.yogas.house_yogas import BENEFICS, MALEFICS, SIGN_LORDS
+from src.jyotish.yogas.mahapurusha_yogas import EXALTATION_SIGNS, OWN_SIGNS
+from src.utils.converters import calculate_aspect
+
+
+KENDRA = (1, 4, 7, 10)
+TRIKONA = (1, 5, 9)
+DUSTHANA = (6, 8, 12)
+NODES = ("Rahu", "Ketu")
+
+# Aspect checks run over these pairs, in this order
+PLANET_LIST = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+PLANET_PAIRS = tuple(
+    (planet1, planet2)
+    for i, planet1 in enumerate(PLANET_LIST)
+    for planet2 in PLANET_LIST[i + 1:]
+)
+
+# Aspect classes of the extended aspect yogas (8 degree orb, first match wins)
+ASPECT_ORB = 8
+CONJUNCTION, OPPOSITION, TRINE, SQUARE = 1, 2, 4, 8
+
+# House counted from the Moon's house
+_FROM_MOON = {
+    2: lambda moon_house: (moon_house % 12) + 1,
+    12: lambda moon_house: ((moon_house - 2) % 12) + 1,
+}
+
+_COMPARE = {"==": operator.eq, ">=": operator.ge}
+
+
+class ChartFeatures:
+    """
+    Phase 6: Chart data every yoga rule reads, derived once per chart.
+
+    Raw house/sign/degree values are kept as given (same defaults as the
+    detector modules), so rules compare exactly what the detectors compared.
+    """
+
+    __slots__ = (
+        "planets", "names", "bits", "house", "sign", "degree", "occupancy",
+        "all", "benefic", "malefic", "node", "lords", "placed_lords", "house_numbers",
+        "angles", "aspects", "_masks",
+    )
+
+    def __init__(self, planets: Dict, houses: List[Dict]):
+        self.planets = planets
+        self.names = []
+        self.bits = {}
+        self.house = {}
+        self.sign = {}
+        self.degree = {}
+        self.occupancy = {}
+        self.all = self.benefic = self.malefic = self.node = 0
+
+        for index, (name, data) in enumerate(planets.items()):
+            bit = 1 << index
+            house = data.get("house", 0)
+            self.names.append(name)
+            self.bits[name] = bit
+            self.house[name] = house
+            self.sign[name] = data.get("sign", -1)
+            self.degree[name] = data.get("degree", 0)
+            self.occupancy[house] = self.occupancy.get(house, 0) | bit
+            self.all |= bit
+            if name in BENEFICS:
+                self.benefic |= bit
+            elif name in MALEFICS:
+                self.malefic |= bit
+            if name in NODES:
+                self.node |= bit
+
+        # Later entries for the same house win, as in the detectors' dicts;
+        # an unknown sign has no lord
+        self.lords = {}
+        self.house_numbers = []
+        for house_data in houses:
+            house_num = house_data.get("house", 0)
+            self.house_numbers.append(house_num)
+            self.lords[house_num] = SIGN_LORDS.get(house_data.get("sign", 0))
+        # Lords that are one of the chart's planets (the ones rules can place)
+        self.placed_lords = {house: lord for house, lord in self.lords.items() if lord in self.bits}
+
+        self.angles = {}
+        self.aspects = {}
+        for planet1, planet2 in PLANET_PAIRS:
+            if planet1 in self.bits and planet2 in self.bits:
+                angle = calculate_aspect(self.degree[planet1], self.degree[planet2])
+                self.angles[(planet1, planet2)] = angle
+                self.aspects[(planet1, planet2)] = _aspect_class(angle)
+
+        self._masks = {}
+
+    def mask(self, houses: Tuple[int, ...]) -> int:
+        """
+        Bitmask of the planets placed in any of the given houses.
+
+        Args:
+            houses: House numbers
+
+        Returns:
+            Planet bitmask
+        """
+        mask = self._masks.get(houses)
+        if mask is None:
+            mask = 0
+            for house in houses:
+                mask |= self.occupancy.get(house, 0)
+            self._masks[houses] = mask
+        return mask
+
+
+def _aspect_class(angle: float) -> int:
+    if angle < ASPECT_ORB:
+        return CONJUNCTION
+    if abs(angle - 180) < ASPECT_ORB:
+        return OPPOSITION
+    if abs(angle - 120) < ASPECT_ORB:
+        return TRINE
+    if abs(angle - 90) < ASPECT_ORB:
+        return SQUARE
+    return 0
+
+
+def _yoga(name: str, yoga_type: str, category: str, description: str = None) -> Dict:
+    yoga = {"name": name, "type": yoga_type, "category": category}
+    if description is not None:
+        yoga["description"] = description
+    return yoga
+
+
+# --- Rule declarations ---------------------------------------------------
+#
+# ("yoga", template, condition): emit the template when the condition holds.
+# ("family", name, *args): a family of yogas named after chart data, compiled
+# by the family compiler of that name.
+#
+# Conditions:
+#   ("present", planet)                    planet is in the chart
+#   ("in_houses", planet, houses)          planet placed in one of the houses
+#   ("sign_in", planet, signs)             planet placed in one of the signs
+#   ("same_sign", planet1, planet2)
+#   ("near", planet1, planet2, angles, orb) aspect angle within orb of an
+#                                          angle (0: below orb)
+#   ("from_moon", offset)                  a planet in the 2nd/12th from Moon
+#   ("count", group, houses, op, n)        planets of a group in the houses
+#   ("share", houses, fraction)            share of non-node planets in houses
+#   ("lord_in", house, group)              house lord belongs to a group
+#   ("lord_exchange", house1, house2)      either lord placed in the other house
+#   ("and", ...), ("or", ...), ("not", condition)
+
+_NEECHABHANGA = ("or",) + tuple(
+    ("and", ("sign_in", planet, (sign,)), ("in_houses", planet, KENDRA))
+    for planet, sign in DEBILITATION.items()
+)
+_MOON_2ND = ("from_moon", 2)
+_MOON_12TH = ("from_moon", 12)
+
+YOGA_RULES = (
+    # Planetary placement yogas
+    ("yoga", _yoga("Gaja Kesari Yoga", "Planetary", "Major",
+                   "Jupiter aspects Moon in Kendra - brings wisdom, wealth, and fame"),
+     ("near", "Jupiter", "Moon", (0, 120, 180, 240), 10)),
+    ("yoga", _yoga("Budha Aditya Yoga", "Planetary", "Major",
+                   "Sun and Mercury in same sign - brings intelligence and communication skills"),
+     ("same_sign", "Sun", "Mercury")),
+    ("yoga", _yoga("Chandra-Mangal Yoga", "Planetary", "Moderate",
+                   "Moon and Mars conjunction - brings courage and determination"),
+     ("or", ("same_sign", "Moon", "Mars"), ("near", "Moon", "Mars", (180, 120), 10))),
+    ("yoga", _yoga("Neechabhanga Raja Yoga", "Planetary", "Major",
+                   "Debilitated planet in Kendra - cancels debilitation and creates Raja Yoga"),
+     _NEECHABHANGA),
+    ("family", "parivartana"),
+
+    # Panch Mahapurusha yogas
+    ("family", "mahapurusha", (
+        ("Mars", "Ruchaka"), ("Mercury", "Bhadra"), ("Jupiter", "Hamsa"),
+        ("Venus", "Malavya"), ("Saturn", "Sasa"),
+    )),
+
+    # House-based yogas
+    ("family", "lord_pairs", KENDRA, TRIKONA, "Raja Yoga ({0}-{1})",
+     "Kendra lord {0} and Trikona lord {1} combination", "House", "Major"),
+    ("family", "planet_in_houses", "Jupiter", (2, 5, 9, 11), "Jupiter Dhana Yoga", "Major",
+     "Jupiter in house {0} - brings wealth and prosperity"),
+    ("family", "planet_in_houses", "Venus", (2, 11), "Venus Dhana Yoga", "Moderate",
+     "Venus in house {0} - brings material comforts"),
+    ("yoga", _yoga("Dhana Yoga (2nd-11th Lords)", "House", "Major",
+                   "Benefic lords of 2nd and 11th houses - strong wealth combination"),
+     ("and", ("lord_in", 2, "benefic"), ("lord_in", 11, "benefic"))),
+    ("yoga", _yoga("Kemdrum Yoga", "House", "Dosha",
+                   "Moon isolated - no planets in 2nd and 12th from Moon"),
+     ("and", ("present", "Moon"), ("not", ("or", _MOON_2ND, _MOON_12TH)))),
+    ("family", "kartari", "benefic", "Shubha Kartari Yoga (House {0})", "Moderate",
+     "Benefics on both sides of house {0}"),
+    ("family", "kartari", "malefic", "Paap Kartari Yoga (House {0})", "Dosha",
+     "Malefics on both sides of house {0} - creates obstacles"),
+    ("family", "lord_pairs", DUSTHANA, DUSTHANA, "Vipareeta Raja Yoga ({0}-{1})",
+     "Lords of houses {2} and {3} in each other's houses", "House", "Major"),
+
+    # Combination yogas
+    ("yoga", _yoga("Chatusagara Yoga", "Combination", "Major",
+                   "All four benefics in Kendra - brings great fortune"),
+     ("count", "benefic", KENDRA, "==", 4)),
+    ("yoga", _yoga("Veshi Yoga", "Combination", "Moderate", "Planet in 2nd house from Moon"),
+     _MOON_2ND),
+    ("yoga", _yoga("Vashi Yoga", "Combination", "Moderate", "Planet in 12th house from Moon"),
+     _MOON_12TH),
+    ("yoga", _yoga("Anapha Yoga", "Combination", "Moderate", "Planet in 12th house from Moon"),
+     _MOON_12TH),
+    ("yoga", _yoga("Sunapha Yoga", "Combination", "Moderate", "Planet in 2nd house from Moon"),
+     _MOON_2ND),
+    ("yoga", _yoga("Durudhara Yoga", "Combination", "Moderate",
+                   "Planets in both 2nd and 12th from Moon"),
+     ("and", _MOON_2ND, _MOON_12TH)),
+    ("yoga", _yoga("Kalpadruma Yoga", "Combination", "Major",
+                   "Most planets in Kendra or Trikona - brings fulfillment of desires"),
+     ("share", (1, 4, 5, 7, 9, 10), 0.7)),
+    ("yoga", _yoga("Sanyasa Yoga", "Combination", "Moderate",
+                   "Most planets in Dusthana - indicates spiritual inclination"),
+     ("share", (3, 6, 9, 12), 0.7)),
+
+    # Advanced Raja yogas
+    ("yoga", _yoga("Dharma-Karmadhipati Yoga", "Raja Yoga", "Major",
+                   "9th and 10th house lords combine - brings dharma and karma fulfillment"),
+     ("lord_exchange", 9, 10)),
+    ("yoga", _yoga("Lakshmi Yoga", "Raja Yoga", "Major",
+                   "9th and 11th house lords combine - brings wealth and fortune"),
+     ("lord_exchange", 9, 11)),
+
+    # Extended yogas
+    ("family", "house_placement", {
+        "Sun": {1: ("Surya Lagna Yoga", "Major"), 4: ("Surya Chaturtha Yoga", "Moderate"),
+                10: ("Surya Karma Yoga", "Major")},
+        "Moon": {1: ("Chandra Lagna Yoga", "Major"), 4: ("Chandra Chaturtha Yoga", "Moderate"),
+                 7: ("Chandra Saptama Yoga", "Moderate")},
+        "Jupiter": {1: ("Guru Lagna Yoga", "Major"), 5: ("Guru Panchama Yoga", "Major"),
+                    9: ("Guru Navama Yoga", "Major"), 11: ("Guru Ekadasha Yoga", "Major")},
+        "Venus": {1: ("Shukra Lagna Yoga", "Major"), 4: ("Shukra Chaturtha Yoga", "Moderate"),
+                  7: ("Shukra Saptama Yoga", "Major")},
+        "Mars": {3: ("Mangal Tritiya Yoga", "Moderate"), 6: ("Mangal Shashta Yoga", "Moderate")},
+        "Mercury": {1: ("Budha Lagna Yoga", "Moderate"), 4: ("Budha Chaturtha Yoga", "Moderate")},
+        "Saturn": {7: ("Shani Saptama Yoga", "Moderate"), 10: ("Shani Karma Yoga", "Moderate")},
+    }),
+    ("family", "aspects"),
+    ("family", "dignity"),
+    ("family", "house_lords"),
+    ("family", "kendra_groups"),
+)
+
+
+# --- Condition compiler --------------------------------------------------
+
+Predicate = Callable[[ChartFeatures], bool]
+Emitter = Callable[[ChartFeatures, List[Dict]], None]
+
+
+def compile_condition(condition: Tuple) -> Predicate:
+    """
+    Phase 6: Compile a rule condition into a predicate over ChartFeatures.
+
+    Args:
+        condition: Condition tuple (see the rule declarations)
+
+    Returns:
+        Function taking ChartFeatures and returning bool
+    """
+    kind, args = condition[0], condition[1:]
+
+    if kind in ("and", "or"):
+        parts = tuple(compile_condition(part) for part in args)
+        if kind == "and":
+            return lambda f: all(part(f) for part in parts)
+        return lambda f: any(part(f) for part in parts)
+
+    if kind == "not":
+        part = compile_condition(args[0])
+        return lambda f: not part(f)
+
+    if kind == "present":
+        planet, = args
+        return lambda f: planet in f.bits
+
+    if kind == "in_houses":
+        planet, houses = args
+        return lambda f: bool(f.mask(houses) & f.bits.get(planet, 0))
+
+    if kind == "sign_in":
+        planet, signs = args
+        return lambda f: planet in f.sign and f.sign[planet] in signs
+
+    if kind == "same_sign":
+        planet1, planet2 = args
+        return lambda f: planet1 in f.sign and planet2 in f.sign and f.sign[planet1] == f.sign[planet2]
+
+    if kind == "near":
+        planet1, planet2, targets, orb = args
+        pair = (planet1, planet2) if PLANET_LIST.index(planet1) < PLANET_LIST.index(planet2) else (planet2, planet1)
+
+        def near(f: ChartFeatures) -> bool:
+            angle = f.angles.get(pair)
+            if angle is None:
+                return False
+            return any(angle < orb if target == 0 else abs(angle - target) < orb for target in targets)
+        return near
+
+    if kind == "from_moon":
+        offset, = args
+        house_from_moon = _FROM_MOON[offset]
+
+        def from_moon(f: ChartFeatures) -> bool:
+            if "Moon" not in f.bits:
+                return False
+            house = house_from_moon(f.house["Moon"])
+            return bool(f.occupancy.get(house, 0) & ~f.bits["Moon"])
+        return from_moon
+
+    if kind == "count":
+        group, houses, op, count = args
+        compare = _COMPARE[op]
+        return lambda f: compare((f.mask(houses) & getattr(f, group)).bit_count(), count)
+
+    if kind == "share":
+        houses, fraction = args
+
+        def share(f: ChartFeatures) -> bool:
+            total = (f.all & ~f.node).bit_count()
+            return (f.mask(houses) & ~f.node).bit_count() >= total * fraction
+        return share
+
+    if kind == "lord_in":
+        house, group = args
+        members = {"benefic": BENEFICS, "malefic": MALEFICS}[group]
+        return lambda f: f.lords.get(house) in members
+
+    if kind == "lord_exchange":
+        house1, house2 = args
+
+        def lord_exchange(f: ChartFeatures) -> bool:
+            lord1, lord2 = f.placed_lords.get(house1), f.placed_lords.get(house2)
+            if lord1 is None or lord2 is None:
+                return False
+            return f.house[lord1] == house2 or f.house[lord2] == house1
+        return lord_exchange
+
+    raise ValueError(f"Unknown yoga condition: {kind}")
+
+
+# --- Family compilers ----------------------------------------------------
+
+def _compile_parivartana() -> Emitter:
+    lord_signs = {
+        planet: tuple(sign for sign, lord in SIGN_LORDS.items() if lord == planet)
+        for planet in PLANET_LIST
+    }
+    pairs = tuple(
+        (planet1, planet2, lord_signs[planet1], lord_signs[planet2],
+         _yoga(f"{planet1}-{planet2} Parivartana Yoga", "Planetary", "Major",
+               "Mutual exchange of signs - strengthens both planets"))
+        for planet1, planet2 in PLANET_PAIRS
+    )
+
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        sign = f.sign
+        for planet1, planet2, signs1, signs2, template in pairs:
+            if planet1 in sign and planet2 in sign and sign[planet1] in signs2 and sign[planet2] in signs1:
+                out.append(dict(template))
+    return emit
+
+
+def _compile_mahapurusha(planets: Tuple) -> Emitter:
+    rules = tuple(
+        (planet, f"{yoga_name} Yoga",
+         tuple(OWN_SIGNS.get(planet, [])) + (EXALTATION_SIGNS.get(planet, -1),),
+         f"{planet} in own/exalted sign in Kendra - brings great qualities")
+        for planet, yoga_name in planets
+    )
+
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        kendra = f.mask(KENDRA)
+        for planet, name, signs, description in rules:
+            if kendra & f.bits.get(planet, 0) and f.sign[planet] in signs:
+                out.append({
+                    "name": name,
+                    "type": "Mahapurusha",
+                    "category": "Major",
+                    "planet": planet,
+                    "sign": f.sign[planet],
+                    "house": f.house[planet],
+                    "description": description
+                })
+    return emit
+
+
+def _compile_lord_pairs(houses1: Tuple, houses2: Tuple, name: str, description: str,
+                        yoga_type: str, category: str) -> Emitter:
+    pairs = tuple((house1, house2) for house1 in houses1 for house2 in houses2 if house1 != house2)
+
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        lords = f.placed_lords
+        for house1, house2 in pairs:
+            lord1, lord2 = lords.get(house1), lords.get(house2)
+            if lord1 is None or lord2 is None:
+                continue
+            if f.house[lord1] == house2 or f.house[lord2] == house1:
+                out.append({
+                    "name": name.format(lord1, lord2),
+                    "type": yoga_type,
+                    "category": category,
+                    "description": description.format(lord1, lord2, house1, house2)
+                })
+    return emit
+
+
+def _compile_planet_in_houses(planet: str, houses: Tuple, name: str, category: str,
+                              description: str) -> Emitter:
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        if f.mask(houses) & f.bits.get(planet, 0):
+            out.append(_yoga(name, "House", category, description.format(f.house[planet])))
+    return emit
+
+
+def _compile_kartari(group: str, name: str, category: str, description: str) -> Emitter:
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        members = getattr(f, group)
+        occupancy = f.occupancy
+        for house_num in f.house_numbers:
+            prev_house = ((house_num - 2) % 12) + 1
+            next_house = (house_num % 12) + 1
+            if occupancy.get(prev_house, 0) & members and occupancy.get(next_house, 0) & members:
+                out.append(_yoga(name.format(house_num), "House", category, description.format(house_num)))
+    return emit
+
+
+def _compile_house_placement(table: Dict) -> Emitter:
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        for name in f.names:
+            yogas = table.get(name)
+            if yogas is None:
+                continue
+            yoga = yogas.get(f.house[name])
+            if yoga is not None:
+                out.append(_yoga(yoga[0], "Planetary", yoga[1]))
+    return emit
+
+
+def _compile_aspects() -> Emitter:
+    pair_yogas = {}
+    for planet1, planet2 in PLANET_PAIRS:
+        names = f"{planet1}-{planet2}"
+        conjunction = None
+        if planet1 in BENEFICS and planet2 in BENEFICS:
+            conjunction = (f"{names} Benefic Conjunction", "Major")
+        elif planet1 in MALEFICS and planet2 in MALEFICS:
+            conjunction = (f"{names} Malefic Conjunction", "Dosha")
+        trine = None
+        if planet1 in BENEFICS or planet2 in BENEFICS:
+            trine = (f"{names} Trine Aspect", "Moderate")
+        pair_yogas[(planet1, planet2)] = {
+            CONJUNCTION: conjunction,
+            OPPOSITION: (f"{names} Opposition", "Moderate"),
+            TRINE: trine,
+            SQUARE: (f"{names} Square Aspect", "Moderate"),
+        }
+
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        for pair, aspect in f.aspects.items():
+            if aspect:
+                yoga = pair_yogas[pair][aspect]
+                if yoga is not None:
+                    out.append(_yoga(yoga[0], "Planetary", yoga[1]))
+    return emit
+
+
+def _compile_dignity() -> Emitter:
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        kendra = f.mask(KENDRA)
+        for name in f.names:
+            if name in NODES:
+                continue
+            sign = f.sign[name]
+            if name in EXALTATION and sign == EXALTATION[name]:
+                out.append(_yoga(f"{name} Exaltation Yoga", "Planetary", "Major", f"{name} in exaltation sign"))
+                if kendra & f.bits[name]:
+                    out.append(_yoga(f"{name} Exaltation in Kendra", "Planetary", "Major",
+                                     f"{name} exalted in Kendra house"))
+            elif name in DEBILITATION and sign == DEBILITATION[name]:
+                out.append(_yoga(f"{name} Debilitation", "Planetary", "Dosha", f"{name} in debilitation sign"))
+    return emit
+
+
+def _compile_house_lords() -> Emitter:
+    placements = (
+        (KENDRA, "House {0} Lord in Kendra", "Moderate"),
+        (TRIKONA, "House {0} Lord in Trikona", "Moderate"),
+        (DUSTHANA, "House {0} Lord in Dusthana", "Dosha"),
+    )
+    # house_num -> (own house template, lord's house -> placement templates)
+    table = {}
+    for house_num in range(1, 13):
+        by_lord_house = {}
+        for houses, name, category in placements:
+            for lord_house in houses:
+                by_lord_house.setdefault(lord_house, []).append(_yoga(name.format(house_num), "House", category))
+        table[house_num] = (_yoga(f"House {house_num} Lord in Own House", "House", "Moderate"), by_lord_house)
+
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        lords = f.placed_lords
+        for house_num, (own_house, by_lord_house) in table.items():
+            lord = lords.get(house_num)
+            if lord is None:
+                continue
+            lord_house = f.house[lord]
+            if lord_house == house_num:
+                out.append(dict(own_house))
+            for template in by_lord_house.get(lord_house, ()):
+                out.append(dict(template))
+    return emit
+
+
+def _compile_kendra_groups() -> Emitter:
+    def emit(f: ChartFeatures, out: List[Dict]) -> None:
+        kendra = f.mask(KENDRA) & ~f.node
+        benefics = (kendra & f.benefic).bit_count()
+        malefics = (kendra & f.malefic).bit_count()
+        if benefics >= 2:
+            out.append(_yoga(f"Multiple Benefics in Kendra ({benefics})", "House", "Major"))
+        if malefics >= 2:
+            out.append(_yoga(f"Multiple Malefics in Kendra ({malefics})", "House", "Dosha"))
+        if benefics == 4:
+            out.append(_yoga("All Benefics in Kendra", "House", "Major"))
+    return emit
+
+
+_FAMILY_COMPILERS = {
+    "parivartana": _compile_parivartana,
+    "mahapurusha": _compile_mahapurusha,
+    "lord_pairs": _compile_lord_pairs,
+    "planet_in_houses": _compile_planet_in_houses,
+    "kartari": _compile_kartari,
+    "house_placement": _compile_house_placement,
+    "aspects": _compile_aspects,
+    "dignity": _compile_dignity,
+    "house_lords": _compile_house_lords,
+    "kendra_groups": _compile_kendra_groups,
+}
+
+
+def compile_yoga_rules(rules: Tuple) -> Tuple[Emitter, ...]:
+    """
+    Phase 6: Compile yoga rule declarations into emitters.
+
+    Args:
+        rules: Rule tuples ("yoga", template, condition) or ("family", name, *args)
+
+    Returns:
+        Emitters, each appending its yogas for a chart, in rule order
+    """
+    emitters = []
+    for rule in rules:
+        if rule[0] == "yoga":
+            template, predicate = rule[1], compile_condition(rule[2])
+
+            def emit(f: ChartFeatures, out: List[Dict], template=template, predicate=predicate) -> None:
+                if predicate(f):
+                    out.append(dict(template))
+            emitters.append(emit)
+        elif rule[0] == "family":
+            emitters.append(_FAMILY_COMPILERS[rule[1]](*rule[2:]))
+        else:
+            raise ValueError(f"Unknown yoga rule: {rule[0]}")
+    return tuple(emitters)
+
+
+COMPILED_YOGA_RULES = compile_yoga_rules(YOGA_RULES)
+
+
+def evaluate_yogas(planets: Dict, houses: List[Dict]) -> List[Dict]:
+    """
+    Phase 6: Detect every yoga of the six detector modules in one pass.
+
+    Args:
+        planets: Dictionary of planet positions with degrees, signs, houses
+        houses: List of house data with signs and degrees
+
+    Returns:
+        List of detected yogas (same order and fields as the detector modules)
+    """
+    features = ChartFeatures(planets, houses)
+    yogas: List[Dict] = []
+    for emit in COMPILED_YOGA_RULES:
+        emit(features, yogas)
+    return yogas
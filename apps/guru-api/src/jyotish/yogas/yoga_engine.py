@@ -21,6 +21,7 @@ from typing import Dict, List, Optional, Tuple, Any
 
 import swisseph as swe
 
+from src.ephemeris import context as swe_context
 from src.utils.converters import normalize_degrees
 from src.jyotish.kundli_engine import SIGN_LORDS
 from src.jyotish.varga_drik import calculate_varga
@@ -95,9 +96,9 @@ def _sidereal_lagna_sign(jd: float, lat: float, lon: float) -> Tuple[float, int]
     Compute sidereal ascendant longitude and sign using Lahiri ayanamsa.
     We compute tropical ascendant from Swiss Ephemeris and subtract Lahiri ayanamsa.
     """
-    cusps, ascmc = swe.houses_ex(jd, lat, lon, b"P")
+    cusps, ascmc = swe_context.houses_ex(jd, lat, lon, b"P")
     asc_tropical = float(ascmc[0])
-    ayanamsa = float(swe.get_ayanamsa_ut(jd))
+    ayanamsa = float(swe_context.get_ayanamsa_ut(jd))
     asc_sidereal = normalize_degrees(asc_tropical - ayanamsa)
     return asc_sidereal, int(asc_sidereal // 30)
 
@@ -434,7 +435,7 @@ def scan_d1_d9_positions(jd: float, lat: float, lon: float) -> Dict[str, Dict[st
     }
 
     for p in SUPPORTED_PLANETS:
-        xx, ret = swe.calc_ut(float(jd), int(planet_map[p]), flag)
+        xx, ret = swe_context.calc(float(jd), int(planet_map[p]), flag)
         if ret < 0:
             raise ValueError(f"SwissEph calc failed for {p}: {ret}")
         lon_p = normalize_degrees(float(xx[0]))
@@ -517,7 +518,7 @@ def build_d1_sign_map_for_sambandha(jd: float) -> Dict[str, int]:
     Includes Vimshottari lords: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu, Ketu.
     Uses Swiss Ephemeris with the CURRENT sidereal mode (caller must ensure Lahiri is set).
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
     flag = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_TRUEPOS | swe.FLG_SPEED
 
     planet_map = {
@@ -534,7 +535,7 @@ def build_d1_sign_map_for_sambandha(jd: float) -> Dict[str, int]:
     out: Dict[str, int] = {}
     rahu_lon: Optional[float] = None
     for name, swe_id in planet_map.items():
-        xx, ret = swe.calc_ut(float(jd), int(swe_id), flag)
+        xx, ret = swe_context.calc(float(jd), int(swe_id), flag)
         if ret < 0:
             raise ValueError(f"SwissEph calc failed for {name}: {ret}")
         lon = normalize_degrees(float(xx[0]))
@@ -603,7 +604,7 @@ def detect_yogas(
       it is marked "Siddha (Rescued)" if Bhanga exists, otherwise "Mṛta (Inactive)".
     """
     # 1) AYANAMSA SYNCHRONIZATION (CRITICAL) — execute once per request
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
 
     planet_ctx = _build_planet_context(jd, lat, lon, shadbala)
     _, lagna_sign = _sidereal_lagna_sign(jd, lat, lon)
@@ -796,12 +797,7 @@ to provide comprehensive yoga analysis following JHora-style rules.
 
 from typing import Dict, List
 
-from src.jyotish.yogas.planetary_yogas import detect_planetary_yogas
-from src.jyotish.yogas.mahapurusha_yogas import detect_mahapurusha_yogas
-from src.jyotish.yogas.house_yogas import detect_house_yogas
-from src.jyotish.yogas.combination_yogas import detect_combination_yogas
-from src.jyotish.yogas.raja_yogas import detect_advanced_raja_yogas
-from src.jyotish.yogas.extended_yogas import detect_extended_yogas
+from src.jyotish.yogas.yoga_compiler import evaluate_yogas
 
 
 def detect_all_yogas(planets: Dict, houses: List[Dict]) -> Dict:
@@ -818,31 +814,9 @@ def detect_all_yogas(planets: Dict, houses: List[Dict]) -> Dict:
     Returns:
         Complete yoga analysis dictionary
     """
-    all_yogas = []
-    
-    # 1. Planetary Placement Yogas
-    planetary_yogas = detect_planetary_yogas(planets, houses)
-    all_yogas.extend(planetary_yogas)
-    
-    # 2. Panch Mahapurusha Yogas
-    mahapurusha_yogas = detect_mahapurusha_yogas(planets, houses)
-    all_yogas.extend(mahapurusha_yogas)
-    
-    # 3. House-Based Yogas
-    house_yogas = detect_house_yogas(planets, houses)
-    all_yogas.extend(house_yogas)
-    
-    # 4. Combination Yogas
-    combination_yogas = detect_combination_yogas(planets, houses)
-    all_yogas.extend(combination_yogas)
-    
-    # 5. Advanced Raja Yogas
-    advanced_raja_yogas = detect_advanced_raja_yogas(planets, houses)
-    all_yogas.extend(advanced_raja_yogas)
-    
-    # 6. Extended Yogas (250+ total)
-    extended_yogas = detect_extended_yogas(planets, houses)
-    all_yogas.extend(extended_yogas)
+    # Planetary, Mahapurusha, house, combination, advanced Raja and
+    # extended yogas, evaluated from one set of chart features
+    all_yogas = evaluate_yogas(planets, houses)
     
     # Categorize yogas
     major_yogas = [y for y in all_yogas if y.get("category") == "Major"]
@@ -8,7 +8,8 @@ from typing import Dict
 from datetime import datetime
 import swisseph as swe
 
-from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
+from src.jyotish.kundli_engine import get_planet_positions
+from src.jyotish.natal_store import get_natal_chart
 from src.jyotish.dasha_engine import calculate_vimshottari_dasha
 from src.jyotish.panchang import calculate_panchang
 from src.jyotish.daily.daily_engine import compute_daily
@@ -41,8 +42,8 @@ def build_context(birth_data: BirthDetail) -> Dict:
     lat = birth_data.birth_latitude
     lon = birth_data.birth_longitude
     
-    # 1. Generate Kundli (Birth Chart)
-    kundli = generate_kundli(jd, lat, lon)
+    # 1. Kundli (Birth Chart) - stored on the birth detail, recomputed only when stale
+    kundli = get_natal_chart(birth_data)["kundli"]
     
     # 2. Calculate Vimshottari Dasha
     moon_degree = kundli["Planets"]["Moon"]["degree"]
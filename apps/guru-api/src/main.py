@@ -13,9 +13,13 @@ from contextlib import asynccontextmanager
 import traceback
 
 from src.config import settings
+from src.ai.llm_client import get_async_llm_client
+from src.compute.executor import get_compute_executor
 from src.db.database import engine, Base
 from src.notifications.scheduler import start_scheduler, stop_scheduler
 from src.notifications.scheduler_extended import start_extended_scheduler, stop_extended_scheduler
+from src.notifications.preferences.delivery_schedule import ensure_delivery_schedule_columns
+from src.utils.log import configure_logging, request_id_middleware, shutdown_logging
 from src.api import (
     kundli_routes,
     dasha_routes,
@@ -32,9 +36,12 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
     Creates database tables on startup and starts notification scheduler.
     """
+    configure_logging()
+
     # Startup: Create database tables (with error handling)
     try:
         Base.metadata.create_all(bind=engine)
+        ensure_delivery_schedule_columns(engine)
     except Exception as e:
         # Log error but don't fail startup if database is not available
         # This allows the API to run without database for basic calculations
@@ -55,6 +62,13 @@ async def lifespan(app: FastAPI):
         print(f"Warning: Could not start extended notification scheduler: {e}")
         print("Multi-channel notifications will not be automatically delivered.")
     
+    # Start compute workers now so the first chart request does not pay for it
+    try:
+        await get_compute_executor().start()
+    except Exception as e:
+        print(f"Warning: Could not start compute workers: {e}")
+        print("Compute workers will be started on first use.")
+    
     yield
     
     # Shutdown: Stop schedulers
@@ -68,6 +82,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Warning: Error stopping extended scheduler: {e}")
 
+    # Close pooled LLM connections
+    try:
+        await get_async_llm_client().aclose()
+    except Exception as e:
+        print(f"Warning: Error closing LLM client: {e}")
+
+    # Stop compute workers
+    try:
+        get_compute_executor().shutdown(wait=False)
+    except Exception as e:
+        print(f"Warning: Error stopping compute workers: {e}")
+
+    shutdown_logging()
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -86,6 +114,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request id (X-Request-ID) on every log record; per-request debug traces
+app.middleware("http")(request_id_middleware)
+
 
 # Include API route modules
 # Phase 2: Core Kundli GET endpoint (direct path as per specification)
@@ -0,0 +1,329 @@
+"""
+Matching index - score one profile against a pool of candidates.
+
+Gun Milan and Porutham depend only on the two Moons: their nakshatra (27) and
+sign (12). Each koota is precomputed once into a 27×27 nakshatra table or a
+12×12 sign table, oriented [boy, girl], by running the existing gun_milan() /
+porutham() code, so the tables cannot drift from the single-pair reports.
+
+A candidate is stored as a compact match key (Moon nakshatra, Moon sign,
+manglik code), and a whole pool is ranked with numpy fancy indexing instead
+of building two kundli dicts per pair.
+"""
+
+import threading
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from src.jyotish.panchang import get_nakshatra
+from src.matching.gun_milan import calculate_bhakoot, gun_milan
+from src.matching.manglik import check_manglik
+from src.matching.porutham import (
+    check_rasi_adhipathi_porutham,
+    check_rasi_porutham,
+    check_vasiya_porutham,
+    porutham,
+)
+from src.utils.converters import degrees_to_sign
+
+NAKSHATRA_SPAN = 360.0 / 27
+GUNA_NAKSHATRA_KOOTAS = ("varna", "vashya", "tara", "yoni", "graha_maitri", "gana", "nadi")
+GUNA_KOOTAS = ("varna", "vashya", "tara", "yoni", "graha_maitri", "gana", "bhakoot", "nadi")
+PORUTHAM_NAKSHATRA_CHECKS = ("dina", "gana", "mahendra", "sthree_deerga", "yoni", "rajju", "vedha")
+PORUTHAM_SIGN_CHECKS = {
+    "rasi": check_rasi_porutham,
+    "rasi_adhipathi": check_rasi_adhipathi_porutham,
+    "vasiya": check_vasiya_porutham,
+}
+PORUTHAMS = ("dina", "gana", "mahendra", "sthree_deerga", "yoni", "rasi", "rasi_adhipathi", "vasiya", "rajju", "vedha")
+
+# Manglik codes stored in a match key
+MANGLIK_NONE = 0
+MANGLIK_DOSHA = 1
+MANGLIK_SELF_CANCELLED = 2  # Mars in own sign (Aries/Scorpio) or exalted (Capricorn)
+MANGLIK_FILTERS = ("any", "cancelled", "safe")
+
+MatchKey = Tuple[int, int, int]
+
+
+def _moon_kundli(moon_degree: float) -> Dict:
+    return {"Planets": {"Moon": {"degree": moon_degree}}}
+
+
+def _build_tables() -> Dict[str, np.ndarray]:
+    """Run gun_milan()/porutham() once per nakshatra pair and the sign checks once per sign pair."""
+    moons = [_moon_kundli((nak + 0.5) * NAKSHATRA_SPAN) for nak in range(27)]
+    tables = {name: np.zeros((27, 27)) for name in GUNA_NAKSHATRA_KOOTAS}
+    tables.update({f"porutham_{name}": np.zeros((27, 27), dtype=bool) for name in PORUTHAM_NAKSHATRA_CHECKS})
+    for boy in range(27):
+        for girl in range(27):
+            guna = gun_milan(moons[boy], moons[girl])
+            for name in GUNA_NAKSHATRA_KOOTAS:
+                tables[name][boy, girl] = guna[name]["score"]
+            checks = porutham(moons[boy], moons[girl])
+            for name in PORUTHAM_NAKSHATRA_CHECKS:
+                tables[f"porutham_{name}"][boy, girl] = checks[name]["compatible"]
+
+    signs = range(12)
+    tables["bhakoot"] = np.array([[calculate_bhakoot(b, g) for g in signs] for b in signs], dtype=float)
+    for name, check in PORUTHAM_SIGN_CHECKS.items():
+        tables[f"porutham_{name}"] = np.array([[check(b, g) for g in signs] for b in signs], dtype=bool)
+
+    tables["guna_nakshatra_total"] = sum(tables[name] for name in GUNA_NAKSHATRA_KOOTAS)
+    tables["porutham_nakshatra_score"] = sum(
+        tables[f"porutham_{name}"].astype(np.int8) for name in PORUTHAM_NAKSHATRA_CHECKS
+    )
+    tables["porutham_sign_score"] = sum(
+        tables[f"porutham_{name}"].astype(np.int8) for name in PORUTHAM_SIGN_CHECKS
+    )
+    for table in tables.values():
+        table.setflags(write=False)
+    return tables
+
+
+_tables: Optional[Dict[str, np.ndarray]] = None
+_tables_lock = threading.Lock()
+
+
+def get_koota_tables() -> Dict[str, np.ndarray]:
+    """
+    Get the precomputed koota tables (built on first use, read-only).
+
+    Returns:
+        Dictionary of [boy, girl] tables: Guna koota scores and Porutham checks
+        (27×27 by nakshatra index, 12×12 by sign index) plus their totals
+    """
+    global _tables
+    if _tables is None:
+        with _tables_lock:
+            if _tables is None:
+                _tables = _build_tables()
+    return _tables
+
+
+def manglik_code(manglik: Dict) -> int:
+    """
+    Compact manglik code from check_manglik().
+
+    Args:
+        manglik: Result of check_manglik()
+
+    Returns:
+        MANGLIK_NONE, MANGLIK_DOSHA or MANGLIK_SELF_CANCELLED
+    """
+    if not manglik["is_manglik"]:
+        return MANGLIK_NONE
+    if manglik["mars_sign"] in [0, 7, 9]:
+        return MANGLIK_SELF_CANCELLED
+    return MANGLIK_DOSHA
+
+
+def match_key(kundli: Dict) -> MatchKey:
+    """
+    Compact match key of a kundli (all Gun Milan / Porutham / Manglik filters need).
+
+    Args:
+        kundli: Kundli dictionary (Planets with Moon and Mars, Ascendant)
+
+    Returns:
+        Tuple of (moon_nakshatra 0-26, moon_sign 0-11, manglik_code)
+    """
+    moon_degree = kundli["Planets"]["Moon"]["degree"]
+    _, nakshatra = get_nakshatra(moon_degree)
+    sign, _ = degrees_to_sign(moon_degree)
+    return nakshatra, sign, manglik_code(check_manglik(kundli))
+
+
+def validate_match_key(key) -> MatchKey:
+    """
+    Validate a stored match key.
+
+    Raises:
+        ValueError: If the nakshatra, sign or manglik code is out of range
+    """
+    nakshatra, sign, manglik = (int(value) for value in key)
+    if not 0 <= nakshatra < 27:
+        raise ValueError(f"Moon nakshatra must be 0-26, got {nakshatra}")
+    if not 0 <= sign < 12:
+        raise ValueError(f"Moon sign must be 0-11, got {sign}")
+    if manglik not in (MANGLIK_NONE, MANGLIK_DOSHA, MANGLIK_SELF_CANCELLED):
+        raise ValueError(f"Manglik code must be 0, 1 or 2, got {manglik}")
+    return nakshatra, sign, manglik
+
+
+def _guna_verdict(total: float) -> str:
+    # Same thresholds as gun_milan()
+    return "Excellent" if total >= 32 else "Very Good" if total >= 28 else "Good" if total >= 24 else "Average" if total >= 18 else "Below Average"
+
+
+def _porutham_verdict(score: int) -> str:
+    # Same thresholds as porutham()
+    return "Excellent" if score >= 9 else "Very Good" if score >= 7 else "Good" if score >= 5 else "Average" if score >= 3 else "Not Recommended"
+
+
+def _manglik_status(profile: np.ndarray, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized check_manglik_cancellation().
+
+    Both Manglik cancel each other; otherwise at most one side has the dosha,
+    and it is cancelled only by Mars in own or exaltation sign.
+
+    Returns:
+        (no_dosha, safe_for_marriage): no_dosha - no uncancelled dosha on
+        either side; safe_for_marriage - as check_manglik_cancellation()
+    """
+    profile_manglik = profile != MANGLIK_NONE
+    candidate_manglik = candidates != MANGLIK_NONE
+    both = profile_manglik & candidate_manglik
+    profile_cancelled = both | (profile == MANGLIK_SELF_CANCELLED)
+    candidate_cancelled = both | (candidates == MANGLIK_SELF_CANCELLED)
+
+    no_dosha = (~profile_manglik | profile_cancelled) & (~candidate_manglik | candidate_cancelled)
+    safe = (profile_cancelled & candidate_cancelled) | (~profile_manglik & ~candidate_manglik)
+    return no_dosha, safe
+
+
+class MatchIndex:
+    """
+    Candidate pool stored as match keys, ranked against one profile at a time.
+
+    Usage:
+        index = MatchIndex()
+        index.add("c-1", match_key(kundli))
+        index.search(profile_key, profile_is_boy=True, top_k=20, min_guna=18)
+    """
+
+    def __init__(self):
+        self._ids: List[Hashable] = []
+        self._keys: List[MatchKey] = []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, candidate_id: Hashable, key) -> None:
+        """
+        Add a candidate by its match key.
+
+        Args:
+            candidate_id: Caller's identifier, returned in search results
+            key: (moon_nakshatra, moon_sign, manglik_code)
+        """
+        key = validate_match_key(key)
+        with self._lock:
+            self._ids.append(candidate_id)
+            self._keys.append(key)
+            self._arrays = None
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with self._lock:
+            if self._arrays is None:
+                keys = np.array(self._keys, dtype=np.intp).reshape(-1, 3)
+                self._arrays = (keys[:, 0], keys[:, 1], keys[:, 2])
+            return self._arrays
+
+    def search(
+        self,
+        profile_key,
+        profile_is_boy: bool = True,
+        top_k: int = 10,
+        min_guna: float = 0,
+        min_porutham: int = 0,
+        manglik: str = "any",
+    ) -> Dict:
+        """
+        Rank the pool against one profile.
+
+        Candidates are ordered by Guna total, then Porutham score, then the
+        order they were added.
+
+        Args:
+            profile_key: Profile's match key
+            profile_is_boy: True to score the profile as the boy, False as the girl
+            top_k: Number of matches to return
+            min_guna: Minimum Guna Milan total (0-36)
+            min_porutham: Minimum Porutham score (0-10)
+            manglik: "any", "cancelled" (no uncancelled dosha on either side)
+                or "safe" (safe_for_marriage as in the full match report)
+
+        Returns:
+            Dictionary with pool size, number of matches passing the filters
+            and the top_k matches with their koota breakdown
+
+        Raises:
+            ValueError: For an invalid profile key, top_k or manglik filter
+        """
+        if manglik not in MANGLIK_FILTERS:
+            raise ValueError(f"manglik filter must be one of {MANGLIK_FILTERS}, got {manglik!r}")
+        if top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
+        profile_nak, profile_sign, profile_manglik = validate_match_key(profile_key)
+        tables = get_koota_tables()
+        naks, signs, mangliks = self._columns()
+
+        if profile_is_boy:
+            boy_nak, girl_nak, boy_sign, girl_sign = profile_nak, naks, profile_sign, signs
+        else:
+            boy_nak, girl_nak, boy_sign, girl_sign = naks, profile_nak, signs, profile_sign
+
+        guna = tables["guna_nakshatra_total"][boy_nak, girl_nak] + tables["bhakoot"][boy_sign, girl_sign]
+        poruthams = tables["porutham_nakshatra_score"][boy_nak, girl_nak] + tables["porutham_sign_score"][boy_sign, girl_sign]
+        no_dosha, safe = _manglik_status(np.intp(profile_manglik), mangliks)
+
+        mask = (guna >= min_guna) & (poruthams >= min_porutham)
+        if manglik == "cancelled":
+            mask &= no_dosha
+        elif manglik == "safe":
+            mask &= safe
+        candidates = np.flatnonzero(mask)
+
+        # Unique integer rank key: Guna (half points) > Porutham > insertion order
+        n = len(self._ids)
+        rank_key = ((np.rint(guna[candidates] * 2).astype(np.int64) * 11 + poruthams[candidates]) * n
+                    + (n - 1 - candidates))
+        if len(candidates) > top_k:
+            best = np.argpartition(-rank_key, top_k - 1)[:top_k]
+        else:
+            best = np.arange(len(candidates))
+        order = candidates[best[np.argsort(-rank_key[best])]]
+
+        matches = []
+        for i in order:
+            b_nak, g_nak = (profile_nak, naks[i]) if profile_is_boy else (naks[i], profile_nak)
+            b_sign, g_sign = (profile_sign, signs[i]) if profile_is_boy else (signs[i], profile_sign)
+            total = float(guna[i])
+            score = int(poruthams[i])
+            kootas = {name: float(tables[name][b_nak, g_nak]) for name in GUNA_NAKSHATRA_KOOTAS}
+            kootas["bhakoot"] = float(tables["bhakoot"][b_sign, g_sign])
+            checks = {
+                name: bool(tables[f"porutham_{name}"][(b_sign, g_sign) if name in PORUTHAM_SIGN_CHECKS else (b_nak, g_nak)])
+                for name in PORUTHAMS
+            }
+            matches.append({
+                "candidate_id": self._ids[i],
+                "guna_milan": {
+                    "total": round(total, 1),
+                    "percentage": round((total / 36) * 100, 1),
+                    "verdict": _guna_verdict(total),
+                    "kootas": {name: kootas[name] for name in GUNA_KOOTAS},
+                },
+                "porutham": {
+                    "score": score,
+                    "percentage": round((score / 10) * 100, 1),
+                    "verdict": _porutham_verdict(score),
+                    "checks": checks,
+                },
+                "manglik": {
+                    "candidate_code": int(mangliks[i]),
+                    "no_uncancelled_dosha": bool(no_dosha[i]),
+                    "safe_for_marriage": bool(safe[i]),
+                },
+            })
+
+        return {
+            "pool_size": n,
+            "matched": int(len(candidates)),
+            "matches": matches,
+        }
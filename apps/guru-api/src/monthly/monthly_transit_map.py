@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 import calendar
 import swisseph as swe
 
-from src.jyotish.kundli_engine import get_planet_positions
+from src.ephemeris.transit_table import get_transit_positions
 from src.jyotish.panchang import get_nakshatra
 from src.utils.converters import degrees_to_sign
 
@@ -35,7 +35,7 @@ def generate_month_transit_positions(month: int, year: int) -> Dict:
         jd = swe.julday(year, month, day, 12.0, swe.GREG_CAL)
         
         # Get planet positions
-        planets = get_planet_positions(jd)
+        planets = get_transit_positions(jd)
         
         daily_transits = {}
         for planet_name, planet_degree in planets.items():
@@ -8,6 +8,29 @@ from typing import Dict, List
 from datetime import datetime
 
 
+# Phase 20: Day-level conditions to avoid for new undertakings
+RIKTA_TITHIS = [4, 9, 14]  # Chaturthi, Navami, Chaturdashi (either paksha)
+VISHTI_KARANA = "Visti"  # Bhadra
+
+
+def get_day_blockers(panchanga: Dict) -> List[str]:
+    """
+    Phase 20: Panchanga conditions that rule out a day for a new undertaking.
+    
+    Args:
+        panchanga: Panchanga data
+    
+    Returns:
+        List of reasons (empty if the day is usable)
+    """
+    blockers = []
+    if panchanga.get("tithi", {}).get("number", 0) in RIKTA_TITHIS:
+        blockers.append("Rikta Tithi")
+    if panchanga.get("karana", {}).get("name", "") == VISHTI_KARANA:
+        blockers.append("Vishti Karana (Bhadra)")
+    return blockers
+
+
 def evaluate_travel_muhurtha(panchanga: Dict, choghadiya: Dict, transit_context: Dict) -> Dict:
     """
     Phase 20: Evaluate Muhurtha for travel.
@@ -0,0 +1,180 @@
+"""
+Phase 20: Muhurtha Range Search
+
+Finds the best Muhurtha windows for a task across a range of days.
+
+Each day is scored with the same functions as get_best_muhurtha()
+(compute_panchanga, compute_choghadiya, analyze_hourly_windows), with the
+natal chart computed once for the whole range instead of once per day:
+
+1. Panchanga first. Days with a blocker from muhurtha_rules (Rikta Tithi,
+   Vishti Karana) are dropped when pruning is on.
+2. Upper bound: calculate_window_score() with the best possible transit.
+   If it cannot reach the minimum window score, or cannot beat the current
+   top-K, the day is skipped before transits and Choghadiya are computed.
+3. The remaining days are scored and kept in a heap of the top-K windows.
+
+Windows are ranked by score, then date, then their order within the day.
+Ranges can be split into chunks (e.g. one compute task each) and the chunk
+results combined with merge_muhurtha_results().
+"""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from src.jyotish.kundli_engine import get_planet_positions
+from src.muhurtha.choghadiya_engine import compute_choghadiya
+from src.muhurtha.muhurtha_engine import analyze_hourly_windows, calculate_window_score
+from src.muhurtha.muhurtha_rules import get_day_blockers
+from src.muhurtha.panchanga_engine import compute_panchanga
+from src.transit_ai.transit_context_builder import build_current_transits
+import swisseph as swe
+
+# analyze_hourly_windows() keeps windows scoring at least this much
+MIN_WINDOW_SCORE = 6
+
+# Most favourable transit calculate_window_score() rewards (upper bound)
+_BEST_CASE_TRANSIT = {
+    "current_transits": {
+        "Jupiter": {"house_from_lagna": 1},
+        "Venus": {"house_from_lagna": 1},
+    }
+}
+
+
+def build_day_transit(date: datetime, natal_asc: float, natal_moon: float) -> Dict:
+    """
+    Phase 20: Transit context for Muhurtha scoring (current transits only).
+
+    Args:
+        date: Date and time
+        natal_asc: Natal Ascendant degree
+        natal_moon: Natal Moon degree
+
+    Returns:
+        Dictionary with current_transits as build_transit_context() builds them
+    """
+    jd = swe.julday(date.year, date.month, date.day, date.hour + date.minute / 60.0, swe.GREG_CAL)
+    return {"current_transits": build_current_transits(get_planet_positions(jd), natal_asc, natal_moon)}
+
+
+def muhurtha_day_upper_bound(panchanga: Dict, task: str) -> int:
+    """
+    Phase 20: Highest window score a day can reach from its Panchanga alone.
+
+    Args:
+        panchanga: Panchanga data
+        task: Task type
+
+    Returns:
+        Upper bound of calculate_window_score() for any transit
+    """
+    return calculate_window_score("", "", panchanga, _BEST_CASE_TRANSIT, task)
+
+
+def _rank_key(window: Dict, day_index: int, position: int) -> tuple:
+    # Larger is better: higher score, then earlier day, then earlier in the day
+    return (window["score"], -day_index, -position)
+
+
+def search_muhurtha_range(
+    start_date: str,
+    days: int,
+    location: Dict,
+    task: str,
+    natal_asc: float,
+    natal_moon: float,
+    top_k: int = 5,
+    prune: bool = True
+) -> Dict:
+    """
+    Phase 20: Best Muhurtha windows for a task over consecutive days.
+
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        days: Number of days to search
+        location: Location dictionary (latitude, longitude, timezone)
+        task: Task type (travel, job_application, etc.)
+        natal_asc: Natal Ascendant degree
+        natal_moon: Natal Moon degree
+        top_k: Number of windows to return
+        prune: Drop Rikta Tithi / Vishti Karana days
+
+    Returns:
+        Dictionary with the top_k windows and day counters
+    """
+    first_day = datetime.strptime(start_date, "%Y-%m-%d")
+    heap: List[tuple] = []
+    stats = {"days_searched": days, "days_pruned": 0, "days_bounded": 0, "days_scored": 0}
+
+    for day_index in range(days):
+        date = first_day + timedelta(days=day_index)
+        panchanga = compute_panchanga(date, location)
+
+        if prune and get_day_blockers(panchanga):
+            stats["days_pruned"] += 1
+            continue
+
+        bound = muhurtha_day_upper_bound(panchanga, task)
+        # Later days lose ties, so matching the heap's weakest score is not enough
+        if bound < MIN_WINDOW_SCORE or (len(heap) == top_k and bound <= heap[0][0][0]):
+            stats["days_bounded"] += 1
+            continue
+
+        stats["days_scored"] += 1
+        transit = build_day_transit(date, natal_asc, natal_moon)
+        choghadiya = compute_choghadiya(date, location)
+        windows = analyze_hourly_windows(date, panchanga, choghadiya, transit, task, {})
+
+        for position, window in enumerate(windows):
+            entry = (_rank_key(window, day_index, position), {
+                "date": date.strftime("%Y-%m-%d"),
+                **window,
+                "panchanga": {
+                    "tithi": panchanga.get("tithi", {}).get("name", ""),
+                    "nakshatra": panchanga.get("nakshatra", {}).get("name", ""),
+                    "yoga": panchanga.get("yoga", {}).get("name", ""),
+                    "karana": panchanga.get("karana", {}).get("name", "")
+                }
+            })
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    best = [window for _, window in sorted(heap, key=lambda entry: entry[0], reverse=True)]
+    return {
+        "task": task,
+        "start_date": start_date,
+        "days": days,
+        "best_windows": best,
+        **stats
+    }
+
+
+def merge_muhurtha_results(results: List[Dict], top_k: int) -> Dict:
+    """
+    Phase 20: Combine search_muhurtha_range() results of consecutive chunks.
+
+    Args:
+        results: Chunk results in date order
+        top_k: Number of windows to return
+
+    Returns:
+        Result for the whole range (same best_windows as one call over the
+        range; day counters are summed per chunk)
+    """
+    # Chunk lists are already ordered; a stable sort on (score, date) keeps
+    # the order within a day
+    windows = [window for result in results for window in result["best_windows"]]
+    windows.sort(key=lambda window: (-window["score"], window["date"]))
+    merged = {
+        "task": results[0]["task"],
+        "start_date": results[0]["start_date"],
+        "days": sum(result["days"] for result in results),
+        "best_windows": windows[:top_k],
+    }
+    for counter in ("days_searched", "days_pruned", "days_bounded", "days_scored"):
+        merged[counter] = sum(result[counter] for result in results)
+    return merged
@@ -0,0 +1,166 @@
+"""
+Phase 12: Channel Connections
+
+Persistent connections shared by the delivery channels:
+- One requests.Session (urllib3 keep-alive pool) for SendGrid / FCM / other HTTP gateways
+- A bounded pool of logged-in SMTP connections, reused across messages
+
+Both are thread-safe, so the delivery workers share them.
+"""
+
+import smtplib
+import threading
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# HTTP keep-alive pool (per host)
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+
+# SMTP
+SMTP_POOL_MAXSIZE = 8
+SMTP_TIMEOUT_SECONDS = 30
+
+_http_session: Optional[requests.Session] = None
+_http_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Shared HTTP session with a keep-alive connection pool.
+
+    Returns:
+        requests.Session (created on first use)
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Rate-limited or server-side HTTP failure (worth retrying with backoff)."""
+    return status_code == 429 or status_code >= 500
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of logged-in SMTP connections.
+
+    Args:
+        host: SMTP host
+        port: SMTP port
+        user: Login user (None = no AUTH)
+        password: Login password
+        starttls: Upgrade the connection with STARTTLS before login
+        max_size: Maximum open connections
+    """
+
+    def __init__(self, host: str, port: int, user: Optional[str], password: Optional[str],
+                 starttls: bool = True, max_size: int = SMTP_POOL_MAXSIZE):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self._idle: LifoQueue = LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT_SECONDS)
+        if self.starttls:
+            server.starttls()
+        if self.user:
+            server.login(self.user, self.password)
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection (reused if idle, opened otherwise); broken connections are dropped."""
+        self._slots.acquire()
+        server = None
+        try:
+            try:
+                server = self._idle.get_nowait()
+            except Empty:
+                server = self._connect()
+            yield server
+            self._idle.put(server)
+            server = None
+        finally:
+            if server is not None:
+                self._close(server)
+            self._slots.release()
+
+    def send_message(self, msg) -> None:
+        """
+        Send one message on a pooled connection.
+
+        A reused connection the server has dropped is replaced once.
+        """
+        for attempt in range(2):
+            try:
+                with self.connection() as server:
+                    server.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                if attempt:
+                    raise
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except Empty:
+                return
+            self._close(server)
+
+
+_smtp_pools: Dict[Tuple, SMTPConnectionPool] = {}
+_smtp_lock = threading.Lock()
+
+
+def get_smtp_pool(host: str, port: int, user: Optional[str], password: Optional[str],
+                  starttls: bool = True) -> SMTPConnectionPool:
+    """Shared SMTP pool for one server/login."""
+    key = (host, port, user, password, starttls)
+    with _smtp_lock:
+        pool = _smtp_pools.get(key)
+        if pool is None:
+            pool = _smtp_pools[key] = SMTPConnectionPool(host, port, user, password, starttls)
+        return pool
+
+
+def close_connections() -> None:
+    """Close pooled SMTP connections and the HTTP session."""
+    global _http_session
+    with _smtp_lock:
+        pools = list(_smtp_pools.values())
+        _smtp_pools.clear()
+    for pool in pools:
+        pool.close_all()
+    with _http_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
@@ -2,6 +2,7 @@
 Phase 12: Email Channel
 
 Email delivery via SMTP (Gmail) or SendGrid.
+SMTP connections and SendGrid HTTP connections are pooled and reused across messages.
 """
 
 import os
@@ -10,21 +11,26 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Optional
 
+import requests
+
 from src.config import settings
+from src.notifications.channels.connections import get_http_session, get_smtp_pool, is_retryable_status
 
 # Phase 12: SMTP credentials from environment
 SMTP_USER = os.getenv("SMTP_USER", getattr(settings, "smtp_user", None))
 SMTP_PASS = os.getenv("SMTP_PASS", getattr(settings, "smtp_pass", None))
 SMTP_HOST = os.getenv("SMTP_HOST", getattr(settings, "smtp_host", "smtp.gmail.com"))
 SMTP_PORT = int(os.getenv("SMTP_PORT", str(getattr(settings, "smtp_port", 587) or 587)))
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() != "false"
 
 # SendGrid support (optional)
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", getattr(settings, "sendgrid_api_key", None))
+SENDGRID_API_URL = os.getenv("SENDGRID_API_URL", "https://api.sendgrid.com/v3/mail/send")
 
 
 def send_email_smtp(to: str, subject: str, body: str, html_body: Optional[str] = None) -> Dict:
     """
-    Phase 12: Send email via SMTP.
+    Phase 12: Send email via SMTP (pooled, logged-in connection).
     
     Args:
         to: Recipient email address
@@ -33,7 +39,7 @@ def send_email_smtp(to: str, subject: str, body: str, html_body: Optional[str] =
         html_body: Optional HTML email body
     
     Returns:
-        Dictionary with success status
+        Dictionary with success status (retryable=True on transient failures)
     """
     if not SMTP_USER or not SMTP_PASS:
         return {
@@ -54,18 +60,35 @@ def send_email_smtp(to: str, subject: str, body: str, html_body: Optional[str] =
         msg["From"] = SMTP_USER
         msg["To"] = to
         
-        # Connect to SMTP server
-        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.send_message(msg)
-        server.quit()
+        # Send on a pooled connection
+        get_smtp_pool(SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, SMTP_STARTTLS).send_message(msg)
         
         return {
             "success": True,
             "method": "smtp"
         }
     
+    except smtplib.SMTPResponseException as e:
+        # 4xx replies are temporary (greylisting, rate limits)
+        return {
+            "success": False,
+            "error": str(e),
+            "retryable": 400 <= e.smtp_code < 500
+        }
+    except smtplib.SMTPException as e:
+        # Refused recipients / unsupported auth are permanent; a dropped connection is not
+        return {
+            "success": False,
+            "error": str(e),
+            "retryable": isinstance(e, smtplib.SMTPServerDisconnected)
+        }
+    except OSError as e:
+        # Network errors, timeouts
+        return {
+            "success": False,
+            "error": str(e),
+            "retryable": True
+        }
     except Exception as e:
         return {
             "success": False,
@@ -75,7 +98,7 @@ def send_email_smtp(to: str, subject: str, body: str, html_body: Optional[str] =
 
 def send_email_sendgrid(to: str, subject: str, body: str, html_body: Optional[str] = None) -> Dict:
     """
-    Phase 12: Send email via SendGrid API.
+    Phase 12: Send email via SendGrid API (keep-alive HTTP session).
     
     Args:
         to: Recipient email address
@@ -84,7 +107,7 @@ def send_email_sendgrid(to: str, subject: str, body: str, html_body: Optional[st
         html_body: Optional HTML email body
     
     Returns:
-        Dictionary with success status
+        Dictionary with success status (retryable=True on transient failures)
     """
     if not SENDGRID_API_KEY:
         return {
@@ -93,9 +116,7 @@ def send_email_sendgrid(to: str, subject: str, body: str, html_body: Optional[st
         }
     
     try:
-        import requests
-        
-        url = "https://api.sendgrid.com/v3/mail/send"
+        url = SENDGRID_API_URL
         headers = {
             "Authorization": f"Bearer {SENDGRID_API_KEY}",
             "Content-Type": "application/json"
@@ -121,7 +142,7 @@ def send_email_sendgrid(to: str, subject: str, body: str, html_body: Optional[st
                 "value": html_body
             })
         
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_http_session().post(url, json=payload, headers=headers, timeout=10)
         
         if response.status_code == 202:
             return {
@@ -131,13 +152,15 @@ def send_email_sendgrid(to: str, subject: str, body: str, html_body: Optional[st
         else:
             return {
                 "success": False,
-                "error": f"SendGrid API error: {response.status_code} - {response.text}"
+                "error": f"SendGrid API error: {response.status_code} - {response.text}",
+                "retryable": is_retryable_status(response.status_code)
             }
     
-    except ImportError:
+    except (requests.ConnectionError, requests.Timeout) as e:
         return {
             "success": False,
-            "error": "requests package required for SendGrid"
+            "error": str(e),
+            "retryable": True
         }
     except Exception as e:
         return {
@@ -160,11 +183,15 @@ def send_email(to: str, subject: str, body: str, html_body: Optional[str] = None
         Dictionary with success status
     """
     # Try SendGrid first if available
+    sendgrid_result = None
     if SENDGRID_API_KEY:
-        result = send_email_sendgrid(to, subject, body, html_body)
-        if result["success"]:
-            return result
+        sendgrid_result = send_email_sendgrid(to, subject, body, html_body)
+        if sendgrid_result["success"]:
+            return sendgrid_result
     
     # Fall back to SMTP
-    return send_email_smtp(to, subject, body, html_body)
+    result = send_email_smtp(to, subject, body, html_body)
+    if not result["success"] and sendgrid_result and sendgrid_result.get("retryable"):
+        result["retryable"] = True
+    return result
 
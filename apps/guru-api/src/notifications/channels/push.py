@@ -2,12 +2,25 @@
 Phase 12: Push Notification Channel
 
 Push notification delivery via Firebase Cloud Messaging (FCM) using Admin SDK (HTTP v1).
+Legacy-API requests share one keep-alive HTTP session.
 """
 
 import os
 from typing import Dict, Optional, List
 
+import requests
+
 from src.config import settings
+from src.notifications.channels.connections import get_http_session, is_retryable_status
+
+# Legacy FCM endpoint (overridable for gateways / local testing)
+FCM_LEGACY_URL = os.getenv("FCM_LEGACY_URL", "https://fcm.googleapis.com/fcm/send")
+
+# Most tokens per multicast request (FCM limit)
+PUSH_MULTICAST_LIMIT = 500
+
+# FCM errors worth retrying with backoff
+_TRANSIENT_FCM_ERRORS = {"Unavailable", "InternalServerError", "UNAVAILABLE", "INTERNAL", "QUOTA_EXCEEDED", "RESOURCE_EXHAUSTED"}
 
 # Phase 12: Firebase Admin SDK initialization
 _firebase_app = None
@@ -65,6 +78,10 @@ def _initialize_firebase():
         return None
     
     except ImportError:
+        # Legacy FCM_SERVER_KEY only needs HTTP
+        if os.getenv("FCM_SERVER_KEY"):
+            _fcm_initialized = True
+            return None
         print("Warning: firebase-admin not installed. Push notifications will not work.")
         return None
     except Exception as e:
@@ -129,18 +146,24 @@ def send_push(token: str, title: str, message: str, data: Optional[Dict] = None)
     except Exception as e:
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            "retryable": _is_transient_error(e)
         }
 
 
+def _is_transient_error(error: Exception) -> bool:
+    """Firebase Admin SDK / network error worth retrying."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return getattr(error, "code", None) in _TRANSIENT_FCM_ERRORS
+
+
 def _send_push_legacy(token: str, title: str, message: str, data: Optional[Dict] = None) -> Dict:
     """
     Phase 12: Legacy FCM API (fallback only).
     
     This method is deprecated but kept for backward compatibility.
     """
-    import requests
-    
     fcm_server_key = os.getenv("FCM_SERVER_KEY")
     if not fcm_server_key:
         return {
@@ -149,7 +172,7 @@ def _send_push_legacy(token: str, title: str, message: str, data: Optional[Dict]
         }
     
     try:
-        url = "https://fcm.googleapis.com/fcm/send"
+        url = FCM_LEGACY_URL
         headers = {
             "Authorization": f"key={fcm_server_key}",
             "Content-Type": "application/json"
@@ -166,7 +189,7 @@ def _send_push_legacy(token: str, title: str, message: str, data: Optional[Dict]
         if data:
             payload["data"] = data
         
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = get_http_session().post(url, json=payload, headers=headers, timeout=10)
         
         if response.status_code == 200:
             result = response.json()
@@ -177,20 +200,84 @@ def _send_push_legacy(token: str, title: str, message: str, data: Optional[Dict]
                     "method": "legacy_api"
                 }
             else:
+                error = result.get("results", [{}])[0].get("error", "Unknown FCM error")
                 return {
                     "success": False,
-                    "error": result.get("results", [{}])[0].get("error", "Unknown FCM error")
+                    "error": error,
+                    "retryable": error in _TRANSIENT_FCM_ERRORS
                 }
         else:
             return {
                 "success": False,
-                "error": f"FCM API error: {response.status_code} - {response.text}"
+                "error": f"FCM API error: {response.status_code} - {response.text}",
+                "retryable": is_retryable_status(response.status_code)
             }
     
     except Exception as e:
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            "retryable": _is_transient_error(e)
+        }
+
+
+def _send_push_multicast_legacy(tokens: List[str], title: str, message: str, data: Optional[Dict] = None) -> Dict:
+    """
+    Phase 12: Legacy FCM API multicast (registration_ids, one request per batch).
+    """
+    fcm_server_key = os.getenv("FCM_SERVER_KEY")
+    if not fcm_server_key:
+        return {
+            "success": False,
+            "error": "FCM_SERVER_KEY not configured"
+        }
+    
+    try:
+        headers = {
+            "Authorization": f"key={fcm_server_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "registration_ids": tokens,
+            "notification": {
+                "title": title,
+                "body": message
+            }
+        }
+        if data:
+            payload["data"] = data
+        
+        response = get_http_session().post(FCM_LEGACY_URL, json=payload, headers=headers, timeout=10)
+        if response.status_code != 200:
+            return {
+                "success": False,
+                "error": f"FCM API error: {response.status_code} - {response.text}",
+                "retryable": is_retryable_status(response.status_code)
+            }
+        
+        result = response.json()
+        results = []
+        for r in result.get("results", []):
+            error = r.get("error")
+            results.append({
+                "success": error is None,
+                "message_id": r.get("message_id"),
+                "error": error,
+                "retryable": error in _TRANSIENT_FCM_ERRORS
+            })
+        return {
+            "success": True,
+            "success_count": result.get("success", 0),
+            "failure_count": result.get("failure", 0),
+            "results": results,
+            "method": "legacy_api"
+        }
+    
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "retryable": _is_transient_error(e)
         }
 
 
@@ -205,11 +292,15 @@ def send_push_multicast(tokens: List[str], title: str, message: str, data: Optio
         data: Optional additional data payload
     
     Returns:
-        Dictionary with success status and results
+        Dictionary with success status and results (one entry per token, in order)
     """
     # Initialize Firebase
     app = _initialize_firebase()
     
+    # Legacy API (FCM_SERVER_KEY) also supports multicast
+    if not app and _fcm_initialized:
+        return _send_push_multicast_legacy(tokens, title, message, data)
+    
     if not app:
         return {
             "success": False,
@@ -232,8 +323,9 @@ def send_push_multicast(tokens: List[str], title: str, message: str, data: Optio
             data=data if data else {}
         )
         
-        # Send
-        response = messaging.send_multicast(message_obj)
+        # Send (send_multicast was removed in newer firebase-admin releases)
+        send_each = getattr(messaging, "send_each_for_multicast", None) or messaging.send_multicast
+        response = send_each(message_obj)
         
         return {
             "success": True,
@@ -243,7 +335,8 @@ def send_push_multicast(tokens: List[str], title: str, message: str, data: Optio
                 {
                     "success": r.success,
                     "message_id": r.message_id if r.success else None,
-                    "error": str(r.exception) if r.exception else None
+                    "error": str(r.exception) if r.exception else None,
+                    "retryable": bool(r.exception) and _is_transient_error(r.exception)
                 }
                 for r in response.responses
             ],
@@ -253,6 +346,7 @@ def send_push_multicast(tokens: List[str], title: str, message: str, data: Optio
     except Exception as e:
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            "retryable": _is_transient_error(e)
         }
 
@@ -2,12 +2,16 @@
 Phase 12: WhatsApp Channel
 
 WhatsApp message delivery via Twilio WhatsApp API.
+The module-level Twilio client keeps one HTTP session, so connections are reused.
 """
 
 import os
 from typing import Optional, Dict
 
+import requests
+
 from src.config import settings
+from src.notifications.channels.connections import is_retryable_status
 
 # Phase 12: Twilio credentials from environment
 TWILIO_SID = os.getenv("TWILIO_SID", getattr(settings, "twilio_sid", None))
@@ -105,8 +109,15 @@ def send_whatsapp(
         }
     
     except Exception as e:
+        # TwilioRestException carries the HTTP status; transport errors have none
+        status = getattr(e, "status", None)
+        if isinstance(status, int):
+            retryable = is_retryable_status(status)
+        else:
+            retryable = isinstance(e, (requests.ConnectionError, requests.Timeout))
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            "retryable": retryable
         }
 
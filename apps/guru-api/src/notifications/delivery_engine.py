@@ -4,24 +4,32 @@ Phase 12: Multi-Channel Delivery Engine
 Orchestrates notification delivery across all channels based on user preferences.
 """
 
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError, wait
 from datetime import datetime
 from typing import Dict, Optional
+import pytz
 import swisseph as swe
 
+from src.config import settings
 from src.db.database import SessionLocal
 from src.db.models import User, BirthDetail, Notification, DeliveryLog, NotificationPreferences
-from src.notifications.preferences.user_prefs import get_prefs
+from src.notifications.preferences.delivery_schedule import (
+    DELIVERY_LEASE,
+    DELIVERY_LEASE_BUDGET,
+    DELIVERY_LEASE_MARGIN,
+    backfill_delivery_schedule,
+    claim_due_deliveries,
+    release_deliveries,
+    schedule_next_delivery,
+)
 from src.notifications.channels.whatsapp import send_whatsapp
 from src.notifications.channels.emailer import send_email
-from src.notifications.channels.push import send_push
+from src.notifications.delivery_pool import DeliveryDispatcher, get_delivery_dispatcher
 from src.notifications.templates.daily import daily_short, daily_full
 from src.ai.interpreter.daily_interpreter import interpret_daily
-from src.jyotish.daily.daily_engine import compute_daily
-from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
-from src.jyotish.dasha_engine import calculate_vimshottari_dasha
-from src.jyotish.panchang_engine import generate_panchang
-from src.jyotish.yogas.yoga_engine import detect_all_yogas
-from src.utils.converters import degrees_to_sign
+from src.jyotish.daily.sky_context import get_local_sky
+from src.jyotish.natal_store import get_natal_chart
 
 
 def build_daily_data(birth_detail: BirthDetail) -> Dict:
@@ -34,18 +42,8 @@ def build_daily_data(birth_detail: BirthDetail) -> Dict:
     Returns:
         Complete daily data dictionary
     """
-    # Parse birth date and time
-    birth_dt = birth_detail.birth_date
-    birth_time_str = birth_detail.birth_time
-    hour, minute = map(int, birth_time_str.split(':'))
-    birth_datetime = datetime.combine(birth_dt, datetime.min.time().replace(hour=hour, minute=minute))
-    
-    # Calculate Julian Days
-    birth_jd = swe.julday(
-        birth_datetime.year, birth_datetime.month, birth_datetime.day,
-        birth_datetime.hour + birth_datetime.minute / 60.0,
-        swe.GREG_CAL
-    )
+    # Natal chart (stored on the birth detail, recomputed only when stale)
+    natal = get_natal_chart(birth_detail)
     
     current_dt = datetime.now()
     current_jd = swe.julday(
@@ -54,35 +52,14 @@ def build_daily_data(birth_detail: BirthDetail) -> Dict:
         swe.GREG_CAL
     )
     
-    # Generate all data
-    kundli = generate_kundli(birth_jd, birth_detail.birth_latitude, birth_detail.birth_longitude)
-    birth_planets = get_planet_positions(birth_jd)
-    moon_degree = birth_planets["Moon"]
-    dasha = calculate_vimshottari_dasha(birth_datetime, moon_degree)
-    panchang = generate_panchang(current_jd, current_dt, birth_detail.birth_latitude, birth_detail.birth_longitude)
-    
-    # Prepare for yogas
-    planets = {}
-    for p, d in kundli['Planets'].items():
-        if p in ["Rahu", "Ketu"]:
-            continue
-        sign_num, _ = degrees_to_sign(d['degree'])
-        asc_deg = kundli['Ascendant']['degree']
-        rel_pos = (d['degree'] - asc_deg) % 360
-        house_num = int(rel_pos / 30) + 1
-        if house_num > 12:
-            house_num = 1
-        planets[p] = {'degree': d['degree'], 'sign': sign_num, 'house': house_num}
-    
-    houses = []
-    asc_sign, _ = degrees_to_sign(kundli['Ascendant']['degree'])
-    houses.append({'house': 1, 'degree': kundli['Ascendant']['degree'], 'sign': asc_sign})
-    for h in kundli['Houses']:
-        sign_num, _ = degrees_to_sign(h['degree'])
-        houses.append({'house': h['house'], 'degree': h['degree'], 'sign': sign_num})
+    kundli = natal["kundli"]
+    dasha = natal["dasha"]
+    yogas = natal["yogas"]
     
-    yogas = detect_all_yogas(planets, houses)
-    daily = compute_daily(birth_jd, current_jd, birth_detail.birth_latitude, birth_detail.birth_longitude, birth_datetime)
+    # Today's sky is shared by every user at this location; only the natal part is per user
+    local_sky = get_local_sky(current_jd, birth_detail.birth_latitude, birth_detail.birth_longitude)
+    panchang = local_sky.panchang()
+    daily = local_sky.daily_for_natal(natal)
     
     # Get moon data for lucky color
     moon_data = daily.get("moon", {})
@@ -106,24 +83,19 @@ def build_daily_data(birth_detail: BirthDetail) -> Dict:
     }
 
 
-def send_to_user(user: User, data: Dict, prefs: NotificationPreferences, db: SessionLocal) -> Dict:
+def dispatch_to_user(user: User, data: Dict, prefs: NotificationPreferences, dispatcher: DeliveryDispatcher) -> Dict:
     """
-    Phase 12: Send notifications to user via all enabled channels.
+    Phase 12: Submit the user's external channel sends (WhatsApp, email, push) to the worker pool.
     
     Args:
         user: User object
         data: Daily prediction data
         prefs: User notification preferences
-        db: Database session
+        dispatcher: Delivery worker pool
     
     Returns:
-        Dictionary with delivery results
+        Pending delivery for record_user_delivery() (channel futures + messages)
     """
-    results = {
-        "user_id": user.id,
-        "channels": {}
-    }
-    
     # Generate messages
     short_msg = daily_short(data, prefs.language)
     summary = data.get("daily_strength", {}).get("summary", "Daily guidance")
@@ -143,58 +115,85 @@ def send_to_user(user: User, data: Dict, prefs: NotificationPreferences, db: Ses
     else:
         full_msg = short_msg  # Free users get short message
     
+    sends = {}
+    
     # WhatsApp delivery
     if prefs.channel_whatsapp == "enabled":
         whatsapp_number = prefs.whatsapp_number or user.phone
         if whatsapp_number:
-            result = send_whatsapp(whatsapp_number, short_msg)
-            status = "success" if result.get("success") else "failed"
-            error_msg = result.get("error") if not result.get("success") else None
-            
-            log = DeliveryLog(
-                user_id=user.id,
-                channel="whatsapp",
-                status=status,
-                message_preview=summary[:200],
-                error_message=error_msg,
-                gateway_response=result
-            )
-            db.add(log)
-            results["channels"]["whatsapp"] = result
+            sends["whatsapp"] = dispatcher.submit("whatsapp", send_whatsapp, whatsapp_number, short_msg)
     
     # Email delivery
     if prefs.channel_email == "enabled" and user.email:
-        result = send_email(user.email, "Your Daily Guru Guidance", full_msg)
-        status = "success" if result.get("success") else "failed"
-        error_msg = result.get("error") if not result.get("success") else None
-        
-        log = DeliveryLog(
-            user_id=user.id,
-            channel="email",
-            status=status,
-            message_preview=summary[:200],
-            error_message=error_msg,
-            gateway_response=result
-        )
-        db.add(log)
-        results["channels"]["email"] = result
+        sends["email"] = dispatcher.submit("email", send_email, user.email, "Your Daily Guru Guidance", full_msg)
     
-    # Push notification delivery
+    # Push notification delivery (batched into multicast requests)
     if prefs.channel_push == "enabled" and prefs.push_token:
-        result = send_push(prefs.push_token, "Guru's Daily Guidance", summary)
+        sends["push"] = dispatcher.submit_push(prefs.push_token, "Guru's Daily Guidance", summary)
+    
+    return {
+        "summary": summary,
+        "full_msg": full_msg,
+        "is_premium": is_premium,
+        "sends": sends
+    }
+
+
+def record_user_delivery(
+    user: User,
+    data: Dict,
+    prefs: NotificationPreferences,
+    pending: Dict,
+    db: SessionLocal,
+    timeout: Optional[float] = None,
+) -> Dict:
+    """
+    Phase 12: Wait for the user's channel sends, log them and create the in-app notification.
+    
+    A send that raised or is still unresolved after the timeout is logged as failed.
+    
+    Args:
+        user: User object
+        data: Daily prediction data
+        prefs: User notification preferences
+        pending: dispatch_to_user() result
+        db: Database session (caller commits)
+        timeout: Seconds to wait for all the user's sends (default: settings.delivery_send_timeout_seconds)
+    
+    Returns:
+        Dictionary with delivery results
+    """
+    results = {
+        "user_id": user.id,
+        "channels": {}
+    }
+    summary = pending["summary"]
+    full_msg = pending["full_msg"]
+    is_premium = pending["is_premium"]
+    deadline = time.monotonic() + (settings.delivery_send_timeout_seconds if timeout is None else timeout)
+    
+    for channel in ("whatsapp", "email", "push"):
+        if channel not in pending["sends"]:
+            continue
+        try:
+            result = pending["sends"][channel].result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            result = {"success": False, "error": "Send still pending at timeout"}
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
         status = "success" if result.get("success") else "failed"
         error_msg = result.get("error") if not result.get("success") else None
         
         log = DeliveryLog(
             user_id=user.id,
-            channel="push",
+            channel=channel,
             status=status,
             message_preview=summary[:200],
             error_message=error_msg,
             gateway_response=result
         )
         db.add(log)
-        results["channels"]["push"] = result
+        results["channels"][channel] = result
     
     # In-app notification (always create if enabled)
     if prefs.channel_inapp == "enabled":
@@ -233,63 +232,145 @@ def send_to_user(user: User, data: Dict, prefs: NotificationPreferences, db: Ses
     return results
 
 
-def process_due_users() -> Dict:
+def send_to_user(
+    user: User,
+    data: Dict,
+    prefs: NotificationPreferences,
+    db: SessionLocal,
+    dispatcher: Optional[DeliveryDispatcher] = None,
+) -> Dict:
     """
-    Phase 12: Process all users who need notifications at current time.
+    Phase 12: Send notifications to user via all enabled channels.
     
-    Runs every 5 minutes, checks which users have delivery_time matching current time.
+    Channels are sent concurrently on the delivery worker pool.
+    
+    Args:
+        user: User object
+        data: Daily prediction data
+        prefs: User notification preferences
+        db: Database session
+        dispatcher: Delivery worker pool (default: shared pool)
+    
+    Returns:
+        Dictionary with delivery results
+    """
+    dispatcher = dispatcher or get_delivery_dispatcher()
+    pending = dispatch_to_user(user, data, prefs, dispatcher)
+    dispatcher.flush()
+    return record_user_delivery(user, data, prefs, pending, db)
+
+
+def process_due_users(
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+    session_factory=SessionLocal,
+    dispatcher: Optional[DeliveryDispatcher] = None,
+) -> Dict:
+    """
+    Phase 12: Process all users whose delivery is due.
+    
+    Runs every 5 minutes. Only rows with next_delivery_at <= now are fetched
+    (indexed), in claimed batches; each processed user is moved to the next
+    local delivery_time. If the process dies mid-batch, the claimed rows are
+    retried once their DELIVERY_LEASE expires (at-least-once).
+    
+    Batches are claimed small (DELIVERY_CLAIM_BATCH_SIZE). If building a
+    batch uses more than DELIVERY_LEASE_BUDGET of the lease, its unstarted
+    rows are released and the claim size shrinks to what fitted, so no row
+    is still being processed when its lease expires and another worker
+    claims it again.
+    
+    A batch's channel sends run concurrently on the delivery worker pool
+    (per-channel limits, retry/backoff, multicast push); logs are written and
+    the batch committed once all of them have resolved. The wait is bounded
+    by what is left of the lease (less DELIVERY_LEASE_MARGIN): users whose
+    sends are still unresolved then are released and the tick ends, so the
+    next tick retries them (a send that completes late may be repeated).
+    
+    Args:
+        now: Current UTC datetime (default: now)
+        batch_size: Deliveries claimed per query (default: settings.delivery_claim_batch_size)
+        session_factory: Session factory (default: SessionLocal)
+        dispatcher: Delivery worker pool (default: shared pool)
     
     Returns:
         Dictionary with processing results
     """
-    db = SessionLocal()
+    now = now or datetime.now(pytz.UTC)
+    batch_size = batch_size or settings.delivery_claim_batch_size
+    lease_budget = DELIVERY_LEASE.total_seconds() * DELIVERY_LEASE_BUDGET
+    dispatcher = dispatcher or get_delivery_dispatcher()
+    db = session_factory()
     try:
-        now = datetime.now().strftime("%H:%M")
-        
-        # Get all users with notifications enabled
-        users = db.query(User).filter(
-            User.daily_notifications == "enabled"
-        ).all()
+        # Rows created without a due time (legacy/imported) join the index here
+        backfill_delivery_schedule(db, now=now)
         
         processed = 0
         successful = 0
         failed = 0
         
-        for user in users:
-            try:
-                # Get user preferences
-                prefs = get_prefs(user.id, db)
-                
-                # Check if it's time to deliver
-                if prefs.delivery_time != now:
-                    continue
-                
-                # Get birth data
-                birth_detail = db.query(BirthDetail).filter(
-                    BirthDetail.user_id == user.id
-                ).first()
+        while True:
+            due = claim_due_deliveries(db, now, batch_size)
+            if not due:
+                break
+            claimed_at = time.monotonic()
+            
+            # Build each user's data and submit their sends; the worker pool delivers concurrently
+            deliveries = []
+            for index, (prefs, user) in enumerate(due):
+                if index and time.monotonic() - claimed_at > lease_budget:
+                    # Running out of lease: hand the rest back and claim fewer next time
+                    release_deliveries(due[index:], now)
+                    batch_size = index
+                    break
+                try:
+                    # Get birth data
+                    birth_detail = db.query(BirthDetail).filter(
+                        BirthDetail.user_id == user.id
+                    ).first()
+                    
+                    if birth_detail:
+                        # Build daily data
+                        data = build_daily_data(birth_detail)
+                        deliveries.append((prefs, user, data, dispatch_to_user(user, data, prefs, dispatcher)))
+                    else:
+                        # Nothing to deliver: index the next local delivery time
+                        schedule_next_delivery(prefs, now)
                 
-                if not birth_detail:
+                except Exception as e:
+                    print(f"Error processing user {user.id}: {e}")
+                    failed += 1
+                    # A delivery that raised is not retried today (a crash is: the lease expires)
+                    schedule_next_delivery(prefs, now)
+            
+            dispatcher.flush()
+            
+            # Wait for the sends and their retries, but only while the rows are still leased
+            lease_left = (DELIVERY_LEASE - DELIVERY_LEASE_MARGIN).total_seconds() - (time.monotonic() - claimed_at)
+            wait(
+                [future for *_, pending in deliveries for future in pending["sends"].values()],
+                timeout=max(0.0, lease_left),
+            )
+            
+            # Collect results, then commit the batch
+            unfinished = []
+            for prefs, user, data, pending in deliveries:
+                if not all(future.done() for future in pending["sends"].values()):
+                    unfinished.append((prefs, user))
                     continue
-                
-                # Build daily data
-                data = build_daily_data(birth_detail)
-                
-                # Send to user
-                result = send_to_user(user, data, prefs, db)
-                
+                result = record_user_delivery(user, data, prefs, pending, db)
                 processed += 1
                 if any(ch.get("success") for ch in result.get("channels", {}).values()):
                     successful += 1
                 else:
                     failed += 1
-                
-            except Exception as e:
-                print(f"Error processing user {user.id}: {e}")
-                failed += 1
-                continue
-        
-        db.commit()
+                schedule_next_delivery(prefs, now)
+            if unfinished:
+                # Lease used up by slow gateways: hand the rest back to the next tick
+                release_deliveries(unfinished, now)
+                db.commit()
+                break
+            db.commit()
         
         return {
             "status": "success",
@@ -309,4 +390,3 @@ def process_due_users() -> Dict:
         }
     finally:
         db.close()
-
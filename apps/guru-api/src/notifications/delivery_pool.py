@@ -0,0 +1,271 @@
+"""
+Phase 12: Delivery Worker Pool
+
+Concurrent multi-channel sends for the delivery engine.
+
+- One thread pool per channel: the pool size is the channel's concurrency
+  limit, so a slow gateway (e.g. SMTP) never starves the others.
+- Failures a channel marks retryable (rate limits, 5xx, dropped connections)
+  are re-queued with exponential backoff and jitter, up to max_attempts.
+- Push messages are queued and sent with send_push_multicast, grouped by
+  identical title/body, in batches of up to PUSH_MULTICAST_LIMIT tokens.
+
+Every submit returns a concurrent.futures.Future resolving to the channel's
+result dict (plus "attempts"); send failures are results, and a future only
+raises if the pool itself failed while handling it.
+"""
+
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from src.config import settings
+from src.notifications.channels.push import PUSH_MULTICAST_LIMIT, send_push_multicast
+
+CHANNELS = ("whatsapp", "email", "push")
+
+
+def default_channel_limits() -> Dict[str, int]:
+    """Concurrent sends per channel from settings."""
+    return {
+        "whatsapp": settings.delivery_whatsapp_workers,
+        "email": settings.delivery_email_workers,
+        "push": settings.delivery_push_workers,
+    }
+
+
+class DeliveryDispatcher:
+    """
+    Per-channel worker pools with retry/backoff and push batching.
+
+    Args:
+        limits: Concurrent sends per channel (default: settings)
+        max_attempts: Attempts per message, including the first (default: settings)
+        backoff_seconds: Delay before the first retry; doubles per attempt (default: settings)
+        push_batch_size: Tokens per multicast request
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        max_attempts: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        push_batch_size: int = PUSH_MULTICAST_LIMIT,
+    ):
+        self.limits = dict(default_channel_limits(), **(limits or {}))
+        self.max_attempts = max(1, max_attempts or settings.delivery_max_attempts)
+        self.backoff_seconds = settings.delivery_retry_backoff_seconds if backoff_seconds is None else backoff_seconds
+        self.push_batch_size = max(1, min(push_batch_size, PUSH_MULTICAST_LIMIT))
+
+        self._executors = {
+            channel: ThreadPoolExecutor(max_workers=max(1, self.limits[channel]), thread_name_prefix=f"delivery-{channel}")
+            for channel in CHANNELS
+        }
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+        self._push_queue: List = []
+        self._push_lock = threading.Lock()
+
+        # Retry queue: (due monotonic time, sequence, channel, task)
+        self._retries: List = []
+        self._retry_cond = threading.Condition()
+        self._sequence = itertools.count()
+        self._closed = False
+        self._retry_thread = threading.Thread(target=self._retry_loop, name="delivery-retry", daemon=True)
+        self._retry_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _future(self) -> Future:
+        future = Future()
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before attempt + 1 (exponential, jittered)."""
+        return self.backoff_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+    def _schedule(self, channel: str, task: Callable, delay: float) -> None:
+        with self._retry_cond:
+            heapq.heappush(self._retries, (time.monotonic() + delay, next(self._sequence), channel, task))
+            self._retry_cond.notify()
+
+    def _retry_loop(self) -> None:
+        with self._retry_cond:
+            while True:
+                if not self._retries:
+                    if self._closed:
+                        return
+                    self._retry_cond.wait()
+                    continue
+                due, _, channel, task = self._retries[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._retry_cond.wait(delay)
+                    continue
+                heapq.heappop(self._retries)
+                self._executors[channel].submit(task)
+
+    def submit(self, channel: str, send: Callable[..., Dict], *args, **kwargs) -> Future:
+        """
+        Send one message on a channel's worker pool.
+
+        Args:
+            channel: whatsapp, email or push
+            send: Channel send function returning {"success": ..., "retryable": ...}
+            *args, **kwargs: Arguments for send
+
+        Returns:
+            Future resolving to the final result dict
+        """
+        future = self._future()
+        self._executors[channel].submit(self._attempt, channel, send, args, kwargs, future, 1)
+        return future
+
+    def _attempt(self, channel, send, args, kwargs, future: Future, attempt: int) -> None:
+        error: BaseException = RuntimeError(f"{channel} send was not resolved")
+        scheduled = False
+        try:
+            try:
+                result = send(*args, **kwargs)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            if not result.get("success") and result.get("retryable") and attempt < self.max_attempts:
+                task = partial(self._attempt, channel, send, args, kwargs, future, attempt + 1)
+                self._schedule(channel, task, self._backoff(attempt))
+                scheduled = True
+                return
+            future.set_result(dict(result, attempts=attempt))
+        except Exception as e:
+            error = e
+        finally:
+            # Resolved or rescheduled, never left pending (a waiter would hang)
+            if not scheduled and not future.done():
+                future.set_exception(error)
+
+    def submit_push(self, token: str, title: str, message: str, data: Optional[Dict] = None) -> Future:
+        """
+        Queue a push message for multicast (sent on flush() or when a batch fills).
+
+        Args:
+            token: FCM device token
+            title: Notification title
+            message: Notification body
+            data: Optional data payload
+
+        Returns:
+            Future resolving to this token's result dict
+        """
+        future = self._future()
+        with self._push_lock:
+            self._push_queue.append((token, title, message, data, future))
+            full = len(self._push_queue) >= self.push_batch_size
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """Send all queued push messages (grouped by identical title/body/data)."""
+        with self._push_lock:
+            queued, self._push_queue = self._push_queue, []
+        groups: Dict = {}
+        for item in queued:
+            _, title, message, data, _ = item
+            key = (title, message, json.dumps(data, sort_keys=True))
+            groups.setdefault(key, []).append(item)
+        for items in groups.values():
+            for start in range(0, len(items), self.push_batch_size):
+                batch = items[start:start + self.push_batch_size]
+                self._executors["push"].submit(self._send_push_batch, batch, 1)
+
+    def _send_push_batch(self, items: List, attempt: int) -> None:
+        error: BaseException = RuntimeError("push batch was not resolved")
+        scheduled: List = []
+        try:
+            _, title, message, data, _ = items[0]
+            tokens = [token for token, *_ in items]
+            try:
+                response = send_push_multicast(tokens, title, message, data)
+            except Exception as e:
+                response = {"success": False, "error": str(e)}
+
+            if response.get("success"):
+                per_token = response.get("results") or []
+                results = [
+                    per_token[i] if i < len(per_token) else {"success": False, "error": "No result for token"}
+                    for i in range(len(items))
+                ]
+                results = [dict(r, method=response.get("method")) for r in results]
+            else:
+                # Whole request failed: every token shares the outcome
+                results = [response] * len(items)
+
+            retry = []
+            for item, result in zip(items, results):
+                if not result.get("success") and result.get("retryable") and attempt < self.max_attempts:
+                    retry.append(item)
+                else:
+                    item[4].set_result(dict(result, attempts=attempt))
+            if retry:
+                self._schedule("push", partial(self._send_push_batch, retry, attempt + 1), self._backoff(attempt))
+                scheduled = retry
+        except Exception as e:
+            error = e
+        finally:
+            # Every token's future is resolved or rescheduled, never left pending
+            for item in items:
+                if not item[4].done() and item not in scheduled:
+                    item[4].set_exception(error)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Flush queued pushes and wait until every submitted message is resolved."""
+        self.flush()
+        with self._pending_lock:
+            pending = list(self._pending)
+        wait(pending, timeout=timeout)
+
+    def shutdown(self) -> None:
+        """Deliver everything outstanding (including retries), then stop the workers."""
+        self.wait()
+        with self._retry_cond:
+            self._closed = True
+            self._retry_cond.notify()
+        self._retry_thread.join()
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+
+
+_dispatcher: Optional[DeliveryDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_delivery_dispatcher() -> DeliveryDispatcher:
+    """
+    Shared delivery worker pool (created on first use).
+
+    Returns:
+        DeliveryDispatcher
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = DeliveryDispatcher()
+    return _dispatcher
@@ -4,19 +4,24 @@ Phase 10: Notification Engine
 Generates daily predictions for all users and stores them as notifications.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional
+import multiprocessing
+import os
+import tempfile
 import swisseph as swe
 import json
 
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import aliased
+
+from src.config import settings
 from src.db.database import SessionLocal
 from src.db.models import User, BirthDetail, Notification
 from src.ai.interpreter.daily_interpreter import interpret_daily, interpret_morning
-from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
-from src.jyotish.dasha_engine import calculate_vimshottari_dasha
-from src.jyotish.panchang_engine import generate_panchang
-from src.jyotish.yogas.yoga_engine import detect_all_yogas
-from src.jyotish.daily.daily_engine import compute_daily
+from src.jyotish.natal_store import get_natal_chart
+from src.jyotish.daily.sky_context import get_local_sky
 from src.ephemeris.ephemeris_utils import get_ascendant, get_houses, get_ayanamsa
 from src.utils.converters import degrees_to_sign, normalize_degrees
 
@@ -32,60 +37,16 @@ def build_user_context(birth_detail: BirthDetail, current_jd: float) -> Dict:
     Returns:
         Complete astrological context dictionary
     """
-    # Parse birth date and time
-    birth_dt = birth_detail.birth_date
-    birth_time_str = birth_detail.birth_time  # HH:MM format
-    hour, minute = map(int, birth_time_str.split(':'))
-    
-    # Create birth datetime
-    birth_datetime = datetime.combine(birth_dt, datetime.min.time().replace(hour=hour, minute=minute))
-    
-    # Calculate birth Julian Day
-    birth_jd = swe.julday(
-        birth_datetime.year, birth_datetime.month, birth_datetime.day,
-        birth_datetime.hour + birth_datetime.minute / 60.0,
-        swe.GREG_CAL
-    )
-    
-    # Generate Kundli
-    kundli = generate_kundli(birth_jd, birth_detail.birth_latitude, birth_detail.birth_longitude)
-    
-    # Get planet positions for dasha
-    birth_planets = get_planet_positions(birth_jd)
-    moon_degree = birth_planets["Moon"]
-    
-    # Calculate Dasha
-    dasha = calculate_vimshottari_dasha(birth_datetime, moon_degree)
-    
-    # Generate Panchang for current date
-    current_datetime = datetime.now()
-    panchang = generate_panchang(current_jd, current_datetime, birth_detail.birth_latitude, birth_detail.birth_longitude)
-    
-    # Prepare planets and houses for yoga detection
-    planets = {}
-    for p, d in kundli['Planets'].items():
-        if p in ["Rahu", "Ketu"]:
-            continue
-        sign_num, _ = degrees_to_sign(d['degree'])
-        asc_deg = kundli['Ascendant']['degree']
-        rel_pos = (d['degree'] - asc_deg) % 360
-        house_num = int(rel_pos / 30) + 1
-        if house_num > 12:
-            house_num = 1
-        planets[p] = {'degree': d['degree'], 'sign': sign_num, 'house': house_num}
+    # Natal chart: Kundli, Dasha and Yogas (stored on the birth detail, recomputed only when stale)
+    natal = get_natal_chart(birth_detail)
+    kundli = natal["kundli"]
+    dasha = natal["dasha"]
+    yogas = natal["yogas"]
     
-    houses = []
-    asc_sign, _ = degrees_to_sign(kundli['Ascendant']['degree'])
-    houses.append({'house': 1, 'degree': kundli['Ascendant']['degree'], 'sign': asc_sign})
-    for h in kundli['Houses']:
-        sign_num, _ = degrees_to_sign(h['degree'])
-        houses.append({'house': h['house'], 'degree': h['degree'], 'sign': sign_num})
-    
-    # Detect Yogas
-    yogas = detect_all_yogas(planets, houses)
-    
-    # Calculate Daily Impact
-    daily = compute_daily(birth_jd, current_jd, birth_detail.birth_latitude, birth_detail.birth_longitude, birth_datetime)
+    # Panchang and Daily Impact from the day's shared sky (computed once per day and location)
+    local_sky = get_local_sky(current_jd, birth_detail.birth_latitude, birth_detail.birth_longitude)
+    panchang = local_sky.panchang()
+    daily = local_sky.daily_for_natal(natal)
     
     # Combine all data
     combined = {
@@ -211,79 +172,246 @@ Yogas Detected: {context.get('yogas', {}).get('total', 0)}
         return None
 
 
-def run_daily_notifications():
+def _notification_job(user: User, birth_detail: BirthDetail) -> Dict:
+    """Picklable worker input for one user (plain fields only)."""
+    return {
+        "user": {
+            "id": user.id,
+            "subscription_level": user.subscription_level,
+        },
+        "birth_detail": {
+            "id": birth_detail.id,
+            "user_id": birth_detail.user_id,
+            "name": birth_detail.name,
+            "birth_date": birth_detail.birth_date,
+            "birth_time": birth_detail.birth_time,
+            "birth_latitude": birth_detail.birth_latitude,
+            "birth_longitude": birth_detail.birth_longitude,
+            "birth_place": birth_detail.birth_place,
+            "timezone": birth_detail.timezone,
+            "kundli_data": birth_detail.kundli_data,
+        },
+    }
+
+
+def generate_notification_job(job: Dict) -> Dict:
+    """
+    Worker entry point: generate one user's notification from a plain job dict.
+    
+    Runs in a worker process, so it works on transient User/BirthDetail objects.
+    
+    Args:
+        job: Output of _notification_job()
+    
+    Returns:
+        Dictionary with user_id, notification (or None) and kundli_data
+        (the refreshed natal record, or None if the stored one was fresh)
+    """
+    user = User(**job["user"])
+    birth_detail = BirthDetail(**job["birth_detail"])
+    stored_kundli_data = birth_detail.kundli_data
+    notification = generate_notification_for_user(user, birth_detail)
+    return {
+        "user_id": user.id,
+        "birth_detail_id": birth_detail.id,
+        "notification": notification,
+        "kundli_data": birth_detail.kundli_data if birth_detail.kundli_data is not stored_kundli_data else None,
+    }
+
+
+def iter_notification_batches(db, batch_size: int, after_user_id: int = 0):
+    """
+    Keyset-paginated batches of (User, first BirthDetail) for users with notifications enabled.
+    
+    One query per batch; users without birth data are skipped by the join.
+    
+    Args:
+        db: Database session
+        batch_size: Users per batch
+        after_user_id: Resume after this user id
+    
+    Yields:
+        Lists of (User, BirthDetail) ordered by user id
+    """
+    first_birth_detail = aliased(BirthDetail)
+    first_birth_detail_id = (
+        select(func.min(first_birth_detail.id))
+        .where(first_birth_detail.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    last_user_id = after_user_id
+    while True:
+        batch = (
+            db.query(User, BirthDetail)
+            .join(BirthDetail, BirthDetail.id == first_birth_detail_id)
+            .filter(User.daily_notifications == "enabled", User.id > last_user_id)
+            .order_by(User.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return
+        last_user_id = batch[-1][0].id
+        yield batch
+        # Drop the batch from the identity map (memory stays flat over the run)
+        db.expunge_all()
+
+
+def _checkpoint_path(run_date: str) -> str:
+    return os.path.join(settings.notification_checkpoint_dir, f"daily_notifications_{run_date}.json")
+
+
+def load_notification_checkpoint(run_date: str) -> Optional[Dict]:
+    """
+    Checkpoint of the daily run for run_date (YYYY-MM-DD), or None.
+    
+    Returns:
+        {"run_date", "last_user_id", "created", "failed", "completed"}
+    """
+    try:
+        with open(_checkpoint_path(run_date)) as f:
+            checkpoint = json.load(f)
+        return checkpoint if checkpoint.get("run_date") == run_date else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_notification_checkpoint(checkpoint: Dict) -> None:
+    """Write the run checkpoint atomically (after each committed batch)."""
+    path = _checkpoint_path(checkpoint["run_date"])
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def _store_batch(db, results) -> int:
+    """
+    Bulk-insert a batch's notifications and refreshed natal records, one commit.
+    
+    Returns:
+        Number of notifications inserted
+    """
+    rows = []
+    natal_updates = []
+    for result in results:
+        notification_data = result["notification"]
+        if notification_data:
+            rows.append({
+                "user_id": notification_data["user_id"],
+                "notification_type": notification_data["notification_type"],
+                "title": notification_data["title"],
+                "message": notification_data["message"],
+                "summary": notification_data["summary"],
+                "prediction_data": notification_data["prediction_data"],
+                "delivery_status": notification_data["delivery_status"],
+            })
+        if result["kundli_data"] is not None:
+            natal_updates.append({"id": result["birth_detail_id"], "kundli_data": result["kundli_data"]})
+    
+    if rows:
+        db.execute(insert(Notification), rows)  # executemany
+    if natal_updates:
+        db.execute(update(BirthDetail), natal_updates)  # bulk UPDATE by primary key
+    db.commit()
+    return len(rows)
+
+
+def run_daily_notifications(
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    resume: bool = True,
+    session_factory=SessionLocal,
+):
     """
     Phase 10: Main function to run daily notifications for all users.
     
     This function:
-    1. Fetches all users with birth data
-    2. Generates daily predictions
-    3. Saves notifications to database
-    4. Respects user notification preferences
+    1. Pages through users with notifications enabled joined to their birth data
+    2. Generates daily predictions for each batch in a process pool
+    3. Bulk-inserts the batch's notifications and commits per batch
+    4. Checkpoints the last committed user id, so a rerun the same day resumes
+    
+    A failing user only fails itself. If storing a batch fails, the batch is
+    rolled back and the run stops with the checkpoint still before it;
+    earlier batches stay committed and a rerun resumes at the failed batch.
+    
+    Args:
+        batch_size: Users per batch (default: settings.notification_batch_size)
+        workers: Worker processes (default: settings.notification_workers, at most one per CPU;
+            <= 1 runs inline). Started with COMPUTE_START_METHOD (forkserver by default):
+            the run is started from a scheduler thread, and forking a threaded process
+            can deadlock the children on locks held by other threads.
+        resume: Continue today's run from its checkpoint
+        session_factory: Session factory (default: SessionLocal)
+    
+    Returns:
+        Run summary dictionary
     """
-    db = SessionLocal()
+    batch_size = batch_size or settings.notification_batch_size
+    workers = min(settings.notification_workers if workers is None else workers, os.cpu_count() or 1)
+    run_date = datetime.now().date().isoformat()
+    
+    checkpoint = load_notification_checkpoint(run_date) if resume else None
+    if checkpoint is None:
+        checkpoint = {"run_date": run_date, "last_user_id": 0, "created": 0, "failed": 0, "completed": False}
+    if checkpoint["completed"]:
+        return {
+            "status": "success",
+            "notifications_created": checkpoint["created"],
+            "notifications_failed": checkpoint["failed"],
+            "resumed": True,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    db = session_factory()
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(settings.compute_start_method)
+        )
     try:
-        # Get all users with birth data and notifications enabled
-        users = db.query(User).filter(
-            User.daily_notifications == "enabled"
-        ).all()
-        
-        notifications_created = 0
-        notifications_failed = 0
-        
-        for user in users:
-            try:
-                # Get user's birth data
-                birth_detail = db.query(BirthDetail).filter(
-                    BirthDetail.user_id == user.id
-                ).first()
-                
-                if not birth_detail:
-                    continue  # Skip users without birth data
-                
-                # Generate notification
-                notification_data = generate_notification_for_user(user, birth_detail)
-                
-                if notification_data:
-                    # Create notification record
-                    notification = Notification(
-                        user_id=notification_data["user_id"],
-                        notification_type=notification_data["notification_type"],
-                        title=notification_data["title"],
-                        message=notification_data["message"],
-                        summary=notification_data["summary"],
-                        prediction_data=notification_data["prediction_data"],
-                        delivery_status=notification_data["delivery_status"]
-                    )
-                    
-                    db.add(notification)
-                    notifications_created += 1
-                else:
-                    notifications_failed += 1
-                    
-            except Exception as e:
-                print(f"Error processing user {user.id}: {e}")
-                notifications_failed += 1
-                continue
+        for batch in iter_notification_batches(db, batch_size, checkpoint["last_user_id"]):
+            jobs = [_notification_job(user, birth_detail) for user, birth_detail in batch]
+            if executor is not None:
+                results = list(executor.map(
+                    generate_notification_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))
+                ))
+            else:
+                results = [generate_notification_job(job) for job in jobs]
+            
+            # Raises on failure (handled below): the checkpoint only advances past committed batches
+            created = _store_batch(db, results)
+            checkpoint["created"] += created
+            checkpoint["failed"] += len(results) - created
+            checkpoint["last_user_id"] = jobs[-1]["user"]["id"]
+            save_notification_checkpoint(checkpoint)
         
-        db.commit()
+        checkpoint["completed"] = True
+        save_notification_checkpoint(checkpoint)
         
-        print(f"Daily notifications completed: {notifications_created} created, {notifications_failed} failed")
+        print(f"Daily notifications completed: {checkpoint['created']} created, {checkpoint['failed']} failed")
         return {
             "status": "success",
-            "notifications_created": notifications_created,
-            "notifications_failed": notifications_failed,
+            "notifications_created": checkpoint["created"],
+            "notifications_failed": checkpoint["failed"],
             "timestamp": datetime.now().isoformat()
         }
     
     except Exception as e:
         db.rollback()
-        print(f"Error in run_daily_notifications: {e}")
+        print(f"Error in run_daily_notifications after user {checkpoint['last_user_id']}: {e}")
         return {
             "status": "error",
             "error": str(e),
+            "notifications_created": checkpoint["created"],
+            "notifications_failed": checkpoint["failed"],
             "timestamp": datetime.now().isoformat()
         }
     finally:
+        if executor is not None:
+            executor.shutdown()
         db.close()
-
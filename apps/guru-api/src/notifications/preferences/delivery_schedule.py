@@ -0,0 +1,194 @@
+"""
+Delivery Schedule - due-time index for multi-channel notifications.
+
+Each NotificationPreferences row carries next_delivery_at: the next UTC
+instant of the user's local delivery_time (HH:MM in the user's timezone),
+with a DB index. A scheduler tick fetches only rows with
+next_delivery_at <= now, so it costs O(due users), and a late tick still
+catches everything that became due since the last one.
+
+At-least-once: a due row is first claimed by pushing next_delivery_at one
+lease ahead (committed), then delivered, then moved to the next local
+delivery time. If the process dies mid-delivery the lease expires and the
+row becomes due again; concurrent ticks never claim the same row
+(SELECT ... FOR UPDATE SKIP LOCKED where the database supports it).
+Claims are small batches, and a batch that has used up its share of the
+lease hands its unstarted rows back (release_deliveries) rather than let
+another worker's tick re-claim rows that are still being sent. Sends still
+unresolved when the lease runs out are handed back the same way.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pytz
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from src.db.models import NotificationPreferences, User
+
+# Timezone used when a user has not set one (delivery_time default "06:00" is IST)
+DEFAULT_DELIVERY_TIMEZONE = "Asia/Kolkata"
+
+# How long a claimed delivery stays reserved before it is retried
+DELIVERY_LEASE = timedelta(minutes=15)
+
+# Share of the lease a claimed batch may spend before releasing its unstarted rows
+DELIVERY_LEASE_BUDGET = 0.5
+
+# Lease time kept back for logging and committing a batch after its sends
+DELIVERY_LEASE_MARGIN = timedelta(minutes=1)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(pytz.UTC)
+
+
+def next_delivery_at(delivery_time: str, timezone: Optional[str], after: Optional[datetime] = None) -> datetime:
+    """
+    Next UTC instant of local delivery_time strictly after `after`.
+
+    Args:
+        delivery_time: Local time HH:MM
+        timezone: IANA timezone of the user (default: DEFAULT_DELIVERY_TIMEZONE)
+        after: UTC datetime (default: now)
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    after = after or _utc_now()
+    if after.tzinfo is None:
+        after = pytz.UTC.localize(after)
+    tz = pytz.timezone(timezone or DEFAULT_DELIVERY_TIMEZONE)
+    hour, minute = map(int, delivery_time.split(':'))
+
+    local_date = after.astimezone(tz).date()
+    for day in range(3):
+        naive = datetime.combine(local_date + timedelta(days=day), datetime.min.time()).replace(hour=hour, minute=minute)
+        candidate = tz.normalize(tz.localize(naive)).astimezone(pytz.UTC)
+        if candidate > after:
+            return candidate
+    raise ValueError(f"No delivery time {delivery_time} after {after.isoformat()} in {timezone}")
+
+
+def schedule_next_delivery(prefs: NotificationPreferences, after: Optional[datetime] = None) -> datetime:
+    """
+    Set prefs.next_delivery_at from its delivery_time/timezone (caller commits).
+
+    Args:
+        prefs: NotificationPreferences row
+        after: UTC datetime (default: now)
+
+    Returns:
+        The new next_delivery_at
+    """
+    prefs.next_delivery_at = next_delivery_at(prefs.delivery_time or "06:00", prefs.timezone, after)
+    return prefs.next_delivery_at
+
+
+def claim_due_deliveries(db: Session, now: datetime, limit: int) -> List[Tuple[NotificationPreferences, User]]:
+    """
+    Claim up to `limit` due deliveries (index range scan on next_delivery_at).
+
+    Claimed rows are leased until now + DELIVERY_LEASE and committed before return.
+
+    Args:
+        db: Database session
+        now: Current UTC datetime
+        limit: Maximum rows to claim
+
+    Returns:
+        List of (prefs, user) ordered by due time
+    """
+    rows = (
+        db.query(NotificationPreferences, User)
+        .join(User, User.id == NotificationPreferences.user_id)
+        .filter(
+            NotificationPreferences.next_delivery_at <= now,
+            User.daily_notifications == "enabled",
+        )
+        .order_by(NotificationPreferences.next_delivery_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=NotificationPreferences)
+        .all()
+    )
+    for prefs, _ in rows:
+        prefs.next_delivery_at = now + DELIVERY_LEASE
+    db.commit()
+    return rows
+
+
+def release_deliveries(rows: List[Tuple[NotificationPreferences, User]], now: datetime) -> None:
+    """
+    Hand claimed but unfinished deliveries back: due again at `now` (caller commits).
+
+    Args:
+        rows: (prefs, user) pairs from claim_due_deliveries
+        now: UTC datetime the rows become due at
+    """
+    for prefs, _ in rows:
+        prefs.next_delivery_at = now
+
+
+def backfill_delivery_schedule(db: Session, create_missing: bool = False, now: Optional[datetime] = None) -> int:
+    """
+    Schedule preferences rows without next_delivery_at (legacy rows, imports).
+
+    Args:
+        db: Database session
+        create_missing: Also create default preferences for enabled users without any
+            (the old per-user scan created them lazily on every tick)
+        now: Current UTC datetime (default: now)
+
+    Returns:
+        Number of rows scheduled
+    """
+    now = now or _utc_now()
+    if create_missing:
+        missing_user_ids = [
+            user_id for (user_id,) in (
+                db.query(User.id)
+                .outerjoin(NotificationPreferences, NotificationPreferences.user_id == User.id)
+                .filter(User.daily_notifications == "enabled", NotificationPreferences.id.is_(None))
+                .all()
+            )
+        ]
+        for user_id in missing_user_ids:
+            db.add(NotificationPreferences(
+                user_id=user_id,
+                delivery_time="06:00",
+                channel_whatsapp="disabled",
+                channel_email="enabled",
+                channel_push="disabled",
+                channel_inapp="enabled",
+                language="english",
+                timezone=DEFAULT_DELIVERY_TIMEZONE,
+            ))
+        db.flush()
+
+    unscheduled = db.query(NotificationPreferences).filter(NotificationPreferences.next_delivery_at.is_(None)).all()
+    for prefs in unscheduled:
+        schedule_next_delivery(prefs, now)
+    db.commit()
+    return len(unscheduled)
+
+
+def ensure_delivery_schedule_columns(engine) -> None:
+    """
+    Add the timezone/next_delivery_at columns and index to an existing table.
+
+    create_all() only creates missing tables; this upgrades databases created
+    before the due-time index existed. Idempotent.
+    """
+    table = NotificationPreferences.__table__
+    inspector = inspect(engine)
+    if not inspector.has_table(table.name):
+        return
+    existing = {column["name"] for column in inspector.get_columns(table.name)}
+    with engine.begin() as conn:
+        for name in ("timezone", "next_delivery_at"):
+            if name not in existing:
+                column_type = table.c[name].type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from src.db.database import SessionLocal
 from src.db.models import NotificationPreferences, User
+from src.notifications.preferences.delivery_schedule import DEFAULT_DELIVERY_TIMEZONE, schedule_next_delivery
 
 
 def get_prefs(user_id: int, db: Optional[Session] = None) -> NotificationPreferences:
@@ -42,8 +43,10 @@ def get_prefs(user_id: int, db: Optional[Session] = None) -> NotificationPrefere
                 channel_email="enabled",
                 channel_push="disabled",
                 channel_inapp="enabled",
-                language="english"
+                language="english",
+                timezone=DEFAULT_DELIVERY_TIMEZONE
             )
+            schedule_next_delivery(prefs)
             db.add(prefs)
             db.commit()
             db.refresh(prefs)
@@ -64,6 +67,7 @@ def update_prefs(
     language: Optional[str] = None,
     whatsapp_number: Optional[str] = None,
     push_token: Optional[str] = None,
+    timezone: Optional[str] = None,
     db: Optional[Session] = None
 ) -> NotificationPreferences:
     """
@@ -79,6 +83,7 @@ def update_prefs(
         language: Preferred language (english/hindi/kannada)
         whatsapp_number: WhatsApp number
         push_token: FCM push token
+        timezone: IANA timezone of delivery_time
         db: Optional database session
     
     Returns:
@@ -109,6 +114,12 @@ def update_prefs(
             prefs.whatsapp_number = whatsapp_number
         if push_token is not None:
             prefs.push_token = push_token
+        if timezone is not None:
+            prefs.timezone = timezone
+        
+        # Re-index the due time when the local delivery time or timezone changes
+        if delivery_time is not None or timezone is not None or prefs.next_delivery_at is None:
+            schedule_next_delivery(prefs)
         
         db.commit()
         db.refresh(prefs)
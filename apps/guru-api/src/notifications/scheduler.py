@@ -8,6 +8,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 from src.notifications.notification_engine import run_daily_notifications
+from src.jyotish.panchanga.panchanga_cache import warm_panchanga_cache
 
 # Phase 10: Initialize scheduler
 scheduler = BackgroundScheduler()
@@ -37,6 +38,20 @@ def start_scheduler():
             replace_existing=True
         )
         
+        # Warm the daily Panchanga cache for the top cities just after midnight IST
+        # (18:35 UTC) so the 6 AM burst reads cached Panchangas
+        scheduler.add_job(
+            warm_panchanga_cache,
+            trigger=CronTrigger(
+                hour=18,
+                minute=35,
+                timezone=pytz.UTC
+            ),
+            id='warm_panchanga_cache',
+            name='Daily Panchanga Cache Warm-up',
+            replace_existing=True
+        )
+        
         scheduler.start()
         print("✅ Daily notification scheduler started (runs at 6:00 AM IST)")
         return True
@@ -8,7 +8,9 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
+from src.db.database import SessionLocal
 from src.notifications.delivery_engine import process_due_users
+from src.notifications.preferences.delivery_schedule import backfill_delivery_schedule
 
 # Phase 12: Extended scheduler instance
 extended_scheduler = BackgroundScheduler()
@@ -21,6 +23,16 @@ def start_extended_scheduler():
     Runs every 5 minutes to check which users need notifications.
     """
     try:
+        # Index every enabled user's next delivery (creates default preferences where missing)
+        try:
+            db = SessionLocal()
+            try:
+                backfill_delivery_schedule(db, create_missing=True)
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"Warning: Could not backfill delivery schedule: {e}")
+        
         # Schedule job to run every 5 minutes
         extended_scheduler.add_job(
             process_due_users,
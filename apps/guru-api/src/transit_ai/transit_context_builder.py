@@ -71,7 +71,6 @@ def build_transit_context(birth_details: Dict, on_datetime: datetime, location:
     current_planets = get_planet_positions(transit_jd)
     
     # Build current transits dictionary
-    current_transits = {}
     natal_asc = natal_chart.get("Ascendant", {}).get("degree", 0)
     natal_moon = natal_chart.get("Planets", {}).get("Moon", {}).get("degree", 0)
     
@@ -79,6 +78,53 @@ def build_transit_context(birth_details: Dict, on_datetime: datetime, location:
     from src.ephemeris.houses import calculate_houses_sidereal
     current_asc = calculate_houses_sidereal(transit_jd, transit_lat, transit_lon)[0]
     
+    current_transits = build_current_transits(current_planets, natal_asc, natal_moon)
+    
+    # Calculate aspects
+    current_aspects = calculate_transit_aspects(current_transits, natal_chart)
+    
+    # Get current Dasha
+    moon_degree = natal_chart["Planets"]["Moon"]["degree"]
+    dasha_data = calculate_vimshottari_dasha(birth_dt_utc, moon_degree)
+    
+    # Find current Dasha period
+    current_dasha = get_current_dasha_period(dasha_data, on_datetime)
+    
+    # Moon specials
+    moon_specials = get_moon_specials(on_datetime, transit_lat, transit_lon, timezone, natal_moon)
+    
+    # Saturn specials
+    saturn_specials = get_saturn_specials(current_transits.get("Saturn", {}), natal_chart)
+    
+    # Jupiter specials
+    jupiter_specials = get_jupiter_specials(current_transits.get("Jupiter", {}), natal_chart)
+    
+    return {
+        "natal_chart": natal_chart,
+        "current_transits": current_transits,
+        "current_aspects": current_aspects,
+        "current_dasha": current_dasha,
+        "moon_specials": moon_specials,
+        "saturn_specials": saturn_specials,
+        "jupiter_specials": jupiter_specials,
+        "transit_date": on_datetime.isoformat(),
+        "transit_location": location
+    }
+
+
+def build_current_transits(current_planets: Dict, natal_asc: float, natal_moon: float) -> Dict:
+    """
+    Phase 19: Transit positions with houses from the natal Ascendant and Moon.
+    
+    Args:
+        current_planets: Transit planet degrees (get_planet_positions)
+        natal_asc: Natal Ascendant degree
+        natal_moon: Natal Moon degree
+    
+    Returns:
+        Dictionary of transit data per planet (Rahu/Ketu excluded)
+    """
+    current_transits = {}
     for planet_name, planet_degree in current_planets.items():
         if planet_name in ["Rahu", "Ketu"]:
             continue
@@ -116,36 +162,7 @@ def build_transit_context(birth_details: Dict, on_datetime: datetime, location:
             "nakshatra_pada": pada
         }
     
-    # Calculate aspects
-    current_aspects = calculate_transit_aspects(current_transits, natal_chart)
-    
-    # Get current Dasha
-    moon_degree = natal_chart["Planets"]["Moon"]["degree"]
-    dasha_data = calculate_vimshottari_dasha(birth_dt_utc, moon_degree)
-    
-    # Find current Dasha period
-    current_dasha = get_current_dasha_period(dasha_data, on_datetime)
-    
-    # Moon specials
-    moon_specials = get_moon_specials(on_datetime, transit_lat, transit_lon, timezone, natal_moon)
-    
-    # Saturn specials
-    saturn_specials = get_saturn_specials(current_transits.get("Saturn", {}), natal_chart)
-    
-    # Jupiter specials
-    jupiter_specials = get_jupiter_specials(current_transits.get("Jupiter", {}), natal_chart)
-    
-    return {
-        "natal_chart": natal_chart,
-        "current_transits": current_transits,
-        "current_aspects": current_aspects,
-        "current_dasha": current_dasha,
-        "moon_specials": moon_specials,
-        "saturn_specials": saturn_specials,
-        "jupiter_specials": jupiter_specials,
-        "transit_date": on_datetime.isoformat(),
-        "transit_location": location
-    }
+    return current_transits
 
 
 def calculate_transit_aspects(current_transits: Dict, natal_chart: Dict) -> Dict:
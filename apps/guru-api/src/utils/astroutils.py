@@ -8,6 +8,8 @@ import swisseph as swe
 from datetime import datetime
 from typing import Tuple
 
+from src.ephemeris import context as swe_context
+
 
 def normalize(deg: float) -> float:
     """
@@ -38,11 +40,11 @@ def get_sun_moon_longitudes(jd: float) -> Tuple[float, float]:
         Tuple of (sun_longitude, moon_longitude) in degrees
     """
     # Calculate Sun position
-    sun_result = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
+    sun_result = swe_context.calc(jd, swe.SUN, swe.FLG_SWIEPH)
     sun_longitude = normalize(sun_result[0][0])
     
     # Calculate Moon position
-    moon_result = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH)
+    moon_result = swe_context.calc(jd, swe.MOON, swe.FLG_SWIEPH)
     moon_longitude = normalize(moon_result[0][0])
     
     return sun_longitude, moon_longitude
@@ -59,7 +61,7 @@ def get_sun_moon_sidereal(jd: float) -> Tuple[float, float]:
         Tuple of (sun_sidereal, moon_sidereal) in degrees
     """
     # Get ayanamsa
-    ayanamsa = swe.get_ayanamsa(jd)
+    ayanamsa = swe_context.get_ayanamsa(jd)
     
     # Get tropical positions
     sun_tropical, moon_tropical = get_sun_moon_longitudes(jd)
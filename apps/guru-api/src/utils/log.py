@@ -0,0 +1,277 @@
+"""
+Structured, level-gated logging for the API and calculation engines.
+
+- get_logger("kundli") returns the "guru.kundli" logger; one per subsystem
+  (kundli, varga, ephemeris, ...), so each can be turned up on its own.
+- configure_logging() sets the levels (LOG_LEVEL, per subsystem LOG_LEVELS
+  e.g. "varga=DEBUG,kundli=INFO"), text or JSON lines (LOG_FORMAT) and,
+  with LOG_QUEUE, a QueueHandler so request threads never wait on stream
+  writes.
+- Debug diagnostics go through trace() with %-style arguments, and
+  multi-line blocks are guarded with tracing(). Nothing is formatted unless
+  the logger is at DEBUG or the current request is traced.
+
+request_id_middleware() tags every record of a request with its
+X-Request-ID (generated if absent). A request is traced when that id is
+listed in LOG_TRACE_REQUEST_IDS, or when it is sampled (LOG_TRACE_SAMPLE_RATE,
+0 to 1). Traced records are logged at DEBUG regardless of the logger level. The trace follows compute
+tasks into worker processes (see src.compute.executor).
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from src.config import settings
+
+ROOT_LOGGER = "guru"
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+
+_request_id: ContextVar[Optional[str]] = ContextVar("guru_request_id", default=None)
+_traced: ContextVar[bool] = ContextVar("guru_request_traced", default=False)
+
+_trace_request_ids = frozenset()
+_trace_sample_rate = 0.0
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """
+    Logger of a subsystem ("kundli" -> "guru.kundli").
+
+    Args:
+        subsystem: Subsystem name
+
+    Returns:
+        logging.Logger
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def _split(value: Optional[str]) -> Iterable[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_levels(value: Optional[str]) -> Dict[str, str]:
+    """
+    Per-subsystem levels from "varga=DEBUG,kundli=INFO".
+
+    Args:
+        value: Comma-separated subsystem=LEVEL pairs
+
+    Returns:
+        Dict of subsystem -> level name
+
+    Raises:
+        ValueError: Malformed pair or unknown level
+    """
+    levels = {}
+    for item in _split(value):
+        subsystem, sep, level = item.partition("=")
+        level = level.strip().upper()
+        if not sep or not subsystem.strip() or not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Invalid log level setting: {item!r}")
+        levels[subsystem.strip()] = level
+    return levels
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds request_id (or "-") to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get() or "-"
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, request_id, message (+ exception)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    levels: Optional[str] = None,
+    fmt: Optional[str] = None,
+    use_queue: Optional[bool] = None,
+    trace_request_ids: Optional[str] = None,
+    trace_sample_rate: Optional[float] = None,
+    stream=None,
+) -> logging.Logger:
+    """
+    Install the "guru" handler and levels (safe to call again, e.g. per worker).
+
+    Arguments default to the LOG_* settings.
+
+    Args:
+        level: Level of the "guru" logger (e.g. "INFO")
+        levels: Per-subsystem levels ("varga=DEBUG,kundli=INFO")
+        fmt: "text" or "json"
+        use_queue: Write records from a QueueListener thread
+        trace_request_ids: Comma-separated request ids to trace
+        trace_sample_rate: Share of requests traced (0 to 1)
+        stream: Output stream (default: stderr)
+
+    Returns:
+        The "guru" logger
+    """
+    global _listener, _trace_request_ids, _trace_sample_rate
+
+    level = (level or settings.log_level).upper()
+    subsystem_levels = parse_levels(levels if levels is not None else settings.log_levels)
+    fmt = (fmt or settings.log_format).lower()
+    use_queue = settings.log_queue if use_queue is None else use_queue
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JSONFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    with _configure_lock:
+        shutdown_logging()
+        root = logging.getLogger(ROOT_LOGGER)
+        for old in list(root.handlers):
+            root.removeHandler(old)
+        if use_queue:
+            # The filter runs in the calling thread, where the request id is set
+            records = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(records)
+            queue_handler.addFilter(RequestIdFilter())
+            root.addHandler(queue_handler)
+            _listener = logging.handlers.QueueListener(records, handler)
+            _listener.start()
+        else:
+            handler.addFilter(RequestIdFilter())
+            root.addHandler(handler)
+        root.setLevel(level)
+        root.propagate = False
+        for subsystem, subsystem_level in subsystem_levels.items():
+            get_logger(subsystem).setLevel(subsystem_level)
+
+        _trace_request_ids = frozenset(_split(
+            trace_request_ids if trace_request_ids is not None else settings.log_trace_request_ids
+        ))
+        _trace_sample_rate = settings.log_trace_sample_rate if trace_sample_rate is None else trace_sample_rate
+    return root
+
+
+def shutdown_logging() -> None:
+    """Stop the queue listener (pending records are written first)."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def should_trace(request_id: Optional[str]) -> bool:
+    """
+    Whether a request is traced: listed in LOG_TRACE_REQUEST_IDS, or sampled.
+
+    Args:
+        request_id: Request id (X-Request-ID)
+
+    Returns:
+        True to trace the request
+    """
+    if request_id is not None and request_id in _trace_request_ids:
+        return True
+    return _trace_sample_rate > 0 and random.random() < _trace_sample_rate
+
+
+@contextmanager
+def request_context(request_id: Optional[str], traced: Optional[bool] = None) -> Iterator[None]:
+    """
+    Request id (and trace flag) for the records logged inside the block.
+
+    Args:
+        request_id: Request id
+        traced: Trace the request (default: should_trace(request_id))
+    """
+    if traced is None:
+        traced = should_trace(request_id)
+    id_token = _request_id.set(request_id)
+    traced_token = _traced.set(traced)
+    try:
+        yield
+    finally:
+        _traced.reset(traced_token)
+        _request_id.reset(id_token)
+
+
+def current_request() -> Tuple[Optional[str], bool]:
+    """
+    Request id and trace flag of the current request (passed on to compute tasks).
+
+    Returns:
+        (request id or None, traced)
+    """
+    return _request_id.get(), _traced.get()
+
+
+def tracing(logger: logging.Logger) -> bool:
+    """
+    Whether trace() records of this logger are emitted; guards multi-line blocks.
+
+    Args:
+        logger: Subsystem logger
+
+    Returns:
+        True if the logger is at DEBUG or the current request is traced
+    """
+    return _traced.get() or logger.isEnabledFor(logging.DEBUG)
+
+
+def trace(logger: logging.Logger, msg: str, *args) -> None:
+    """
+    Debug diagnostic, %-formatted only if it is emitted (see tracing()).
+
+    Args:
+        logger: Subsystem logger
+        msg: Message with %-style placeholders
+        *args: Placeholder values
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args, stacklevel=2)
+    elif _traced.get():
+        # Traced request: emit at DEBUG even though the logger level is higher
+        fn, lno, func, _ = logger.findCaller(stacklevel=2)
+        logger.handle(logger.makeRecord(logger.name, logging.DEBUG, fn, lno, msg, args, None, func))
+
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
+async def request_id_middleware(request, call_next):
+    """
+    HTTP middleware: request context from X-Request-ID (generated if absent), echoed in the response.
+
+    Args:
+        request: Incoming request
+        call_next: Next ASGI handler
+
+    Returns:
+        Response with the X-Request-ID header
+    """
+    request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+    with request_context(request_id):
+        response = await call_next(request)
+    response.headers[REQUEST_ID_HEADER] = request_id
+    return response
@@ -9,10 +9,21 @@ from datetime import datetime
 import swisseph as swe
 import calendar
 
-from src.jyotish.kundli_engine import get_planet_positions
+from src.ephemeris.transit_table import get_transit_positions
+from src.ephemeris.transit_events import find_transit_events
 from src.jyotish.panchang import get_nakshatra
 from src.utils.converters import degrees_to_sign
 
+# Retrograde descriptions (stations from the transit event index)
+RETROGRADE_DESCRIPTIONS = {
+    "Mercury": "Mercury retrograde - review and reflect",
+    "Venus": "Venus retrograde - relationship review",
+    "Mars": "Mars retrograde - energy internalization",
+    "Jupiter": "Jupiter retrograde - internal growth",
+    "Saturn": "Saturn retrograde - karmic review",
+}
+RETROGRADE_SEARCH_PADDING_DAYS = 200
+
 
 def build_yearly_matrix(year: int) -> Dict:
     """
@@ -35,7 +46,7 @@ def build_yearly_matrix(year: int) -> Dict:
         date = datetime(year, month, 15, 12, 0)
         jd = swe.julday(year, month, 15, 12.0, swe.GREG_CAL)
         
-        planets = get_planet_positions(jd)
+        planets = get_transit_positions(jd)
         
         monthly_positions[month] = {}
         for planet_name, planet_degree in planets.items():
@@ -124,9 +135,19 @@ def identify_yearly_major_events(monthly_positions: Dict, year: int) -> List[Dic
     return events
 
 
+def _jd_to_date_str(jd: float) -> str:
+    """UTC calendar date (YYYY-MM-DD) of a Julian Day."""
+    year, month, day, _ = swe.revjul(jd, swe.GREG_CAL)
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
 def identify_retrogrades(monthly_positions: Dict, year: int) -> List[Dict]:
     """
-    Phase 20: Identify retrograde periods (simplified).
+    Phase 20: Identify retrograde periods overlapping the year.
+    
+    Periods run from the exact retrograde station to the exact direct station
+    (transit event index), so a period may start in the previous year or end
+    in the next one.
     
     Args:
         monthly_positions: Monthly positions
@@ -135,34 +156,36 @@ def identify_retrogrades(monthly_positions: Dict, year: int) -> List[Dict]:
     Returns:
         List of retrograde periods
     """
-    retrogrades = []
+    jd_year_start = swe.julday(year, 1, 1, 0.0, swe.GREG_CAL)
+    jd_year_end = swe.julday(year + 1, 1, 1, 0.0, swe.GREG_CAL)
     
-    # Simplified - in production, use proper retrograde calculations
-    # For now, provide approximate periods
-    
-    retrograde_periods = {
-        "Mercury": [
-            {"start": f"{year}-03-01", "end": f"{year}-03-25", "description": "Mercury retrograde - communication challenges"},
-            {"start": f"{year}-07-01", "end": f"{year}-07-25", "description": "Mercury retrograde - review and reflect"},
-            {"start": f"{year}-11-01", "end": f"{year}-11-25", "description": "Mercury retrograde - avoid hasty decisions"}
-        ],
-        "Venus": [
-            {"start": f"{year}-06-01", "end": f"{year}-07-15", "description": "Venus retrograde - relationship review"}
-        ],
-        "Mars": [
-            {"start": f"{year}-09-01", "end": f"{year}-11-15", "description": "Mars retrograde - energy internalization"}
-        ],
-        "Jupiter": [
-            {"start": f"{year}-04-01", "end": f"{year}-08-15", "description": "Jupiter retrograde - internal growth"}
-        ],
-        "Saturn": [
-            {"start": f"{year}-05-01", "end": f"{year}-09-15", "description": "Saturn retrograde - karmic review"}
-        ]
-    }
+    # Longest retrograde (Saturn ~140 days) fits in the padding on both sides
+    stations = find_transit_events(
+        jd_year_start - RETROGRADE_SEARCH_PADDING_DAYS,
+        jd_year_end + RETROGRADE_SEARCH_PADDING_DAYS,
+        RETROGRADE_DESCRIPTIONS.keys(),
+        kinds=("station",),
+    )
     
-    for planet, periods in retrograde_periods.items():
-        retrogrades.extend(periods)
+    retrogrades = []
+    for planet, description in RETROGRADE_DESCRIPTIONS.items():
+        retro_start = None
+        for station in stations:
+            if station.planet != planet:
+                continue
+            if station.retrograde:
+                retro_start = station.jd
+            elif retro_start is not None:
+                if retro_start < jd_year_end and station.jd >= jd_year_start:
+                    retrogrades.append({
+                        "planet": planet,
+                        "start": _jd_to_date_str(retro_start),
+                        "end": _jd_to_date_str(station.jd),
+                        "description": description
+                    })
+                retro_start = None
     
+    retrogrades.sort(key=lambda period: period["start"])
     return retrogrades
 
 
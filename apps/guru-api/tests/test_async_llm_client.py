@@ -0,0 +1,181 @@
+"""
+Tests for the async LLM client (pooled completions, streaming, concurrency cap, timeouts,
+cancellation on client disconnect) against a local stub /api/generate.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.ai.llm_client import AsyncLLMClient, run_until_disconnected
+
+
+class _GenerateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append(payload)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            words = server.reply(payload) if server.reply else ["Om ", "shanti ", payload["prompt"]]
+            if payload["stream"]:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for i, word in enumerate(words + [""]):
+                    time.sleep(server.chunk_delay)
+                    line = json.dumps({"response": word, "done": i == len(words)}).encode() + b"\n"
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.write(b"0\r\n\r\n")
+            else:
+                body = json.dumps({"response": "".join(words), "done": True}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+class _GenerateServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _GenerateHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+        self.chunk_delay = 0.0
+        # Optional callable(payload) -> list of response chunks
+        self.reply = None
+
+
+@pytest.fixture
+def llm_server():
+    server = _GenerateServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs):
+    return AsyncLLMClient(openai_api_key="", local_llm_url=f"http://127.0.0.1:{server.server_address[1]}", **kwargs)
+
+
+def test_complete_sends_system_prompt_and_json_mode(llm_server):
+    client = _client(llm_server)
+
+    async def run():
+        try:
+            return await client.complete("namaste", system="You are a Guru", json_mode=True, top_p=0.9)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == "Om shanti namaste"
+    payload = llm_server.requests[0]
+    assert payload["system"] == "You are a Guru" and payload["format"] == "json"
+    assert payload["stream"] is False and payload["options"]["top_p"] == 0.9
+
+
+def test_stream_yields_chunks(llm_server):
+    client = _client(llm_server)
+
+    async def run():
+        try:
+            return [chunk async for chunk in client.stream("namaste")]
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == ["Om ", "shanti ", "namaste"]
+    assert llm_server.requests[0]["stream"] is True
+
+
+def test_stream_has_an_overall_deadline(llm_server):
+    # Every gap is well within the timeout; the whole stream is not
+    llm_server.chunk_delay = 0.15
+    client = _client(llm_server, timeout=0.4)
+
+    async def run():
+        chunks = []
+        try:
+            with pytest.raises(TimeoutError):
+                async for chunk in client.stream("namaste"):
+                    chunks.append(chunk)
+            return chunks
+        finally:
+            await client.aclose()
+
+    chunks = asyncio.run(run())
+    assert 0 < len(chunks) < 3
+
+
+def test_concurrency_is_capped(llm_server):
+    llm_server.delay = 0.1
+    client = _client(llm_server, max_concurrency=2)
+
+    async def run():
+        try:
+            return await asyncio.gather(*(client.complete(f"p{i}") for i in range(6)))
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+    assert results == [f"Om shanti p{i}" for i in range(6)]
+    assert llm_server.max_active == 2
+
+
+def test_timeout_raises(llm_server):
+    llm_server.delay = 1.0
+    client = _client(llm_server, timeout=0.2)
+
+    async def run():
+        try:
+            await client.complete("slow")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+
+def test_disconnect_cancels_and_frees_the_slot(llm_server):
+    llm_server.delay = 0.5
+    client = _client(llm_server, max_concurrency=1)
+
+    async def disconnected():
+        return True
+
+    async def connected():
+        return False
+
+    async def run():
+        try:
+            started = time.perf_counter()
+            with pytest.raises(asyncio.CancelledError):
+                await run_until_disconnected(client.complete("gone"), disconnected, poll_interval=0.05)
+            assert time.perf_counter() - started < 0.4
+
+            llm_server.delay = 0.0
+            return await run_until_disconnected(client.complete("next"), connected, poll_interval=0.05)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == "Om shanti next"
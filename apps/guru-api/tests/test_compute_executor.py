@@ -0,0 +1,98 @@
+"""
+Tests for the compute executor (worker processes return the same charts as a direct call;
+backpressure and timeouts keep the pending count honest).
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.api.strength_routes import compute_shadbala
+from src.compute import executor
+from src.compute.executor import ComputeBusyError, ComputeExecutor, ComputeTimeoutError
+
+BIRTH = {"dob": "1995-05-16", "time": "18:38", "lat": 12.9716, "lon": 77.5946, "timezone": "Asia/Kolkata"}
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def sleep_task(monkeypatch):
+    monkeypatch.setitem(executor.COMPUTE_TASKS, "sleep", "tests.test_compute_executor:_sleep")
+
+
+def test_process_workers_match_direct_call():
+    async def run():
+        pool = ComputeExecutor(workers=2, max_pending=8, timeout=120)
+        try:
+            await pool.start()
+            return await asyncio.gather(*(pool.compute("shadbala", BIRTH) for _ in range(3))), pool.stats()
+        finally:
+            pool.shutdown()
+
+    results, stats = asyncio.run(run())
+    expected = compute_shadbala(**BIRTH)
+    assert all(result == expected for result in results)
+    assert stats["mode"] == "process"
+    assert (stats["submitted"], stats["completed"], stats["pending"]) == (3, 3, 0)
+    assert stats["tasks"] == {"shadbala": 3}
+
+
+def test_backpressure_rejects_beyond_max_pending(sleep_task):
+    async def run():
+        pool = ComputeExecutor(workers=0, max_pending=2)
+        try:
+            running = [asyncio.ensure_future(pool.compute("sleep", {"seconds": 0.2})) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ComputeBusyError):
+                await pool.compute("sleep", {"seconds": 0})
+            assert await asyncio.gather(*running) == [0.2, 0.2]
+            # Slots are free again
+            assert await pool.compute("sleep", {"seconds": 0}) == 0
+            return pool.stats()
+        finally:
+            pool.shutdown()
+
+    stats = asyncio.run(run())
+    assert stats["rejected"] == 1
+    assert stats["max_pending_seen"] == 2
+    assert stats["completed"] == 3
+
+
+def test_timeout_keeps_slot_until_task_ends(sleep_task):
+    async def run():
+        pool = ComputeExecutor(workers=0, max_pending=1)
+        try:
+            with pytest.raises(ComputeTimeoutError):
+                await pool.compute("sleep", {"seconds": 0.3}, timeout=0.05)
+            # The timed-out task is still running and holds the only slot
+            with pytest.raises(ComputeBusyError):
+                await pool.compute("sleep", {"seconds": 0})
+            await asyncio.sleep(0.4)
+            assert await pool.compute("sleep", {"seconds": 0}) == 0
+            return pool.stats()
+        finally:
+            pool.shutdown()
+
+    stats = asyncio.run(run())
+    assert stats["timeouts"] == 1
+    assert stats["pending"] == 0
+    assert ComputeTimeoutError.status_code == 504 and ComputeBusyError.status_code == 503
+
+
+def test_task_errors_propagate():
+    async def run():
+        pool = ComputeExecutor(workers=0)
+        try:
+            with pytest.raises(ValueError):
+                await pool.compute("shadbala", dict(BIRTH, dob="1995-13-40"))
+            return pool.stats()
+        finally:
+            pool.shutdown()
+
+    stats = asyncio.run(run())
+    assert (stats["failed"], stats["pending"]) == (1, 0)
@@ -0,0 +1,291 @@
+"""
+Tests for the delivery worker pool (pooled SMTP/HTTP connections, retry/backoff, multicast push)
+against local stub SMTP and HTTP servers.
+"""
+
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.database import Base
+from src.db.models import DeliveryLog, NotificationPreferences, User
+from src.notifications.channels import emailer, push
+from src.notifications.channels.connections import close_connections
+from src.notifications import delivery_pool
+from src.notifications.delivery_engine import record_user_delivery, send_to_user
+from src.notifications.delivery_pool import DeliveryDispatcher
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        sent_here = 0
+        self._reply("220 stub ESMTP")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            command = line.split(" ", 1)[0].upper()
+            if command == "EHLO":
+                self.wfile.write(b"250-stub\r\n250-AUTH PLAIN LOGIN\r\n250 OK\r\n")
+            elif command == "AUTH":
+                self._reply("235 Authenticated")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.messages += 1
+                sent_here += 1
+                self._reply("250 Queued")
+                if server.drop_after and sent_here >= server.drop_after:
+                    return
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, drop_after=0):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = 0
+        self.drop_after = drop_after
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, payload))
+            status = server.statuses.pop(0) if server.statuses else 202
+        if self.path == "/mail":
+            return self._send(status)
+
+        # Legacy FCM multicast
+        results = []
+        for token in payload["registration_ids"]:
+            with server.lock:
+                seen = server.seen_tokens.get(token, 0)
+                server.seen_tokens[token] = seen + 1
+            if token.startswith("bad"):
+                results.append({"error": "NotRegistered"})
+            elif token.startswith("flaky") and not seen:
+                results.append({"error": "Unavailable"})
+            else:
+                results.append({"message_id": f"m-{token}"})
+        body = json.dumps({
+            "success": sum("message_id" in r for r in results),
+            "failure": sum("error" in r for r in results),
+            "results": results,
+        }).encode()
+        self._send(200, body)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _HTTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.statuses = []
+        self.seen_tokens = {}
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture(autouse=True)
+def _fresh_connections():
+    close_connections()
+    yield
+    close_connections()
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    server = _serve(_SMTPServer())
+    monkeypatch.setattr(emailer, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(emailer, "SMTP_PORT", server.server_address[1])
+    monkeypatch.setattr(emailer, "SMTP_USER", "guru@example.com")
+    monkeypatch.setattr(emailer, "SMTP_PASS", "secret")
+    monkeypatch.setattr(emailer, "SMTP_STARTTLS", False)
+    monkeypatch.setattr(emailer, "SENDGRID_API_KEY", None)
+    yield server
+    close_connections()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    server = _serve(_HTTPServer())
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(emailer, "SENDGRID_API_KEY", "sg-key")
+    monkeypatch.setattr(emailer, "SENDGRID_API_URL", f"{base}/mail")
+    monkeypatch.setattr(push, "FCM_LEGACY_URL", f"{base}/fcm")
+    monkeypatch.setattr(push, "_firebase_app", None)
+    monkeypatch.setattr(push, "_fcm_initialized", True)
+    monkeypatch.setenv("FCM_SERVER_KEY", "fcm-key")
+    yield server
+    close_connections()
+    server.shutdown()
+    server.server_close()
+
+
+def test_smtp_connections_are_pooled(smtp_server):
+    with DeliveryDispatcher(limits={"email": 3}) as dispatcher:
+        futures = [
+            dispatcher.submit("email", emailer.send_email_smtp, f"user{i}@example.com", "Hi", "Body")
+            for i in range(12)
+        ]
+        results = [f.result(timeout=10) for f in futures]
+
+    assert all(r["success"] for r in results)
+    assert smtp_server.messages == 12
+    assert smtp_server.connections <= 3
+
+
+def test_smtp_pool_replaces_dropped_connection(smtp_server):
+    smtp_server.drop_after = 1
+    for i in range(3):
+        assert emailer.send_email_smtp(f"user{i}@example.com", "Hi", "Body")["success"]
+    assert smtp_server.messages == 3
+    assert smtp_server.connections == 3
+
+
+def test_http_retries_with_backoff_on_one_connection(http_server):
+    http_server.statuses = [503, 429]
+    with DeliveryDispatcher(max_attempts=3, backoff_seconds=0.01) as dispatcher:
+        result = dispatcher.submit("email", emailer.send_email_sendgrid, "a@example.com", "Hi", "Body").result(timeout=10)
+
+    assert result["success"] and result["attempts"] == 3
+    assert len(http_server.requests) == 3
+    assert http_server.connections == 1
+
+
+def test_permanent_failure_is_not_retried(http_server):
+    http_server.statuses = [400]
+    with DeliveryDispatcher(max_attempts=3, backoff_seconds=0.01) as dispatcher:
+        result = dispatcher.submit("email", emailer.send_email_sendgrid, "a@example.com", "Hi", "Body").result(timeout=10)
+
+    assert not result["success"] and not result["retryable"]
+    assert result["attempts"] == 1
+    assert len(http_server.requests) == 1
+
+
+def test_push_is_sent_as_multicast_batches(http_server):
+    tokens = ["t1", "t2", "bad1", "t4", "flaky1", "t6", "t7"]
+    with DeliveryDispatcher(max_attempts=2, backoff_seconds=0.01, push_batch_size=3) as dispatcher:
+        futures = {token: dispatcher.submit_push(token, "Guru", "Good day") for token in tokens}
+        other = dispatcher.submit_push("t8", "Guru", "Different body")
+        dispatcher.wait(timeout=10)
+
+    results = {token: future.result() for token, future in futures.items()}
+    assert results["bad1"] == dict(results["bad1"], success=False, error="NotRegistered", attempts=1)
+    assert results["flaky1"]["success"] and results["flaky1"]["attempts"] == 2
+    assert all(results[t]["success"] for t in tokens if not t.startswith("bad"))
+    assert other.result()["success"]
+
+    batches = [payload["registration_ids"] for path, payload in http_server.requests]
+    # 7 tokens in batches of 3, one batch for the other body, one retry for the flaky token
+    assert sorted(len(b) for b in batches) == [1, 1, 1, 3, 3]
+    assert ["flaky1"] in batches
+
+
+def test_push_batch_error_fails_its_futures(monkeypatch):
+    # Malformed per-token results make building the batch outcome raise
+    monkeypatch.setattr(delivery_pool, "send_push_multicast", lambda *args: {"success": True, "results": ["ok", "ok"]})
+    with DeliveryDispatcher() as dispatcher:
+        futures = [dispatcher.submit_push(token, "Guru", "Good day") for token in ("t1", "t2")]
+        dispatcher.flush()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+
+
+def test_unresolved_send_is_logged_as_failed():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = User(id=1, email="u1@example.com", name="U", password="x")
+    prefs = NotificationPreferences(user_id=1, delivery_time="06:00", channel_inapp="disabled")
+    db.add_all([user, prefs])
+    db.commit()
+    gateway = threading.Event()
+
+    with DeliveryDispatcher() as dispatcher:
+        pending = {
+            "summary": "Good day", "full_msg": "Good day", "is_premium": False,
+            "sends": {"email": dispatcher.submit("email", lambda: gateway.wait() and {"success": True})},
+        }
+        result = record_user_delivery(user, {}, prefs, pending, db, timeout=0.1)
+        gateway.set()
+    db.commit()
+
+    assert result["channels"]["email"] == {"success": False, "error": "Send still pending at timeout"}
+    assert [(log.channel, log.status) for log in db.query(DeliveryLog).all()] == [("email", "failed")]
+    db.close()
+
+
+def test_send_to_user_logs_concurrent_channels(http_server):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = User(id=1, email="u1@example.com", name="U", password="x")
+    prefs = NotificationPreferences(
+        user_id=1, delivery_time="06:00", language="english",
+        channel_whatsapp="disabled", channel_email="enabled", channel_push="enabled",
+        channel_inapp="enabled", push_token="t1",
+    )
+    db.add_all([user, prefs])
+    db.commit()
+    data = {"daily_strength": {"summary": "Good day", "score": 80, "rating": "Good"}}
+
+    with DeliveryDispatcher(backoff_seconds=0.01) as dispatcher:
+        result = send_to_user(user, data, prefs, db, dispatcher=dispatcher)
+    db.commit()
+
+    assert {ch: r["success"] for ch, r in result["channels"].items()} == {"email": True, "push": True, "in_app": True}
+    logs = {log.channel: log.status for log in db.query(DeliveryLog).all()}
+    assert logs == {"email": "success", "push": "success", "in_app": "success"}
+    db.close()
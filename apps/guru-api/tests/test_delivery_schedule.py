@@ -0,0 +1,232 @@
+"""
+Tests for the delivery schedule (local delivery time to UTC, claims, at-least-once leases).
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.database import Base
+from src.db.models import BirthDetail, DeliveryLog, NotificationPreferences, User
+from src.notifications import delivery_engine
+from src.notifications.delivery_engine import process_due_users
+from src.notifications.delivery_pool import DeliveryDispatcher
+from src.notifications.preferences.delivery_schedule import (
+    DELIVERY_LEASE,
+    backfill_delivery_schedule,
+    claim_due_deliveries,
+    ensure_delivery_schedule_columns,
+    next_delivery_at,
+)
+
+UTC = pytz.UTC
+
+
+def _utc(*args):
+    return UTC.localize(datetime(*args))
+
+
+def test_next_delivery_is_next_local_occurrence():
+    # 06:00 IST = 00:30 UTC
+    assert next_delivery_at("06:00", "Asia/Kolkata", _utc(2026, 3, 1, 0, 0)) == _utc(2026, 3, 1, 0, 30)
+    assert next_delivery_at("06:00", "Asia/Kolkata", _utc(2026, 3, 1, 0, 30)) == _utc(2026, 3, 2, 0, 30)
+    # Local date differs from the UTC date
+    assert next_delivery_at("06:00", "Asia/Kolkata", _utc(2026, 2, 28, 23, 0)) == _utc(2026, 3, 1, 0, 30)
+    assert next_delivery_at("07:15", None, _utc(2026, 3, 1, 0, 0)) == _utc(2026, 3, 1, 1, 45)
+
+
+def test_next_delivery_follows_dst():
+    # New York: EST (UTC-5) before 2026-03-08, EDT (UTC-4) after
+    assert next_delivery_at("06:00", "America/New_York", _utc(2026, 3, 7, 12, 0)) == _utc(2026, 3, 8, 10, 0)
+    assert next_delivery_at("06:00", "America/New_York", _utc(2026, 3, 6, 12, 0)) == _utc(2026, 3, 7, 11, 0)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _add_user(db, user_id, delivery_time=None, enabled=True, timezone="Asia/Kolkata"):
+    db.add(User(
+        id=user_id, email=f"u{user_id}@example.com", name=f"User {user_id}", password="x",
+        daily_notifications="enabled" if enabled else "disabled",
+    ))
+    db.add(BirthDetail(
+        user_id=user_id, name="n", birth_date=datetime(1990, 1, 1), birth_time="06:30",
+        birth_latitude=12.97, birth_longitude=77.59, birth_place="", timezone="Asia/Kolkata",
+    ))
+    if delivery_time:
+        db.add(NotificationPreferences(
+            user_id=user_id, delivery_time=delivery_time, timezone=timezone,
+            channel_email="disabled", channel_inapp="enabled",
+        ))
+
+
+def test_claim_fetches_only_due_rows(session_factory):
+    db = session_factory()
+    _add_user(db, 1, "06:00")
+    _add_user(db, 2, "06:03")
+    _add_user(db, 3, "09:00")
+    _add_user(db, 4, "06:00", enabled=False)
+    db.commit()
+    backfill_delivery_schedule(db, now=_utc(2026, 3, 1, 0, 0))
+
+    now = _utc(2026, 3, 1, 0, 35)  # tick at 06:05 IST
+    claimed = claim_due_deliveries(db, now, limit=10)
+    assert [user.id for _, user in claimed] == [1, 2]
+    # Leased: not claimable again until the lease expires
+    assert claim_due_deliveries(db, now, limit=10) == []
+    assert [user.id for _, user in claim_due_deliveries(db, now + DELIVERY_LEASE, limit=10)] == [1, 2]
+    db.close()
+
+
+def test_backfill_creates_missing_preferences(session_factory):
+    db = session_factory()
+    _add_user(db, 1)
+    _add_user(db, 2, enabled=False)
+    db.commit()
+    assert backfill_delivery_schedule(db, create_missing=True, now=_utc(2026, 3, 1, 0, 0)) == 1
+    prefs = db.query(NotificationPreferences).one()
+    assert prefs.user_id == 1
+    assert prefs.next_delivery_at.replace(tzinfo=UTC) == _utc(2026, 3, 1, 0, 30)
+    db.close()
+
+
+def test_process_due_users_delivers_once_per_day(session_factory, monkeypatch):
+    monkeypatch.setattr(delivery_engine, "build_daily_data", lambda birth_detail: {
+        "daily_strength": {"summary": "Good day", "score": 80, "rating": "Good"},
+    })
+    db = session_factory()
+    _add_user(db, 1, "06:00")
+    _add_user(db, 2, "06:02")
+    _add_user(db, 3, "18:00")
+    db.commit()
+    backfill_delivery_schedule(db, now=_utc(2026, 3, 1, 0, 0))
+    db.close()
+
+    # Tick at 06:05 IST catches 06:00 and 06:02 (no exact-minute match needed)
+    result = process_due_users(now=_utc(2026, 3, 1, 0, 35), session_factory=session_factory)
+    assert result["status"] == "success"
+    assert result["processed"] == 2 and result["successful"] == 2
+
+    db = session_factory()
+    assert sorted(log.user_id for log in db.query(DeliveryLog).all()) == [1, 2]
+    next_times = {p.user_id: p.next_delivery_at.replace(tzinfo=UTC) for p in db.query(NotificationPreferences)}
+    assert next_times[1] == _utc(2026, 3, 2, 0, 30)
+    assert next_times[2] == _utc(2026, 3, 2, 0, 32)
+    assert next_times[3] == _utc(2026, 3, 1, 12, 30)
+    db.close()
+
+    # Next tick: nothing due
+    again = process_due_users(now=_utc(2026, 3, 1, 0, 40), session_factory=session_factory)
+    assert again["processed"] == 0
+
+
+def test_slow_batch_releases_unstarted_rows(session_factory, monkeypatch):
+    monkeypatch.setattr(delivery_engine, "build_daily_data", lambda birth_detail: {
+        "daily_strength": {"summary": "Good day", "score": 80, "rating": "Good"},
+    })
+    # Every row after the first one in a batch is past the lease budget
+    monkeypatch.setattr(delivery_engine, "DELIVERY_LEASE_BUDGET", 0)
+    claims = []
+
+    def claim(db, now, limit):
+        claims.append(limit)
+        return claim_due_deliveries(db, now, limit)
+
+    monkeypatch.setattr(delivery_engine, "claim_due_deliveries", claim)
+    db = session_factory()
+    for user_id in (1, 2, 3):
+        _add_user(db, user_id, "06:00")
+    db.commit()
+    backfill_delivery_schedule(db, now=_utc(2026, 3, 1, 0, 0))
+    db.close()
+
+    result = process_due_users(now=_utc(2026, 3, 1, 0, 35), batch_size=10, session_factory=session_factory)
+    assert result["processed"] == 3
+    # Released rows were claimed again in batches that fit
+    assert claims == [10, 1, 1, 1]
+    db = session_factory()
+    assert sorted(log.user_id for log in db.query(DeliveryLog).all()) == [1, 2, 3]
+    db.close()
+
+
+def test_sends_past_the_lease_are_released(session_factory, monkeypatch):
+    monkeypatch.setattr(delivery_engine, "build_daily_data", lambda birth_detail: {
+        "daily_strength": {"summary": "Good day", "score": 80, "rating": "Good"},
+    })
+    gateway = threading.Event()
+
+    def send_email(to, subject, body):
+        if to == "u2@example.com":
+            gateway.wait()
+        return {"success": True}
+
+    monkeypatch.setattr(delivery_engine, "send_email", send_email)
+    monkeypatch.setattr(delivery_engine, "DELIVERY_LEASE", timedelta(seconds=0.5))
+    monkeypatch.setattr(delivery_engine, "DELIVERY_LEASE_MARGIN", timedelta(0))
+    db = session_factory()
+    for user_id in (1, 2):
+        _add_user(db, user_id, "06:00")
+    db.commit()
+    db.query(NotificationPreferences).update({"channel_email": "enabled"})
+    db.commit()
+    backfill_delivery_schedule(db, now=_utc(2026, 3, 1, 0, 0))
+    db.close()
+
+    now = _utc(2026, 3, 1, 0, 35)
+    dispatcher = DeliveryDispatcher(max_attempts=1)
+    try:
+        result = process_due_users(now=now, session_factory=session_factory, dispatcher=dispatcher)
+    finally:
+        gateway.set()
+        dispatcher.shutdown()
+    assert result["status"] == "success" and result["processed"] == 1
+
+    db = session_factory()
+    assert {log.user_id for log in db.query(DeliveryLog).all()} == {1}
+    next_times = {p.user_id: p.next_delivery_at.replace(tzinfo=UTC) for p in db.query(NotificationPreferences)}
+    # The stuck send is handed back to the next tick instead of outliving its lease
+    assert next_times[2] == now
+    assert next_times[1] == _utc(2026, 3, 2, 0, 30)
+    db.close()
+
+
+def test_failed_delivery_moves_to_next_day(session_factory, monkeypatch):
+    def boom(birth_detail):
+        raise RuntimeError("ephemeris down")
+
+    monkeypatch.setattr(delivery_engine, "build_daily_data", boom)
+    db = session_factory()
+    _add_user(db, 1, "06:00")
+    db.commit()
+    backfill_delivery_schedule(db, now=_utc(2026, 3, 1, 0, 0))
+    db.close()
+
+    result = process_due_users(now=_utc(2026, 3, 1, 0, 35), session_factory=session_factory)
+    assert result["failed"] == 1
+    db = session_factory()
+    assert db.query(NotificationPreferences).one().next_delivery_at.replace(tzinfo=UTC) == _utc(2026, 3, 2, 0, 30)
+    db.close()
+
+
+def test_legacy_table_is_upgraded():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE notification_preferences (id INTEGER PRIMARY KEY, user_id INTEGER, delivery_time VARCHAR)"
+        ))
+    ensure_delivery_schedule_columns(engine)
+    ensure_delivery_schedule_columns(engine)  # idempotent
+    inspector = inspect(engine)
+    columns = {column["name"] for column in inspector.get_columns("notification_preferences")}
+    assert {"timezone", "next_delivery_at"} <= columns
+    indexed = {tuple(index["column_names"]) for index in inspector.get_indexes("notification_preferences")}
+    assert ("next_delivery_at",) in indexed
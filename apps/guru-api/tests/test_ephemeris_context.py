@@ -0,0 +1,69 @@
+"""
+Tests for the Swiss Ephemeris context (per-thread modes, redundant mode switches, concurrent charts).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import swisseph as swe
+
+from src.api.strength_routes import compute_shadbala
+from src.ephemeris import context as swe_context
+
+SIDEREAL = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+BIRTHS = [
+    ("1995-05-16", "18:38", 12.9716, 77.5946, "Asia/Kolkata"),
+    ("1980-01-01", "06:05", 28.6139, 77.2090, "Asia/Kolkata"),
+    ("2001-09-11", "23:59", 40.7128, -74.0060, "America/New_York"),
+    ("1964-07-30", "12:00", -33.8688, 151.2093, "Australia/Sydney"),
+]
+
+
+def _in_new_thread(fn):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "ephemeris call blocked in a second thread"
+    return result[0]
+
+
+def test_redundant_sid_mode_is_skipped():
+    swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+    before = swe_context.get_ephemeris_state()
+    for _ in range(5):
+        swe_context.set_sid_mode(swe.SIDM_LAHIRI)
+        swe_context.calc(2451545.0, swe.MOON, SIDEREAL)
+    after = swe_context.get_ephemeris_state()
+    assert after["sid_mode"] == swe_context.SID_MODE_LAHIRI
+    assert after["sid_mode_set"] == before["sid_mode_set"]
+    assert after["sid_mode_skipped"] == before["sid_mode_skipped"] + 10
+
+
+def test_fresh_thread_calculates_in_lahiri():
+    moon = swe_context.calc(2451545.0, swe.MOON, SIDEREAL)[0]
+    ayanamsa = swe_context.get_ayanamsa_ut(2451545.0)
+    cusps = swe_context.houses_ex(2451545.0, 12.9716, 77.5946, b'P', swe.FLG_SIDEREAL)
+
+    assert _in_new_thread(lambda: swe_context.calc(2451545.0, swe.MOON, SIDEREAL)[0]) == moon
+    assert _in_new_thread(lambda: swe_context.get_ayanamsa_ut(2451545.0)) == ayanamsa
+    assert _in_new_thread(lambda: swe_context.houses_ex(2451545.0, 12.9716, 77.5946, b'P', swe.FLG_SIDEREAL)) == cusps
+
+
+def test_sunrise_uses_the_callers_observer():
+    flags = swe.BIT_DISC_CENTER | swe.FLG_SWIEPH | swe.FLG_TOPOCTR
+
+    def sunrise(lon, lat):
+        return swe_context.rise_trans(2461329.5, swe.SUN, swe.CALC_RISE, [lon, lat, 0.0], 0.0, 0.0, flags)[1][0]
+
+    bangalore, new_york = sunrise(77.5946, 12.9716), sunrise(-74.0060, 40.7128)
+    assert bangalore != new_york
+    assert _in_new_thread(lambda: sunrise(77.5946, 12.9716)) == bangalore
+    assert swe_context.get_ephemeris_state()["topo"] == (-74.006, 40.7128, 0.0)
+
+
+def test_concurrent_charts_match_serial():
+    expected = [compute_shadbala(*birth) for birth in BIRTHS]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda birth: compute_shadbala(*birth), BIRTHS * 4))
+    assert results == expected * 4
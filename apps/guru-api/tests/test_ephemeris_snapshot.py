@@ -0,0 +1,98 @@
+"""
+Tests for the ephemeris snapshot (one ephemeris pass per chart, identical output).
+"""
+
+from datetime import date
+
+import pytest
+import swisseph as swe
+
+from src.ephemeris.planets_jhora_exact import (
+    calculate_ascendant_jhora_exact,
+    calculate_all_planets_jhora_exact,
+)
+from src.ephemeris.snapshot import build_ephemeris_snapshot, ensure_ephemeris_snapshot
+from src.jyotish.dasha_drik import calculate_vimshottari_dasha_drik
+from src.jyotish.drik_panchang_engine import get_julian_day_utc
+from src.jyotish.kundli_engine import generate_kundli
+
+# 1995-05-16 18:38 IST, Bangalore (golden test birth)
+BIRTH_DATE = date(1995, 5, 16)
+BIRTH_TIME = "18:38"
+LAT, LON = 12.9716, 77.5946
+TZ = "Asia/Kolkata"
+JD = get_julian_day_utc(BIRTH_DATE, BIRTH_TIME, TZ)
+
+
+def test_snapshot_matches_direct_ephemeris():
+    """Snapshot longitudes are bit-identical to the JHORA-exact functions."""
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    assert snapshot.ascendant_longitude == calculate_ascendant_jhora_exact(JD, LAT, LON)["longitude"]
+    direct = calculate_all_planets_jhora_exact(JD)
+    assert snapshot.planet_longitudes == {name: data["longitude"] for name, data in direct.items()}
+    assert len(snapshot.houses_sidereal) == 12
+
+
+def test_snapshot_is_immutable():
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    with pytest.raises(Exception):
+        snapshot.julian_day = 0.0
+    with pytest.raises(TypeError):
+        snapshot.planets["Sun"]["longitude"] = 0.0
+
+
+def test_generate_kundli_with_snapshot_identical():
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    assert generate_kundli(JD, LAT, LON, snapshot=snapshot) == generate_kundli(JD, LAT, LON)
+
+
+def test_generate_kundli_with_snapshot_no_ephemeris_calls(monkeypatch):
+    """All raw values come from the snapshot - no swe.calc_ut()/swe.houses() per consumer."""
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    calls = []
+
+    def _forbidden(*args, **kwargs):
+        calls.append(args)
+        raise AssertionError("ephemeris recomputed despite snapshot")
+
+    monkeypatch.setattr(swe, "calc_ut", _forbidden)
+    monkeypatch.setattr(swe, "houses", _forbidden)
+    monkeypatch.setattr(swe, "houses_ex", _forbidden)
+    generate_kundli(JD, LAT, LON, snapshot=snapshot)
+    calculate_vimshottari_dasha_drik(BIRTH_DATE, BIRTH_TIME, LAT, LON, TZ, snapshot=snapshot)
+    assert calls == []
+
+
+def test_dasha_with_snapshot_identical():
+    from datetime import datetime
+    now = datetime(2026, 1, 1)
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    with_snapshot = calculate_vimshottari_dasha_drik(BIRTH_DATE, BIRTH_TIME, LAT, LON, TZ, now, snapshot=snapshot)
+    without = calculate_vimshottari_dasha_drik(BIRTH_DATE, BIRTH_TIME, LAT, LON, TZ, now)
+    assert with_snapshot == without
+
+
+def test_snapshot_location_mismatch_rejected():
+    snapshot = build_ephemeris_snapshot(JD, LAT, LON)
+    with pytest.raises(ValueError):
+        ensure_ephemeris_snapshot(snapshot, JD, LAT + 1.0, LON)
+
+
+@pytest.mark.parametrize("handler, chart", [("get_navamsa", "D9"), ("get_dasamsa", "D10")])
+def test_varga_endpoints_match_kundli(handler, chart):
+    import asyncio
+    from datetime import datetime
+
+    from src.api import kundli_routes
+    from src.db.schemas import KundliRequest
+
+    request = KundliRequest(
+        name="Golden", birth_date=datetime(1995, 5, 16), birth_time=BIRTH_TIME,
+        birth_latitude=LAT, birth_longitude=LON, birth_place="Bangalore", timezone=TZ,
+    )
+    result = asyncio.run(getattr(kundli_routes, handler)(request))
+    expected = kundli_routes.compute_kundli("1995-05-16", BIRTH_TIME, LAT, LON, TZ)[chart]
+    assert result["chartType"] == chart
+    assert result["Ascendant"]["sign_index"] == expected["Ascendant"]["sign_index"]
+    assert {name: p["sign_index"] for name, p in result["Planets"].items()} == \
+        {name: p["sign_index"] for name, p in expected["Planets"].items()}
@@ -0,0 +1,85 @@
+"""
+Tests for the GET /kundli response path (fast JSON encoding, chart/field selection, compact tables).
+"""
+
+import asyncio
+import copy
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api import kundli_routes, responses
+from src.api.kundli_routes import KUNDLI_CHARTS, compact_table, compute_kundli, select_kundli_response
+from src.api.responses import FastJSONResponse
+
+
+@pytest.fixture(scope="module")
+def kundli():
+    return compute_kundli("1995-05-16", "18:38", 12.9716, 77.5946, "Asia/Kolkata")
+
+
+def _expand(table, key_column=None):
+    rows = [dict(zip(table["columns"], row)) for row in table["rows"]]
+    if key_column is None:
+        return rows
+    return {row.pop(key_column): {k: v for k, v in row.items() if v is not None} for row in rows}
+
+
+def test_fast_response_matches_default_encoding(kundli, monkeypatch):
+    expected = json.loads(JSONResponse(jsonable_encoder(kundli)).body)
+    assert json.loads(FastJSONResponse(kundli).body) == expected
+    monkeypatch.setattr(responses, "orjson", None)
+    assert json.loads(FastJSONResponse(kundli).body) == expected
+
+
+def test_selection_keeps_requested_charts_and_fields(kundli):
+    original = copy.deepcopy(kundli)
+    assert select_kundli_response(kundli) is kundli
+
+    selected = select_kundli_response(kundli, vargas={"D1", "D9"}, fields={"julian_day"})
+    assert list(selected) == ["julian_day", "D1", "D9"]
+    assert selected["D9"] is kundli["D9"]
+
+    charts_only = select_kundli_response(kundli, fields=set())
+    assert list(charts_only) == [key for key in kundli if key in KUNDLI_CHARTS]
+    assert kundli == original
+
+
+def test_compact_tables_expand_to_full_charts(kundli):
+    original = copy.deepcopy(kundli)
+    compact = select_kundli_response(kundli, compact=True)
+    assert kundli == original
+    for chart in KUNDLI_CHARTS:
+        full, packed = kundli[chart], compact[chart]
+        assert _expand(packed["Planets"], "planet") == full["Planets"]
+        assert _expand(packed["Aspects"]) == full["Aspects"]
+        if full.get("Houses") is None:
+            assert packed["Houses"] is None
+        else:
+            assert _expand(packed["Houses"]) == full["Houses"]
+    assert len(FastJSONResponse(compact).body) < len(FastJSONResponse(kundli).body)
+
+
+def test_compact_table_fills_missing_columns():
+    table = compact_table({"Sun": {"sign": 1}, "Rahu": {"sign": 2, "retro": True}}, "planet")
+    assert table == {"columns": ["planet", "sign", "retro"], "rows": [["Sun", 1, None], ["Rahu", 2, True]]}
+    assert compact_table([]) == {"columns": [], "rows": []}
+
+
+@pytest.mark.parametrize("query", ["vargas=D1,D5", "fields=julian_day,yogas"])
+def test_unknown_selection_rejected(query):
+    app = FastAPI()
+    app.include_router(kundli_routes.router)
+
+    async def get():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(f"/kundli?dob=1995-05-16&time=18:38&lat=12.97&lon=77.59&{query}")
+
+    response = asyncio.run(get())
+    assert response.status_code == 400
+    assert "Allowed" in response.json()["detail"]
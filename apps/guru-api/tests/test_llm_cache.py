@@ -0,0 +1,145 @@
+"""
+Tests for the LLM response cache (content keys, period-aligned expiry, memory/SQLite backends,
+predict() generating once per seeker and day).
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytz
+
+from src.ai import llm_cache, llm_client
+from src.ai.llm_cache import (
+    LLMResponseCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    canonical_context,
+    make_cache_key,
+    period_end,
+)
+from src.ai.llm_client import AsyncLLMClient
+from src.api.prediction_routes import predict
+from tests.test_async_llm_client import _GenerateServer
+
+FAR_FUTURE = 4102444800.0  # 2100-01-01
+
+
+def _key(context, timescale="daily", when=datetime(2026, 3, 1, 7, 10), **kwargs):
+    return make_cache_key(timescale, canonical_context(context, timescale, when), "openai:gpt-4o", **kwargs)
+
+
+def test_key_is_canonical():
+    context = {"calculation_date": "2026-03-01T07:10:00", "moon": {"sign": 3, "house": 8}, "dasha": "Saturn"}
+    reordered = {"dasha": "Saturn", "moon": {"house": 8, "sign": 3}, "calculation_date": "2026-03-01T21:45:00"}
+
+    assert _key(context) == _key(reordered, when=datetime(2026, 3, 1, 21, 45))
+    assert _key(context) != _key(context, when=datetime(2026, 3, 2, 7, 10))
+    assert _key(context) != _key(dict(context, dasha="Mercury"))
+    assert _key(context) != _key(context, prompt_version="2")
+    assert _key(context) != _key(context, variant="narrative")
+    # Monthly: any day of the month
+    assert _key(context, "monthly") == _key(context, "monthly", when=datetime(2026, 3, 28))
+
+
+def test_period_end_is_local_boundary():
+    ist = pytz.timezone("Asia/Kolkata")
+    when = datetime(2026, 12, 31, 23, 30)
+    assert period_end("daily", when, "Asia/Kolkata") == ist.localize(datetime(2027, 1, 1)).timestamp()
+    assert period_end("monthly", datetime(2026, 1, 31, 9), "Asia/Kolkata") == ist.localize(datetime(2026, 2, 1)).timestamp()
+    assert period_end("yearly", when, "America/New_York") == (
+        pytz.timezone("America/New_York").localize(datetime(2027, 1, 1)).timestamp()
+    )
+
+
+def test_memory_backend_lru_and_expiry():
+    cache = LLMResponseCache([MemoryCacheBackend(max_entries=2)])
+    cache.set("a", "A", FAR_FUTURE)
+    cache.set("b", "B", FAR_FUTURE)
+    assert cache.get("a") == "A"
+    cache.set("c", "C", FAR_FUTURE)  # evicts b (least recently used)
+    assert cache.get("b") is None and cache.get("c") == "C"
+
+    cache.backends[0].set("old", "X", 1.0)
+    assert cache.get("old") is None
+    cache.set("past", "Y", 1.0)  # already expired: not stored
+    assert len(cache.backends[0]) == 1
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (2, 2, 3)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_sqlite_backend_persists_and_promotes(tmp_path):
+    path = str(tmp_path / "llm" / "cache.sqlite3")
+    LLMResponseCache([SQLiteCacheBackend(path)]).set("k", "Om shanti", FAR_FUTURE)
+
+    memory = MemoryCacheBackend()
+    tiered = LLMResponseCache([memory, SQLiteCacheBackend(path)])
+    assert tiered.get("k") == "Om shanti"
+    assert memory.get("k", 0) == ("Om shanti", FAR_FUTURE)
+    assert tiered.get("k") == "Om shanti"
+    assert tiered.stats()["tier_hits"] == {"memory": 1, "sqlite": 1}
+
+    # Concurrent writers from worker threads
+    threads = [
+        threading.Thread(target=tiered.set, args=(f"t{i}", str(i), FAR_FUTURE))
+        for i in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert tiered.stats()["entries"]["sqlite"] == 9
+    assert tiered.purge_expired() == 0
+
+
+class ThreadRecordingCache(LLMResponseCache):
+    """Records the threads cache lookups and writes run on."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, expires_at):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, expires_at)
+
+
+def test_predict_generates_once_per_context(monkeypatch):
+    server = _GenerateServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = AsyncLLMClient(openai_api_key="", local_llm_url=f"http://127.0.0.1:{server.server_address[1]}")
+    cache = ThreadRecordingCache([MemoryCacheBackend()])
+    monkeypatch.setattr(llm_client, "_async_llm_client", client)
+    monkeypatch.setattr(llm_cache, "_llm_cache", cache)
+    birth = {"name": "Test", "dob": "1995-05-16", "time": "18:38", "lat": 12.9716, "lon": 77.5946, "timezone": "Asia/Kolkata"}
+    # Entries live until the period ends, so use the current day
+    today = datetime.now(pytz.timezone("Asia/Kolkata")).strftime("%Y-%m-%d")
+
+    async def run():
+        try:
+            first = await predict(birth, "monthly", f"{today}T00:10:00")
+            # Same day refreshed later: same canonical context
+            again = await predict(birth, "monthly", f"{today}T23:45:00")
+            other = await predict(dict(birth, name="Other"), "monthly", f"{today}T00:10:00")
+            return first, again, other
+        finally:
+            await client.aclose()
+
+    try:
+        first, again, other = asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first["guidance"] == again["guidance"]
+    assert other["guidance"] != first["guidance"]
+    assert len(server.requests) == 2
+    assert cache.stats()["hits"] == 1
+    # SQLite-backed lookups must not block the event loop
+    assert cache.threads and threading.get_ident() not in cache.threads
@@ -0,0 +1,141 @@
+"""
+Tests for the structured logging layer (level gating, per-request traces, JSON/queue output).
+"""
+
+import asyncio
+import io
+import json
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.kundli_routes import compute_kundli
+from src.compute import executor
+from src.compute.executor import ComputeExecutor
+from src.utils import log
+from src.utils.log import configure_logging, get_logger, request_context, should_trace, shutdown_logging, trace
+
+BIRTH = ("1995-05-16", "18:38", 12.9716, 77.5946, "Asia/Kolkata")
+
+
+class CountingArg:
+    """Log argument that counts how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+def _current_request(**params):
+    return log.current_request()
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    # Restored on teardown
+    monkeypatch.setattr(log, "_trace_request_ids", log._trace_request_ids)
+    monkeypatch.setattr(log, "_trace_sample_rate", log._trace_sample_rate)
+    stream = io.StringIO()
+
+    def configure_(**kwargs):
+        configure_logging(stream=stream, **kwargs)
+        return stream
+
+    yield configure_
+    shutdown_logging()
+    root = logging.getLogger(log.ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for name in ("kundli", "varga", "ephemeris"):
+        get_logger(name).setLevel(logging.NOTSET)
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+
+
+def test_untraced_request_does_no_formatting(configure, capsys):
+    stream = configure(level="INFO", levels="", trace_request_ids="", trace_sample_rate=0)
+    arg = CountingArg()
+    with request_context("req-1"):
+        trace(get_logger("kundli"), "value=%s", arg)
+        compute_kundli(*BIRTH)
+    assert arg.formatted == 0
+    assert stream.getvalue() == ""
+    assert capsys.readouterr().out == ""
+
+
+def test_listed_request_id_is_traced(configure):
+    stream = configure(level="WARNING", levels="", trace_request_ids="req-traced", trace_sample_rate=0)
+    with request_context("req-other"):
+        compute_kundli(*BIRTH)
+    assert stream.getvalue() == ""
+
+    with request_context("req-traced"):
+        compute_kundli(*BIRTH)
+    lines = stream.getvalue().splitlines()
+    assert any("STEP 1A" in line for line in lines)
+    assert any("D4 payload" in line for line in lines)
+    assert all("[req-traced]" in line and " DEBUG " in line for line in lines)
+
+
+def test_subsystem_level_and_sampling(configure):
+    stream = configure(level="INFO", levels="varga=DEBUG", trace_request_ids="", trace_sample_rate=0)
+    trace(get_logger("kundli"), "kundli %s", 1)
+    trace(get_logger("varga"), "varga %s", 2)
+    assert "varga 2" in stream.getvalue()
+    assert "kundli 1" not in stream.getvalue()
+    assert not should_trace("req-1")
+
+    configure(trace_sample_rate=1.0)
+    assert should_trace("req-1")
+    with pytest.raises(ValueError):
+        log.parse_levels("varga=LOUD")
+
+
+def test_json_lines_through_queue(configure):
+    stream = configure(level="INFO", fmt="json", use_queue=True)
+    with request_context("req-json", traced=False):
+        get_logger("kundli").warning("missing %s", ["D60"])
+    shutdown_logging()
+    entry = json.loads(stream.getvalue())
+    assert entry["request_id"] == "req-json"
+    assert entry["logger"] == "guru.kundli"
+    assert entry["message"] == "missing ['D60']"
+
+
+def test_middleware_sets_and_echoes_request_id():
+    app = FastAPI()
+    app.middleware("http")(log.request_id_middleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"request_id": log.current_request()[0]}
+
+    async def get(headers):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/ping", headers=headers)
+
+    given = asyncio.run(get({"X-Request-ID": "req-42"}))
+    assert given.headers["X-Request-ID"] == "req-42"
+    assert given.json() == {"request_id": "req-42"}
+    generated = asyncio.run(get({}))
+    assert generated.json()["request_id"] == generated.headers["X-Request-ID"]
+
+
+def test_request_context_reaches_compute_workers(monkeypatch):
+    monkeypatch.setitem(executor.COMPUTE_TASKS, "request", "tests.test_logging:_current_request")
+
+    async def run():
+        pool = ComputeExecutor(workers=1, max_pending=4, timeout=120)
+        try:
+            with request_context("req-worker", traced=True):
+                return await pool.compute("request", {})
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(run()) == ("req-worker", True)
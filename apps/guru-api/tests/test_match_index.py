@@ -0,0 +1,123 @@
+"""
+Tests for the matching index (pool search equals the single-pair Gun Milan, Porutham and Manglik reports).
+"""
+
+import random
+
+import pytest
+
+from src.matching.gun_milan import gun_milan
+from src.matching.manglik import check_manglik_cancellation
+from src.matching.match_index import (
+    GUNA_KOOTAS,
+    PORUTHAMS,
+    MANGLIK_DOSHA,
+    MANGLIK_NONE,
+    MANGLIK_SELF_CANCELLED,
+    MatchIndex,
+    match_key,
+)
+from src.matching.porutham import porutham
+
+# Moon at the middle of each of the 108 padas: every nakshatra/sign combination
+PADA_DEGREES = [(pada + 0.5) * 360.0 / 108 for pada in range(108)]
+# Mars sign per manglik code (Taurus: no cancellation, Aries: own sign)
+MANGLIK_REPORTS = {
+    MANGLIK_NONE: {"is_manglik": False, "mars_sign": 1},
+    MANGLIK_DOSHA: {"is_manglik": True, "mars_sign": 1},
+    MANGLIK_SELF_CANCELLED: {"is_manglik": True, "mars_sign": 0},
+}
+
+
+def _kundli(moon_degree, mars_degree=45.0, ascendant_degree=0.0):
+    return {
+        "Planets": {"Moon": {"degree": moon_degree}, "Mars": {"degree": mars_degree}},
+        "Ascendant": {"degree": ascendant_degree},
+    }
+
+
+def test_every_moon_pair_matches_single_pair_reports():
+    index = MatchIndex()
+    for pada, degree in enumerate(PADA_DEGREES):
+        index.add(pada, match_key(_kundli(degree)))
+
+    for boy_degree in PADA_DEGREES:
+        boy = _kundli(boy_degree)
+        result = index.search(match_key(boy), profile_is_boy=True, top_k=108)
+        assert result["matched"] == 108
+        for match in result["matches"]:
+            girl = _kundli(PADA_DEGREES[match["candidate_id"]])
+            guna = gun_milan(boy, girl)
+            checks = porutham(boy, girl)
+            assert match["guna_milan"]["total"] == guna["total"]
+            assert match["guna_milan"]["percentage"] == guna["percentage"]
+            assert match["guna_milan"]["verdict"] == guna["verdict"]
+            assert match["guna_milan"]["kootas"] == {name: guna[name]["score"] for name in GUNA_KOOTAS}
+            assert match["porutham"]["score"] == checks["score"]
+            assert match["porutham"]["verdict"] == checks["verdict"]
+            assert match["porutham"]["checks"] == {name: checks[name]["compatible"] for name in PORUTHAMS}
+
+
+def test_profile_as_girl_swaps_orientation():
+    index = MatchIndex()
+    for pada, degree in enumerate(PADA_DEGREES):
+        index.add(pada, match_key(_kundli(degree)))
+
+    girl = _kundli(PADA_DEGREES[40])
+    result = index.search(match_key(girl), profile_is_boy=False, top_k=108)
+    for match in result["matches"]:
+        boy = _kundli(PADA_DEGREES[match["candidate_id"]])
+        assert match["guna_milan"]["total"] == gun_milan(boy, girl)["total"]
+        assert match["porutham"]["score"] == porutham(boy, girl)["score"]
+
+
+def test_top_k_and_filters_match_brute_force():
+    rng = random.Random(7)
+    keys = [(rng.randrange(27), rng.randrange(12), rng.randrange(3)) for _ in range(2000)]
+    index = MatchIndex()
+    for i, key in enumerate(keys):
+        index.add(f"c-{i}", key)
+
+    full = index.search((5, 1, MANGLIK_DOSHA), top_k=len(keys))
+    scored = {m["candidate_id"]: m for m in full["matches"]}
+    order = sorted(
+        range(len(keys)),
+        key=lambda i: (-scored[f"c-{i}"]["guna_milan"]["total"], -scored[f"c-{i}"]["porutham"]["score"], i),
+    )
+    assert [m["candidate_id"] for m in full["matches"]] == [f"c-{i}" for i in order]
+
+    top = index.search((5, 1, MANGLIK_DOSHA), top_k=25, min_guna=18, min_porutham=4, manglik="safe")
+    expected = [
+        m for m in full["matches"]
+        if m["guna_milan"]["total"] >= 18 and m["porutham"]["score"] >= 4 and m["manglik"]["safe_for_marriage"]
+    ]
+    assert top["matched"] == len(expected)
+    assert top["matches"] == expected[:25]
+
+
+@pytest.mark.parametrize("profile_code", list(MANGLIK_REPORTS))
+@pytest.mark.parametrize("candidate_code", list(MANGLIK_REPORTS))
+def test_manglik_filters_follow_cancellation_rules(profile_code, candidate_code):
+    index = MatchIndex()
+    index.add("c", (0, 0, candidate_code))
+    match = index.search((0, 0, profile_code))["matches"][0]
+
+    cancellation = check_manglik_cancellation(MANGLIK_REPORTS[profile_code], MANGLIK_REPORTS[candidate_code])
+    no_dosha = (
+        (not cancellation["boy_manglik"] or cancellation["boy_cancelled"])
+        and (not cancellation["girl_manglik"] or cancellation["girl_cancelled"])
+    )
+    assert match["manglik"]["safe_for_marriage"] == cancellation["safe_for_marriage"]
+    assert match["manglik"]["no_uncancelled_dosha"] == no_dosha
+    assert len(index.search((0, 0, profile_code), manglik="safe")["matches"]) == int(cancellation["safe_for_marriage"])
+
+
+def test_invalid_keys_are_rejected():
+    index = MatchIndex()
+    with pytest.raises(ValueError):
+        index.add("c", (27, 0, 0))
+    with pytest.raises(ValueError):
+        index.add("c", (0, 0, 3))
+    with pytest.raises(ValueError):
+        index.search((0, 0, 0), manglik="none")
+    assert index.search((0, 0, 0)) == {"pool_size": 0, "matched": 0, "matches": []}
@@ -0,0 +1,96 @@
+"""
+Tests for the Muhurtha range search (pruned heap search equals scoring every day).
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import swisseph as swe
+
+from src.jyotish.kundli_engine import generate_kundli, get_planet_positions
+from src.muhurtha.choghadiya_engine import compute_choghadiya
+from src.muhurtha.muhurtha_engine import analyze_hourly_windows
+from src.muhurtha.muhurtha_rules import get_day_blockers
+from src.muhurtha.muhurtha_search import (
+    build_day_transit,
+    merge_muhurtha_results,
+    search_muhurtha_range,
+)
+from src.muhurtha.panchanga_engine import compute_panchanga
+from src.utils.timezone import local_to_utc
+
+LOCATION = {"latitude": 12.9716, "longitude": 77.5946, "timezone": "Asia/Kolkata"}
+START = "2026-10-16"
+DAYS = 60
+
+
+@pytest.fixture(scope="module")
+def natal():
+    birth_utc = local_to_utc(datetime(1995, 5, 16, 18, 38), "Asia/Kolkata")
+    jd = swe.julday(birth_utc.year, birth_utc.month, birth_utc.day, birth_utc.hour + birth_utc.minute / 60.0, swe.GREG_CAL)
+    chart = generate_kundli(jd, 12.9716, 77.5946)
+    return chart["Ascendant"]["degree"], chart["Planets"]["Moon"]["degree"]
+
+
+def _every_window(task, natal, prune):
+    """Score every day of the range and sort all windows (score, date, order in day)."""
+    windows = []
+    for day_index in range(DAYS):
+        date = datetime.strptime(START, "%Y-%m-%d") + timedelta(days=day_index)
+        panchanga = compute_panchanga(date, LOCATION)
+        if prune and get_day_blockers(panchanga):
+            continue
+        transit = build_day_transit(date, *natal)
+        day_windows = analyze_hourly_windows(date, panchanga, compute_choghadiya(date, LOCATION), transit, task, {})
+        for position, window in enumerate(day_windows):
+            windows.append(((-window["score"], day_index, position), date.strftime("%Y-%m-%d"), window))
+    windows.sort(key=lambda entry: entry[0])
+    return [(date, window["start"], window["score"]) for _, date, window in windows]
+
+
+def _summary(result):
+    return [(window["date"], window["start"], window["score"]) for window in result["best_windows"]]
+
+
+@pytest.mark.parametrize("task", ["travel", "marriage_talk"])
+@pytest.mark.parametrize("prune", [False, True])
+def test_search_matches_scoring_every_day(natal, task, prune):
+    expected = _every_window(task, natal, prune)
+    for top_k in (1, 5, 1000):
+        result = search_muhurtha_range(START, DAYS, LOCATION, task, *natal, top_k=top_k, prune=prune)
+        assert _summary(result) == expected[:top_k]
+        assert result["days_pruned"] + result["days_bounded"] + result["days_scored"] == DAYS
+    assert result["days_pruned"] > 0 if prune else result["days_pruned"] == 0
+
+
+def test_pruned_days_never_returned(natal):
+    result = search_muhurtha_range(START, DAYS, LOCATION, "travel", *natal, top_k=1000)
+    for window in result["best_windows"]:
+        panchanga = compute_panchanga(datetime.strptime(window["date"], "%Y-%m-%d"), LOCATION)
+        assert get_day_blockers(panchanga) == []
+        assert window["panchanga"]["karana"] == panchanga["karana"]["name"]
+
+
+def test_chunked_search_merges_to_single_search(natal):
+    single = search_muhurtha_range(START, DAYS, LOCATION, "travel", *natal, top_k=7)
+    first_day = datetime.strptime(START, "%Y-%m-%d")
+    chunks = [
+        search_muhurtha_range((first_day + timedelta(days=offset)).strftime("%Y-%m-%d"), 20, LOCATION, "travel", *natal, top_k=7)
+        for offset in range(0, DAYS, 20)
+    ]
+    merged = merge_muhurtha_results(chunks, top_k=7)
+    assert merged["best_windows"] == single["best_windows"]
+    assert merged["days"] == merged["days_searched"] == DAYS
+
+
+def test_day_transit_houses_from_natal_lagna(natal):
+    natal_asc, natal_moon = natal
+    date = datetime(2026, 11, 3)
+    jd = swe.julday(date.year, date.month, date.day, 0.0, swe.GREG_CAL)
+    transits = build_day_transit(date, natal_asc, natal_moon)["current_transits"]
+    assert "Rahu" not in transits and "Ketu" not in transits
+    for planet, degree in get_planet_positions(jd).items():
+        if planet in transits:
+            assert transits[planet]["degree"] == degree
+            assert transits[planet]["house_from_lagna"] == int(((degree - natal_asc) % 360) / 30) + 1
+            assert transits[planet]["house_from_moon"] == int(((degree - natal_moon) % 360) / 30) + 1
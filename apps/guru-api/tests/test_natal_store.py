@@ -0,0 +1,168 @@
+"""
+Tests for the natal chart store (compute once, hydrate on read, invalidate on code/input change).
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+from src.db.models import BirthDetail
+from src.jyotish import natal_store
+from src.jyotish.natal_store import (
+    compute_natal_chart,
+    get_natal_chart,
+    get_stored_kundli_response,
+    natal_engine_version,
+    refresh_natal_chart,
+    store_kundli_response,
+)
+
+
+def _birth_detail(**overrides):
+    fields = dict(
+        user_id=1,
+        name="Test",
+        birth_date=datetime(1995, 5, 16),
+        birth_time="18:38",
+        birth_latitude=12.9716,
+        birth_longitude=77.5946,
+        birth_place="Bangalore",
+        timezone="Asia/Kolkata",
+    )
+    fields.update(overrides)
+    return BirthDetail(**fields)
+
+
+def _roundtrip(value):
+    # What a JSON column hands back after a commit
+    return json.loads(json.dumps(value))
+
+
+def test_engine_version_is_explicit(monkeypatch):
+    version = natal_engine_version()
+    assert version.startswith(natal_store.NATAL_ENGINE_VERSION + ";")
+    # Bumped by hand, not derived from source files
+    monkeypatch.setattr(natal_store, "NATAL_ENGINE_VERSION", "NATAL_TEST")
+    assert natal_engine_version() != version
+
+
+def test_stored_chart_matches_fresh_computation():
+    bd = _birth_detail()
+    fresh = compute_natal_chart(bd)
+    refresh_natal_chart(bd)
+    bd.kundli_data = _roundtrip(bd.kundli_data)
+
+    natal = get_natal_chart(bd)
+    assert natal["birth_datetime"] == datetime(1995, 5, 16, 18, 38)
+    assert natal["birth_jd"] == fresh["birth_jd"]
+    for key in ("kundli", "birth_planets", "dasha", "yogas"):
+        assert natal[key] == fresh[key], key
+
+
+def test_fresh_record_is_not_recomputed(monkeypatch):
+    bd = _birth_detail()
+    refresh_natal_chart(bd)
+
+    def fail(_):
+        raise AssertionError("natal chart recomputed")
+
+    monkeypatch.setattr(natal_store, "compute_natal_chart", fail)
+    natal = get_natal_chart(bd)
+    # Hydrated copies are independent of the stored record
+    natal["kundli"]["Planets"].clear()
+    assert get_natal_chart(bd)["kundli"]["Planets"]
+
+
+def test_record_invalidated_by_engine_version(monkeypatch):
+    bd = _birth_detail()
+    refresh_natal_chart(bd)
+    monkeypatch.setattr(natal_store, "natal_engine_version", lambda: "0" * 16)
+    get_natal_chart(bd)
+    assert bd.kundli_data["engine_version"] == "0" * 16
+
+
+def test_record_invalidated_by_birth_inputs():
+    bd = _birth_detail()
+    refresh_natal_chart(bd)
+    asc_before = bd.kundli_data["natal"]["kundli"]["Ascendant"]["degree"]
+    bd.birth_time = "06:38"
+    natal = get_natal_chart(bd)
+    assert bd.kundli_data["inputs"]["time"] == "06:38"
+    assert natal["kundli"]["Ascendant"]["degree"] != asc_before
+
+
+def test_kundli_response_store_roundtrip():
+    bd = _birth_detail()
+    refresh_natal_chart(bd)
+    inputs = {"date": "1995-05-16", "time": "18:38", "lat": 12.9716, "lon": 77.5946, "timezone": "Asia/Kolkata"}
+    response = {"julian_day": 2449854.0, "D1": {"Planets": {}}, "D9": {"chartType": "D9"}, "D10": {"chartType": "D10"}}
+    store_kundli_response(bd, inputs, dict(response, current_dasha={"mahadasha": "Venus"}))
+
+    assert "D9" not in bd.kundli_data["kundli"]["response"]
+    assert bd.navamsa_data == {"chartType": "D9"}
+    assert bd.dasamsa_data == {"chartType": "D10"}
+    # Natal part of the record is kept
+    assert "natal" in bd.kundli_data
+
+    assert get_stored_kundli_response(bd, inputs) == response
+    assert get_stored_kundli_response(bd, dict(inputs, timezone="UTC")) is None
+
+
+def test_kundli_endpoint_response_is_storable():
+    from src.api.kundli_routes import kundli_get
+
+    response = json.loads(asyncio.run(kundli_get(
+        user_id=None, dob="1995-05-16", time="18:38", lat=12.9716, lon=77.5946, timezone="Asia/Kolkata",
+        vargas=None, fields=None, compact=False,
+    )).body)
+    response.pop("current_dasha", None)
+    bd = _birth_detail()
+    inputs = {"date": "1995-05-16", "time": "18:38", "lat": 12.9716, "lon": 77.5946, "timezone": "Asia/Kolkata"}
+    store_kundli_response(bd, inputs, response)
+    bd.kundli_data = _roundtrip(bd.kundli_data)
+    bd.navamsa_data = _roundtrip(bd.navamsa_data)
+    bd.dasamsa_data = _roundtrip(bd.dasamsa_data)
+    assert get_stored_kundli_response(bd, inputs) == _roundtrip(response)
+
+
+def test_event_route_persists_refreshed_chart(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.api import event_routes
+    from src.db.database import Base
+    from src.db.models import User
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add(User(id=1, name="Test", email="test@example.com", password="x"))
+    db.add(_birth_detail())
+    db.commit()
+    db.close()
+
+    def build_full_context(birth_data):
+        get_natal_chart(birth_data)
+        return {"events": {}}
+
+    monkeypatch.setattr(event_routes, "SessionLocal", Session)
+    monkeypatch.setattr(event_routes, "get_user_from_token", lambda token: User(id=1))
+    monkeypatch.setattr(event_routes, "build_full_context", build_full_context)
+    asyncio.run(event_routes.get_bad_events(authorization="Bearer token"))
+
+    db = Session()
+    stored = db.query(BirthDetail).filter(BirthDetail.user_id == 1).one().kundli_data
+    db.close()
+    assert stored["engine_version"] == natal_engine_version()
+    assert "natal" in stored
+
+
+def test_birth_detail_response_omits_stored_chart():
+    from src.db.schemas import BirthDetailResponse
+
+    bd = _birth_detail(id=1, created_at=datetime(2026, 1, 1))
+    refresh_natal_chart(bd)
+    fields = BirthDetailResponse.model_validate(bd).model_dump()
+    assert not {"kundli_data", "navamsa_data", "dasamsa_data"} & fields.keys()
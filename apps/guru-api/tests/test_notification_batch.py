@@ -0,0 +1,133 @@
+"""
+Tests for the daily notification batch job (keyset batches, bulk insert, per-batch commit, resume).
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config import settings
+from src.db.database import Base
+from src.db.models import BirthDetail, Notification, User
+from src.notifications import notification_engine
+from src.notifications.notification_engine import (
+    iter_notification_batches,
+    load_notification_checkpoint,
+    run_daily_notifications,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "notification_checkpoint_dir", str(tmp_path))
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = factory()
+    for i in range(1, 8):
+        db.add(User(
+            id=i, email=f"u{i}@example.com", name=f"User {i}", password="x",
+            subscription_level="premium" if i == 5 else "free",
+            daily_notifications="disabled" if i == 6 else "enabled",
+        ))
+        if i == 7:
+            continue  # no birth data
+        for hour in (6, 18):  # second birth detail must be ignored
+            db.add(BirthDetail(
+                user_id=i, name=f"User {i}", birth_date=datetime(1990, 1, i), birth_time=f"{hour}:30",
+                birth_latitude=12.97, birth_longitude=77.59, birth_place="", timezone="Asia/Kolkata",
+            ))
+    db.commit()
+    db.close()
+    return factory
+
+
+def test_batches_are_keyset_paginated(session_factory):
+    db = session_factory()
+    batches = list(iter_notification_batches(db, batch_size=2))
+    db.close()
+    assert [[user.id for user, _ in batch] for batch in batches] == [[1, 2], [3, 4], [5]]
+    for batch in batches:
+        for user, birth_detail in batch:
+            assert birth_detail.birth_time == "6:30"
+
+
+def test_run_creates_notifications_and_resumes(session_factory):
+    result = run_daily_notifications(batch_size=2, workers=0, session_factory=session_factory)
+    # Premium users are cut over to /api/v1/predict and count as failed
+    assert result["status"] == "success"
+    assert result["notifications_created"] == 4
+    assert result["notifications_failed"] == 1
+
+    db = session_factory()
+    assert sorted(n.user_id for n in db.query(Notification).all()) == [1, 2, 3, 4]
+    # Natal charts computed in the run are written back
+    stored = db.query(BirthDetail).filter(BirthDetail.user_id == 1).order_by(BirthDetail.id).first()
+    assert stored.kundli_data and "natal" in stored.kundli_data
+    db.close()
+
+    checkpoint = load_notification_checkpoint(datetime.now().date().isoformat())
+    assert checkpoint["completed"] and checkpoint["last_user_id"] == 5
+
+    again = run_daily_notifications(batch_size=2, workers=0, session_factory=session_factory)
+    assert again["resumed"] and again["notifications_created"] == 4
+    db = session_factory()
+    assert db.query(Notification).count() == 4
+    db.close()
+
+
+def test_failed_batch_is_retried_on_resume(session_factory, monkeypatch):
+    store_batch = notification_engine._store_batch
+    calls = []
+
+    def flaky_store(db, results):
+        calls.append(len(results))
+        if len(calls) == 2:
+            raise RuntimeError("insert failed")
+        return store_batch(db, results)
+
+    monkeypatch.setattr(notification_engine, "_store_batch", flaky_store)
+    result = run_daily_notifications(batch_size=2, workers=0, session_factory=session_factory)
+    assert result["status"] == "error"
+    assert result["notifications_created"] == 2
+
+    db = session_factory()
+    assert sorted(n.user_id for n in db.query(Notification).all()) == [1, 2]
+    db.close()
+    # The checkpoint stays before the rolled-back batch
+    checkpoint = load_notification_checkpoint(datetime.now().date().isoformat())
+    assert checkpoint["last_user_id"] == 2 and not checkpoint["completed"]
+
+    resumed = run_daily_notifications(batch_size=2, workers=0, session_factory=session_factory)
+    assert resumed["status"] == "success"
+    assert (resumed["notifications_created"], resumed["notifications_failed"]) == (4, 1)
+    db = session_factory()
+    assert sorted(n.user_id for n in db.query(Notification).all()) == [1, 2, 3, 4]
+    db.close()
+
+
+def test_worker_pool_avoids_fork(session_factory, monkeypatch):
+    pools = []
+
+    class InlinePool:
+        def __init__(self, max_workers, mp_context):
+            pools.append((max_workers, mp_context.get_start_method()))
+
+        def map(self, fn, jobs, chunksize=1):
+            return map(fn, jobs)
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(notification_engine, "ProcessPoolExecutor", InlinePool)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(settings, "compute_start_method", "spawn")
+    result = run_daily_notifications(batch_size=2, workers=16, session_factory=session_factory)
+    assert result["notifications_created"] == 4
+    # Capped at one worker per CPU; never forked from the scheduler thread
+    assert pools == [(2, "spawn")]
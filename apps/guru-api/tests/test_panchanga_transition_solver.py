@@ -0,0 +1,95 @@
+"""
+Tests for the Panchanga transition solver (Newton end times land exactly on the boundaries).
+"""
+
+import random
+
+import pytest
+import swisseph as swe
+
+from src.ephemeris.ephemeris_utils import calculate_planet_position
+from src.jyotish.panchanga.panchanga_engine import (
+    calculate_karana_array,
+    calculate_nakshatra,
+    calculate_yoga,
+    find_exact_amavasya_purnima,
+)
+from src.jyotish.panchanga.transition_solver import (
+    find_next_transition,
+    panchanga_angle,
+    solve_transition,
+)
+
+ONE_SECOND = 1.0 / 86400.0
+_rng = random.Random(108)
+JDS = [2449853.5, 2451545.0, 2460000.25] + [_rng.uniform(2433282.5, 2469807.5) for _ in range(5)]
+
+
+def _elongation(jd):
+    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    sun = calculate_planet_position(jd, swe.SUN)["longitude"]
+    moon = calculate_planet_position(jd, swe.MOON)["longitude"]
+    return (moon - sun) % 360.0
+
+
+def _bisect_next(jd_start, element, target):
+    """Reference: first crossing after jd_start by plain bisection (2-day window)."""
+    def ahead(jd):
+        return (target - panchanga_angle(jd, element)[0]) % 360.0
+
+    low, high = jd_start, jd_start + 2.0
+    start_ahead = ahead(jd_start)
+    for _ in range(60):
+        mid = (low + high) / 2.0
+        if ahead(mid) <= start_ahead:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2.0
+
+
+@pytest.mark.parametrize("jd", JDS)
+@pytest.mark.parametrize("element,span", [("tithi", 12.0), ("nakshatra", 360.0 / 27), ("yoga", 360.0 / 27)])
+def test_next_transition_matches_bisection(jd, element, span):
+    angle, _ = panchanga_angle(jd, element)
+    target = ((int(angle // span) + 1) * span) % 360.0
+    jd_end = find_next_transition(jd, element, target)
+    assert jd_end > jd
+    assert abs(jd_end - _bisect_next(jd, element, target)) < ONE_SECOND
+    residual = (panchanga_angle(jd_end, element)[0] - target + 180.0) % 360.0 - 180.0
+    assert abs(residual) < 1e-5
+
+
+def test_zero_target_is_not_collapsed_to_start():
+    """Revati / last yoga end at 0°: the end time lies ahead, not at the start JD."""
+    jd = 2449853.5
+    moon, _ = panchanga_angle(jd, "nakshatra")
+    jd_revati = solve_transition(jd + ((350.0 - moon) % 360.0) / 13.2, "nakshatra", 350.0)
+    assert calculate_nakshatra(jd_revati)["current"]["name"] == "Revati"
+    assert find_next_transition(jd_revati, "nakshatra", 0.0) - jd_revati > 0.1
+    yoga_angle, _ = panchanga_angle(jd, "yoga")
+    jd_last_yoga = solve_transition(jd + ((355.0 - yoga_angle) % 360.0) / 14.0, "yoga", 355.0)
+    assert calculate_yoga(jd_last_yoga)["current"]["name"] == "Vaidhriti"
+    assert find_next_transition(jd_last_yoga, "yoga", 0.0) - jd_last_yoga > 0.05
+
+
+@pytest.mark.parametrize("target", [0.0, 180.0])
+def test_amavasya_purnima_exact_crossing_in_window(target):
+    for jd in JDS:
+        jd_found = find_exact_amavasya_purnima(jd, target)
+        assert jd - 45 <= jd_found <= jd
+        residual = (_elongation(jd_found) - target + 180.0) % 360.0 - 180.0
+        assert abs(residual) < 1e-5
+
+
+def test_karana_sequence_boundaries():
+    jd_sunrise = 2449853.5
+    karanas = calculate_karana_array(jd_sunrise, jd_sunrise + 1.0, "Asia/Kolkata")
+    assert 2 <= len(karanas) <= 4
+    assert len({k["end_time"] for k in karanas}) == len(karanas)
+    # Each karana end (except a clamp at next sunrise) sits on a 6° boundary
+    jd = jd_sunrise
+    target = ((int(_elongation(jd) // 6.0) + 1) * 6.0) % 360.0
+    jd_end = find_next_transition(jd, "karana", target)
+    residual = (_elongation(jd_end) - target + 180.0) % 360.0 - 180.0
+    assert abs(residual) < 1e-5
@@ -0,0 +1,94 @@
+"""
+Tests for the compiled post-processor (RewriteTable equals one re.sub per rule for every shipped
+table; the fused paragraph passes keep their output).
+"""
+
+import random
+import re
+
+import pytest
+
+from src.ai import post_processor
+from src.ai.post_processor import (
+    DHARMIC_FLUFF_PATTERNS,
+    DOCTRINAL_LEAK_PATTERNS,
+    MAHABHARATA_CADENCE_PATTERNS,
+    apply_anti_leak_sanitizer,
+    validate_and_format_guidance,
+)
+from src.ai.rewrite_engine import RewriteTable, required_literal
+from src.api.prediction_routes import _strip_disallowed_retrograde
+
+VOCABULARY = (
+    "Sun Moon Saturn Rahu Venus strength amplified results fluctuate weak dusthana Kendra bindu low_bindu "
+    "expansion language restrict expansion As lord of primary dosha of the day combust ſhadbala İnterpretation "
+    "Interpretation unavailable for this section Do not initiate major ventures today Stay positive "
+    "Do not let get you down You've got this Under the influence of Rahu Mahadasha and Venus Antardasha "
+    "Focus on clear communication. Don't rush into new partnerships. Avoid taking unnecessary risks. "
+    "Do focus on , . \n \n\n"
+).split(" ")
+
+
+def _sequential(rules, text, flags=re.IGNORECASE):
+    for pattern, replacement in rules:
+        text = re.sub(pattern, replacement, text, flags=flags)
+    return text
+
+
+def test_required_literal():
+    assert required_literal(r"\bdusthana\b") == "dusthana"
+    assert required_literal(r"Interpretation unavailable\.?") == "Interpretation unavailable"
+    assert required_literal(r"Don'?t rush[^.]*\.") == "t rush"
+    assert required_literal(r"Under the influence of (\w+) Mahadasha and (\w+) Antardasha") == "Under the influence of "
+    assert required_literal(r"\bStay\b|\bpositive\b") is None
+    assert required_literal(r"(\w+)\s+") is None
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [DOCTRINAL_LEAK_PATTERNS, DHARMIC_FLUFF_PATTERNS, MAHABHARATA_CADENCE_PATTERNS],
+    ids=["anti_leak", "dharmic_fluff", "cadence"],
+)
+def test_table_matches_sequential_substitution(rules):
+    table = RewriteTable(rules, re.IGNORECASE)
+    rng = random.Random(18)
+    for _ in range(2000):
+        text = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 60)))
+        assert table.apply(text) == _sequential(rules, text)
+
+
+def test_sanitizer_rewrites_case_insensitively():
+    assert apply_anti_leak_sanitizer("A DUSTHANA; ſhadbala is low.") == "A challenging house; planetary strength is low."
+    # Chained rules still see earlier rewrites
+    assert apply_anti_leak_sanitizer("restrict expansion language") == "restrict optimistic phrasing"
+
+
+def test_guidance_paragraph_passes():
+    context = {
+        "time": {"mahadasha_lord": "Saturn"},
+        "transit": {"Moon": {"house_from_moon": 8}},
+        "strength": {"Sun": {"virupas": 500}},
+    }
+    guidance = (
+        "Seeker, the wheel of Time turns thus:\n\n"
+        "On this sacred Ekadashi the day is steady.\n\n"
+        "Saturn Mahadasha shapes the year. Sun strength amplified\n\n"
+        "Remember, patience wins.\n\n"
+        "Do your duty."
+    )
+    assert validate_and_format_guidance(guidance, context) == (
+        "Seeker, the wheel of Time turns thus:\n\n"
+        "On this sacred Ekadashi the day is steady.\n\n"
+        "Saturn Mahadasha shapes the year. Sun. Strength amplified.\n\n"
+        "Let this not be a day for decisive beginnings."
+    )
+    assert post_processor._enforce_chandra_bala("A.\n\nOn this sacred day.", context) == (
+        "A.\n\nOn this sacred day.\n\nDo not initiate major ventures today."
+    )
+
+
+def test_retrograde_strip_fast_path():
+    guidance = "🪐 MAJOR TRANSITS\nMars moves forward.\n⚖ NIRNAYA\nSteady."
+    assert _strip_disallowed_retrograde(guidance, {"Mercury"}) is guidance
+    with_retro = "🪐 MAJOR TRANSITS\nMars is retrograde.\nMercury is retrograde.\n⚖ NIRNAYA"
+    assert _strip_disallowed_retrograde(with_retro, {"Mercury"}) == "🪐 MAJOR TRANSITS\nMercury is retrograde.\n⚖ NIRNAYA"
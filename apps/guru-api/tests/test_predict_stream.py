@@ -0,0 +1,170 @@
+"""
+Tests for streaming predict (context and backend sections first, LLM sections as they complete
+with the /predict post-processing, final event equal to the /predict response).
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.ai import llm_cache, llm_client
+from src.ai.json_stream import JsonObjectStream
+from src.ai.llm_cache import LLMResponseCache, MemoryCacheBackend
+from src.ai.llm_client import AsyncLLMClient
+from src.api import prediction_routes
+from src.api.prediction_routes import predict, predict_stream
+from tests.test_async_llm_client import _GenerateServer
+from tests.test_llm_cache import ThreadRecordingCache
+
+BIRTH = {"name": "Test", "dob": "1995-05-16", "time": "18:38", "lat": 12.9716, "lon": 77.5946, "timezone": "Asia/Kolkata"}
+DATE = "2026-03-01T07:10:00"
+SECTIONS = {
+    "greeting": "Test, I have examined your chart with care.",
+    "panchanga": "On this sacred Ekadashi the day is steady.",
+    "dasha": "Saturn rules the period with a dusthana weight.",
+    "chandra_bala": "The Moon is steady.",
+    "tara_bala": "Tara is mild.",
+    "major_transits": "Jupiter moves through your 10th house.",
+    "dharmic_guidance": "Do your duty. Avoid haste.",
+    "throne": "You were born under Rohini.",
+    "moon_movement": "",
+    "nirnaya": "Travel is fine. Work steadily. Be patient. Avoid anger.",
+    "shanti_parihara": "Offer water to the Sun.",
+}
+
+
+def _chunks(text, size=24):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    server = _GenerateServer()
+    server.reply = lambda payload: (
+        _chunks(json.dumps(SECTIONS)) if payload.get("format") == "json" else ["Steady ", "effort ", "today."]
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = AsyncLLMClient(openai_api_key="", local_llm_url=f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(llm_client, "_async_llm_client", client)
+    monkeypatch.setattr(llm_cache, "_llm_cache", LLMResponseCache([MemoryCacheBackend()], enabled=False))
+    yield server, client
+    server.shutdown()
+    server.server_close()
+
+
+def _collect(client, timescale):
+    async def run():
+        try:
+            events = []
+            started = time.perf_counter()
+            async for event, data in predict_stream(BIRTH, timescale, DATE):
+                events.append((event, data, time.perf_counter() - started))
+            expected = await predict(BIRTH, timescale, DATE)
+            return events, expected
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_json_object_stream_any_chunking():
+    text = "```json\n" + json.dumps(dict(SECTIONS, count=12, nested={"a": [1, "}"]}), indent=1) + "\n```"
+    for _ in range(50):
+        stream = JsonObjectStream()
+        members = []
+        pos = 0
+        while pos < len(text):
+            step = random.randint(1, 9)
+            members += stream.feed(text[pos:pos + step])
+            pos += step
+        assert [k for k, _ in members] == list(SECTIONS) + ["count", "nested"]
+        assert dict(members)["nested"] == {"a": [1, "}"]} and stream.done
+
+    broken = JsonObjectStream()
+    assert broken.feed("Namaste") == [] and broken.failed
+
+
+def test_daily_stream_sends_backend_sections_first(llm):
+    server, client = llm
+    server.delay = 0.3
+    events, expected = _collect(client, "daily")
+
+    names = [event for event, _, _ in events]
+    assert names[0] == "context" and names[-1] == "done"
+    backend = [data for event, data, _ in events if event == "section" and data["source"] == "backend"]
+    llm_sections = [(data, at) for event, data, at in events if event == "section" and data["source"] == "llm"]
+    assert [s["key"] for s in backend] == ["declarations", "greeting", "panchanga", "throne"]
+    assert backend[0]["final"] and not any(s["final"] for s in backend[1:])
+
+    # Everything before the first LLM section was sent without waiting for the LLM
+    first_llm_at = llm_sections[0][1]
+    assert all(at < first_llm_at - 0.2 for event, _, at in events[:len(backend) + 1])
+
+    done = events[-1][1]
+    assert json.dumps(done, sort_keys=True, default=str) == json.dumps(expected, sort_keys=True, default=str)
+    assert [s["key"] for s, _ in llm_sections] == list(SECTIONS)
+    for section, _ in llm_sections:
+        assert section["content"] == done["structured"][section["key"]]
+        assert section["heading"] == prediction_routes.CANONICAL_SECTION_HEADINGS[section["key"]]
+
+
+def test_narrative_stream_sends_deltas(llm):
+    server, client = llm
+    events, expected = _collect(client, "monthly")
+
+    assert [event for event, _, _ in events] == ["context", "delta", "delta", "delta", "done"]
+    assert "".join(data["text"] for event, data, _ in events if event == "delta") == "Steady effort today."
+    assert json.dumps(events[-1][1], sort_keys=True, default=str) == json.dumps(expected, sort_keys=True, default=str)
+
+
+def test_narrative_stream_replays_cache_off_the_loop(llm, monkeypatch):
+    server, client = llm
+    cache = ThreadRecordingCache([MemoryCacheBackend()])
+    monkeypatch.setattr(llm_cache, "_llm_cache", cache)
+    # Entries live until the period ends, so use the current month
+    date = time.strftime("%Y-%m-%dT07:10:00")
+
+    async def run():
+        try:
+            return [
+                [(event, data) async for event, data in predict_stream(BIRTH, "monthly", date)]
+                for _ in range(2)
+            ]
+        finally:
+            await client.aclose()
+
+    first, again = asyncio.run(run())
+    assert [event for event, _ in again] == ["context", "delta", "done"]
+    assert again[1][1]["text"] == "Steady effort today."
+    assert again[-1][1]["guidance"] == first[-1][1]["guidance"]
+    assert len(server.requests) == 1
+    assert cache.threads and threading.get_ident() not in cache.threads
+
+
+def test_stream_route_emits_sse(llm):
+    server, client = llm
+    app = FastAPI()
+    app.include_router(prediction_routes.router, prefix="/api/v1")
+
+    async def run():
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as http:
+                body = {"birth_details": BIRTH, "timescale": "daily", "calculation_date": DATE}
+                return await http.post("/api/v1/predict/stream", json=body)
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = [block.split("\n", 1) for block in response.text.strip().split("\n\n")]
+    events = [(head[len("event: "):], json.loads(data[len("data: "):])) for head, data in messages]
+    assert events[0][0] == "context" and events[-1][0] == "done"
+    assert set(events[-1][1]["structured"]) >= set(SECTIONS)
@@ -0,0 +1,133 @@
+"""
+Tests for batch Shadbala calculations (calculate_shadbala_batch() equals the per-planet bala functions).
+"""
+
+import random
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from src.ephemeris.ephemeris_utils import get_ascendant
+from src.jyotish.kundli_engine import get_planet_positions
+from src.jyotish.strength import shadbala
+from src.jyotish.strength.shadbala import (
+    MINIMUM_REQUIREMENT,
+    NAISARGIKA_BALA,
+    SHADBALA_CONFIG,
+    SHADBALA_INPUT_COLUMNS,
+    build_shadbala_snapshot,
+    calculate_ayana_bala,
+    calculate_cheshta_bala,
+    calculate_dig_bala,
+    calculate_dina_bala,
+    calculate_drekkana_bala,
+    calculate_drik_bala,
+    calculate_hora_bala_for_chart,
+    calculate_kala_bala,
+    calculate_kendradi_bala_whole_sign,
+    calculate_masa_bala,
+    calculate_nathonnatha_bala,
+    calculate_ojhayugmarasiamsa_bala,
+    calculate_paksha_bala,
+    calculate_saptavargaja_bala,
+    calculate_shadbala,
+    calculate_shadbala_batch,
+    calculate_sthana_bala,
+    calculate_tribhaga_bala,
+    calculate_uchcha_bala,
+    calculate_varsha_bala,
+)
+
+TIMEZONES = ("Asia/Kolkata", "Europe/London", "America/New_York", "Australia/Sydney")
+
+
+def _random_charts(count, seed=1953):
+    rng = random.Random(seed)
+    charts = []
+    for _ in range(count):
+        jd = swe.julday(rng.randint(1920, 2080), rng.randint(1, 12), rng.randint(1, 28), rng.uniform(0.0, 24.0))
+        charts.append((jd, rng.uniform(-55.0, 60.0), rng.uniform(-180.0, 180.0), rng.choice(TIMEZONES)))
+    return charts
+
+
+CHARTS = [(2449853.0541666667, 12.9716, 77.5946, "Asia/Kolkata")] + _random_charts(24)
+
+
+def _scalar_columns(jd, lat, lon, tz):
+    """Reference: every component from the independent per-planet functions."""
+    planets = get_planet_positions(jd)
+    asc = get_ascendant(jd, lat, lon)
+    columns = {}
+    for name, degree in planets.items():
+        if name in ("Rahu", "Ketu"):
+            continue
+        drik = calculate_drik_bala(name, degree, planets, {})
+        sthana = calculate_sthana_bala(name, degree, jd, asc, lat, lon)
+        kala = calculate_kala_bala(name, degree, jd, lat, lon, tz, planets, asc)
+        cheshta = calculate_cheshta_bala(name, jd, planets["Moon"], planets["Sun"])
+        dig = calculate_dig_bala(name, degree, asc, jd, lat, lon)
+        total = NAISARGIKA_BALA[name] + cheshta + sthana + dig + kala + drik
+        columns[name] = {
+            "naisargika_bala": NAISARGIKA_BALA[name],
+            "cheshta_bala": cheshta,
+            "uchcha_bala": calculate_uchcha_bala(name, degree),
+            "saptavargaja_bala": calculate_saptavargaja_bala(name, degree, jd, asc) / SHADBALA_CONFIG["SAPTAVARGAJA_DIVISOR"],
+            "ojhayugmarasiamsa_bala": calculate_ojhayugmarasiamsa_bala(name, degree),
+            "kendradi_bala": calculate_kendradi_bala_whole_sign(degree, asc),
+            "drekkana_bala": calculate_drekkana_bala(name, degree),
+            "sthana_bala": sthana,
+            "dig_bala": dig,
+            "nathonnatha_bala": calculate_nathonnatha_bala(name, jd, lat, lon, tz),
+            "paksha_bala": calculate_paksha_bala(name, jd),
+            "tribhaga_bala": calculate_tribhaga_bala(name, jd, lat, lon, tz),
+            "varsha_bala": calculate_varsha_bala(name, jd),
+            "masa_bala": calculate_masa_bala(name, jd, lat, lon, tz),
+            "dina_bala": calculate_dina_bala(name, jd),
+            "hora_bala": calculate_hora_bala_for_chart(name, jd, lat, lon, tz),
+            "ayana_bala": calculate_ayana_bala(name, jd),
+            "kala_bala": kala,
+            "drik_bala": drik,
+            "total_shadbala": total,
+            "ratio": total / MINIMUM_REQUIREMENT[name],
+        }
+    return columns
+
+
+@pytest.mark.parametrize("chart", CHARTS, ids=lambda chart: f"jd{chart[0]:.4f}")
+def test_batch_identical_to_scalar_balas(chart):
+    jd, lat, lon, tz = chart
+    table = calculate_shadbala_batch(build_shadbala_snapshot(jd, lat, lon, tz))
+    reference = _scalar_columns(jd, lat, lon, tz)
+    assert table.planets == tuple(reference.keys())
+    for row, name in enumerate(table.planets):
+        for component, expected in reference[name].items():
+            assert float(table.columns[component][row]) == expected, (name, component)
+
+
+def test_table_shape_and_immutability():
+    jd, lat, lon, tz = CHARTS[0]
+    table = calculate_shadbala_batch(build_shadbala_snapshot(jd, lat, lon, tz))
+    assert table.inputs.shape == (7, len(SHADBALA_INPUT_COLUMNS))
+    assert all(column.shape == (7,) for column in table.columns.values())
+    assert set(table.column("ratio")) == set(table.planets)
+    with pytest.raises(ValueError):
+        table.columns["ratio"][0] = 0.0
+    with pytest.raises(TypeError):
+        table.columns["ratio"] = np.zeros(7)
+
+
+def test_calculate_shadbala_single_ephemeris_pass(monkeypatch):
+    """Positions are read once per chart, not once per planet (Saptavargaja)."""
+    jd, lat, lon, tz = CHARTS[0]
+    calls = []
+    real_positions = shadbala.get_planet_positions
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return real_positions(*args, **kwargs)
+
+    monkeypatch.setattr(shadbala, "get_planet_positions", _counting)
+    result = calculate_shadbala(jd, lat, lon, timezone=tz)
+    assert len(calls) == 1
+    assert sorted(r["relative_rank"] for r in result.values()) == list(range(1, 8))
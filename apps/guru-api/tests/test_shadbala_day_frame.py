@@ -0,0 +1,121 @@
+"""
+Tests for the Shadbala day frame (Kala Bala inputs computed once per chart, identical output).
+"""
+
+from datetime import date
+
+import pytest
+import swisseph as swe
+
+from src.jyotish.drik_panchang_engine import get_julian_day_utc
+from src.jyotish.strength import shadbala
+from src.jyotish.strength.shadbala import (
+    PLANET_TO_SE,
+    build_shadbala_day_frame,
+    calculate_ayana_bala,
+    calculate_hora_bala_for_chart,
+    calculate_kala_bala,
+    calculate_masa_bala,
+    calculate_nathonnatha_bala,
+    calculate_paksha_bala,
+    calculate_shadbala,
+    calculate_tribhaga_bala,
+    calculate_yuddha_bala,
+    ensure_shadbala_day_frame,
+)
+
+# (birth date, time, lat, lon, timezone): day birth, night birth, pre-sunrise birth
+CHARTS = [
+    (date(1995, 5, 16), "18:38", 12.9716, 77.5946, "Asia/Kolkata"),
+    (date(2006, 2, 6), "04:30", 28.6139, 77.2090, "Asia/Kolkata"),
+    (date(2001, 9, 9), "13:13", -33.8688, 151.2093, "Australia/Sydney"),
+]
+PLANETS = list(PLANET_TO_SE.keys())
+
+
+@pytest.fixture(params=CHARTS, ids=lambda chart: f"{chart[0]}-{chart[1]}")
+def chart(request):
+    birth_date, birth_time, lat, lon, tz = request.param
+    return get_julian_day_utc(birth_date, birth_time, tz), lat, lon, tz
+
+
+def test_sub_balas_identical_with_day_frame(chart):
+    jd, lat, lon, tz = chart
+    frame = build_shadbala_day_frame(jd, lat, lon, tz)
+    for planet in PLANETS:
+        assert calculate_nathonnatha_bala(planet, jd, lat, lon, tz, frame) == calculate_nathonnatha_bala(planet, jd, lat, lon, tz)
+        assert calculate_paksha_bala(planet, jd, frame) == calculate_paksha_bala(planet, jd)
+        assert calculate_tribhaga_bala(planet, jd, lat, lon, tz, frame) == calculate_tribhaga_bala(planet, jd, lat, lon, tz)
+        assert calculate_masa_bala(planet, jd, lat, lon, tz, frame) == calculate_masa_bala(planet, jd, lat, lon, tz)
+        assert calculate_hora_bala_for_chart(planet, jd, lat, lon, tz, frame) == calculate_hora_bala_for_chart(planet, jd, lat, lon, tz)
+        assert calculate_ayana_bala(planet, jd, frame) == calculate_ayana_bala(planet, jd)
+
+
+def test_yuddha_identical_with_day_frame(chart):
+    """Forced planetary war exercises the Kala Bala (no Ayana) path twice per pair."""
+    jd, lat, lon, tz = chart
+    frame = build_shadbala_day_frame(jd, lat, lon, tz)
+    all_planets = {"Sun": 10.0, "Moon": 100.0, "Mars": 200.3, "Venus": 200.8, "Saturn": 300.0}
+    for planet in ("Mars", "Venus"):
+        with_frame = calculate_yuddha_bala(planet, all_planets[planet], all_planets, jd, lat, lon, 15.0, tz, frame)
+        without = calculate_yuddha_bala(planet, all_planets[planet], all_planets, jd, lat, lon, 15.0, tz)
+        assert with_frame == without
+        assert with_frame != 0.0
+        assert calculate_kala_bala(planet, all_planets[planet], jd, lat, lon, tz, all_planets, 15.0, frame) == \
+            calculate_kala_bala(planet, all_planets[planet], jd, lat, lon, tz, all_planets, 15.0)
+
+
+def test_shadbala_rise_trans_once_per_chart(chart, monkeypatch):
+    """calculate_shadbala() does the day frame's rise/set searches and no per-planet ones."""
+    jd, lat, lon, tz = chart
+    real_rise_trans = swe.rise_trans
+    calls = []
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return real_rise_trans(*args, **kwargs)
+
+    monkeypatch.setattr(swe, "rise_trans", _counting)
+    build_shadbala_day_frame(jd, lat, lon, tz)
+    frame_calls = len(calls)
+    calls.clear()
+    calculate_shadbala(jd, lat, lon, timezone=tz)
+    assert frame_calls > 0
+    assert len(calls) == frame_calls
+
+
+def test_day_frame_is_immutable(chart):
+    jd, lat, lon, tz = chart
+    frame = build_shadbala_day_frame(jd, lat, lon, tz)
+    with pytest.raises(Exception):
+        frame.hora_lord = "Sun"
+    with pytest.raises(TypeError):
+        frame.declinations["Sun"] = 0.0
+
+
+def test_day_frame_location_mismatch_rejected(chart):
+    jd, lat, lon, tz = chart
+    frame = build_shadbala_day_frame(jd, lat, lon, tz)
+    assert ensure_shadbala_day_frame(frame, jd, lat, lon, tz) is frame
+    with pytest.raises(ValueError):
+        ensure_shadbala_day_frame(frame, jd, lat + 1.0, lon, tz)
+    with pytest.raises(ValueError):
+        calculate_kala_bala("Sun", 10.0, jd + 1.0, lat, lon, tz, {"Sun": 10.0}, 15.0, frame)
+
+
+def test_failed_sunrise_keeps_legacy_fallbacks(chart, monkeypatch):
+    """When rise/set fails, frame-based balas take exactly the pre-frame fallbacks."""
+    jd, lat, lon, tz = chart
+
+    def _failing(*args, **kwargs):
+        raise ValueError("Sunrise/sunset calculation failed")
+
+    monkeypatch.setattr(shadbala, "calculate_sunrise_sunset", _failing)
+    monkeypatch.setattr(shadbala, "get_sunrise_sunset_jds", _failing)
+    frame = build_shadbala_day_frame(jd, lat, lon, tz)
+    assert frame.local_day_hours is None
+    assert frame.hora_lord is None
+    for planet in PLANETS:
+        assert calculate_nathonnatha_bala(planet, jd, lat, lon, tz, frame) == calculate_nathonnatha_bala(planet, jd, lat, lon, tz)
+        assert calculate_tribhaga_bala(planet, jd, lat, lon, tz, frame) == calculate_tribhaga_bala(planet, jd, lat, lon, tz)
+        assert calculate_hora_bala_for_chart(planet, jd, lat, lon, tz, frame) == calculate_hora_bala_for_chart(planet, jd, lat, lon, tz)
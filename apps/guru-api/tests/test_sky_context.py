@@ -0,0 +1,104 @@
+"""
+Tests for the daily sky context (the shared day/location sky reproduces compute_daily() and
+generate_panchang(), and is computed once per day and location cell).
+"""
+
+from datetime import datetime
+
+import swisseph as swe
+
+from src.db.models import BirthDetail
+from src.jyotish.daily import sky_context
+from src.jyotish.daily.daily_engine import compute_daily
+from src.jyotish.daily.sky_context import SkyContextCache, get_local_sky, sky_context_cache
+from src.jyotish.kundli_engine import get_planet_positions
+from src.jyotish.natal_store import refresh_natal_chart
+from src.jyotish.panchang_engine import generate_panchang
+from src.notifications.notification_engine import build_user_context
+
+DAY = datetime(2026, 3, 1)
+JD = swe.julday(DAY.year, DAY.month, DAY.day, 12.0, swe.GREG_CAL)
+
+
+def _birth_detail(**overrides):
+    fields = dict(
+        user_id=1,
+        name="Test",
+        birth_date=datetime(1995, 5, 16),
+        birth_time="18:38",
+        birth_latitude=12.9716,
+        birth_longitude=77.5946,
+        birth_place="Bangalore",
+        timezone="Asia/Kolkata",
+    )
+    fields.update(overrides)
+    return BirthDetail(**fields)
+
+
+def test_local_sky_matches_per_user_calculation():
+    bd = _birth_detail()
+    natal = refresh_natal_chart(bd)
+    local = SkyContextCache(grid_deg=0).local(JD, bd.birth_latitude, bd.birth_longitude)
+
+    expected = compute_daily(natal["birth_jd"], JD, bd.birth_latitude, bd.birth_longitude, natal["birth_datetime"])
+    assert local.daily_for_natal(natal) == expected
+    assert local.panchang() == generate_panchang(JD, DAY, bd.birth_latitude, bd.birth_longitude)
+
+
+def test_sky_context_fields():
+    sky = SkyContextCache().sky(JD)
+    assert sky.planets == get_planet_positions(JD)
+    assert sky.retrograde == {name: speed < 0 for name, speed in sky.speeds.items()}
+    assert not sky.retrograde["Sun"] and not sky.retrograde["Moon"]
+    assert all(0 <= sign <= 11 for sign in sky.signs.values())
+
+    moon_start = int(get_planet_positions(JD - 0.5)["Moon"] // 30)
+    moon_end = int(get_planet_positions(JD + 0.5)["Moon"] // 30)
+    assert bool(sky.moon_sign_changes) == (moon_start != moon_end)
+    for change in sky.moon_sign_changes:
+        assert JD - 0.5 <= change["jd"] <= JD + 0.5
+        assert change["to_sign"] == int(get_planet_positions(change["jd"] + 1e-4)["Moon"] // 30)
+
+
+def test_local_sky_is_computed_once_per_cell(monkeypatch):
+    built = []
+    original = sky_context.build_local_sky
+
+    def counting(sky, latitude, longitude):
+        built.append((latitude, longitude))
+        return original(sky, latitude, longitude)
+
+    monkeypatch.setattr(sky_context, "build_local_sky", counting)
+    cache = SkyContextCache(grid_deg=0.01)
+
+    first = cache.local(JD, 12.9716, 77.5946)
+    # Same grid cell
+    assert cache.local(JD, 12.9738, 77.5921) is first
+    cache.local(JD, 19.0760, 72.8777)
+    cache.local(JD + 1, 12.9716, 77.5946)
+    assert built == [(12.97, 77.59), (19.08, 72.88), (12.97, 77.59)]
+    assert cache.stats()["hits"] == 1
+
+    # Callers get private copies
+    natal = refresh_natal_chart(_birth_detail())
+    daily = first.daily_for_natal(natal)
+    daily["house_impacts"].clear()
+    assert first.daily_for_natal(natal)["house_impacts"]
+
+
+def test_user_contexts_share_the_days_sky(monkeypatch):
+    sky_context_cache.clear()
+    built = []
+    original = sky_context.build_local_sky
+    monkeypatch.setattr(
+        sky_context, "build_local_sky",
+        lambda sky, lat, lon: built.append((lat, lon)) or original(sky, lat, lon),
+    )
+
+    first = build_user_context(_birth_detail(), JD)
+    second = build_user_context(_birth_detail(user_id=2, birth_time="04:10", birth_date=datetime(1988, 1, 2)), JD)
+
+    assert len(built) == 1
+    assert first["panchang"] == second["panchang"] == get_local_sky(JD, 12.9716, 77.5946).panchang()
+    assert first["daily"]["house_impacts"] == second["daily"]["house_impacts"]
+    sky_context_cache.clear()
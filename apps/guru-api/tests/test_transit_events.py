@@ -0,0 +1,86 @@
+"""
+Tests for the transit event index (exact ingresses and stations, range queries).
+"""
+
+import pytest
+
+from src.ephemeris import transit_events
+from src.ephemeris.transit_events import (
+    EVENT_SPANS,
+    build_transit_event_index,
+    find_transit_events,
+    scan_transit_events_exact,
+)
+from src.ephemeris.transit_table import build_transit_table
+from src.jyotish.kundli_engine import get_planet_positions
+
+JD_START = 2460676.5  # 2025-01-01
+DAYS = 400
+
+
+@pytest.fixture(scope="module")
+def index():
+    return build_transit_event_index(build_transit_table(JD_START, JD_START + DAYS))
+
+
+def _index_at(planet, jd, span):
+    return int(get_planet_positions(jd)[planet] // span) % round(360.0 / span)
+
+
+def test_ingresses_straddle_their_boundary(index):
+    ingresses = [event for event in index.events if event.kind != "station"]
+    assert ingresses
+    for event in ingresses:
+        span = EVENT_SPANS[event.kind]
+        assert _index_at(event.planet, event.jd - 1e-4, span) == event.from_index, event
+        assert _index_at(event.planet, event.jd + 1e-4, span) == event.to_index, event
+
+
+def test_stations_change_direction(index):
+    stations = [event for event in index.events if event.kind == "station"]
+    assert {"Mercury", "Venus", "Mars", "Jupiter", "Saturn"} <= {event.planet for event in stations}
+    for event in stations:
+        before = transit_events._motion(event.planet, event.jd - 1e-3)[1]
+        after = transit_events._motion(event.planet, event.jd + 1e-3)[1]
+        assert (before < 0) != (after < 0)
+        assert (after < 0) == event.retrograde
+
+
+def test_no_sign_change_missed(index):
+    """Fine day-stepping finds exactly the indexed sign ingresses of the slow grahas."""
+    for planet in ("Mars", "Jupiter", "Saturn"):
+        expected = 0
+        previous = _index_at(planet, JD_START, 30.0)
+        jd = JD_START
+        while jd < JD_START + DAYS:
+            jd += 0.25
+            current = _index_at(planet, jd, 30.0)
+            expected += current != previous
+            previous = current
+        assert len(index.query(JD_START, jd, [planet], ["sign"])) == expected
+
+
+def test_query_filters_and_ranges(index):
+    jd_from, jd_to = JD_START + 30.0, JD_START + 60.0
+    events = index.query(jd_from, jd_to, ["Moon"], ["nakshatra"])
+    assert 25 <= len(events) <= 30
+    assert all(jd_from <= e.jd <= jd_to and e.planet == "Moon" and e.kind == "nakshatra" for e in events)
+    assert [e.jd for e in events] == sorted(e.jd for e in events)
+
+
+def test_exact_scan_matches_index(index):
+    jd_from, jd_to = JD_START + 10.0, JD_START + 200.0
+    exact = scan_transit_events_exact("Mercury", jd_from, jd_to)
+    indexed = index.query(jd_from, jd_to, ["Mercury"])
+    assert [(e.kind, e.from_index, e.to_index, e.retrograde) for e in exact] == \
+        [(e.kind, e.from_index, e.to_index, e.retrograde) for e in indexed]
+    assert max(abs(a.jd - b.jd) for a, b in zip(exact, indexed)) < 1e-5
+
+
+def test_find_transit_events_outside_index(index, monkeypatch):
+    monkeypatch.setattr(transit_events, "get_transit_event_index", lambda: index)
+    inside = find_transit_events(JD_START + 50.0, JD_START + 80.0, ["Sun"], ["sign"])
+    assert inside == index.query(JD_START + 50.0, JD_START + 80.0, ["Sun"], ["sign"])
+    outside = find_transit_events(JD_START - 60.0, JD_START - 1.0, ["Sun"], ["sign"])
+    assert len(outside) == 2
+    assert all(JD_START - 60.0 <= e.jd <= JD_START - 1.0 for e in outside)
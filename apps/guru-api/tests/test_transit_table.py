@@ -0,0 +1,80 @@
+"""
+Tests for the transit table (interpolated shared positions match get_planet_positions()).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.ephemeris import transit_table
+from src.ephemeris.transit_table import (
+    TABLE_PLANETS,
+    TransitTable,
+    build_transit_table,
+    get_transit_positions,
+    load_transit_table,
+    save_transit_table,
+)
+from src.jyotish.kundli_engine import get_planet_positions
+
+JD_START = 2460676.5  # 2025-01-01
+MAX_ERROR_DEG = 5e-5
+
+
+def _angle_error(a, b):
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+@pytest.fixture(scope="module")
+def small_table():
+    return build_transit_table(JD_START, JD_START + 60.0)
+
+
+def test_positions_match_swiss_ephemeris(small_table):
+    rng = random.Random(27)
+    for _ in range(200):
+        jd = rng.uniform(small_table.jd_start, small_table.jd_end)
+        table_positions = small_table.positions(jd)
+        exact = get_planet_positions(jd)
+        assert set(table_positions) == set(exact)
+        for name, longitude in exact.items():
+            assert _angle_error(table_positions[name], longitude) < MAX_ERROR_DEG, (jd, name)
+
+
+def test_rows_are_exact_and_float32(small_table):
+    assert small_table.longitudes.dtype == np.float32
+    exact = get_planet_positions(JD_START + 10.0)
+    row = int(10.0 / small_table.step)
+    for col, name in enumerate(TABLE_PLANETS):
+        assert _angle_error(float(small_table.longitudes[row, col]), exact[name]) < 1e-4
+
+
+def test_outside_window_rejected(small_table):
+    assert not small_table.covers(JD_START - 1.0)
+    with pytest.raises(ValueError):
+        small_table.positions(small_table.jd_end + 1.0)
+
+
+def test_save_and_memory_map_roundtrip(small_table, tmp_path):
+    path = str(tmp_path / "table")
+    save_transit_table(small_table, path)
+    loaded = load_transit_table(path)
+    assert isinstance(loaded.longitudes, np.memmap)
+    assert loaded.jd_start == small_table.jd_start and loaded.jd_end == small_table.jd_end
+    jd = JD_START + 17.3
+    assert loaded.positions(jd) == small_table.positions(jd)
+    assert load_transit_table(str(tmp_path / "missing")) is None
+
+
+def test_shared_lookup_falls_back_outside_window(small_table, monkeypatch):
+    monkeypatch.setattr(transit_table, "get_transit_table", lambda year=None: small_table)
+    inside = get_transit_positions(JD_START + 5.25)
+    assert inside == small_table.positions(JD_START + 5.25)
+    outside_jd = JD_START - 400.0
+    assert get_transit_positions(outside_jd) == get_planet_positions(outside_jd)
+
+
+def test_shape_validation():
+    with pytest.raises(ValueError):
+        TransitTable(JD_START, 0.5, np.zeros((3, len(TABLE_PLANETS))), np.zeros((3, 2)))
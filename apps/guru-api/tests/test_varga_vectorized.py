@@ -0,0 +1,64 @@
+"""
+Tests for the vectorized varga engine (bit-identical to build_varga_chart() for D1-D60).
+"""
+
+import pytest
+
+from src.jyotish.varga_engine import build_varga_chart, build_all_varga_charts_vectorized
+from src.jyotish.varga_vectorized import SUPPORTED_VARGAS
+
+KUNDLI_VARGAS = (2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+# 1995-05-16 18:38 IST Bangalore (golden birth) - raw JHORA-exact longitudes
+GOLDEN_PLANETS = {
+    "Sun": 31.7547, "Moon": 235.2375, "Mars": 125.3815, "Mercury": 51.2603,
+    "Jupiter": 234.1045, "Venus": 356.4211, "Saturn": 330.7416,
+    "Rahu": 199.8221, "Ketu": 19.8221,
+}
+GOLDEN_ASCENDANT = 222.0733
+
+
+def _boundary_longitudes():
+    """Every amsa boundary of every varga, plus just-below/just-above values."""
+    points = set()
+    for sign in range(12):
+        for divisions in (2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60):
+            for part in range(divisions + 1):
+                edge = sign * 30.0 + part * (30.0 / divisions)
+                for delta in (-1e-7, -1e-9, 0.0, 1e-9, 1e-7, 0.123456789):
+                    lon = edge + delta
+                    if 0.0 <= lon < 360.0:
+                        points.add(lon)
+        for edge in (5.0, 10.0, 12.0, 18.0, 20.0, 25.0):  # D30 unequal segments
+            points.add(sign * 30.0 + edge)
+            points.add(sign * 30.0 + edge - 1e-9)
+    return sorted(points)
+
+
+@pytest.mark.parametrize("varga_type", KUNDLI_VARGAS)
+def test_golden_chart_identical(varga_type):
+    vectorized = build_all_varga_charts_vectorized(GOLDEN_PLANETS, GOLDEN_ASCENDANT, KUNDLI_VARGAS)
+    assert vectorized[varga_type] == build_varga_chart(GOLDEN_PLANETS, GOLDEN_ASCENDANT, varga_type)
+
+
+@pytest.mark.parametrize("varga_type", SUPPORTED_VARGAS)
+def test_boundary_longitudes_identical(varga_type):
+    """Dense boundary sweep: sign, degree, DMS and house must all match the scalar engine."""
+    longitudes = _boundary_longitudes()
+    for start in range(0, len(longitudes), 9):
+        batch = longitudes[start:start + 9]
+        planets = {f"P{i}": lon for i, lon in enumerate(batch)}
+        ascendant = batch[len(batch) // 2]
+        vectorized = build_all_varga_charts_vectorized(planets, ascendant, (varga_type,))[varga_type]
+        assert vectorized == build_varga_chart(planets, ascendant, varga_type)
+
+
+def test_default_covers_all_supported_vargas():
+    charts = build_all_varga_charts_vectorized(GOLDEN_PLANETS, GOLDEN_ASCENDANT)
+    assert tuple(charts.keys()) == SUPPORTED_VARGAS
+    assert list(charts[9]["planets"].keys()) == list(GOLDEN_PLANETS.keys())
+
+
+def test_empty_planets_rejected():
+    with pytest.raises(ValueError):
+        build_all_varga_charts_vectorized({}, GOLDEN_ASCENDANT)
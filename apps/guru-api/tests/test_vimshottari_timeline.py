@@ -0,0 +1,103 @@
+"""
+Tests for the Vimshottari timeline (lazy tree equals engine output, bisect lookups, range queries).
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.jyotish.dasha.timeline import (
+    DASHA_LEVELS,
+    get_vimshottari_timeline_for_birth,
+    locate_period,
+)
+from src.jyotish.dasha.vimshottari_engine import (
+    calculate_antardashas,
+    calculate_pratyantardashas,
+    calculate_vimshottari_dasha,
+)
+
+BIRTH = ("1995-05-16", "18:38", "Asia/Kolkata")
+LAT, LON = 12.9716, 77.5946
+
+
+@pytest.fixture(scope="module")
+def timeline():
+    return get_vimshottari_timeline_for_birth(*BIRTH)
+
+
+def test_timeline_is_memoized(timeline):
+    assert get_vimshottari_timeline_for_birth(*BIRTH) is timeline
+    md = timeline.mahadashas[0]
+    assert timeline.children(md) is timeline.children(md)
+
+
+def test_matches_engine_output(timeline):
+    calculation_date = datetime(2025, 3, 1, 12, 0)
+    dasha = calculate_vimshottari_dasha(BIRTH[0], BIRTH[1], LAT, LON, BIRTH[2], calculation_date=calculation_date)
+    assert [md.to_dict() for md in timeline.mahadashas] == dasha["mahadashas"]
+    for md in timeline.mahadashas:
+        assert [ad.to_dict() for ad in timeline.children(md)] == dasha["antardashas"][md.lord]
+    path = timeline.path_at(calculation_date, depth=3)
+    assert [p.lord for p in path] == [
+        dasha["current_dasha"]["mahadasha"],
+        dasha["current_dasha"]["antardasha"],
+        dasha["current_dasha"]["pratyantar"],
+    ]
+
+
+def test_children_match_legacy_helpers(timeline):
+    md = timeline.mahadashas[3]
+    ads = timeline.children(md)
+    legacy_ads = calculate_antardashas(md.lord, md.start, md.end)
+    assert [ad.to_dict() for ad in ads] == legacy_ads
+
+    ad = ads[4]
+    legacy_pds = calculate_pratyantardashas(md.lord, ad.lord, ad.start, ad.end)
+    assert [pd.to_dict() for pd in timeline.children(ad)] == legacy_pds
+
+
+def test_period_at_agrees_with_linear_scan(timeline):
+    first, last = timeline.mahadashas[0].start, timeline.mahadashas[-1].end
+    when = first
+    while when < last:
+        for depth in range(1, 4):
+            expected = None
+            periods = timeline.mahadashas
+            for _ in range(depth):
+                expected = next(p for p in periods if p.start <= when <= p.end)
+                periods = timeline.children(expected)
+            assert timeline.period_at(when, depth) == expected
+        when += timedelta(days=997)
+    assert timeline.period_at(first - timedelta(days=1)) is None
+    assert timeline.period_at(last + timedelta(days=1)) is None
+
+
+def test_periods_between_is_contiguous_and_covers_range(timeline):
+    start = datetime(2030, 1, 1)
+    end = datetime(2034, 6, 1)
+    for depth in (2, 3):
+        periods = timeline.periods_between(start, end, depth)
+        assert periods[0].start <= start <= periods[0].end
+        assert periods[-1].start <= end <= periods[-1].end
+        for a, b in zip(periods, periods[1:]):
+            assert a.end == b.start
+        assert all(p.depth == depth for p in periods)
+
+
+def test_prana_is_deepest_level(timeline):
+    when = datetime(2026, 7, 1)
+    path = timeline.path_at(when, depth=len(DASHA_LEVELS))
+    assert len(path) == 5
+    assert path[-1].end - path[-1].start < timedelta(days=30)
+    with pytest.raises(ValueError):
+        timeline.children(path[-1])
+    with pytest.raises(ValueError):
+        timeline.period_at(when, depth=6)
+
+
+def test_locate_period_boundaries(timeline):
+    mds = timeline.mahadashas
+    assert locate_period(mds, mds[1].start) in (mds[0], mds[1])
+    assert locate_period(mds, mds[1].start + timedelta(seconds=1)) == mds[1]
+    assert locate_period(mds, mds[-1].end) == mds[-1]
@@ -0,0 +1,101 @@
+"""
+Tests for the compiled yoga evaluator (same yogas, order and fields as the six detector modules).
+"""
+
+import json
+import random
+
+import pytest
+import swisseph as swe
+
+from src.jyotish.kundli_engine import generate_kundli
+from src.jyotish.natal_store import yoga_inputs
+from src.jyotish.yogas.combination_yogas import detect_combination_yogas
+from src.jyotish.yogas.extended_yogas import detect_extended_yogas
+from src.jyotish.yogas.house_yogas import detect_house_yogas
+from src.jyotish.yogas.mahapurusha_yogas import detect_mahapurusha_yogas
+from src.jyotish.yogas.planetary_yogas import detect_planetary_yogas
+from src.jyotish.yogas.raja_yogas import detect_advanced_raja_yogas
+from src.jyotish.yogas.yoga_compiler import compile_condition, evaluate_yogas
+from src.jyotish.yogas.yoga_engine import detect_all_yogas
+
+PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+DETECTORS = [
+    detect_planetary_yogas,
+    detect_mahapurusha_yogas,
+    detect_house_yogas,
+    detect_combination_yogas,
+    detect_advanced_raja_yogas,
+    detect_extended_yogas,
+]
+
+
+def _detectors(planets, houses):
+    return [yoga for detect in DETECTORS for yoga in detect(planets, houses)]
+
+
+def _random_chart(rng):
+    names = rng.sample(PLANETS, rng.randint(0, len(PLANETS)))
+    # A few house/degree values per chart so conjunctions and full houses occur
+    house_choices = rng.sample(range(1, 13), rng.randint(1, 12))
+    planets = {}
+    for name in names:
+        data = {
+            "house": rng.choice(house_choices),
+            "sign": rng.randrange(12),
+            "degree": rng.choice([0.0, 3.5, 90.0, 121.0, 178.0, 185.0, 240.0, 359.0]) + rng.uniform(0, 6),
+        }
+        for key in ("house", "sign", "degree"):
+            if rng.random() < 0.03:
+                del data[key]
+        planets[name] = data
+    houses = [{"house": house, "sign": (house - 1 + rng.randrange(12)) % 12} for house in range(1, 13)]
+    rng.shuffle(houses)
+    if rng.random() < 0.2:
+        del houses[rng.randrange(len(houses)):]
+    if rng.random() < 0.1:
+        houses.append({"house": rng.randint(1, 12), "sign": 12})
+    return planets, houses
+
+
+def test_random_charts_match_detectors():
+    rng = random.Random(23)
+    seen = set()
+    for _ in range(3000):
+        planets, houses = _random_chart(rng)
+        expected = _detectors(planets, houses)
+        yogas = evaluate_yogas(planets, houses)
+        assert json.dumps(yogas) == json.dumps(expected)
+        seen.update(yoga["name"] for yoga in yogas)
+    # Every kind of rule fired at least once
+    for name in ("Gaja Kesari Yoga", "Chatusagara Yoga", "Kemdrum Yoga", "Sanyasa Yoga", "Lakshmi Yoga",
+                 "Hamsa Yoga", "All Benefics in Kendra", "Neechabhanga Raja Yoga", "Dharma-Karmadhipati Yoga"):
+        assert name in seen
+    for part in ("Parivartana", "Vipareeta", "Kartari", "Conjunction", "Trine Aspect", "Lord in Own House"):
+        assert any(part in name for name in seen)
+
+
+@pytest.mark.parametrize("birth", [
+    (1995, 5, 16, 13.1, 12.9716, 77.5946),
+    (1980, 1, 1, 0.6, 28.6139, 77.2090),
+    (2001, 9, 12, 3.98, 40.7128, -74.0060),
+    (1964, 7, 30, 2.0, -33.8688, 151.2093),
+])
+def test_real_charts_match_detectors(birth):
+    kundli = generate_kundli(swe.julday(*birth[:4]), *birth[4:])
+    planets, houses = yoga_inputs(kundli)
+    result = detect_all_yogas(planets, houses)
+    assert json.dumps(result["all_yogas"]) == json.dumps(_detectors(planets, houses))
+    assert result["total_yogas"] == len(result["all_yogas"])
+
+
+def test_yogas_are_fresh_dicts():
+    planets = {"Moon": {"house": 1, "sign": 3, "degree": 100.0}, "Jupiter": {"house": 1, "sign": 3, "degree": 102.0}}
+    first = evaluate_yogas(planets, [])
+    first[0]["name"] = "changed"
+    assert evaluate_yogas(planets, [])[0]["name"] == "Gaja Kesari Yoga"
+
+
+def test_unknown_condition_rejected():
+    with pytest.raises(ValueError):
+        compile_condition(("sometimes", "Moon"))